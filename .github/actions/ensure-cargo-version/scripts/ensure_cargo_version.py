@@ -15,6 +15,7 @@ import dataclasses
 import os
 import re
 import typing as typ
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cyclopts
@@ -27,15 +28,12 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 prepend_project_root(start=_SCRIPT_DIR)
 
 from bool_utils import coerce_bool_strict
-from cargo_utils import (
-    ManifestError,
-    find_workspace_root,
-    get_workspace_version,
-    read_manifest,
-)
+from cargo_utils import ManifestError, default_index, metadata_package
 
 app = App(config=cyclopts.config.Env("INPUT_", command=False))
 
+_GLOB_CHARS = frozenset("*?[")
+
 
 @dataclasses.dataclass(slots=True)
 class ManifestVersion:
@@ -53,19 +51,44 @@ def _workspace() -> Path:
     return Path.cwd()
 
 
+def _expand_glob(pattern: Path) -> list[Path]:
+    """Return the manifests matching an absolute glob *pattern*, sorted."""
+    anchor = Path(pattern.anchor)
+    relative = pattern.relative_to(anchor).as_posix()
+    return sorted(path for path in anchor.glob(relative) if path.is_file())
+
+
 def _resolve_paths(manifests: list[Path]) -> list[Path]:
-    """Resolve manifest paths relative to the workspace."""
+    """Resolve manifest paths relative to the workspace.
+
+    Entries containing glob characters are expanded once, in sorted order.
+    A pattern that matches nothing is kept verbatim so the missing manifest
+    is reported like any other unreadable path. Duplicates are dropped while
+    preserving first-seen order, so the first manifest still drives the
+    ``crate-name`` and ``crate-version`` outputs.
+    """
     workspace = _workspace()
     resolved: list[Path] = []
+    seen: set[Path] = set()
     for manifest in manifests:
         path = manifest if manifest.is_absolute() else workspace / manifest
-        resolved.append(path)
+        matches = [path]
+        if _GLOB_CHARS.intersection(str(manifest)):
+            matches = _expand_glob(path) or [path]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                resolved.append(match)
     return resolved
 
 
 def _read_manifest_version(path: Path) -> ManifestVersion:
     """Parse a manifest and return the discovered package metadata."""
-    data = read_manifest(path)
+    if (resolved := metadata_package(path)) is not None:
+        return ManifestVersion(path=path, name=resolved.name, version=resolved.version)
+
+    index = default_index()
+    data = index.manifest(path)
 
     package = data.get("package")
     if not isinstance(package, dict):
@@ -78,19 +101,21 @@ def _read_manifest_version(path: Path) -> ManifestVersion:
 
     version = package.get("version")
     if isinstance(version, dict) and version.get("workspace") is True:
-        workspace_manifest = find_workspace_root(path.parent)
+        workspace_manifest = index.workspace_root(path.parent)
         if workspace_manifest is None:
             raise ManifestError(
                 path,
                 "Could not resolve workspace root for inherited version",
             )
-        workspace_version = get_workspace_version(workspace_manifest)
-        if workspace_version is None:
+        workspace_version = index.workspace_package(workspace_manifest).get("version")
+        if not isinstance(workspace_version, str):
             raise ManifestError(
                 workspace_manifest,
                 "Workspace manifest missing [workspace.package].version",
             )
-        return ManifestVersion(path=path, name=crate_name, version=workspace_version)
+        return ManifestVersion(
+            path=path, name=crate_name, version=workspace_version.strip()
+        )
 
     if not isinstance(version, str) or not version.strip():
         raise ManifestError(path, "Could not read package.version")
@@ -176,28 +201,93 @@ def _resolve_tag_version(tag_prefix: str, check_tag: str) -> tuple[str | None, b
     return tag_version, should_check_tag
 
 
-def _validate_manifests(
+def _try_read_manifest_version(path: Path) -> ManifestVersion | ManifestError:
+    """Return the manifest metadata for *path*, or the error raised reading it."""
+    try:
+        return _read_manifest_version(path)
+    except ManifestError as exc:
+        return exc
+
+
+def _read_manifests(
     resolved_paths: list[Path],
+) -> list[ManifestVersion | ManifestError]:
+    """Read every manifest concurrently, returning results in input order.
+
+    Manifests are read on a thread pool through the shared
+    :func:`cargo_utils.default_index`, so each workspace root is parsed once
+    however many members inherit from it. The first manifest is read before
+    the pool starts to warm the workspace and ``cargo metadata`` caches.
+    Failures are returned in place rather than raised, so one bad manifest
+    does not hide the others.
+    """
+    if not resolved_paths:
+        return []
+    first, *rest = resolved_paths
+    results = [_try_read_manifest_version(first)]
+    if rest:
+        with ThreadPoolExecutor(max_workers=min(32, len(rest))) as pool:
+            results.extend(pool.map(_try_read_manifest_version, rest))
+    return results
+
+
+def _validate_manifests(
+    results: list[ManifestVersion | ManifestError],
 ) -> tuple[list[ManifestVersion], list[tuple[str, str, Path | None]]]:
-    """Read and validate manifest versions, returning metadata and errors."""
+    """Split manifest read results into metadata and reportable errors."""
     manifest_versions: list[ManifestVersion] = []
     errors: list[tuple[str, str, Path | None]] = []
 
-    for manifest_path in resolved_paths:
-        try:
-            manifest_versions.append(_read_manifest_version(manifest_path))
-        except ManifestError as exc:
+    for result in results:
+        if isinstance(result, ManifestError):
             errors.append(
                 (
                     "Cargo.toml parse failure",
-                    f"{exc} in {_display_path(exc.path)}",
-                    exc.path,
+                    f"{result} in {_display_path(result.path)}",
+                    result.path,
                 )
             )
+        else:
+            manifest_versions.append(result)
 
     return manifest_versions, errors
 
 
+def _write_step_summary(
+    resolved_paths: list[Path],
+    results: list[ManifestVersion | ManifestError],
+    expected_tag: str,
+) -> None:
+    """Append a per-crate verification table to the GitHub step summary."""
+    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+    if not summary_path:
+        return
+
+    def _cell(value: str) -> str:
+        return value.replace("|", "\\|").replace("\n", " ")
+
+    expected = expected_tag or "-"
+    lines = [
+        "### Cargo manifest versions",
+        "",
+        "| Manifest | Crate | Version | Expected | Status |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for path, result in zip(resolved_paths, results, strict=True):
+        display = f"`{_display_path(path)}`"
+        if isinstance(result, ManifestError):
+            status = _cell(f"error: {result} in {_display_path(result.path)}")
+            lines.append(f"| {display} | - | - | {expected} | {status} |")
+            continue
+        matches = not expected_tag or result.version == expected_tag
+        lines.append(
+            f"| {display} | {_cell(result.name)} | {_cell(result.version)} "
+            f"| {expected} | {'ok' if matches else 'mismatch'} |"
+        )
+    with Path(summary_path).open("a", encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n\n")
+
+
 def _check_version_matches(
     manifest_versions: list[ManifestVersion],
     expected_tag: str,
@@ -231,7 +321,8 @@ def main(
 
     tag_version, should_check_tag = _resolve_tag_version(tag_prefix, check_tag)
 
-    manifest_versions, errors = _validate_manifests(resolved)
+    results = _read_manifests(resolved)
+    manifest_versions, errors = _validate_manifests(results)
 
     crate_version = manifest_versions[0].version if manifest_versions else ""
     crate_name = manifest_versions[0].name if manifest_versions else ""
@@ -244,6 +335,8 @@ def main(
         expected_tag = tag_version
         errors.extend(_check_version_matches(manifest_versions, expected_tag))
 
+    _write_step_summary(resolved, results, expected_tag)
+
     if errors:
         for title, message, path in errors:
             _emit_error(title, message, path=path)
@@ -333,3 +333,72 @@ def test_main_creates_parent_directories_for_github_output(
     assert output_file.exists()
     contents = output_file.read_text(encoding="utf-8")
     assert "crate-version=1.0.0" in contents
+
+
+def test_main_expands_globs_and_reports_every_mismatch(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Globbed manifests are all checked and summarized in a single pass."""
+    workspace = tmp_path
+    _write_raw_manifest(
+        workspace / "Cargo.toml",
+        '[workspace]\nmembers = ["crates/*"]\n\n[workspace.package]\n'
+        'version = "1.0.0"\n',
+    )
+    for name in ("alpha", "beta"):
+        _write_raw_manifest(
+            workspace / "crates" / name / "Cargo.toml",
+            f'[package]\nname = "{name}"\nversion.workspace = true\n',
+        )
+    _write_manifest(
+        workspace / "crates" / "gamma" / "Cargo.toml", "0.9.0", name="gamma"
+    )
+    _write_manifest(
+        workspace / "crates" / "delta" / "Cargo.toml", "0.8.0", name="delta"
+    )
+
+    summary = workspace / "summary.md"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(workspace))
+    monkeypatch.setenv("GITHUB_REF_NAME", "v1.0.0")
+
+    recorded_errors: list[tuple[str, str, Path | None]] = []
+
+    def record_error(title: str, message: str, *, path: Path | None = None) -> None:
+        recorded_errors.append((title, message, path))
+
+    monkeypatch.setattr(ensure, "_emit_error", record_error)
+
+    with pytest.raises(SystemExit) as excinfo:
+        ensure.main(
+            manifests=[Path("crates/*/Cargo.toml"), Path("crates/alpha/Cargo.toml")]
+        )
+
+    assert excinfo.value.code == 1
+    mismatched = sorted(path.parent.name for _, _, path in recorded_errors if path)
+    assert mismatched == ["delta", "gamma"]
+
+    table = summary.read_text(encoding="utf-8").splitlines()
+    rows = [line for line in table if line.startswith("| `crates/")]
+    assert [row.split("`")[1] for row in rows] == [
+        "crates/alpha/Cargo.toml",
+        "crates/beta/Cargo.toml",
+        "crates/delta/Cargo.toml",
+        "crates/gamma/Cargo.toml",
+    ]
+    assert rows[0].endswith("| alpha | 1.0.0 | 1.0.0 | ok |")
+    assert rows[2].endswith("| delta | 0.8.0 | 1.0.0 | mismatch |")
+
+
+def test_resolve_paths_keeps_unmatched_globs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A glob matching nothing is reported as a missing manifest."""
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+
+    resolved = ensure._resolve_paths([Path("missing/*/Cargo.toml")])
+
+    assert resolved == [tmp_path / "missing" / "*" / "Cargo.toml"]
+    (result,) = ensure._read_manifests(resolved)
+    assert isinstance(result, ensure.ManifestError)
@@ -45,8 +45,10 @@ from actions_common import normalize_input_env
 from bool_utils import coerce_bool_strict
 from cargo_utils import (
     ManifestError,
+    PackageMetadata,
     get_bin_name,
     get_package_field,
+    metadata_package,
     read_manifest,
     resolve_version,
 )
@@ -102,12 +104,29 @@ def _emit_warning(message: str) -> None:
     print(f"::warning::{escaped}")
 
 
+def _extract_resolved_field(resolved: PackageMetadata, field: str) -> str | None:
+    """Extract a single field from ``cargo metadata`` output."""
+    match field:
+        case "name":
+            return resolved.name
+        case "version":
+            return resolved.version
+        case "bin-name":
+            return resolved.bin_names[0] if resolved.bin_names else resolved.name
+        case "description":
+            return resolved.description
+        case _:
+            return None
+
+
 def _extract_field(
     manifest: dict[str, typ.Any],
     manifest_path: Path,
     field: str,
 ) -> str | None:
     """Extract a single field from the manifest."""
+    if (resolved := metadata_package(manifest_path)) is not None:
+        return _extract_resolved_field(resolved, field)
     match field:
         case "name":
             return get_package_field(manifest, "name", manifest_path)
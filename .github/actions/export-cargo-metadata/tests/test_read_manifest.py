@@ -149,6 +149,34 @@ def test_extract_field(
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        ("name", "resolved-pkg"),
+        ("version", "9.9.9"),
+        ("bin-name", "resolved-cli"),
+        ("description", "From cargo"),
+    ],
+)
+def test_extract_field_prefers_cargo_metadata(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: PathType, field: str, expected: str
+) -> None:
+    """In metadata resolver mode, cargo's resolved view should win."""
+    from cargo_utils import PackageMetadata, TargetMetadata
+
+    resolved = PackageMetadata(
+        name="resolved-pkg",
+        version="9.9.9",
+        manifest_path=tmp_path / "Cargo.toml",
+        description="From cargo",
+        targets=(TargetMetadata("resolved-cli", ("bin",), tmp_path / "main.rs"),),
+    )
+    monkeypatch.setattr(read_manifest_mod, "metadata_package", lambda _path: resolved)
+
+    manifest = '[package]\nname = "toml-pkg"\nversion = "1.0.0"\n'
+    assert _load_and_extract(tmp_path, manifest, field) == expected
+
+
 def _setup_github_env(
     monkeypatch: pytest.MonkeyPatch, workspace: PathType
 ) -> tuple[PathType, PathType]:
@@ -7,7 +7,12 @@ streaming and captured stdout. It provides:
   applies ``env_unsets``, then merges ``env_overrides``.
 - Output pumping — selector-based on POSIX (``_pump_cargo_output``) and
   thread-based on Windows (``_pump_cargo_output_windows``), both bounded by
-  ``RUN_RUST_CARGO_WAIT_TIMEOUT``.
+  ``RUN_RUST_CARGO_WAIT_TIMEOUT``. Both read chunks of up to ``_CHUNK_SIZE``
+  bytes from the raw pipe descriptors with ``os.read``, copy each chunk to the
+  console in a single write, and split lines only for the captured stdout.
+- Capture policies (``CapturePolicy``) — which stdout lines are kept: all of
+  them, the last N, or only those matching a pattern. Setting
+  ``RUN_RUST_CAPTURE=full`` keeps every line regardless, for debugging.
 - Process lifecycle helpers — stream assertion, timeout enforcement, and
   cleanup (``_assert_cargo_streams``, ``_raise_cargo_timeout``,
   ``_wait_for_cargo``, ``_kill_cargo_process``).
@@ -20,9 +25,14 @@ for use only by ``run_rust.py``.
 
 from __future__ import annotations
 
+import codecs
+import collections
+import collections.abc as cabc
 import contextlib
 import dataclasses
+import functools
 import os
+import re
 import selectors
 import shlex
 import subprocess
@@ -35,17 +45,186 @@ import typing as typ
 import typer
 from plumbum.cmd import cargo
 
+# Large enough that a chatty nextest run needs few wake-ups, small enough that
+# output still appears promptly; os.read returns whatever is available.
+_CHUNK_SIZE = 64 * 1024
+CAPTURE_ENV = "RUN_RUST_CAPTURE"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CapturePolicy:
+    """Which stdout lines ``_run_cargo`` keeps while streaming.
+
+    Every line is still echoed to the console; the policy only bounds what is
+    held in memory and returned. ``pattern`` keeps only lines it matches
+    (``re.search``) and ``tail`` keeps at most that many of the remaining
+    lines, the most recent ones. The default keeps everything.
+    """
+
+    pattern: re.Pattern[str] | None = None
+    tail: int | None = None
+
+    @classmethod
+    def full(cls) -> CapturePolicy:
+        """Return a policy keeping every stdout line."""
+        return cls()
+
+    @classmethod
+    def last(cls, lines: int) -> CapturePolicy:
+        """Return a policy keeping the final ``lines`` stdout lines."""
+        return cls(tail=max(lines, 0))
+
+    @classmethod
+    def matching(cls, pattern: str | re.Pattern[str]) -> CapturePolicy:
+        """Return a policy keeping the stdout lines that match ``pattern``."""
+        return cls(pattern=re.compile(pattern))
+
+    @property
+    def discards_all(self) -> bool:
+        """Return ``True`` when no line can be kept."""
+        return self.tail == 0
+
+    def resolve(self) -> CapturePolicy:
+        """Return the full policy when ``RUN_RUST_CAPTURE=full``, else ``self``."""
+        if os.environ.get(CAPTURE_ENV, "").strip().lower() == "full":
+            return CapturePolicy.full()
+        return self
+
 
 @dataclasses.dataclass
 class _CargoProcCtx:
     """Cargo process handle together with its timing constraints."""
 
-    proc: subprocess.Popen[str]
+    proc: subprocess.Popen[bytes]
     deadline: float
     wait_timeout: float
 
 
-def _safe_close_text_stream(stream: typ.IO[str] | None) -> None:
+def _chunk_reader(stream: typ.IO[typ.Any]) -> cabc.Callable[[], bytes]:
+    """Return a callable that reads the next chunk of ``stream`` as bytes.
+
+    Pipes are read with ``os.read`` on their descriptor, bypassing Python's
+    buffered and text layers. Streams without a descriptor (in-memory test
+    doubles) fall back to ``read``.
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+
+        def read() -> bytes:
+            data = stream.read(_CHUNK_SIZE)
+            return data.encode("utf-8") if isinstance(data, str) else data
+
+        return read
+    return functools.partial(os.read, fd, _CHUNK_SIZE)
+
+
+def _set_nonblocking(stream: typ.IO[typ.Any]) -> None:
+    """Put ``stream``'s descriptor in non-blocking mode when it has one."""
+    with contextlib.suppress(AttributeError, OSError, ValueError):
+        os.set_blocking(stream.fileno(), False)
+
+
+class _ConsoleWriter:
+    """Copy raw child output to this process's stdout or stderr."""
+
+    def __init__(self, *, err: bool) -> None:
+        self._stream = sys.stderr if err else sys.stdout
+        self._buffer = getattr(self._stream, "buffer", None)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def write(self, chunk: bytes) -> None:
+        """Write ``chunk`` and flush, so it reaches the console immediately."""
+        if self._buffer is None:
+            self._stream.write(self._decoder.decode(chunk))
+            self._stream.flush()
+            return
+        # Flush text already queued on the wrapper so output stays ordered.
+        self._stream.flush()
+        self._buffer.write(chunk)
+        self._buffer.flush()
+
+
+class _LineCollector:
+    """Split captured output into lines without their line endings.
+
+    Only the lines allowed by the :class:`CapturePolicy` are retained.
+    """
+
+    def __init__(self, policy: CapturePolicy | None = None) -> None:
+        policy = policy or CapturePolicy()
+        self._lines: collections.deque[str] = collections.deque(maxlen=policy.tail)
+        self._pattern = policy.pattern
+        self._partial = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def _keep(self, lines: cabc.Iterable[str]) -> None:
+        stripped = (line.rstrip("\r") for line in lines)
+        if self._pattern is None:
+            self._lines.extend(stripped)
+        else:
+            self._lines.extend(line for line in stripped if self._pattern.search(line))
+
+    def feed(self, chunk: bytes) -> None:
+        """Add the complete lines in ``chunk``, keeping any trailing fragment."""
+        text = self._partial + self._decoder.decode(chunk)
+        *complete, self._partial = text.split("\n")
+        self._keep(complete)
+
+    def close(self) -> list[str]:
+        """Flush the final unterminated line and return the retained lines."""
+        tail = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        if tail:
+            self._keep([tail])
+        return list(self._lines)
+
+
+@dataclasses.dataclass(slots=True)
+class _StreamPump:
+    """Copy one cargo stream to the console, collecting lines when asked."""
+
+    read: cabc.Callable[[], bytes]
+    console: _ConsoleWriter
+    collector: _LineCollector | None = None
+
+    def pump(self) -> bool:
+        """Copy the next available chunk; return ``False`` at end of stream."""
+        try:
+            chunk = self.read()
+        except BlockingIOError:
+            return True
+        if not chunk:
+            return False
+        self.console.write(chunk)
+        if self.collector is not None:
+            self.collector.feed(chunk)
+        return True
+
+
+def _stream_pumps(
+    stdout_stream: typ.IO[typ.Any],
+    stderr_stream: typ.IO[typ.Any],
+    capture: CapturePolicy | None = None,
+) -> tuple[_StreamPump, _StreamPump]:
+    """Return the stdout (capturing) and stderr pumps for a cargo process.
+
+    Stdout is not decoded at all when ``capture`` keeps no lines.
+    """
+    capture = capture or CapturePolicy()
+    collector = None if capture.discards_all else _LineCollector(capture)
+    return (
+        _StreamPump(_chunk_reader(stdout_stream), _ConsoleWriter(err=False), collector),
+        _StreamPump(_chunk_reader(stderr_stream), _ConsoleWriter(err=True)),
+    )
+
+
+def _captured_lines(pump: _StreamPump) -> list[str]:
+    """Return the lines ``pump`` retained, or ``[]`` when it captured nothing."""
+    return [] if pump.collector is None else pump.collector.close()
+
+
+def _safe_close_text_stream(stream: typ.IO[typ.Any] | None) -> None:
     """Close ``stream`` while suppressing any cleanup errors."""
     if stream is None:
         return
@@ -59,24 +238,18 @@ def _is_debug_pump_enabled() -> bool:
 
 
 def _pump_stream_thread(
-    src: typ.IO[str],
+    pump: _StreamPump,
     *,
-    to_stdout: bool,
-    stdout_lines: list[str],
     thread_exceptions: list[Exception],
 ) -> None:
-    """Read lines from *src*, echo them, and capture stdout lines.
+    """Copy *pump*'s stream to the console until it is exhausted.
 
     Thread exceptions are appended to *thread_exceptions* rather than
     propagated so that the monitoring loop can handle them.
     """
-    dest = sys.stdout if to_stdout else sys.stderr
     try:
-        for line in iter(src.readline, ""):
-            dest.write(line)
-            dest.flush()
-            if to_stdout:
-                stdout_lines.append(line.rstrip("\r\n"))
+        while pump.pump():
+            pass
     except Exception as exc:  # noqa: BLE001
         thread_exceptions.append(exc)
         if _is_debug_pump_enabled():
@@ -107,7 +280,7 @@ def _poll_pump_loop_iteration(
 
 def _finalize_pump_threads(
     threads: list[threading.Thread],
-    proc: subprocess.Popen[str],
+    proc: subprocess.Popen[bytes],
     thread_exceptions: list[Exception],
 ) -> None:
     """Join threads, kill on timeout, and re-raise any captured thread exception."""
@@ -129,35 +302,23 @@ def _finalize_pump_threads(
 
 
 def _pump_cargo_output_windows(
-    stdout_stream: typ.IO[str],
-    stderr_stream: typ.IO[str],
+    stdout_stream: typ.IO[typ.Any],
+    stderr_stream: typ.IO[typ.Any],
     ctx: _CargoProcCtx,
+    capture: CapturePolicy | None = None,
 ) -> list[str]:
     """Pump cargo output on Windows using background threads."""
     thread_exceptions: list[Exception] = []
-    stdout_lines: list[str] = []
+    stdout_pump, stderr_pump = _stream_pumps(stdout_stream, stderr_stream, capture)
 
     threads = [
         threading.Thread(
-            name="cargo-stdout",
-            target=_pump_stream_thread,
-            args=(stdout_stream,),
-            kwargs={
-                "to_stdout": True,
-                "stdout_lines": stdout_lines,
-                "thread_exceptions": thread_exceptions,
-            },
-        ),
-        threading.Thread(
-            name="cargo-stderr",
+            name=f"cargo-{name}",
             target=_pump_stream_thread,
-            args=(stderr_stream,),
-            kwargs={
-                "to_stdout": False,
-                "stdout_lines": stdout_lines,
-                "thread_exceptions": thread_exceptions,
-            },
-        ),
+            args=(pump,),
+            kwargs={"thread_exceptions": thread_exceptions},
+        )
+        for name, pump in (("stdout", stdout_pump), ("stderr", stderr_pump))
     ]
     for thread in threads:
         thread.start()
@@ -166,32 +327,10 @@ def _pump_cargo_output_windows(
             pass
     finally:
         _finalize_pump_threads(threads, ctx.proc, thread_exceptions)
-    return stdout_lines
-
-
-def _handle_cargo_output_event(
-    key: selectors.SelectorKey,
-    stdout_lines: list[str],
-    sel: selectors.DefaultSelector,
-) -> None:
-    """Process one selector event from a cargo output stream.
-
-    Unregisters the stream when EOF is reached; otherwise echoes the line
-    and, for stdout, appends it to *stdout_lines*.
-    """
-    stream = typ.cast("typ.TextIO", key.fileobj)
-    line = stream.readline()
-    if not line:
-        sel.unregister(stream)
-        return
-    if key.data == "stdout":
-        typer.echo(line, nl=False)
-        stdout_lines.append(line.rstrip("\r\n"))
-    else:
-        typer.echo(line, err=True, nl=False)
+    return _captured_lines(stdout_pump)
 
 
-def _kill_cargo_process(proc: subprocess.Popen[str]) -> None:
+def _kill_cargo_process(proc: subprocess.Popen[bytes]) -> None:
     """Kill *proc* and wait for termination, suppressing any errors."""
     with contextlib.suppress(Exception):
         proc.kill()
@@ -200,50 +339,62 @@ def _kill_cargo_process(proc: subprocess.Popen[str]) -> None:
 
 
 def _pump_cargo_output_posix(
-    stdout_stream: typ.IO[str],
-    stderr_stream: typ.IO[str],
+    stdout_stream: typ.IO[typ.Any],
+    stderr_stream: typ.IO[typ.Any],
     ctx: _CargoProcCtx,
+    capture: CapturePolicy | None = None,
 ) -> list[str]:
     """Pump cargo output on POSIX using a selector-based event loop.
 
+    Both descriptors are switched to non-blocking mode. Each readiness event
+    copies one chunk, so the loop wakes once per chunk rather than per line.
+
     Parameters
     ----------
     stdout_stream:
-        The captured stdout text stream from the cargo process.
+        The captured stdout stream from the cargo process.
     stderr_stream:
-        The captured stderr text stream from the cargo process.
+        The captured stderr stream from the cargo process.
     ctx:
         Shared context holding the process handle, deadline, and timeout.
+    capture:
+        Which stdout lines to retain; every line is kept when omitted.
 
     Returns
     -------
     list[str]
-        Lines collected from stdout (newlines stripped).
+        Lines retained from stdout (newlines stripped).
     """
-    stdout_lines: list[str] = []
+    stdout_pump, stderr_pump = _stream_pumps(stdout_stream, stderr_stream, capture)
     sel = selectors.DefaultSelector()
     try:
-        sel.register(stdout_stream, selectors.EVENT_READ, data="stdout")
-        sel.register(stderr_stream, selectors.EVENT_READ, data="stderr")
+        for stream, pump in (
+            (stdout_stream, stdout_pump),
+            (stderr_stream, stderr_pump),
+        ):
+            _set_nonblocking(stream)
+            sel.register(stream, selectors.EVENT_READ, data=pump)
         while sel.get_map():
             if time.monotonic() >= ctx.deadline:
                 _raise_cargo_timeout(ctx.proc, wait_timeout=ctx.wait_timeout)
             timeout = max(0.0, ctx.deadline - time.monotonic())
             for key, _ in sel.select(timeout):
-                _handle_cargo_output_event(key, stdout_lines, sel)
+                if not typ.cast("_StreamPump", key.data).pump():
+                    sel.unregister(key.fileobj)
     except Exception:
         _kill_cargo_process(ctx.proc)
         raise
     finally:
         sel.close()
-    return stdout_lines
+    return _captured_lines(stdout_pump)
 
 
 def _pump_cargo_output(
-    proc: subprocess.Popen[str],
+    proc: subprocess.Popen[bytes],
     *,
     deadline: float,
     wait_timeout: float,
+    capture: CapturePolicy | None = None,
 ) -> list[str]:
     """Pump ``proc`` output streams to console and collect stdout lines.
 
@@ -264,8 +415,8 @@ def _pump_cargo_output(
 
     ctx = _CargoProcCtx(proc=proc, deadline=deadline, wait_timeout=wait_timeout)
     if os.name == "nt":
-        return _pump_cargo_output_windows(stdout_stream, stderr_stream, ctx)
-    return _pump_cargo_output_posix(stdout_stream, stderr_stream, ctx)
+        return _pump_cargo_output_windows(stdout_stream, stderr_stream, ctx, capture)
+    return _pump_cargo_output_posix(stdout_stream, stderr_stream, ctx, capture)
 
 
 def _build_cargo_env(
@@ -285,7 +436,7 @@ def _build_cargo_env(
     return env
 
 
-def _assert_cargo_streams(proc: subprocess.Popen[str]) -> None:
+def _assert_cargo_streams(proc: subprocess.Popen[bytes]) -> None:
     """Raise ``typer.Exit(1)`` if stdout or stderr were not captured.
 
     Kills and cleans up the process before raising so no resources leak.
@@ -303,14 +454,14 @@ def _assert_cargo_streams(proc: subprocess.Popen[str]) -> None:
         proc.kill()
     with contextlib.suppress(Exception):
         proc.wait(timeout=5)
-    _safe_close_text_stream(typ.cast("typ.TextIO | None", proc.stdout))
-    _safe_close_text_stream(typ.cast("typ.TextIO | None", proc.stderr))
+    _safe_close_text_stream(proc.stdout)
+    _safe_close_text_stream(proc.stderr)
     typer.echo(f"::error::{message}", err=True)
     raise typer.Exit(1) from None
 
 
 def _raise_cargo_timeout(
-    proc: subprocess.Popen[str], *, wait_timeout: float
+    proc: subprocess.Popen[bytes], *, wait_timeout: float
 ) -> typ.Never:
     """Kill ``proc`` and raise ``typer.Exit(1)`` for a cargo timeout."""
     typer.echo(
@@ -325,7 +476,7 @@ def _raise_cargo_timeout(
 
 
 def _wait_for_cargo(
-    proc: subprocess.Popen[str], *, deadline: float, wait_timeout: float
+    proc: subprocess.Popen[bytes], *, deadline: float, wait_timeout: float
 ) -> int:
     """Wait for cargo to exit and return its return code.
 
@@ -341,19 +492,18 @@ def _wait_for_cargo(
 def _spawn_cargo(
     command: typ.Any,  # noqa: ANN401
     env: dict[str, str],
-) -> subprocess.Popen[str]:
+) -> subprocess.Popen[bytes]:
     """Spawn a ``cargo`` subprocess with the given environment.
 
-    Handles both direct ``popen`` invocation and plumbum machine-env
-    contexts transparently.
+    The pipes are unbuffered binary streams: the pumps read their descriptors
+    directly and decode only the captured stdout. Handles both direct
+    ``popen`` invocation and plumbum machine-env contexts transparently.
     """
     popen_kwargs: dict[str, typ.Any] = {
         "stdin": subprocess.DEVNULL,
         "stdout": subprocess.PIPE,
         "stderr": subprocess.PIPE,
-        "text": True,
-        "encoding": "utf-8",
-        "errors": "replace",
+        "bufsize": 0,
     }
     machine_env = getattr(getattr(cargo, "machine", None), "env", None)
     if machine_env is None:
@@ -369,6 +519,7 @@ def _run_cargo(
     *,
     env_overrides: typ.Mapping[str, str] | None = None,
     env_unsets: typ.Iterable[str] = (),
+    capture: CapturePolicy | None = None,
 ) -> str:
     """Run ``cargo`` with ``args`` streaming output and return ``stdout``.
 
@@ -392,11 +543,15 @@ def _run_cargo(
         Unsets are performed before overrides, so ``env_overrides`` can
         unconditionally set a variable that may or may not have been
         inherited.
+    capture : CapturePolicy | None, optional
+        Which stdout lines to return. When ``None`` (the default) every line
+        is kept. ``RUN_RUST_CAPTURE=full`` overrides any policy.
 
     Returns
     -------
     str
-        Captured stdout from the ``cargo`` invocation.
+        Retained stdout lines from the ``cargo`` invocation, joined by
+        newlines.
     """
     typer.echo(f"$ cargo {shlex.join(args)}")
     env = _build_cargo_env(env_overrides, env_unsets)
@@ -416,6 +571,7 @@ def _run_cargo(
             proc,
             deadline=deadline,
             wait_timeout=wait_timeout,
+            capture=(capture or CapturePolicy()).resolve(),
         )
         retcode = _wait_for_cargo(
             proc,
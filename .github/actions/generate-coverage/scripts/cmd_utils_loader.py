@@ -4,15 +4,15 @@ from __future__ import annotations
 
 import importlib.util
 import os
+import sys
 import typing as typ
 from functools import cache
 from pathlib import Path
-
-if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
-    from types import ModuleType
-
+from types import ModuleType
 
 CMD_UTILS_FILENAME: typ.Final[str] = "cmd_utils.py"
+CARGO_UTILS_FILENAME: typ.Final[str] = "cargo_utils.py"
+FINGERPRINT_FILENAME: typ.Final[str] = "fingerprint.py"
 ERROR_REPO_ROOT_NOT_FOUND: typ.Final[str] = "Repository root not found"
 ERROR_IMPORT_FAILED: typ.Final[str] = "Failed to import cmd_utils from repository root"
 
@@ -84,6 +84,36 @@ def _get_cmd_utils() -> ModuleType:
     return load_cmd_utils()
 
 
+def _load_repo_module(name: str, filename: str) -> ModuleType:
+    """Import the repository-level module ``name`` from ``filename``."""
+    if isinstance(existing := sys.modules.get(name), ModuleType):
+        return existing
+    module_path = find_repo_root() / filename
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    if spec is None or spec.loader is None:  # pragma: no cover - import-time failure
+        raise CmdUtilsImportError(module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as exc:  # pragma: no cover - import-time failure
+        del sys.modules[name]
+        raise CmdUtilsImportError(module_path, original_exception=exc) from exc
+    return module
+
+
+@cache
+def load_cargo_utils() -> ModuleType:
+    """Import and return the repository-level ``cargo_utils`` module."""
+    return _load_repo_module("cargo_utils", CARGO_UTILS_FILENAME)
+
+
+@cache
+def load_fingerprint() -> ModuleType:
+    """Import and return the repository-level ``fingerprint`` module."""
+    return _load_repo_module("fingerprint", FINGERPRINT_FILENAME)
+
+
 def run_cmd(*args: typ.Any, **kwargs: typ.Any) -> typ.Any:  # noqa: ANN401 - passthrough
     """Proxy ``cmd_utils.run_cmd`` with lazy module loading."""
     try:
@@ -94,10 +124,14 @@ def run_cmd(*args: typ.Any, **kwargs: typ.Any) -> typ.Any:  # noqa: ANN401 - pas
 
 
 __all__ = [
+    "CARGO_UTILS_FILENAME",
     "CMD_UTILS_FILENAME",
+    "FINGERPRINT_FILENAME",
     "CmdUtilsImportError",
     "RepoRootNotFoundError",
     "find_repo_root",
+    "load_cargo_utils",
     "load_cmd_utils",
+    "load_fingerprint",
     "run_cmd",
 ]
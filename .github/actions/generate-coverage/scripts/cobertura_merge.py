@@ -0,0 +1,327 @@
+"""Merge Cobertura XML reports without leaving the Python process.
+
+Each input is read with :func:`lxml.etree.iterparse`, so only one ``<class>``
+element is held as a tree at a time; its line hits are folded into compact
+per-class tables and the element is cleared. Classes are matched on their
+package name and ``filename``; hits for the same line are summed and, for
+branch lines, the best ``condition-coverage`` seen is kept because Cobertura
+does not record which conditions were taken. Package, class and root
+``line-rate``/``branch-rate`` attributes and the root ``lines-valid``,
+``lines-covered``, ``branches-valid`` and ``branches-covered`` totals are then
+recomputed while the result is written incrementally with
+:class:`lxml.etree.xmlfile`.
+
+``<methods>`` is copied from the first report that contains the class; the
+tools used by this action emit it empty.
+
+:func:`overlay_cobertura_files` reuses the same reader and writer to replace
+whole classes of one report with those of another instead of summing them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import os
+import tempfile
+import typing as typ
+from pathlib import Path
+
+from coverage_parsers import _etree, line_conditions
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+
+__all__ = ["CoberturaMergeError", "merge_cobertura_files", "overlay_cobertura_files"]
+
+
+class CoberturaMergeError(ValueError):
+    """Raised when a Cobertura input cannot be parsed."""
+
+
+@dataclasses.dataclass(slots=True)
+class _Line:
+    hits: int
+    conditions_covered: int = 0
+    conditions: int = 0
+
+    def add(self, hits: int, covered: int, total: int) -> None:
+        self.hits += hits
+        if total and covered * self.conditions >= self.conditions_covered * total:
+            self.conditions_covered = covered
+            self.conditions = total
+
+
+@dataclasses.dataclass(slots=True)
+class _Counts:
+    lines: int = 0
+    lines_covered: int = 0
+    branches: int = 0
+    branches_covered: int = 0
+
+    def __iadd__(self, other: _Counts) -> _Counts:
+        self.lines += other.lines
+        self.lines_covered += other.lines_covered
+        self.branches += other.branches
+        self.branches_covered += other.branches_covered
+        return self
+
+    def rates(self) -> dict[str, str]:
+        return {
+            "line-rate": _rate(self.lines_covered, self.lines),
+            "branch-rate": _rate(self.branches_covered, self.branches),
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class _Class:
+    name: str
+    filename: str
+    methods: bytes | None = None
+    lines: dict[int, _Line] = dataclasses.field(default_factory=dict)
+
+    def counts(self) -> _Counts:
+        counts = _Counts(lines=len(self.lines))
+        for line in self.lines.values():
+            counts.lines_covered += line.hits > 0
+            counts.branches += line.conditions
+            counts.branches_covered += line.conditions_covered
+        return counts
+
+
+@dataclasses.dataclass(slots=True)
+class _Package:
+    name: str
+    classes: dict[str, _Class] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class _Report:
+    root: dict[str, str] = dataclasses.field(default_factory=dict)
+    sources: dict[str, None] = dataclasses.field(default_factory=dict)
+    packages: dict[str, _Package] = dataclasses.field(default_factory=dict)
+
+
+def _rate(covered: int, total: int) -> str:
+    """Return ``covered / total`` formatted like coverage.py's reports."""
+    if total == 0:
+        return "0"
+    return f"{covered / total:.4g}"
+
+
+def _fold_class(
+    report: _Report,
+    package: str,
+    element: typ.Any,  # noqa: ANN401 - lxml element
+) -> None:
+    """Fold one parsed ``<class>`` element into ``report``."""
+    etree = _etree()
+    pkg = report.packages.setdefault(package, _Package(package))
+    filename = element.get("filename", "")
+    cls = pkg.classes.get(filename)
+    if cls is None:
+        cls = pkg.classes[filename] = _Class(element.get("name", filename), filename)
+        methods = element.find("methods")
+        if methods is not None:
+            cls.methods = etree.tostring(methods)
+    for line in element.iterfind("lines/line"):
+        number = int(line.get("number"))
+        hits = int(float(line.get("hits", "0")))
+        covered, total = line_conditions(line)
+        existing = cls.lines.get(number)
+        if existing is None:
+            cls.lines[number] = _Line(hits, covered, total)
+        else:
+            existing.add(hits, covered, total)
+
+
+def _read_report(report: _Report, path: Path) -> None:
+    """Stream ``path`` into ``report``, clearing elements once consumed."""
+    etree = _etree()
+    package = ""
+    context = etree.iterparse(
+        str(path), events=("start", "end"), remove_blank_text=True
+    )
+    for event, element in context:
+        tag = element.tag
+        if event == "start":
+            if tag == "coverage" and not report.root:
+                report.root = dict(element.attrib)
+            elif tag == "package":
+                package = element.get("name", "")
+            continue
+        if tag == "source":
+            if element.text:
+                report.sources.setdefault(element.text.strip(), None)
+        elif tag == "class":
+            _fold_class(report, package, element)
+        elif tag != "package":
+            continue
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _line_attrs(number: int, line: _Line) -> dict[str, str]:
+    attrs = {"number": str(number), "hits": str(line.hits)}
+    if line.conditions:
+        percent = line.conditions_covered * 100 // line.conditions
+        attrs["branch"] = "true"
+        attrs["condition-coverage"] = (
+            f"{percent}% ({line.conditions_covered}/{line.conditions})"
+        )
+    return attrs
+
+
+def _package_counts(report: _Report) -> cabc.Iterator[tuple[_Package, _Counts]]:
+    for package in report.packages.values():
+        counts = _Counts()
+        for cls in package.classes.values():
+            counts += cls.counts()
+        yield package, counts
+
+
+def _write_report(report: _Report, output: Path) -> None:
+    """Write ``report`` to ``output`` element by element."""
+    etree = _etree()
+    packages = list(_package_counts(report))
+    totals = _Counts()
+    for _, counts in packages:
+        totals += counts
+    root = {
+        **report.root,
+        "lines-valid": str(totals.lines),
+        "lines-covered": str(totals.lines_covered),
+        "branches-valid": str(totals.branches),
+        "branches-covered": str(totals.branches_covered),
+        **totals.rates(),
+    }
+    root.setdefault("complexity", "0")
+    with etree.xmlfile(str(output), encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("coverage", root):
+            with xf.element("sources"):
+                for source in report.sources:
+                    element = etree.Element("source")
+                    element.text = source
+                    xf.write(element)
+            with xf.element("packages"):
+                for package, counts in packages:
+                    attrs = {"name": package.name, **counts.rates(), "complexity": "0"}
+                    with xf.element("package", attrs), xf.element("classes"):
+                        for cls in package.classes.values():
+                            _write_class(xf, cls)
+
+
+def _write_class(xf: typ.Any, cls: _Class) -> None:  # noqa: ANN401 - lxml writer
+    etree = _etree()
+    attrs = {
+        "name": cls.name,
+        "filename": cls.filename,
+        **cls.counts().rates(),
+        "complexity": "0",
+    }
+    with xf.element("class", attrs):
+        if cls.methods is not None:
+            xf.write(etree.fromstring(cls.methods))
+        else:
+            xf.write(etree.Element("methods"))
+        with xf.element("lines"):
+            for number, line in sorted(cls.lines.items()):
+                xf.write(etree.Element("line", _line_attrs(number, line)))
+
+
+def _read_reports(inputs: cabc.Iterable[Path]) -> _Report:
+    """Return the classes of every report in ``inputs`` folded together."""
+    etree = _etree()
+    report = _Report()
+    for path in inputs:
+        if not path.is_file():
+            raise FileNotFoundError(path)
+        try:
+            _read_report(report, path)
+        except (etree.XMLSyntaxError, TypeError, ValueError) as exc:
+            msg = f"Invalid Cobertura data in {path}: {exc}"
+            raise CoberturaMergeError(msg) from exc
+    return report
+
+
+def _write_atomically(report: _Report, output: Path) -> None:
+    """Write ``report`` beside ``output`` and move it into place once complete."""
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        os.close(fd)
+        _write_report(report, tmp_path)
+        tmp_path.replace(output)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def _keep_classes(report: _Report, keep: cabc.Callable[[str], bool]) -> None:
+    """Drop the classes whose ``filename`` fails ``keep``, then empty packages."""
+    for package in report.packages.values():
+        package.classes = {
+            filename: cls for filename, cls in package.classes.items() if keep(filename)
+        }
+    report.packages = {
+        name: package for name, package in report.packages.items() if package.classes
+    }
+
+
+def merge_cobertura_files(inputs: cabc.Sequence[Path], output: Path) -> None:
+    """Merge the Cobertura reports ``inputs`` into ``output``.
+
+    ``output`` may also be one of the inputs; the result is written to a
+    temporary file alongside it and moved into place once complete.
+
+    Raises
+    ------
+    CoberturaMergeError
+        If no inputs are given or an input is not valid Cobertura XML.
+    OSError
+        If an input cannot be read or the output cannot be written.
+    """
+    if not inputs:
+        msg = "At least one Cobertura input is required"
+        raise CoberturaMergeError(msg)
+    _write_atomically(_read_reports(inputs), output)
+
+
+def overlay_cobertura_files(
+    base: Path,
+    overlay: Path | None,
+    output: Path,
+    *,
+    replace: cabc.Callable[[str], bool],
+) -> None:
+    """Write ``base`` to ``output`` with the classes ``replace`` selects swapped.
+
+    Classes of ``base`` whose ``filename`` satisfies ``replace`` are dropped
+    and the classes of ``overlay`` that satisfy it take their place; hits are
+    not summed. Without ``overlay`` the selected classes are only dropped.
+    Totals and rates are recomputed as for :func:`merge_cobertura_files`, and
+    ``output`` may be either input.
+
+    Raises
+    ------
+    CoberturaMergeError
+        If an input is not valid Cobertura XML.
+    OSError
+        If an input cannot be read or the output cannot be written.
+    """
+    report = _read_reports([base])
+    _keep_classes(report, lambda filename: not replace(filename))
+    if overlay is not None:
+        update = _read_reports([overlay])
+        _keep_classes(update, replace)
+        for source in update.sources:
+            report.sources.setdefault(source, None)
+        for name, package in update.packages.items():
+            target = report.packages.setdefault(name, _Package(name))
+            target.classes.update(package.classes)
+    _write_atomically(report, output)
@@ -0,0 +1,466 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["typer", "lxml"]
+# ///
+"""Convert coverage reports between LCOV and Cobertura XML.
+
+Both directions stream their input. LCOV tracefiles are read one ``SF:``
+record at a time and each record becomes one Cobertura ``<class>``; because
+Cobertura carries its totals as attributes of the enclosing elements, the
+tracefile is read twice, first to count and then to write. Cobertura reports
+are read with :func:`lxml.etree.iterparse` and each ``<class>`` becomes one
+LCOV record as soon as it has been parsed.
+
+Cobertura keeps only a covered/total condition count per line, so a converted
+LCOV report lists that many ``BRDA`` entries per branch line, marking the
+first ``covered`` of them as taken once. Going the other way, ``BRDA`` taken
+counts collapse into a ``condition-coverage`` attribute. Line hits and
+function hits survive both directions unchanged.
+
+:func:`merge_reports` builds on the converters so that reports can be merged
+whatever format each tool emitted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import itertools
+import os
+import posixpath
+import shutil
+import tempfile
+import typing as typ
+from pathlib import Path
+
+import typer
+from cobertura_merge import (
+    _Counts,
+    _Line,
+    _line_attrs,
+    merge_cobertura_files,
+)
+from coverage_parsers import _etree, line_conditions
+from lcov_merge import (
+    _FN_RE,
+    LcovFormatError,
+    _iter_records,
+    _Record,
+    merge_lcov_files,
+)
+from phase_timing import span
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+
+__all__ = [
+    "REPORT_FORMATS",
+    "CoverageConversionError",
+    "cobertura_to_lcov",
+    "convert_report",
+    "detect_report_format",
+    "lcov_to_cobertura",
+    "merge_reports",
+]
+
+REPORT_FORMATS = ("lcov", "cobertura")
+_SUFFIXES = {"lcov": ".info", "cobertura": ".xml"}
+
+
+class CoverageConversionError(ValueError):
+    """Raised when a report cannot be converted."""
+
+
+def detect_report_format(path: Path) -> str:
+    """Return ``"cobertura"`` for XML reports and ``"lcov"`` otherwise.
+
+    Only the first non-blank bytes of ``path`` are inspected.
+    """
+    with path.open("rb") as fh:
+        head = fh.read(512)
+    head = head.removeprefix(b"\xef\xbb\xbf").lstrip()
+    return "cobertura" if head.startswith(b"<") else "lcov"
+
+
+@dataclasses.dataclass(slots=True)
+class _LcovFile:
+    """Coverage of one LCOV record, reshaped for Cobertura."""
+
+    source: str
+    lines: dict[int, _Line] = dataclasses.field(default_factory=dict)
+    functions: dict[str, int] = dataclasses.field(default_factory=dict)
+    function_hits: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def counts(self) -> _Counts:
+        counts = _Counts(lines=len(self.lines))
+        for line in self.lines.values():
+            counts.lines_covered += line.hits > 0
+            counts.branches += line.conditions
+            counts.branches_covered += line.conditions_covered
+        return counts
+
+
+def _function_entry(value: str) -> tuple[int, str]:
+    """Return the start line and name of an ``FN`` value; names may hold commas."""
+    match = _FN_RE.match(value)
+    if match is None:
+        raise ValueError(value)
+    return int(match[1]), match[3]
+
+
+def _parse_lcov_record(record: _Record, origin: Path) -> _LcovFile:
+    """Return the line, branch and function coverage held in ``record``."""
+    parsed = _LcovFile(record.source or "")
+    for line in record.lines:
+        tag, _, value = line.partition(":")
+        try:
+            if tag == "DA":
+                lineno, count, *_ = value.split(",")
+                entry = parsed.lines.setdefault(int(lineno), _Line(0))
+                entry.hits += int(count)
+            elif tag == "BRDA":
+                lineno, _block, _branch, taken = value.split(",")
+                entry = parsed.lines.setdefault(int(lineno), _Line(0))
+                entry.conditions += 1
+                entry.conditions_covered += taken not in {"-", "0"}
+            elif tag == "FN":
+                lineno, name = _function_entry(value)
+                parsed.functions.setdefault(name, lineno)
+            elif tag == "FNDA":
+                count, name = value.split(",", 1)
+                hits = parsed.function_hits.get(name, 0) + int(count)
+                parsed.function_hits[name] = hits
+        except ValueError as exc:
+            msg = f"Malformed lcov data in {origin}: {line!r}"
+            raise LcovFormatError(msg) from exc
+    return parsed
+
+
+def _parsed_records(lcov: Path) -> cabc.Iterator[_LcovFile]:
+    for record in _iter_records(lcov):
+        if record.source is None:
+            continue
+        yield _parse_lcov_record(record, lcov)
+
+
+def _relative_source(source: str, source_root: Path | None) -> str:
+    """Return ``source`` relative to ``source_root`` when it lies beneath it."""
+    path = Path(source)
+    if source_root is not None and path.is_absolute():
+        with contextlib.suppress(ValueError):
+            return path.relative_to(source_root).as_posix()
+    return source
+
+
+def _package_name(filename: str) -> str:
+    return posixpath.dirname(filename.replace("\\", "/")) or "."
+
+
+def _lcov_packages(
+    lcov: Path, source_root: Path | None
+) -> list[tuple[str, int, _Counts]]:
+    """Return ``(package, class count, totals)`` for each run of records.
+
+    Consecutive records in the same directory form one package; the list is
+    replayed while the second pass writes the report.
+    """
+    packages: list[tuple[str, int, _Counts]] = []
+    for name, group in itertools.groupby(
+        _parsed_records(lcov),
+        key=lambda parsed: _package_name(_relative_source(parsed.source, source_root)),
+    ):
+        counts = _Counts()
+        size = 0
+        for parsed in group:
+            counts += parsed.counts()
+            size += 1
+        packages.append((name, size, counts))
+    return packages
+
+
+def _write_lcov_class(
+    xf: typ.Any,  # noqa: ANN401 - lxml writer
+    parsed: _LcovFile,
+    filename: str,
+) -> None:
+    etree = _etree()
+    attrs = {
+        "name": posixpath.basename(filename),
+        "filename": filename,
+        **parsed.counts().rates(),
+        "complexity": "0",
+    }
+    with xf.element("class", attrs):
+        with xf.element("methods"):
+            for name, lineno in parsed.functions.items():
+                hits = parsed.function_hits.get(name, 0)
+                rate = "1" if hits else "0"
+                method = etree.Element(
+                    "method",
+                    {
+                        "name": name,
+                        "signature": "",
+                        "line-rate": rate,
+                        "branch-rate": "0",
+                        "complexity": "0",
+                    },
+                )
+                lines = etree.SubElement(method, "lines")
+                etree.SubElement(
+                    lines, "line", {"number": str(lineno), "hits": str(hits)}
+                )
+                xf.write(method)
+        with xf.element("lines"):
+            for number, line in sorted(parsed.lines.items()):
+                xf.write(etree.Element("line", _line_attrs(number, line)))
+
+
+def _write_cobertura(lcov: Path, output: Path, source_root: Path | None) -> None:
+    etree = _etree()
+    packages = _lcov_packages(lcov, source_root)
+    totals = _Counts()
+    for _, _, counts in packages:
+        totals += counts
+    root = {
+        "version": "lcov",
+        "lines-valid": str(totals.lines),
+        "lines-covered": str(totals.lines_covered),
+        "branches-valid": str(totals.branches),
+        "branches-covered": str(totals.branches_covered),
+        **totals.rates(),
+        "complexity": "0",
+    }
+    records = _parsed_records(lcov)
+    with etree.xmlfile(str(output), encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("coverage", root):
+            with xf.element("sources"):
+                source = etree.Element("source")
+                source.text = str(source_root) if source_root is not None else "."
+                xf.write(source)
+            with xf.element("packages"):
+                for name, size, counts in packages:
+                    attrs = {"name": name, **counts.rates(), "complexity": "0"}
+                    with xf.element("package", attrs), xf.element("classes"):
+                        for parsed in itertools.islice(records, size):
+                            filename = _relative_source(parsed.source, source_root)
+                            _write_lcov_class(xf, parsed, filename)
+
+
+def _atomic_write(output: Path, write: cabc.Callable[[Path], object]) -> None:
+    """Call ``write`` on a temporary file beside ``output``, then move it into place."""
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        os.close(fd)
+        write(tmp_path)
+        tmp_path.replace(output)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def lcov_to_cobertura(
+    lcov: Path, output: Path, *, source_root: Path | None = None
+) -> None:
+    """Convert the LCOV tracefile ``lcov`` to a Cobertura report at ``output``.
+
+    Absolute ``SF:`` paths beneath ``source_root`` are written relative to it
+    and ``source_root`` becomes the report's ``<source>``. Records in the same
+    directory are grouped into one ``<package>``.
+
+    Raises
+    ------
+    LcovFormatError
+        If ``lcov`` is empty, truncated or contains an unparsable line.
+    OSError
+        If ``lcov`` cannot be read or ``output`` cannot be written.
+    """
+    _atomic_write(output, lambda tmp: _write_cobertura(lcov, tmp, source_root))
+
+
+def _class_sources(
+    xml_file: Path,
+) -> cabc.Iterator[tuple[str, typ.Any]]:
+    """Yield ``(source path, <class> element)`` pairs from ``xml_file``.
+
+    Each element is cleared once the caller resumes the generator.
+    """
+    etree = _etree()
+    source = ""
+    context = etree.iterparse(str(xml_file), events=("end",), remove_blank_text=True)
+    for _, element in context:
+        if element.tag == "source":
+            if not source and element.text:
+                source = element.text.strip()
+            continue
+        if element.tag != "class":
+            continue
+        filename = element.get("filename", "")
+        if source not in {"", "."} and not Path(filename).is_absolute():
+            filename = posixpath.join(source.replace("\\", "/"), filename)
+        yield filename, element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _lcov_record(filename: str, element: typ.Any) -> cabc.Iterator[str]:  # noqa: ANN401 - lxml element
+    """Yield the LCOV lines describing one Cobertura ``<class>``."""
+    yield f"SF:{filename}"
+    functions: list[tuple[str, int, int]] = []
+    for method in element.iterfind("methods/method"):
+        first = method.find("lines/line")
+        if first is None:
+            continue
+        functions.append(
+            (
+                method.get("name", ""),
+                int(first.get("number")),
+                int(float(first.get("hits", "0"))),
+            )
+        )
+    for name, lineno, _ in functions:
+        yield f"FN:{lineno},{name}"
+    for name, _, hits in functions:
+        yield f"FNDA:{hits},{name}"
+    if functions:
+        yield f"FNF:{len(functions)}"
+        yield f"FNH:{sum(1 for *_, hits in functions if hits)}"
+    lines: list[tuple[int, int]] = []
+    branches = covered_branches = 0
+    for line in element.iterfind("lines/line"):
+        number = int(line.get("number"))
+        hits = int(float(line.get("hits", "0")))
+        lines.append((number, hits))
+        covered, total = line_conditions(line)
+        for index in range(total):
+            taken = "1" if index < covered else ("0" if hits else "-")
+            yield f"BRDA:{number},0,{index},{taken}"
+        branches += total
+        covered_branches += covered
+    if branches:
+        yield f"BRF:{branches}"
+        yield f"BRH:{covered_branches}"
+    for number, hits in lines:
+        yield f"DA:{number},{hits}"
+    yield f"LF:{len(lines)}"
+    yield f"LH:{sum(1 for _, hits in lines if hits)}"
+    yield "end_of_record"
+
+
+def _write_lcov(xml_file: Path, output: Path) -> None:
+    etree = _etree()
+    try:
+        with output.open("w", encoding="utf-8", newline="\n") as fh:
+            for filename, element in _class_sources(xml_file):
+                for line in _lcov_record(filename, element):
+                    fh.write(line)
+                    fh.write("\n")
+    except (etree.XMLSyntaxError, TypeError, ValueError) as exc:
+        msg = f"Invalid Cobertura data in {xml_file}: {exc}"
+        raise CoverageConversionError(msg) from exc
+
+
+def cobertura_to_lcov(xml_file: Path, output: Path) -> None:
+    """Convert the Cobertura report ``xml_file`` to an LCOV tracefile at ``output``.
+
+    Relative class filenames are joined to the first ``<source>`` so that
+    ``SF:`` paths resolve outside the report. Each ``<class>`` becomes one
+    record, so a file split across several classes yields several records;
+    :func:`merge_reports` combines them.
+
+    Raises
+    ------
+    CoverageConversionError
+        If ``xml_file`` is not valid Cobertura XML.
+    OSError
+        If ``xml_file`` cannot be read or ``output`` cannot be written.
+    """
+    _atomic_write(output, lambda tmp: _write_lcov(xml_file, tmp))
+
+
+def convert_report(
+    source: Path, output: Path, fmt: str, *, source_root: Path | None = None
+) -> None:
+    """Write ``source`` to ``output`` as ``fmt``, converting only when needed."""
+    if fmt not in REPORT_FORMATS:
+        msg = f"Unsupported report format: {fmt}"
+        raise CoverageConversionError(msg)
+    if detect_report_format(source) == fmt:
+        if source != output:
+            _atomic_write(output, lambda tmp: shutil.copyfile(source, tmp))
+    elif fmt == "cobertura":
+        lcov_to_cobertura(source, output, source_root=source_root)
+    else:
+        cobertura_to_lcov(source, output)
+
+
+def merge_reports(
+    inputs: cabc.Sequence[Path],
+    output: Path,
+    fmt: str,
+    *,
+    source_root: Path | None = None,
+) -> None:
+    """Merge ``inputs``, each LCOV or Cobertura, into a ``fmt`` report at ``output``.
+
+    Inputs already in ``fmt`` are merged directly; the rest are converted to a
+    temporary file first. ``output`` may be one of the inputs.
+
+    Raises
+    ------
+    CoverageConversionError
+        If ``fmt`` is unsupported or an input cannot be converted.
+    cobertura_merge.CoberturaMergeError, LcovFormatError
+        If an input is malformed.
+    OSError
+        If an input cannot be read or the output cannot be written.
+    """
+    if fmt not in REPORT_FORMATS:
+        msg = f"Unsupported report format: {fmt}"
+        raise CoverageConversionError(msg)
+    with tempfile.TemporaryDirectory(
+        prefix=f".{output.name}.", dir=output.parent
+    ) as tmp:
+        native: list[Path] = []
+        for index, path in enumerate(inputs):
+            if detect_report_format(path) == fmt:
+                native.append(path)
+                continue
+            converted = Path(tmp) / f"{index}{_SUFFIXES[fmt]}"
+            with span("convert"):
+                convert_report(path, converted, fmt, source_root=source_root)
+            native.append(converted)
+        with span("merge"):
+            if fmt == "cobertura":
+                merge_cobertura_files(native, output)
+            else:
+                merge_lcov_files(native, output)
+
+
+def main(
+    source: typ.Annotated[Path, typer.Argument(exists=True, dir_okay=False)],
+    output_path: typ.Annotated[Path, typer.Option("--output-path", "-o")],
+    to: typ.Annotated[str, typer.Option("--to", help="lcov or cobertura")],
+    source_root: typ.Annotated[
+        Path | None,
+        typer.Option(help="Directory that Cobertura filenames are relative to."),
+    ] = None,
+) -> None:
+    """Convert ``source`` to the ``--to`` format at ``output_path``."""
+    try:
+        convert_report(
+            source, output_path, to.lower(), source_root=source_root or Path.cwd()
+        )
+    except (CoverageConversionError, LcovFormatError, OSError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -2,49 +2,148 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import math
+import mmap
+import os
 import re
 import typing as typ
 from decimal import ROUND_HALF_UP, Decimal
+from functools import cache
 
 import typer
-
-try:  # runtime import for graceful fallback
-    from lxml import etree
-except ImportError as exc:  # pragma: no cover - fail fast if dependency missing
-    typer.echo(
-        "lxml is required for Cobertura parsing. Install with 'pip install lxml'.",
-        err=True,
-    )
-    raise typer.Exit(1) from exc
+from phase_timing import span
 
 logger = logging.getLogger(__name__)
 
 # Match coverage.py's CLI output which rounds half up to two decimal places.
 # ROUND_HALF_UP ensures we report the same values as the tool's summary.
 QUANT = Decimal("0.01")
+_CONDITION_RE = re.compile(r"\((\d+)/(\d+)\)")
 
 if typ.TYPE_CHECKING:  # pragma: no cover - import for type hints only
     from pathlib import Path
+    from types import ModuleType
 
 
-def get_line_coverage_percent_from_cobertura(xml_file: Path) -> str:
-    """Return the overall line coverage percentage from a Cobertura XML file.
+@cache
+def _etree() -> ModuleType:
+    """Import :mod:`lxml.etree` on first use.
 
-    Parameters
-    ----------
-    xml_file : Path
-        Path to the coverage file to read.
+    Only Cobertura parsing needs lxml, so LCOV-only runs skip its import cost.
+    """
+    try:
+        from lxml import etree
+    except ImportError as exc:  # pragma: no cover - fail fast if dependency missing
+        typer.echo(
+            "lxml is required for Cobertura parsing. Install with 'pip install lxml'.",
+            err=True,
+        )
+        raise typer.Exit(1) from exc
+    return etree
 
-    Returns
-    -------
-    str
-        The coverage percentage with two decimal places. ``"0.00"`` is returned
-        if the file cannot be read or parsed.
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CoberturaTotals:
+    """Line and branch counts summed over a Cobertura report."""
+
+    lines_covered: int = 0
+    lines_valid: int = 0
+    branches_covered: int = 0
+    branches_valid: int = 0
+
+    @property
+    def line_percent(self) -> str:
+        """Return the line coverage percentage with two decimal places."""
+        return _percent(self.lines_covered, self.lines_valid)
+
+    @property
+    def branch_percent(self) -> str:
+        """Return the branch coverage percentage with two decimal places."""
+        return _percent(self.branches_covered, self.branches_valid)
+
+
+def _percent(covered: int, total: int) -> str:
+    if total == 0:
+        return "0.00"
+    percent = (Decimal(covered) / Decimal(total) * 100).quantize(
+        QUANT, rounding=ROUND_HALF_UP
+    )
+    return f"{percent}"
+
+
+def _count_attr(element: typ.Any, name: str) -> int:  # noqa: ANN401 - lxml element
+    """Return the numeric attribute ``name`` of ``element``, or ``0``."""
+    try:
+        value = float(element.get(name, "nan"))
+    except ValueError:
+        return 0
+    return 0 if math.isnan(value) else int(value)
+
+
+def line_conditions(line: typ.Any) -> tuple[int, int]:  # noqa: ANN401 - lxml element
+    """Return ``(covered, total)`` from a ``<line>``'s ``condition-coverage``."""
+    if line.get("branch") != "true":
+        return 0, 0
+    match = _CONDITION_RE.search(line.get("condition-coverage", ""))
+    if match is None:
+        return 0, 0
+    return int(match[1]), int(match[2])
+
+
+def _scan_cobertura(source: typ.BinaryIO) -> CoberturaTotals:
+    """Count lines and branches in one pass over ``source``.
+
+    Only ``<line>`` elements directly under ``<class><lines>`` are counted;
+    method-level duplicates are ignored. Each ``<class>`` is cleared once
+    counted, so memory stays bounded by the largest class. When the report
+    carries no per-line detail, the root summary attributes are used instead.
+    """
+    etree = _etree()
+    lines_valid = lines_covered = branches_valid = branches_covered = 0
+    context = etree.iterparse(source, events=("end",), tag="class")
+    for _, element in context:
+        for line in element.iterfind("lines/line"):
+            lines_valid += 1
+            # Most uncovered lines carry a literal "0"; skip parsing those.
+            if line.get("hits", "0") != "0" and _count_attr(line, "hits") > 0:
+                lines_covered += 1
+            if line.get("branch") == "true":
+                covered, total = line_conditions(line)
+                branches_covered += covered
+                branches_valid += total
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    root = context.root
+    if root is None:
+        return CoberturaTotals()
+    if lines_valid == 0:
+        lines_covered = _count_attr(root, "lines-covered")
+        lines_valid = _count_attr(root, "lines-valid")
+    if branches_valid == 0:
+        branches_covered = _count_attr(root, "branches-covered")
+        branches_valid = _count_attr(root, "branches-valid")
+    return CoberturaTotals(lines_covered, lines_valid, branches_covered, branches_valid)
+
+
+@span("parse")
+def read_cobertura_totals(xml_file: Path) -> CoberturaTotals:
+    """Return the line and branch totals of a Cobertura XML file.
+
+    The file is streamed with :func:`lxml.etree.iterparse` rather than loaded
+    as a tree, so large reports are counted in a single pass.
+
+    Raises
+    ------
+    typer.Exit
+        If the file cannot be read or is not well-formed XML.
     """
+    etree = _etree()
     try:
-        root = etree.parse(str(xml_file)).getroot()
+        with xml_file.open("rb") as fh:
+            return _scan_cobertura(fh)
     except FileNotFoundError as exc:
         typer.echo(f"Coverage file not found: {xml_file}", err=True)
         raise typer.Exit(1) from exc
@@ -58,71 +157,136 @@ def get_line_coverage_percent_from_cobertura(xml_file: Path) -> str:
         typer.echo(f"Failed to parse coverage file {xml_file}: {exc}", err=True)
         raise typer.Exit(1) from exc
 
-    def num_or_zero(expr: str) -> int:
-        try:
-            n = typ.cast("float", root.xpath(f"number({expr})"))
-        except Exception:  # noqa: BLE001 - defensive
-            return 0
-        else:
-            return 0 if math.isnan(n) else int(n)
-
-    def lines_from_detail() -> tuple[int, int]:
-        try:
-            total = int(typ.cast("float", root.xpath("count(//class/lines/line)")))
-            covered = int(
-                typ.cast(
-                    "float",
-                    root.xpath("count(//class/lines/line[number(@hits) > 0])"),
-                )
+
+def get_line_coverage_percent_from_cobertura(xml_file: Path) -> str:
+    """Return the overall line coverage percentage from a Cobertura XML file.
+
+    Parameters
+    ----------
+    xml_file : Path
+        Path to the coverage file to read.
+
+    Returns
+    -------
+    str
+        The coverage percentage with two decimal places. ``"0.00"`` is
+        returned when the report has no lines.
+    """
+    return read_cobertura_totals(xml_file).line_percent
+
+
+@dataclasses.dataclass(slots=True)
+class LcovTotals:
+    """Counts from the LCOV ``LF``/``LH``, ``BRF``/``BRH`` and ``FNF``/``FNH`` tags."""
+
+    lines_found: int = 0
+    lines_hit: int = 0
+    branches_found: int = 0
+    branches_hit: int = 0
+    functions_found: int = 0
+    functions_hit: int = 0
+
+    @property
+    def line_percent(self) -> str:
+        """Return the line coverage percentage with two decimal places."""
+        return _percent(self.lines_hit, self.lines_found)
+
+    @property
+    def branch_percent(self) -> str:
+        """Return the branch coverage percentage with two decimal places."""
+        return _percent(self.branches_hit, self.branches_found)
+
+    @property
+    def function_percent(self) -> str:
+        """Return the function coverage percentage with two decimal places."""
+        return _percent(self.functions_hit, self.functions_found)
+
+
+@dataclasses.dataclass(slots=True)
+class LcovSummary:
+    """Totals for a whole LCOV file and, optionally, for each source file."""
+
+    totals: LcovTotals = dataclasses.field(default_factory=LcovTotals)
+    files: dict[str, LcovTotals] = dataclasses.field(default_factory=dict)
+
+    def worst_files(self, limit: int = 10) -> list[tuple[str, LcovTotals]]:
+        """Return up to ``limit`` files with lines, least covered first."""
+        measured = [item for item in self.files.items() if item[1].lines_found]
+        measured.sort(
+            key=lambda item: (
+                item[1].lines_hit / item[1].lines_found,
+                -item[1].lines_found,
+                item[0],
             )
-        except Exception:  # noqa: BLE001 - defensive
-            return 0, 0
-        else:
-            return covered, total
+        )
+        return measured[:limit]
 
-    covered, total = lines_from_detail()
-    if total == 0:
-        covered = num_or_zero("/coverage/@lines-covered")
-        total = num_or_zero("/coverage/@lines-valid")
 
-    if total == 0:
-        return "0.00"
+_LCOV_FIELDS: dict[bytes, str] = {
+    b"LF": "lines_found",
+    b"LH": "lines_hit",
+    b"BRF": "branches_found",
+    b"BRH": "branches_hit",
+    b"FNF": "functions_found",
+    b"FNH": "functions_hit",
+}
+# Only summary tags with a purely numeric value count, matching the historical
+# ``^LF:(\d+)$`` scan; malformed values are ignored rather than fatal.
+_LCOV_SUMMARY_RE = re.compile(
+    rb"^(?:(LF|LH|BRF|BRH|FNF|FNH):(\d+)|SF:(.*?))\r?$", re.MULTILINE
+)
 
-    percent = (Decimal(covered) / Decimal(total) * 100).quantize(
-        QUANT, rounding=ROUND_HALF_UP
-    )
-    return f"{percent}"
 
+def _scan_lcov(data: mmap.mmap | bytes, *, per_file: bool) -> LcovSummary:
+    """Sum the summary tags in ``data`` in a single pass over its bytes."""
+    summary = LcovSummary()
+    totals = summary.totals
+    current: LcovTotals | None = None
+    for match in _LCOV_SUMMARY_RE.finditer(data):
+        tag, value, source = match.groups()
+        if tag is None:
+            if per_file:
+                name = source.decode("utf-8", errors="replace")
+                current = summary.files.setdefault(name, LcovTotals())
+            continue
+        field = _LCOV_FIELDS[tag]
+        count = int(value)
+        setattr(totals, field, getattr(totals, field) + count)
+        if current is not None:
+            setattr(current, field, getattr(current, field) + count)
+    return summary
 
-def get_line_coverage_percent_from_lcov(lcov_file: Path) -> str:
-    """Return the overall line coverage percentage from an ``lcov.info`` file."""
+
+@span("parse")
+def read_lcov_totals(lcov_file: Path, *, per_file: bool = False) -> LcovSummary:
+    """Return the summary totals of an ``lcov.info`` file.
+
+    The file is memory-mapped and scanned once at the byte level, so it is
+    never decoded into a Python string. With ``per_file`` the totals are also
+    broken down by ``SF:`` source path.
+
+    Raises
+    ------
+    typer.Exit
+        If the file cannot be read.
+    """
     try:
-        text = lcov_file.read_text(encoding="utf-8")
+        with lcov_file.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return LcovSummary()
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _scan_lcov(data, per_file=per_file)
     except OSError as exc:
         typer.echo(f"Could not read {lcov_file}: {exc}", err=True)
         raise typer.Exit(1) from exc
 
-    def total(tag: str) -> int:
-        values = re.findall(rf"^{tag}:(\d+)$", text, flags=re.MULTILINE)
-        try:
-            return sum(int(v) for v in values)
-        except ValueError as exc:
-            typer.echo(f"Malformed lcov data in {lcov_file}: {exc}", err=True)
-            raise typer.Exit(1) from exc
-
-    lines_found = total("LF")
-    lines_hit = total("LH")
 
-    if lines_found == 0:
+def get_line_coverage_percent_from_lcov(lcov_file: Path) -> str:
+    """Return the overall line coverage percentage from an ``lcov.info`` file."""
+    totals = read_lcov_totals(lcov_file).totals
+    if totals.lines_found == 0:
         logger.warning(
             "No lines found in lcov data. This may indicate an empty or "
             "misconfigured lcov file."
         )
-
-    if lines_found == 0:
-        return "0.00"
-
-    percent = (Decimal(lines_hit) / Decimal(lines_found) * 100).quantize(
-        QUANT, rounding=ROUND_HALF_UP
-    )
-    return f"{percent}"
+    return totals.line_percent
@@ -202,8 +202,8 @@ def _check_format_compatibility(lang: Lang, fmt: CoverageFmt) -> None:
             _fail("coveragepy format only supported for Python projects")
         case (Lang.PYTHON, CoverageFmt.LCOV):
             _fail("lcov format only supported for Rust projects")
-        case (Lang.MIXED, other) if other != CoverageFmt.COBERTURA:
-            _fail("Mixed projects only support cobertura format")
+        case (Lang.MIXED, CoverageFmt.COVERAGEPY):
+            _fail("Mixed projects only support cobertura or lcov format")
 
 
 def main(
@@ -0,0 +1,351 @@
+"""Select the pytest tests a change can affect from a recorded impact map.
+
+A full coverage run on the default branch loads the
+``generate_coverage_impact`` pytest plugin, which records the files below the
+working directory that each test executes. :func:`collect_impact_map` folds
+the per-worker records into an :class:`ImpactMap` keyed to the commit it was
+recorded at, and ``run_python.py`` stores it next to the Cobertura report of
+that run, the *baseline*.
+
+On a pull request :func:`changed_files` lists what changed since the recorded
+commit and :func:`plan_selection` picks the tests to run:
+
+- tests that executed a changed or deleted Python file;
+- every test in a Python file added since the map was recorded.
+
+It falls back to the full suite when a change could reach tests the map cannot
+see: pytest or packaging configuration (``conftest.py``, ``pyproject.toml``,
+``uv.lock`` and friends), a modified Python file no recorded test executed
+(for example a module of constants, which only runs at import), or any other
+file outside documentation and ``.github``. Files are compared at file
+granularity, so a test that only reads a module-level value of an otherwise
+executed file is not selected when that value changes.
+
+:func:`overlay_baseline` then takes the classes of the changed files from the
+partial report and everything else from the baseline.
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc  # noqa: TC003 - used at runtime
+import dataclasses
+import gzip
+import json
+import typing as typ
+from pathlib import Path, PurePosixPath
+
+from cobertura_merge import overlay_cobertura_files
+from phase_timing import span
+from plumbum import local
+from plumbum.commands.processes import CommandNotFound, ProcessExecutionError
+
+IMPACT_VERSION = 1
+MAP_NAME = "impact-map.json.gz"
+BASELINE_NAME = "baseline.xml"
+PLUGIN_NAME = "generate_coverage_impact"
+RECORD_ENV = "GENERATE_COVERAGE_IMPACT_OUT"
+SELECT_ENV = "GENERATE_COVERAGE_IMPACT_SELECT"
+# Changes to these can alter any test, whatever the map says.
+_FULL_RUN_NAMES = frozenset(
+    {
+        "conftest.py",
+        "pyproject.toml",
+        "pytest.ini",
+        "setup.cfg",
+        "setup.py",
+        "tox.ini",
+        "uv.lock",
+    }
+)
+# Changes to these cannot alter a test outcome or the Python coverage.
+_IGNORED_SUFFIXES = frozenset({".md", ".rst", ".adoc"})
+_IGNORED_DIRS = frozenset({".github", "docs"})
+_IGNORED_NAMES = frozenset({"LICENSE", ".gitignore", ".gitattributes"})
+
+__all__ = [
+    "BASELINE_NAME",
+    "IMPACT_VERSION",
+    "MAP_NAME",
+    "PLUGIN_NAME",
+    "RECORD_ENV",
+    "SELECT_ENV",
+    "Change",
+    "ImpactMap",
+    "ImpactRun",
+    "Selection",
+    "changed_files",
+    "collect_impact_map",
+    "current_commit",
+    "load_impact_map",
+    "overlay_baseline",
+    "plan_selection",
+    "save_impact_map",
+    "write_selection",
+]
+
+
+class Change(typ.NamedTuple):
+    """One ``git diff --name-status`` entry relative to the working directory."""
+
+    status: str
+    path: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ImpactMap:
+    """The files each test executed during the run recorded at ``sha``."""
+
+    sha: str
+    tests: cabc.Mapping[str, frozenset[str]]
+
+    def files(self) -> frozenset[str]:
+        """Return every file at least one test executed."""
+        return frozenset().union(*self.tests.values())
+
+    def tests_touching(self, paths: cabc.Iterable[str]) -> frozenset[str]:
+        """Return the node IDs of the tests that executed any of ``paths``."""
+        wanted = frozenset(paths)
+        return frozenset(
+            nodeid for nodeid, files in self.tests.items() if files & wanted
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class ImpactRun:
+    """How a coverage run applies test impact selection.
+
+    ``pytest_args`` load the plugin, ``skip_tests`` means the baseline is
+    reused as is, and ``partial`` that only some tests run. ``recorded`` is
+    set to the stored map once a recording run succeeds.
+    """
+
+    pytest_args: tuple[str, ...] = ()
+    skip_tests: bool = False
+    partial: bool = False
+    recorded: Path | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Selection:
+    """The outcome of :func:`plan_selection`.
+
+    ``reason`` is set, and the other fields are empty, when the full suite
+    must run. Otherwise ``nodeids`` and ``paths`` are what the plugin keeps
+    and ``replaced`` lists the report files the partial run supersedes.
+    """
+
+    nodeids: frozenset[str] = frozenset()
+    paths: frozenset[str] = frozenset()
+    replaced: frozenset[str] = frozenset()
+    reason: str | None = None
+
+    @property
+    def full(self) -> bool:
+        """Return ``True`` when the full suite must run."""
+        return self.reason is not None
+
+    @property
+    def empty(self) -> bool:
+        """Return ``True`` when no test needs to run at all."""
+        return not self.full and not self.nodeids and not self.paths
+
+
+def _full_run(reason: str) -> Selection:
+    return Selection(reason=reason)
+
+
+def collect_impact_map(directory: Path, sha: str) -> ImpactMap:
+    """Fold the per-worker files the plugin wrote to ``directory``."""
+    tests: dict[str, set[str]] = {}
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict) or data.get("version") != IMPACT_VERSION:
+            continue
+        raw = data.get("tests")
+        if not isinstance(raw, dict):
+            continue
+        for nodeid, files in raw.items():
+            tests.setdefault(str(nodeid), set()).update(map(str, files))
+    return ImpactMap(sha, {key: frozenset(files) for key, files in tests.items()})
+
+
+def save_impact_map(path: Path, impact_map: ImpactMap) -> None:
+    """Write ``impact_map`` to ``path`` as gzipped JSON, replacing it atomically.
+
+    Each file path is stored once and tests refer to it by index, which keeps
+    the artefact small for suites where most tests share a few modules.
+    """
+    files = sorted(impact_map.files())
+    index = {name: position for position, name in enumerate(files)}
+    payload = {
+        "version": IMPACT_VERSION,
+        "sha": impact_map.sha,
+        "files": files,
+        "tests": {
+            nodeid: sorted(index[name] for name in impact_map.tests[nodeid])
+            for nodeid in sorted(impact_map.tests)
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    tmp.write_bytes(gzip.compress(data, mtime=0))
+    tmp.replace(path)
+
+
+def load_impact_map(path: Path) -> ImpactMap | None:
+    """Return the map stored at ``path``, or ``None`` when it is unusable."""
+    try:
+        data = json.loads(gzip.decompress(path.read_bytes()))
+    except (OSError, EOFError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != IMPACT_VERSION:
+        return None
+    sha, files, raw = data.get("sha"), data.get("files"), data.get("tests")
+    if not isinstance(sha, str) or not isinstance(files, list):
+        return None
+    if not isinstance(raw, dict):
+        return None
+    try:
+        tests = {
+            str(nodeid): frozenset(files[position] for position in positions)
+            for nodeid, positions in raw.items()
+        }
+    except (IndexError, TypeError):
+        return None
+    return ImpactMap(sha, tests)
+
+
+def _git(*args: str) -> str | None:
+    """Return the stdout of ``git args``, or ``None`` when it fails."""
+    try:
+        return local["git"][args]()
+    except (CommandNotFound, ProcessExecutionError, OSError):
+        return None
+
+
+def current_commit() -> str | None:
+    """Return the commit checked out in the working directory."""
+    head = _git("rev-parse", "HEAD")
+    return head.strip() if head else None
+
+
+def changed_files(base: str) -> list[Change] | None:
+    """Return the files changed between ``base`` and the working tree.
+
+    Paths are relative to the working directory and changes outside it are
+    left out. ``base`` is fetched from ``origin`` first when the checkout is
+    too shallow to contain it. Returns ``None`` when git cannot tell.
+    """
+    if _git("cat-file", "-e", f"{base}^{{commit}}") is None:
+        _git("fetch", "--no-tags", "--depth=1", "origin", base)
+    output = _git("diff", "--name-status", "--no-renames", "--relative", base)
+    if output is None:
+        return None
+    changes: list[Change] = []
+    for line in output.splitlines():
+        status, _, path = line.partition("\t")
+        if path:
+            changes.append(Change(status[:1], path))
+    return changes
+
+
+def _ignored(path: PurePosixPath) -> bool:
+    return (
+        path.suffix in _IGNORED_SUFFIXES
+        or path.name in _IGNORED_NAMES
+        or path.parts[0] in _IGNORED_DIRS
+    )
+
+
+def _forces_full_run(path: PurePosixPath) -> bool:
+    return path.name in _FULL_RUN_NAMES or (
+        path.name.startswith("requirements") and path.suffix in {".txt", ".in"}
+    )
+
+
+def plan_selection(impact_map: ImpactMap, changes: cabc.Iterable[Change]) -> Selection:
+    """Return the tests to run for ``changes`` against ``impact_map``.
+
+    Parameters
+    ----------
+    impact_map : ImpactMap
+        Map recorded by the last full run.
+    changes : Iterable[Change]
+        Files changed since ``impact_map.sha``.
+
+    Returns
+    -------
+    Selection
+        The tests and report files to replace, or a full run with its reason.
+    """
+    recorded = impact_map.files()
+    touched: set[str] = set()
+    paths: set[str] = set()
+    for change in changes:
+        path = PurePosixPath(change.path)
+        if _forces_full_run(path):
+            return _full_run(f"{change.path} changed")
+        if path.suffix != ".py":
+            if _ignored(path):
+                continue
+            return _full_run(f"{change.path} is not a Python file")
+        if change.path in recorded:
+            touched.add(change.path)
+        elif change.status == "A":
+            paths.add(change.path)
+        elif change.status != "D":
+            return _full_run(f"no recorded test executed {change.path}")
+        else:
+            touched.add(change.path)
+    return Selection(
+        nodeids=impact_map.tests_touching(touched),
+        paths=frozenset(paths),
+        replaced=frozenset(touched | paths),
+    )
+
+
+def write_selection(path: Path, selection: Selection) -> None:
+    """Write the node IDs and files ``selection`` keeps for the pytest plugin."""
+    path.write_text(
+        json.dumps(
+            {
+                "version": IMPACT_VERSION,
+                "nodeids": sorted(selection.nodeids),
+                "paths": sorted(selection.paths),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _report_path(filename: str) -> str:
+    """Return a Cobertura class ``filename`` relative to the working directory."""
+    path = Path(filename)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(Path.cwd())
+        except ValueError:
+            return path.as_posix()
+    return path.as_posix()
+
+
+@span("merge")
+def overlay_baseline(
+    baseline: Path, partial: Path | None, output: Path, replaced: frozenset[str]
+) -> None:
+    """Write ``baseline`` with the ``replaced`` files taken from ``partial``.
+
+    ``partial`` is the report of the selected tests, or ``None`` when none
+    ran; files listed in ``replaced`` but missing from it were deleted and are
+    dropped.
+    """
+    overlay_cobertura_files(
+        baseline,
+        partial,
+        output,
+        replace=lambda filename: _report_path(filename) in replaced,
+    )
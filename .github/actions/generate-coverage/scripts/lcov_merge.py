@@ -0,0 +1,257 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["typer"]
+# ///
+"""Merge LCOV tracefiles record by record.
+
+Each input is read as a stream of ``SF:`` records terminated by
+``end_of_record``. Records for the same source file are combined: ``DA``,
+``BRDA`` and ``FNDA`` hit counts are summed and the ``LF``/``LH``,
+``BRF``/``BRH`` and ``FNF``/``FNH`` summaries are recomputed. Records that
+appear in only one input are copied through unchanged.
+
+``cargo llvm-cov`` and ``coverage lcov`` both emit records sorted by source
+path, so the inputs are normally merged with a k-way merge that holds a single
+record per input in memory. An input that is not sorted is detected by a cheap
+pre-scan of its ``SF:`` lines and falls back to sorting its records in memory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import heapq
+import itertools
+import os
+import re
+import tempfile
+import typing as typ
+from pathlib import Path
+
+import typer
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+
+__all__ = ["LcovFormatError", "merge_lcov_files"]
+
+_END_OF_RECORD = "end_of_record"
+_FN_RE = re.compile(r"^(\d+),(?:(\d+),)?(.*)$")
+
+
+class LcovFormatError(ValueError):
+    """Raised when an LCOV input cannot be parsed."""
+
+
+@dataclasses.dataclass(slots=True)
+class _Record:
+    """Raw lines of one LCOV record, excluding ``end_of_record``."""
+
+    source: str | None
+    lines: list[str]
+
+    @property
+    def sort_key(self) -> str:
+        """Return the merge key; records without ``SF:`` sort first."""
+        return self.source or ""
+
+
+def _iter_records(path: Path) -> cabc.Iterator[_Record]:
+    """Yield the records of ``path`` in file order."""
+    lines: list[str] = []
+    source: str | None = None
+    seen = False
+    with path.open(encoding="utf-8") as fh:
+        for raw in fh:
+            line = raw.rstrip("\r\n")
+            if not line.strip():
+                continue
+            if line == _END_OF_RECORD:
+                seen = True
+                yield _Record(source, lines)
+                lines, source = [], None
+                continue
+            if line.startswith("SF:"):
+                source = line[3:]
+            lines.append(line)
+    if lines:
+        msg = f"Malformed lcov data in {path}: missing final end_of_record"
+        raise LcovFormatError(msg)
+    if not seen:
+        msg = f"Malformed lcov data in {path}: no records found"
+        raise LcovFormatError(msg)
+
+
+def _is_sorted(path: Path) -> bool:
+    """Return ``True`` when the ``SF:`` paths in ``path`` are non-decreasing."""
+    previous = ""
+    with path.open(encoding="utf-8") as fh:
+        for raw in fh:
+            if not raw.startswith("SF:"):
+                continue
+            current = raw[3:].rstrip("\r\n")
+            if current < previous:
+                return False
+            previous = current
+    return True
+
+
+def _record_stream(path: Path) -> cabc.Iterator[_Record]:
+    """Return the records of ``path`` ordered by source path."""
+    if _is_sorted(path):
+        return _iter_records(path)
+    return iter(sorted(_iter_records(path), key=lambda rec: rec.sort_key))
+
+
+def _merge_taken(current: int | None, taken: str) -> int | None:
+    """Add a ``BRDA`` taken count, where ``-`` means the block never ran."""
+    if taken == "-":
+        return current
+    return (current or 0) + int(taken)
+
+
+@dataclasses.dataclass(slots=True)
+class _MergedRecord:
+    """Accumulated coverage for one source file across several records."""
+
+    source: str
+    header: list[str] = dataclasses.field(default_factory=list)
+    functions: dict[str, str] = dataclasses.field(default_factory=dict)
+    function_hits: dict[str, int] = dataclasses.field(default_factory=dict)
+    branches: dict[tuple[int, str, str], int | None] = dataclasses.field(
+        default_factory=dict
+    )
+    line_hits: dict[int, int] = dataclasses.field(default_factory=dict)
+    first: bool = True
+
+    def add(self, record: _Record, origin: Path) -> None:
+        """Fold ``record`` from ``origin`` into the accumulated counts."""
+        for line in record.lines:
+            tag, _, value = line.partition(":")
+            try:
+                self._add_line(tag, value, line)
+            except ValueError as exc:
+                msg = f"Malformed lcov data in {origin}: {line!r}"
+                raise LcovFormatError(msg) from exc
+        self.first = False
+
+    def _add_line(self, tag: str, value: str, line: str) -> None:
+        if tag == "DA":
+            lineno, count, *_ = value.split(",")
+            key = int(lineno)
+            self.line_hits[key] = self.line_hits.get(key, 0) + int(count)
+        elif tag == "BRDA":
+            lineno, block, branch, taken = value.split(",")
+            key = (int(lineno), block, branch)
+            self.branches[key] = _merge_taken(self.branches.get(key), taken)
+        elif tag == "FN":
+            match = _FN_RE.match(value)
+            if match is None:
+                raise ValueError(value)
+            self.functions.setdefault(match[3], value)
+        elif tag == "FNDA":
+            count, name = value.split(",", 1)
+            self.function_hits[name] = self.function_hits.get(name, 0) + int(count)
+        elif tag in {"LF", "LH", "BRF", "BRH", "FNF", "FNH"}:
+            return
+        elif self.first:
+            # ``TN:``, ``SF:`` and any extension lines are taken from the
+            # first record only.
+            self.header.append(line)
+
+    def render(self) -> cabc.Iterator[str]:
+        """Yield the merged record in geninfo order."""
+        yield from self.header
+        if self.functions:
+            for value in self.functions.values():
+                yield f"FN:{value}"
+            for name in self.functions:
+                yield f"FNDA:{self.function_hits.get(name, 0)},{name}"
+            yield f"FNF:{len(self.functions)}"
+            yield f"FNH:{sum(1 for n in self.functions if self.function_hits.get(n))}"
+        if self.branches:
+            for (lineno, block, branch), taken in sorted(self.branches.items()):
+                shown = "-" if taken is None else taken
+                yield f"BRDA:{lineno},{block},{branch},{shown}"
+            yield f"BRF:{len(self.branches)}"
+            yield f"BRH:{sum(1 for t in self.branches.values() if t)}"
+        for lineno, count in sorted(self.line_hits.items()):
+            yield f"DA:{lineno},{count}"
+        yield f"LF:{len(self.line_hits)}"
+        yield f"LH:{sum(1 for c in self.line_hits.values() if c)}"
+        yield _END_OF_RECORD
+
+
+def _tagged(path: Path) -> cabc.Iterator[tuple[Path, _Record]]:
+    for record in _record_stream(path):
+        yield path, record
+
+
+def _merged_lines(inputs: cabc.Sequence[Path]) -> cabc.Iterator[str]:
+    """Yield the merged tracefile for ``inputs`` line by line."""
+    stream = heapq.merge(
+        *(_tagged(path) for path in inputs),
+        key=lambda item: item[1].sort_key,
+    )
+    for source, group in itertools.groupby(stream, key=lambda item: item[1].source):
+        items = list(group)
+        if source is None or len(items) == 1:
+            # Unnamed records cannot be matched; single records need no
+            # arithmetic, so both are copied through verbatim.
+            for _, record in items:
+                yield from record.lines
+                yield _END_OF_RECORD
+            continue
+        merged = _MergedRecord(source)
+        for origin, record in items:
+            merged.add(record, origin)
+        yield from merged.render()
+
+
+def merge_lcov_files(inputs: cabc.Sequence[Path], output: Path) -> None:
+    """Merge the LCOV tracefiles ``inputs`` into ``output``.
+
+    ``output`` may also be one of the inputs; the result is written to a
+    temporary file alongside it and moved into place once complete.
+
+    Raises
+    ------
+    LcovFormatError
+        If an input is empty, truncated or contains an unparsable line.
+    OSError
+        If an input cannot be read or the output cannot be written.
+    """
+    if not inputs:
+        msg = "At least one LCOV input is required"
+        raise LcovFormatError(msg)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+            for line in _merged_lines(inputs):
+                fh.write(line)
+                fh.write("\n")
+        tmp_path.replace(output)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def main(
+    inputs: typ.Annotated[list[Path], typer.Argument(exists=True, dir_okay=False)],
+    output_path: typ.Annotated[Path, typer.Option("--output-path", "-o")],
+) -> None:
+    """Merge LCOV ``inputs`` into ``output_path``."""
+    try:
+        merge_lcov_files(inputs, output_path)
+    except (LcovFormatError, OSError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,20 +1,28 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.12"
-# dependencies = ["plumbum", "typer"]
+# dependencies = ["typer", "lxml"]
 # ///
-"""Merge Cobertura XML files from Rust and Python coverage runs."""
+"""Merge the coverage reports from Rust and Python coverage runs.
+
+Each input may be LCOV or Cobertura XML, whichever its tool emitted; inputs
+not already in the requested output format are converted in-process by
+:mod:`coverage_convert` before merging.
+"""
 
 from __future__ import annotations
 
 import typing as typ
 from pathlib import Path
 
+import phase_timing
 import typer
-from cmd_utils_loader import run_cmd
+from cobertura_merge import CoberturaMergeError
 from common import _required_env
-from plumbum.cmd import uvx
-from plumbum.commands.processes import ProcessExecutionError
+from coverage_convert import CoverageConversionError, merge_reports
+from lcov_merge import LcovFormatError
+
+_FORMAT_LABELS = {"cobertura": "Cobertura", "lcov": "LCOV"}
 
 
 def main(
@@ -37,21 +45,29 @@ def main(
         ),
     ] = None,
     output_path: typ.Annotated[Path | None, typer.Option(envvar="OUTPUT_PATH")] = None,
+    output_format: typ.Annotated[
+        str, typer.Option(envvar="OUTPUT_FORMAT", help="cobertura or lcov")
+    ] = "cobertura",
 ) -> None:
-    """Merge two cobertura XML files and delete the inputs."""
+    """Merge the Rust and Python reports into ``output_path`` and delete the inputs."""
     rust_file = rust_file or Path(_required_env("RUST_FILE"))
     python_file = python_file or Path(_required_env("PYTHON_FILE"))
     output_path = output_path or Path(_required_env("OUTPUT_PATH"))
+    fmt = output_format.strip().lower() or "cobertura"
+    label = _FORMAT_LABELS.get(fmt, fmt)
     try:
-        cmd = uvx["merge-cobertura", str(rust_file), str(python_file)]
-        output = run_cmd(cmd)
-    except ProcessExecutionError as exc:
-        typer.echo(
-            f"merge-cobertura failed with code {exc.retcode}: {exc.stderr}",
-            err=True,
-        )
-        raise typer.Exit(code=exc.retcode or 1) from exc
-    output_path.write_text(output)
+        with phase_timing.recording("merge_cobertura"):
+            merge_reports(
+                [rust_file, python_file], output_path, fmt, source_root=Path.cwd()
+            )
+    except (
+        CoberturaMergeError,
+        CoverageConversionError,
+        LcovFormatError,
+        OSError,
+    ) as exc:
+        typer.echo(f"{label} merge failed: {exc}", err=True)
+        raise typer.Exit(1) from exc
     rust_file.unlink()
     python_file.unlink()
 
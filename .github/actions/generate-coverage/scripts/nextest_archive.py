@@ -0,0 +1,184 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["plumbum", "typer"]
+# ///
+"""Fingerprint the Rust workspace to key a reusable nextest test archive.
+
+``cargo llvm-cov nextest-archive`` packs the instrumented test binaries into
+one file that later ``cargo llvm-cov nextest --archive-file`` runs execute
+without compiling anything. The archive is only valid for the exact inputs it
+was built from, so :func:`archive_key` combines:
+
+- the repository ``fingerprint`` key over every tracked file below the
+  workspace root (the directory of the nearest ``Cargo.lock`` at or above the
+  manifest) except those matching :data:`IGNORED_PATHSPECS`, plus that
+  ``Cargo.lock`` itself;
+- the feature selection passed to the build;
+- the coverage environment overrides from :mod:`_cranelift`;
+- ``rustc -vV`` and the pinned ``cargo-llvm-cov`` version.
+
+Hashing the whole workspace covers ``include_str!`` data, build-script inputs
+and ``.cargo/config*`` or ``rust-toolchain*`` files above a member crate.
+Sources are hashed from the blob ids git already records, so the cost does
+not grow with file size.
+
+Run as a step before ``run_rust.py``, this script writes ``key`` and ``path``
+outputs so the archive can be restored from and saved to the Actions cache.
+When the manifest is not inside a git work tree it writes neither, and the
+Rust run compiles as usual.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import typing as typ
+from pathlib import Path
+
+import typer
+from _cranelift import get_cargo_coverage_env
+from cmd_utils_loader import load_fingerprint
+from common import _env_bool, _required_env
+from install_cargo_llvm_cov import CARGO_LLVM_COV_VERSION
+from plumbum import local
+from plumbum.commands.processes import CommandNotFound, ProcessExecutionError
+
+# Git pathspecs, relative to the workspace root, for tracked files that cannot
+# change the compiled test binaries. ``*`` also matches ``/`` in excludes.
+# ``Cargo.lock`` is hashed separately through ``fingerprint.lockfile_digest``
+# so formatting churn does not invalidate the archive.
+IGNORED_PATHSPECS: typ.Final[tuple[str, ...]] = (
+    "*.md",
+    "docs",
+    ".github",
+    "Cargo.lock",
+)
+
+
+def _workspace_lockfile(root: Path) -> Path | None:
+    """Return the nearest ``Cargo.lock`` at or above ``root``, if any."""
+    resolved = root.resolve()
+    for parent in (resolved, *resolved.parents):
+        candidate = parent / "Cargo.lock"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _toolchain_version() -> str:
+    """Return ``rustc -vV``, or ``unknown`` when rustc cannot be run."""
+    try:
+        return local["rustc"]["-vV"]()
+    except (CommandNotFound, ProcessExecutionError, OSError):
+        return "unknown"
+
+
+def source_fingerprint(root: Path) -> str:
+    """Return the ``fingerprint`` key over the workspace that contains ``root``.
+
+    The workspace root is the directory of the nearest ``Cargo.lock``, or
+    ``root`` itself when there is none.
+
+    Raises
+    ------
+    fingerprint.FingerprintError
+        If git is unavailable or ``root`` is not inside a work tree.
+    """
+    lockfile = _workspace_lockfile(root)
+    workspace = root if lockfile is None else lockfile.parent
+    return (
+        load_fingerprint()
+        .compute_fingerprint(
+            workspace,
+            lockfiles=[] if lockfile is None else [lockfile],
+            exclude=IGNORED_PATHSPECS,
+        )
+        .key
+    )
+
+
+def archive_key(
+    manifest_path: Path,
+    *,
+    features: str,
+    with_default: bool,
+    toolchain: str | None = None,
+) -> str:
+    """Return the cache key for the instrumented nextest archive.
+
+    Parameters
+    ----------
+    manifest_path : Path
+        ``Cargo.toml`` the coverage run builds.
+    features : str
+        Value of the ``features`` input.
+    with_default : bool
+        Whether default features are enabled.
+    toolchain : str | None, optional
+        ``rustc -vV`` output; detected when omitted.
+
+    Returns
+    -------
+    str
+        A 32-character hexadecimal key.
+    """
+    digest = hashlib.sha256()
+    parts = [
+        source_fingerprint(manifest_path.parent),
+        f"features={features}",
+        f"default-features={with_default}",
+        f"cargo-llvm-cov={CARGO_LLVM_COV_VERSION}",
+        toolchain if toolchain is not None else _toolchain_version(),
+        *(
+            f"{name}={value}"
+            for name, value in sorted(get_cargo_coverage_env(manifest_path).items())
+        ),
+    ]
+    for part in parts:
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()[:32]
+
+
+def archive_path(key: str, directory: Path | None = None) -> Path:
+    """Return where the archive for ``key`` is stored.
+
+    ``directory`` defaults to ``RUNNER_TEMP`` (or the system temporary
+    directory), outside ``target`` so ``cargo llvm-cov clean`` keeps it.
+    """
+    base = directory or Path(os.getenv("RUNNER_TEMP") or tempfile.gettempdir())
+    return base / "nextest-archive" / f"coverage-{key}.tar.zst"
+
+
+def main(
+    manifest_path: typ.Annotated[Path | None, typer.Option()] = None,
+    features: typ.Annotated[str, typer.Option()] = "",
+    *,
+    with_default: typ.Annotated[bool | None, typer.Option()] = None,
+    github_output: typ.Annotated[Path | None, typer.Option()] = None,
+) -> None:
+    """Write the archive ``key`` and ``path`` to ``GITHUB_OUTPUT``."""
+    if manifest_path is None:
+        detected = os.getenv("DETECTED_CARGO_MANIFEST", "").strip()
+        manifest_path = Path(detected or "Cargo.toml")
+    features = features or os.getenv("INPUT_FEATURES", "")
+    if with_default is None:
+        with_default = _env_bool("INPUT_WITH_DEFAULT_FEATURES", default=True)
+    github_output = github_output or Path(_required_env("GITHUB_OUTPUT"))
+
+    try:
+        key = archive_key(manifest_path, features=features, with_default=with_default)
+    except load_fingerprint().FingerprintError as exc:
+        typer.echo(f"::warning::nextest archive disabled: {exc}", err=True)
+        return
+    path = archive_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    typer.echo(f"nextest archive key: {key}")
+    with github_output.open("a") as fh:
+        fh.write(f"key={key}\n")
+        fh.write(f"path={path}\n")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,223 @@
+"""Record how long each phase of a coverage script takes.
+
+Entry points wrap their work in :func:`recording`; code anywhere below them
+marks phases with :func:`span`, used as a context manager or a decorator::
+
+    with phase_timing.recording("run_rust", github_output=github_output):
+        with phase_timing.span("test"):
+            ...
+
+A span only costs two ``perf_counter`` calls, and nothing at all outside
+:func:`recording`, so library code such as the report parsers is
+instrumented unconditionally. Repeated spans with the same name are summed.
+Nested spans are timed exclusively: the time of an inner span is subtracted
+from the span around it, so the phases never add up to more than the total.
+Time outside every span is reported as ``other``.
+
+When :func:`recording` exits the phases are published as:
+
+- a Markdown table in ``GITHUB_STEP_SUMMARY``;
+- ``<script>.json`` in ``COVERAGE_TIMINGS_DIR``, together with the
+  repository and run identifiers needed to aggregate timings across
+  repositories;
+- ``timing_<phase>``, ``timing_total``, a compact ``timings`` JSON object and
+  the ``timings_file`` path in ``GITHUB_OUTPUT``.
+
+Each destination is skipped when its variable is unset. The summary and the
+JSON file are written for failed runs too, since those are often the slow
+ones; step outputs are only written on success, as the scripts' other
+outputs are.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import datetime as dt
+import json
+import os
+import time
+import typing as typ
+from pathlib import Path
+
+import typer
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+
+TIMINGS_DIR_ENV = "COVERAGE_TIMINGS_DIR"
+TIMINGS_VERSION = 1
+OTHER_PHASE = "other"
+# GitHub context recorded with every timings file, keyed by JSON field.
+_RUN_CONTEXT = {
+    "repository": "GITHUB_REPOSITORY",
+    "workflow": "GITHUB_WORKFLOW",
+    "job": "GITHUB_JOB",
+    "run_id": "GITHUB_RUN_ID",
+    "run_attempt": "GITHUB_RUN_ATTEMPT",
+    "ref": "GITHUB_REF_NAME",
+    "sha": "GITHUB_SHA",
+    "runner_os": "RUNNER_OS",
+}
+
+__all__ = [
+    "OTHER_PHASE",
+    "TIMINGS_DIR_ENV",
+    "TIMINGS_VERSION",
+    "PhaseRecorder",
+    "recording",
+    "span",
+]
+
+
+@dataclasses.dataclass(slots=True)
+class PhaseRecorder:
+    """Exclusive seconds per phase for one run of a coverage script."""
+
+    script: str
+    clock: cabc.Callable[[], float] = time.perf_counter
+    started: float = dataclasses.field(init=False)
+    phases: dict[str, float] = dataclasses.field(default_factory=dict)
+    _nested: list[float] = dataclasses.field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Start the run clock."""
+        self.started = self.clock()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to phase ``name``."""
+        self.phases[name] = self.phases.get(name, 0.0) + max(seconds, 0.0)
+
+    def total(self) -> float:
+        """Return the seconds elapsed since the recorder started."""
+        return self.clock() - self.started
+
+    def breakdown(self, total: float) -> dict[str, float]:
+        """Return the phases plus ``other``, the time outside every span."""
+        phases = dict(self.phases)
+        other = total - sum(phases.values())
+        if other > 0:
+            phases[OTHER_PHASE] = phases.get(OTHER_PHASE, 0.0) + other
+        return phases
+
+
+_active: PhaseRecorder | None = None
+
+
+@contextlib.contextmanager
+def span(name: str) -> cabc.Iterator[None]:
+    """Attribute the time spent in the block to phase ``name``."""
+    recorder = _active
+    if recorder is None:
+        yield
+        return
+    started = recorder.clock()
+    recorder._nested.append(0.0)
+    try:
+        yield
+    finally:
+        elapsed = recorder.clock() - started
+        recorder.add(name, elapsed - recorder._nested.pop())
+        if recorder._nested:
+            recorder._nested[-1] += elapsed
+
+
+def _round(phases: cabc.Mapping[str, float]) -> dict[str, float]:
+    return {name: round(seconds, 3) for name, seconds in phases.items()}
+
+
+def _output_name(phase: str) -> str:
+    return "timing_" + "".join(ch if ch.isalnum() else "_" for ch in phase.lower())
+
+
+def _summary_table(script: str, phases: cabc.Mapping[str, float], total: float) -> str:
+    rows = [
+        f"### Coverage timings: `{script}`",
+        "",
+        "| Phase | Seconds | Share |",
+        "| --- | ---: | ---: |",
+    ]
+    for name, seconds in sorted(phases.items(), key=lambda item: -item[1]):
+        share = seconds / total * 100 if total > 0 else 0.0
+        rows.append(f"| {name} | {seconds:.2f} | {share:.0f}% |")
+    rows.append(f"| **total** | **{total:.2f}** | |")
+    return "\n".join(rows) + "\n\n"
+
+
+def _timings_document(
+    script: str, phases: cabc.Mapping[str, float], total: float
+) -> dict[str, typ.Any]:
+    context = {field: os.getenv(env) or None for field, env in _RUN_CONTEXT.items()}
+    return {
+        "version": TIMINGS_VERSION,
+        "script": script,
+        "recorded_at": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+        **context,
+        "total_seconds": round(total, 3),
+        "phases": _round(phases),
+    }
+
+
+def _publish(recorder: PhaseRecorder, github_output: Path | None) -> None:
+    """Write the phases of ``recorder`` to every configured destination."""
+    total = recorder.total()
+    phases = recorder.breakdown(total)
+    outputs = {_output_name(name): f"{seconds:.3f}" for name, seconds in phases.items()}
+    outputs["timing_total"] = f"{total:.3f}"
+    outputs["timings"] = json.dumps(_round(phases), separators=(",", ":"))
+
+    if directory := os.getenv(TIMINGS_DIR_ENV, "").strip():
+        path = Path(directory) / f"{recorder.script}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = _timings_document(recorder.script, phases, total)
+        path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        outputs["timings_file"] = str(path)
+    if summary := os.getenv("GITHUB_STEP_SUMMARY"):
+        with Path(summary).open("a", encoding="utf-8") as handle:
+            handle.write(_summary_table(recorder.script, phases, total))
+    if github_output is not None:
+        with github_output.open("a") as fh:
+            fh.writelines(f"{key}={value}\n" for key, value in outputs.items())
+
+
+@contextlib.contextmanager
+def recording(
+    script: str,
+    *,
+    github_output: Path | None = None,
+    clock: cabc.Callable[[], float] = time.perf_counter,
+) -> cabc.Iterator[PhaseRecorder]:
+    """Record the spans of ``script`` and publish them when the block exits.
+
+    Parameters
+    ----------
+    script : str
+        Name used in the step summary and for the JSON file.
+    github_output : Path | None, optional
+        Step output file, written only when the block succeeds; defaults to
+        ``GITHUB_OUTPUT`` when that is set.
+    clock : Callable[[], float], optional
+        Monotonic clock in seconds.
+
+    Yields
+    ------
+    PhaseRecorder
+        The recorder the spans inside the block add to.
+    """
+    global _active
+    if github_output is None and (env_output := os.getenv("GITHUB_OUTPUT")):
+        github_output = Path(env_output)
+    recorder = PhaseRecorder(script, clock)
+    previous, _active = _active, recorder
+    succeeded = False
+    try:
+        yield recorder
+        succeeded = True
+    finally:
+        _active = previous
+        try:
+            _publish(recorder, github_output if succeeded else None)
+        except OSError as exc:
+            typer.echo(
+                f"::warning::could not publish coverage timings: {exc}", err=True
+            )
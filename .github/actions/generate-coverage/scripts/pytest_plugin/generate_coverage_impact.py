@@ -0,0 +1,186 @@
+"""Pytest plugin that records and applies the coverage test-impact map.
+
+``run_python.py`` loads this module with ``-p generate_coverage_impact``
+inside the coverage venv, so it may only use the standard library and pytest.
+
+- When ``GENERATE_COVERAGE_IMPACT_OUT`` names a directory, every process that
+  runs tests records which files below the working directory each test
+  executes and writes them there as ``<worker>.json`` when the session ends.
+  Files are recorded through :mod:`sys.monitoring` ``PY_START`` events into
+  a per-test set. The events stay enabled rather than being disabled and
+  re-armed with ``sys.monitoring.restart_events()``, which is global and
+  would also re-arm the events coverage tools disabled. Python 3.11 and older
+  lack :mod:`sys.monitoring`; recording is skipped with a warning.
+- When ``GENERATE_COVERAGE_IMPACT_SELECT`` names a selection written by
+  ``impact_selection.write_selection``, tests whose node ID or file it does not
+  list are deselected.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import typing as typ
+import warnings
+from pathlib import Path
+
+import pytest
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+    import types
+
+RECORD_ENV = "GENERATE_COVERAGE_IMPACT_OUT"
+SELECT_ENV = "GENERATE_COVERAGE_IMPACT_SELECT"
+VERSION = 1
+# pytest-xdist appends "@<group>" to node IDs under --dist loadgroup. Groups
+# may be the schedule plan's or the project's own, so a trailing suffix
+# outside a parametrize ID's brackets is stripped.
+_GROUP_SUFFIX = re.compile(r"@[^@/:\[\]]*$")
+# Tool IDs 0-2 and 5 are reserved for debuggers, coverage tools and profilers.
+_TOOL_IDS = (3, 4)
+_TOOL_NAME = "generate-coverage-impact"
+
+
+def _relative(path: Path, root: Path) -> str | None:
+    """Return ``path`` relative to ``root`` in POSIX form, if it lies below it."""
+    try:
+        parts = path.relative_to(root).parts
+    except ValueError:
+        return None
+    if not parts or parts[0].startswith(".") or "site-packages" in parts:
+        return None
+    return "/".join(parts)
+
+
+def _load_selection() -> tuple[frozenset[str], frozenset[str]] | None:
+    path = os.environ.get(SELECT_ENV)
+    if not path:
+        return None
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != VERSION:
+        return None
+    return frozenset(data.get("nodeids", ())), frozenset(data.get("paths", ()))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselect the tests the selection does not name."""
+    selection = _load_selection()
+    if selection is None:
+        return
+    nodeids, paths = selection
+    root = Path.cwd()
+    keep: list[pytest.Item] = []
+    drop: list[pytest.Item] = []
+    for item in items:
+        nodeid = _GROUP_SUFFIX.sub("", item.nodeid)
+        selected = nodeid in nodeids or _relative(Path(item.path), root) in paths
+        (keep if selected else drop).append(item)
+    if drop:
+        config.hook.pytest_deselected(items=drop)
+        items[:] = keep
+
+
+class _ImpactRecorder:
+    """Collect the files each test executes in this process."""
+
+    def __init__(self, directory: str, name: str, tool: int) -> None:
+        self.path = Path(directory) / f"{name}.json"
+        self.root = Path.cwd()
+        self.tool = tool
+        self.tests: dict[str, list[str]] = {}
+        self._files: set[str] | None = None
+        self._paths: dict[str, str | None] = {}
+        monitoring = sys.monitoring
+        monitoring.register_callback(tool, monitoring.events.PY_START, self._start)
+        monitoring.set_events(tool, monitoring.events.PY_START)
+
+    def _start(self, code: types.CodeType, _offset: int) -> None:
+        if self._files is not None:
+            self._files.add(code.co_filename)
+
+    def _relative_files(self, filenames: cabc.Iterable[str]) -> list[str]:
+        files: set[str] = set()
+        for filename in filenames:
+            if filename not in self._paths:
+                self._paths[filename] = (
+                    None
+                    if filename.startswith("<")
+                    else _relative(Path(filename).resolve(), self.root)
+                )
+            if (path := self._paths[filename]) is not None:
+                files.add(path)
+        return sorted(files)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> cabc.Iterator[None]:
+        files = self._files = set()
+        try:
+            yield
+        finally:
+            self._files = None
+        files.add(str(Path(item.path).resolve()))
+        nodeid = _GROUP_SUFFIX.sub("", item.nodeid)
+        self.tests[nodeid] = self._relative_files(files)
+
+    def pytest_sessionfinish(self) -> None:
+        sys.monitoring.set_events(self.tool, 0)
+        sys.monitoring.free_tool_id(self.tool)
+        if not self.tests:
+            return
+        payload = {"version": VERSION, "tests": self.tests}
+        try:
+            self.path.write_text(
+                json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+            )
+        except OSError as exc:
+            warnings.warn(
+                f"generate-coverage: could not record the impact map: {exc}",
+                pytest.PytestWarning,
+                stacklevel=1,
+            )
+
+
+def _claim_tool_id() -> int | None:
+    for tool in _TOOL_IDS:
+        try:
+            sys.monitoring.use_tool_id(tool, _TOOL_NAME)
+        except ValueError:
+            continue
+        return tool
+    return None
+
+
+def _config_warning(config: pytest.Config, message: str) -> None:
+    config.issue_config_time_warning(
+        pytest.PytestConfigWarning(f"generate-coverage: {message}"), stacklevel=2
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the impact recorder in every process that runs tests."""
+    directory = os.environ.get(RECORD_ENV)
+    if not directory:
+        return
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None and config.getoption("numprocesses", None):
+        return
+    if not hasattr(sys, "monitoring"):
+        _config_warning(config, "test impact recording needs Python 3.12+")
+        return
+    tool = _claim_tool_id()
+    if tool is None:
+        _config_warning(config, "no free sys.monitoring tool ID for test impact")
+        return
+    name = workerinput["workerid"] if workerinput is not None else "main"
+    config.pluginmanager.register(
+        _ImpactRecorder(directory, name, tool), "generate-coverage-impact"
+    )
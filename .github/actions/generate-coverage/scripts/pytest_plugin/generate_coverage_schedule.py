@@ -0,0 +1,106 @@
+"""Pytest plugin that applies and records the coverage test schedule.
+
+``run_python.py`` loads this module with ``-p generate_coverage_schedule``
+inside the coverage venv, so it may only use the standard library and pytest.
+
+- When ``GENERATE_COVERAGE_SCHEDULE_PLAN`` names a plan written by
+  ``pytest_schedule.write_plan``, every test of a planned module (or planned
+  node ID) is tagged with ``xdist_group`` before pytest-xdist reads the
+  markers for ``--dist loadgroup``. Tests that already carry an
+  ``xdist_group`` marker keep it, so a project's own serialization groups
+  still hold. Tests the plan does not know about are left untagged and are
+  distributed individually.
+- When ``GENERATE_COVERAGE_DURATIONS_OUT`` is set, the controlling process
+  sums the setup, call and teardown time of every test and the busy time of
+  every worker, and writes them there as JSON when the session ends.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import typing as typ
+import warnings
+from pathlib import Path
+
+import pytest
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    import collections.abc as cabc
+
+PLAN_ENV = "GENERATE_COVERAGE_SCHEDULE_PLAN"
+RESULTS_ENV = "GENERATE_COVERAGE_DURATIONS_OUT"
+VERSION = 1
+# pytest-xdist appends "@<group>" to node IDs under --dist loadgroup. Groups
+# may be the plan's or the project's own, so a trailing suffix outside a
+# parametrize ID's brackets is stripped.
+_GROUP_SUFFIX = re.compile(r"@[^@/:\[\]]*$")
+
+
+def _load_groups() -> dict[str, str]:
+    path = os.environ.get(PLAN_ENV)
+    if not path:
+        return {}
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != VERSION:
+        return {}
+    groups = data.get("groups")
+    return groups if isinstance(groups, dict) else {}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: cabc.Sequence[pytest.Item]) -> None:
+    """Tag planned tests with their ``xdist_group`` before xdist reads it."""
+    groups = _load_groups()
+    if not groups:
+        return
+    for item in items:
+        if item.get_closest_marker("xdist_group") is not None:
+            continue
+        group = groups.get(item.nodeid) or groups.get(item.nodeid.partition("::")[0])
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+class _Recorder:
+    """Accumulate per-test and per-worker durations on the controller."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.durations: dict[str, float] = {}
+        self.workers: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        nodeid = _GROUP_SUFFIX.sub("", report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        gateway = getattr(getattr(report, "node", None), "gateway", None)
+        worker = getattr(gateway, "id", None) or "main"
+        self.workers[worker] = self.workers.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        payload = {
+            "version": VERSION,
+            "durations": self.durations,
+            "workers": self.workers,
+        }
+        try:
+            Path(self.path).write_text(
+                json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+            )
+        except OSError as exc:
+            warnings.warn(
+                f"generate-coverage: could not record durations: {exc}",
+                pytest.PytestWarning,
+                stacklevel=1,
+            )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the duration recorder on the controlling process only."""
+    path = os.environ.get(RESULTS_ENV)
+    if path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(_Recorder(path), "generate-coverage-recorder")
@@ -0,0 +1,210 @@
+"""Plan balanced pytest-xdist runs from recorded per-test durations.
+
+``run_python.py`` loads the durations the previous coverage run recorded and
+calls :func:`plan_schedule` to assign whole test modules to workers by
+longest-processing-time-first (LPT): each unit, longest first, goes to the
+least-loaded worker. A module longer than an even share of the total is split
+into its individual tests so one slow file cannot pin a worker on its own.
+The assignment is handed to the ``generate_coverage_schedule`` pytest plugin,
+which tags each test with an ``xdist_group`` marker for ``--dist loadgroup``.
+The plugin also records the durations of the current run for the next one.
+
+When ``pytest-workers`` is ``auto`` or ``logical`` the worker count is capped
+at ``ceil(total / longest unit)``: beyond that the longest unit bounds the
+makespan and each extra worker only adds instrumented start-up cost. An
+explicit count is always honoured.
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc  # noqa: TC003 - used at runtime
+import dataclasses
+import heapq
+import json
+import math
+import os
+import typing as typ
+from pathlib import Path
+
+DURATIONS_VERSION = 1
+GROUP_PREFIX = "gencov-"
+PLUGIN_NAME = "generate_coverage_schedule"
+PLUGIN_DIR = Path(__file__).resolve().parent / "pytest_plugin"
+PLAN_ENV = "GENERATE_COVERAGE_SCHEDULE_PLAN"
+RESULTS_ENV = "GENERATE_COVERAGE_DURATIONS_OUT"
+_NAMED_WORKERS = frozenset({"auto", "logical"})
+
+__all__ = [
+    "DURATIONS_VERSION",
+    "PLAN_ENV",
+    "PLUGIN_DIR",
+    "PLUGIN_NAME",
+    "RESULTS_ENV",
+    "RunTimings",
+    "SchedulePlan",
+    "load_durations",
+    "plan_schedule",
+    "plugin_pythonpath",
+    "read_run_timings",
+    "save_durations",
+    "write_plan",
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SchedulePlan:
+    """Worker count and ``xdist_group`` assignment for one pytest run."""
+
+    workers: str
+    groups: cabc.Mapping[str, str]
+    loads: tuple[float, ...]
+
+    @property
+    def predicted_makespan(self) -> float:
+        """Return the predicted duration of the busiest worker in seconds."""
+        return max(self.loads, default=0.0)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RunTimings:
+    """Per-test durations and per-worker busy time recorded by the plugin."""
+
+    durations: cabc.Mapping[str, float]
+    workers: cabc.Mapping[str, float]
+
+    @property
+    def actual_makespan(self) -> float:
+        """Return the busy time of the busiest worker in seconds."""
+        return max(self.workers.values(), default=0.0)
+
+
+def _read_json(path: Path) -> dict[str, typ.Any]:
+    """Return the JSON object stored at ``path``, or ``{}`` when unusable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != DURATIONS_VERSION:
+        return {}
+    return data
+
+
+def _float_map(raw: object) -> dict[str, float]:
+    """Return the ``str -> non-negative float`` entries of ``raw``."""
+    if not isinstance(raw, dict):
+        return {}
+    return {
+        str(key): float(value)
+        for key, value in raw.items()
+        if isinstance(value, int | float) and value >= 0
+    }
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """Return the per-test durations stored at ``path``.
+
+    A missing, unreadable or incompatible file yields an empty mapping, which
+    leaves scheduling to the pytest-xdist defaults.
+    """
+    return _float_map(_read_json(path).get("durations"))
+
+
+def save_durations(path: Path, durations: cabc.Mapping[str, float]) -> None:
+    """Write ``durations`` to ``path`` as compact JSON, replacing it atomically."""
+    payload = {
+        "version": DURATIONS_VERSION,
+        "durations": {key: round(durations[key], 3) for key in sorted(durations)},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def read_run_timings(path: Path) -> RunTimings | None:
+    """Return the timings the plugin wrote to ``path``, or ``None``."""
+    data = _read_json(path)
+    if not data:
+        return None
+    return RunTimings(
+        durations=_float_map(data.get("durations")),
+        workers=_float_map(data.get("workers")),
+    )
+
+
+def _units(
+    durations: cabc.Mapping[str, float], workers: int
+) -> list[tuple[float, str]]:
+    """Return schedulable ``(seconds, key)`` units, longest first.
+
+    Keys are module paths, or node IDs for modules split because they exceed
+    an even share of the total.
+    """
+    modules: dict[str, dict[str, float]] = {}
+    for nodeid, seconds in durations.items():
+        modules.setdefault(nodeid.partition("::")[0], {})[nodeid] = seconds
+    share = sum(durations.values()) / workers
+    units: list[tuple[float, str]] = []
+    for module, tests in modules.items():
+        total = sum(tests.values())
+        if total > share and len(tests) > 1:
+            units.extend((seconds, nodeid) for nodeid, seconds in tests.items())
+        else:
+            units.append((total, module))
+    units.sort(key=lambda unit: (-unit[0], unit[1]))
+    return units
+
+
+def plan_schedule(
+    durations: cabc.Mapping[str, float],
+    workers: str,
+    *,
+    cpu_count: int,
+) -> SchedulePlan | None:
+    """Return a balanced plan for ``workers``, or ``None`` to keep defaults.
+
+    Parameters
+    ----------
+    durations : Mapping[str, float]
+        Recorded seconds per pytest node ID.
+    workers : str
+        Validated ``pytest-workers`` value; empty means a serial run.
+    cpu_count : int
+        Worker count that ``auto``/``logical`` would use.
+
+    Returns
+    -------
+    SchedulePlan or None
+        ``None`` for serial runs or when there is no usable history.
+    """
+    if not workers or sum(durations.values()) <= 0:
+        return None
+    requested = max(1, cpu_count) if workers in _NAMED_WORKERS else int(workers)
+    units = _units(durations, requested)
+    count = requested
+    if workers in _NAMED_WORKERS:
+        total = sum(seconds for seconds, _ in units)
+        count = min(requested, max(1, math.ceil(total / units[0][0])))
+    heap = [(0.0, index) for index in range(count)]
+    loads = [0.0] * count
+    groups: dict[str, str] = {}
+    for seconds, key in units:
+        load, index = heapq.heappop(heap)
+        loads[index] = load + seconds
+        groups[key] = f"{GROUP_PREFIX}{index}"
+        heapq.heappush(heap, (loads[index], index))
+    return SchedulePlan(workers=str(count), groups=groups, loads=tuple(loads))
+
+
+def write_plan(path: Path, plan: SchedulePlan) -> None:
+    """Write the group assignment of ``plan`` for the pytest plugin."""
+    path.write_text(
+        json.dumps({"version": DURATIONS_VERSION, "groups": dict(plan.groups)}),
+        encoding="utf-8",
+    )
+
+
+def plugin_pythonpath() -> str:
+    """Return ``PYTHONPATH`` with the plugin directory prepended."""
+    existing = os.environ.get("PYTHONPATH")
+    return os.pathsep.join(filter(None, (str(PLUGIN_DIR), existing)))
@@ -0,0 +1,290 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["plumbum", "typer", "lxml"]
+# ///
+"""Run Rust and Python coverage concurrently for mixed-language projects.
+
+``run_rust.py`` and ``run_python.py`` are started side by side with this
+interpreter, so the combined wall time is roughly that of the slower suite.
+Each child keeps its own timeouts (``RUN_RUST_CARGO_WAIT_TIMEOUT`` still
+bounds every cargo invocation) and writes its step outputs to a private
+``GITHUB_OUTPUT`` file. Their stdout and stderr are pumped by one reader
+thread per stream, as ``_cargo_runner`` does on Windows, and echoed with a
+``[rust]``/``[python]`` prefix; GitHub workflow commands (lines starting with
+``::``) are passed through unprefixed so annotations still work.
+
+When one child fails the other is stopped and the failing exit code is
+returned. Once both succeed their reports are merged in-process by
+:func:`coverage_convert.merge_reports`, whichever format each tool emitted,
+and the child outputs are re-exported with a ``rust_``/``python_`` prefix,
+except file outputs naming the merged (and deleted) per-language reports.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as typ
+from pathlib import Path
+from types import MappingProxyType
+
+import phase_timing
+import typer
+from cobertura_merge import CoberturaMergeError
+from common import _required_env
+from coverage_convert import CoverageConversionError, merge_reports
+from lcov_merge import LcovFormatError
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CHILD_SCRIPTS: typ.Mapping[str, Path] = MappingProxyType(
+    {
+        "rust": SCRIPTS_DIR / "run_rust.py",
+        "python": SCRIPTS_DIR / "run_python.py",
+    }
+)
+_FORMAT_LABELS = {"cobertura": "Cobertura", "lcov": "LCOV"}
+# Seconds a stopped child's process group has to exit after SIGTERM.
+STOP_GRACE_SECONDS = 5.0
+
+
+@dataclasses.dataclass(slots=True)
+class _Child:
+    """A running coverage script and the outputs it reports."""
+
+    name: str
+    proc: subprocess.Popen[str]
+    github_output: Path
+    open_streams: int = 2
+    returncode: int | None = None
+
+
+def _spawn_child(name: str, script: Path, github_output: Path) -> _Child:
+    """Start ``script`` with its own ``GITHUB_OUTPUT`` file."""
+    github_output.touch()
+    env = {**os.environ, "GITHUB_OUTPUT": str(github_output)}
+    proc = subprocess.Popen(  # noqa: S603 - argv built from trusted paths
+        [sys.executable, str(script)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+        # Each child leads its own process group so stopping it also reaches
+        # the cargo, nextest and pytest-xdist processes it started.
+        start_new_session=os.name != "nt",
+    )
+    return _Child(name, proc, github_output)
+
+
+def _read_stream(
+    child: _Child,
+    stream: typ.IO[str],
+    *,
+    err: bool,
+    events: queue.Queue[tuple[_Child, bool, str | None]],
+) -> None:
+    """Queue each line of ``stream``, then ``None`` once it is exhausted."""
+    try:
+        for line in iter(stream.readline, ""):
+            events.put((child, err, line))
+    finally:
+        events.put((child, err, None))
+
+
+def _echo_prefixed(name: str, line: str, *, err: bool) -> None:
+    """Echo ``line`` from child ``name``, leaving workflow commands intact."""
+    text = line if line.startswith("::") else f"[{name}] {line}"
+    typer.echo(text, err=err, nl=not text.endswith("\n"))
+
+
+def _signal_group(child: _Child, sig: int) -> None:
+    """Send ``sig`` to ``child``'s process group, or kill it on Windows."""
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if os.name == "nt":
+            if child.proc.poll() is None:
+                child.proc.kill()
+        else:
+            os.killpg(child.proc.pid, sig)
+
+
+def _stop_children(children: typ.Iterable[_Child]) -> None:
+    """Stop every unfinished or failed child with the processes it started.
+
+    Each process group receives ``SIGTERM`` first; any group still alive after
+    ``STOP_GRACE_SECONDS`` receives ``SIGKILL``. A failed child's group is
+    signalled even after its leader exited, so orphaned grandchildren stop too;
+    children that succeeded are left alone.
+    """
+    stopping = [child for child in children if child.returncode != 0]
+    for child in stopping:
+        _signal_group(child, signal.SIGTERM)
+    deadline = time.monotonic() + STOP_GRACE_SECONDS
+    for child in stopping:
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            child.proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+    for child in stopping:
+        if os.name != "nt":
+            _signal_group(child, signal.SIGKILL)
+        with contextlib.suppress(Exception):
+            child.proc.wait(timeout=5)
+
+
+def _wait_timeout() -> float | None:
+    """Return ``RUN_MIXED_WAIT_TIMEOUT`` in seconds, or ``None`` when unset."""
+    raw = os.getenv("RUN_MIXED_WAIT_TIMEOUT", "").strip()
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError as exc:
+        typer.echo("::error::RUN_MIXED_WAIT_TIMEOUT must be a number", err=True)
+        raise typer.Exit(1) from exc
+
+
+def _finish_child(child: _Child, children: typ.Sequence[_Child]) -> None:
+    """Record ``child``'s exit status, stopping the rest when it failed."""
+    child.returncode = child.proc.wait()
+    if child.returncode == 0:
+        return
+    typer.echo(
+        f"::error::{child.name} coverage failed with code {child.returncode}",
+        err=True,
+    )
+    _stop_children(other for other in children if other is not child)
+    raise typer.Exit(child.returncode)
+
+
+def pump_children(children: typ.Sequence[_Child], *, timeout: float | None) -> None:
+    """Echo the output of ``children`` until all of them exit successfully.
+
+    Raises
+    ------
+    typer.Exit
+        With the first non-zero child exit code, or 1 when ``timeout``
+        seconds pass before every child has exited.
+    """
+    events: queue.Queue[tuple[_Child, bool, str | None]] = queue.Queue()
+    threads = [
+        threading.Thread(
+            name=f"{child.name}-{'stderr' if err else 'stdout'}",
+            target=_read_stream,
+            args=(child, stream),
+            kwargs={"err": err, "events": events},
+            daemon=True,
+        )
+        for child in children
+        for err, stream in ((False, child.proc.stdout), (True, child.proc.stderr))
+        if stream is not None
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while any(child.returncode is None for child in children):
+            if deadline is not None and time.monotonic() >= deadline:
+                typer.echo(
+                    f"::error::coverage runs did not finish within {timeout}s; killing",
+                    err=True,
+                )
+                raise typer.Exit(1)
+            try:
+                child, err, line = events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if line is not None:
+                _echo_prefixed(child.name, line, err=err)
+                continue
+            child.open_streams -= 1
+            if child.open_streams == 0:
+                _finish_child(child, children)
+    finally:
+        _stop_children(children)
+
+
+def _read_outputs(path: Path) -> dict[str, str]:
+    """Return the ``key=value`` outputs a child wrote to ``path``."""
+    outputs: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            outputs[key] = value
+    return outputs
+
+
+def _child_report(name: str, outputs: typ.Mapping[str, str]) -> Path:
+    """Return the report path ``name`` wrote, failing when it is missing."""
+    report = outputs.get("file")
+    if not report:
+        typer.echo(f"::error::{name} coverage did not report a file output", err=True)
+        raise typer.Exit(1)
+    return Path(report)
+
+
+def main(
+    output_path: typ.Annotated[Path | None, typer.Option()] = None,
+    fmt: typ.Annotated[str | None, typer.Option()] = None,
+    github_output: typ.Annotated[Path | None, typer.Option()] = None,
+) -> None:
+    """Run both coverage scripts concurrently and merge their reports."""
+    output_path = output_path or Path(_required_env("INPUT_OUTPUT_PATH"))
+    fmt = fmt or _required_env("DETECTED_FMT")
+    github_output = github_output or Path(_required_env("GITHUB_OUTPUT"))
+    timeout = _wait_timeout()
+
+    with phase_timing.recording("run_mixed", github_output=github_output):
+        with tempfile.TemporaryDirectory(prefix="coverage-outputs-") as tmp:
+            children: list[_Child] = []
+            try:
+                for name, script in CHILD_SCRIPTS.items():
+                    children.append(
+                        _spawn_child(name, script, Path(tmp) / f"{name}.out")
+                    )
+            except OSError as exc:
+                _stop_children(children)
+                typer.echo(f"::error::could not start coverage run: {exc}", err=True)
+                raise typer.Exit(1) from exc
+            with phase_timing.span("suites"):
+                pump_children(children, timeout=timeout)
+            outputs = {
+                child.name: _read_outputs(child.github_output) for child in children
+            }
+
+        reports = [_child_report(name, values) for name, values in outputs.items()]
+        label = _FORMAT_LABELS.get(fmt, fmt)
+        try:
+            merge_reports(reports, output_path, fmt, source_root=Path.cwd())
+        except (
+            CoberturaMergeError,
+            CoverageConversionError,
+            LcovFormatError,
+            OSError,
+        ) as exc:
+            typer.echo(f"{label} merge failed: {exc}", err=True)
+            raise typer.Exit(1) from exc
+        for report in reports:
+            report.unlink()
+
+        merged = {str(report) for report in reports}
+        with github_output.open("a") as fh:
+            fh.write(f"file={output_path}\n")
+            for name, values in outputs.items():
+                for key, value in values.items():
+                    if key.startswith("file") and value in merged:
+                        # The per-language report was merged and removed.
+                        continue
+                    fh.write(f"{name}_{key}={value}\n")
+
+
+if __name__ == "__main__":
+    typer.run(main)
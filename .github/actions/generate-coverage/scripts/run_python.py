@@ -9,20 +9,53 @@ from __future__ import annotations
 
 import collections.abc as cabc  # noqa: TC003 - used at runtime
 import contextlib
+import json
 import logging
 import os
 import shutil
+import tempfile
 import typing as typ
 from functools import lru_cache
 from pathlib import Path
 
+import phase_timing
 import typer
-from cmd_utils_loader import run_cmd
+from cmd_utils_loader import load_fingerprint, run_cmd
 from common import _required_env
 from coverage_parsers import get_line_coverage_percent_from_cobertura
+from impact_selection import (
+    BASELINE_NAME,
+    MAP_NAME,
+    RECORD_ENV,
+    SELECT_ENV,
+    ImpactRun,
+    Selection,
+    changed_files,
+    collect_impact_map,
+    current_commit,
+    load_impact_map,
+    overlay_baseline,
+    plan_selection,
+    save_impact_map,
+    write_selection,
+)
+from impact_selection import PLUGIN_NAME as IMPACT_PLUGIN_NAME
 from plumbum import local
 from plumbum.cmd import uv
 from plumbum.commands.processes import ProcessExecutionError
+from pytest_schedule import (
+    PLAN_ENV,
+    PLUGIN_NAME,
+    RESULTS_ENV,
+    RunTimings,
+    SchedulePlan,
+    load_durations,
+    plan_schedule,
+    plugin_pythonpath,
+    read_run_timings,
+    save_durations,
+    write_plan,
+)
 from shared_utils import read_previous_coverage
 
 if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
@@ -43,6 +76,10 @@ TOOLING_PACKAGES: tuple[str, ...] = (
     "coverage",
 )
 PROJECT_SYNC_ARGS: tuple[str, ...] = ("sync", "--inexact", "--python")
+# Files whose contents decide whether ``uv sync`` must run again. The stamp
+# recording them lives inside the venv so it is cached and removed with it.
+PROJECT_FILES: tuple[str, ...] = ("uv.lock", "pyproject.toml")
+VENV_STAMP_NAME = ".coverage-stamp.json"
 
 SLIPCOVER_ARGS: tuple[str, ...] = (
     "-m",
@@ -55,6 +92,14 @@ PYTEST_ARGS: tuple[str, ...] = (
     "-v",
 )
 DEFAULT_PYTEST_WORKERS = "auto"
+# Per-test durations from the previous run; empty disables duration-aware
+# scheduling. The action restores and saves it per branch.
+DURATIONS_FILE_ENV = "PYTEST_DURATIONS_FILE"
+# Directory holding the test-impact map and its baseline report; empty
+# disables test impact selection. ``record`` refreshes both after a full run,
+# ``select`` runs only the tests the change can affect.
+IMPACT_DIR_ENV = "TEST_IMPACT_DIR"
+IMPACT_MODE_ENV = "TEST_IMPACT_MODE"
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -172,6 +217,56 @@ def _install_coverage_tooling(python: Path) -> None:
     typer.echo(f"Coverage tooling installed into {COVERAGE_VENV}")
 
 
+def _project_fingerprint() -> str:
+    """Return the normalized digest of the project files that drive ``uv sync``.
+
+    ``fingerprint.lockfile_digest`` parses the TOML files first, so comment and
+    formatting churn in ``uv.lock`` or ``pyproject.toml`` keeps the venv.
+    """
+    return load_fingerprint().lockfile_digest(Path(name) for name in PROJECT_FILES)
+
+
+def _venv_python_version() -> str | None:
+    """Return the interpreter version recorded in the venv's ``pyvenv.cfg``."""
+    try:
+        text = (COVERAGE_VENV / "pyvenv.cfg").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    values: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
+    return values.get("version_info") or values.get("version") or None
+
+
+def _current_venv_stamp() -> dict[str, typ.Any]:
+    """Return the stamp describing what the venv should currently contain."""
+    return {
+        "python": _venv_python_version(),
+        "project": _project_fingerprint(),
+        "tooling": [*TOOLING_PACKAGES],
+    }
+
+
+def _read_venv_stamp() -> dict[str, typ.Any]:
+    """Return the stamp left by the last successful install, or ``{}``."""
+    try:
+        stamp = json.loads(
+            (COVERAGE_VENV / VENV_STAMP_NAME).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+    return stamp if isinstance(stamp, dict) else {}
+
+
+def _write_venv_stamp(stamp: cabc.Mapping[str, typ.Any]) -> None:
+    """Record ``stamp`` inside the coverage venv."""
+    (COVERAGE_VENV / VENV_STAMP_NAME).write_text(
+        json.dumps(stamp, sort_keys=True), encoding="utf-8"
+    )
+
+
 def _acquire_coverage_python() -> Path:
     """Discover or create the coverage venv and return its Python path.
 
@@ -233,6 +328,13 @@ def _ensure_coverage_venv() -> str:
     runs ``uv sync`` to install project dependencies, followed by
     ``uv pip install`` to add ``slipcover``, ``pytest``, and ``coverage``.
 
+    A stamp inside the venv records the interpreter version, a hash of
+    ``uv.lock`` and ``pyproject.toml``, and ``TOOLING_PACKAGES`` after a
+    successful install. A reused venv whose stamp still matches skips both
+    commands. When only ``TOOLING_PACKAGES`` changed, ``uv sync`` is skipped.
+    Any other change runs both, because ``uv sync`` may replace packages the
+    tooling install pinned.
+
     Returns
     -------
     str
@@ -257,7 +359,24 @@ def _ensure_coverage_venv() -> str:
             "tooling_packages": [*TOOLING_PACKAGES],
         },
     )
-    _sync_project_deps(python)
+    current = _current_venv_stamp()
+    previous = _read_venv_stamp()
+    same_python = current["python"] is not None and (
+        previous.get("python") == current["python"]
+    )
+    sync_needed = not same_python or previous.get("project") != current["project"]
+    tooling_needed = sync_needed or previous.get("tooling") != current["tooling"]
+    if not tooling_needed:
+        typer.echo(
+            f"Coverage venv at {COVERAGE_VENV} matches its stamp; "
+            "skipping uv sync and tooling install"
+        )
+        return str(python)
+    (COVERAGE_VENV / VENV_STAMP_NAME).unlink(missing_ok=True)
+    if sync_needed:
+        _sync_project_deps(python)
+    else:
+        typer.echo("Project dependencies unchanged; skipping uv sync")
     logger.info(
         "installing coverage tooling with uv pip",
         extra={
@@ -267,6 +386,7 @@ def _ensure_coverage_venv() -> str:
         },
     )
     _install_coverage_tooling(python)
+    _write_venv_stamp(current)
     return str(python)
 
 
@@ -277,7 +397,8 @@ def _ensure_coverage_venv() -> str:
 @lru_cache(maxsize=1)
 def _coverage_python_cmd() -> BoundCommand:
     """Return the coverage venv Python command, creating it on first use."""
-    python = _ensure_coverage_venv()
+    with phase_timing.span("venv"):
+        python = _ensure_coverage_venv()
     return local[python]
 
 
@@ -327,7 +448,12 @@ def _normalize_pytest_workers(raw: str | None) -> str:
         raise typer.Exit(2) from exc
 
 
-def _coverage_args(fmt: str, out: Path, workers: str = "") -> list[str]:
+def _coverage_args(
+    fmt: str,
+    out: Path,
+    workers: str = "",
+    pytest_args: cabc.Sequence[str] = (),
+) -> list[str]:
     """Return the slipcover/pytest argv for the requested format."""
     args: list[str] = [*SLIPCOVER_ARGS]
     if fmt == "cobertura":
@@ -336,10 +462,16 @@ def _coverage_args(fmt: str, out: Path, workers: str = "") -> list[str]:
     args.extend(PYTEST_ARGS)
     if workers:
         args.extend(["-n", workers])
+    args.extend(pytest_args)
     return args
 
 
-def coverage_cmd_for_fmt(fmt: str, out: Path, workers: str = "") -> BoundCommand:
+def coverage_cmd_for_fmt(
+    fmt: str,
+    out: Path,
+    workers: str = "",
+    pytest_args: cabc.Sequence[str] = (),
+) -> BoundCommand:
     """Return the slipcover command for the requested coverage format.
 
     Parameters
@@ -355,6 +487,8 @@ def coverage_cmd_for_fmt(fmt: str, out: Path, workers: str = "") -> BoundCommand
         Worker count for pytest-xdist's ``-n`` flag. Empty disables xdist;
         otherwise must already be a validated value such as ``"auto"`` or a
         non-negative integer string.
+    pytest_args : Sequence[str]
+        Extra pytest arguments appended after the worker count.
 
     Returns
     -------
@@ -362,7 +496,7 @@ def coverage_cmd_for_fmt(fmt: str, out: Path, workers: str = "") -> BoundCommand
         A plumbum command that runs slipcover via the coverage venv Python.
     """
     python_cmd = _coverage_python_cmd()
-    return python_cmd[_coverage_args(fmt, out, workers)]
+    return python_cmd[_coverage_args(fmt, out, workers, pytest_args)]
 
 
 @contextlib.contextmanager
@@ -393,7 +527,8 @@ def tmp_coveragepy_xml(out: Path) -> cabc.Generator[Path]:
     python_cmd = _coverage_python_cmd()
     try:
         cmd = python_cmd["-m", "coverage", "xml", "-o", str(xml_tmp)]
-        run_cmd(cmd)
+        with phase_timing.span("report"):
+            run_cmd(cmd)
     except ProcessExecutionError as exc:
         typer.echo(
             f"coverage xml failed with code {exc.retcode}: {exc.stderr}",
@@ -427,7 +562,12 @@ def _resolve_output_path(output_path: Path, lang: str) -> Path:
     return output_path
 
 
-def _run_coverage(fmt: str, out: Path, workers: str = "") -> str:
+def _run_coverage(
+    fmt: str,
+    out: Path,
+    workers: str = "",
+    pytest_args: cabc.Sequence[str] = (),
+) -> str:
     """Run slipcover and return the line coverage percentage.
 
     Parameters
@@ -438,6 +578,8 @@ def _run_coverage(fmt: str, out: Path, workers: str = "") -> str:
         Destination path for the coverage output file.
     workers : str
         Worker count for pytest-xdist's ``-n`` flag; empty disables xdist.
+    pytest_args : Sequence[str]
+        Extra pytest arguments, such as the scheduling plugin options.
 
     Returns
     -------
@@ -452,8 +594,9 @@ def _run_coverage(fmt: str, out: Path, workers: str = "") -> str:
         ``coveragepy`` format mode.
     """
     try:
-        cmd = coverage_cmd_for_fmt(fmt, out, workers)
-        run_cmd(cmd, method="run_fg")
+        cmd = coverage_cmd_for_fmt(fmt, out, workers, pytest_args)
+        with phase_timing.span("test"):
+            run_cmd(cmd, method="run_fg")
     except ProcessExecutionError as exc:
         raise typer.Exit(code=exc.retcode or 1) from exc
     except RuntimeError as exc:
@@ -468,6 +611,180 @@ def _run_coverage(fmt: str, out: Path, workers: str = "") -> str:
     return get_line_coverage_percent_from_cobertura(out)
 
 
+@contextlib.contextmanager
+def _env_overrides(values: cabc.Mapping[str, str]) -> cabc.Iterator[None]:
+    """Temporarily set the environment variables in ``values``."""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _report_makespan(plan: SchedulePlan | None, timings: RunTimings) -> None:
+    """Echo predicted and actual makespan and add them to the job summary."""
+    predicted = "n/a" if plan is None else f"{plan.predicted_makespan:.1f}s"
+    actual = f"{timings.actual_makespan:.1f}s"
+    typer.echo(
+        f"Pytest makespan: predicted {predicted}, actual {actual} "
+        f"across {len(timings.workers)} worker(s)"
+    )
+    summary_path = os.getenv("GITHUB_STEP_SUMMARY")
+    if not summary_path:
+        return
+    with Path(summary_path).open("a", encoding="utf-8") as handle:
+        handle.write(
+            "### Pytest schedule\n\n"
+            "| Workers | Predicted makespan | Actual makespan |\n"
+            "| --- | --- | --- |\n"
+            f"| {len(timings.workers)} | {predicted} | {actual} |\n\n"
+        )
+
+
+@contextlib.contextmanager
+def _duration_schedule(
+    workers: str, *, partial: bool = False
+) -> cabc.Iterator[tuple[str, list[str]]]:
+    """Balance the pytest run on recorded durations and record new ones.
+
+    Yields the worker count and extra pytest arguments to run with. When
+    ``PYTEST_DURATIONS_FILE`` is unset or empty both are passed through
+    unchanged. Otherwise the ``generate_coverage_schedule`` plugin is loaded
+    to record this run's durations, and a plan from
+    :func:`pytest_schedule.plan_schedule` switches the run to
+    ``--dist loadgroup``. After a successful run the file is replaced with the
+    new durations, or updated with them when ``partial`` runs only some of
+    the tests; a failed run leaves it untouched.
+    """
+    raw = os.getenv(DURATIONS_FILE_ENV, "").strip()
+    if not raw:
+        yield workers, []
+        return
+    durations_file = Path(raw)
+    history = load_durations(durations_file)
+    plan = plan_schedule(history, workers, cpu_count=os.cpu_count() or 1)
+    args = ["-p", PLUGIN_NAME]
+    with tempfile.TemporaryDirectory(prefix="pytest-schedule-") as tmp:
+        results = Path(tmp) / "timings.json"
+        env = {"PYTHONPATH": plugin_pythonpath(), RESULTS_ENV: str(results)}
+        if plan is not None:
+            plan_path = Path(tmp) / "plan.json"
+            write_plan(plan_path, plan)
+            env[PLAN_ENV] = str(plan_path)
+            args.extend(["--dist", "loadgroup"])
+            workers = plan.workers
+            typer.echo(
+                f"Pytest schedule: {plan.workers} worker(s), --dist loadgroup, "
+                f"predicted makespan {plan.predicted_makespan:.1f}s "
+                f"from {len(history)} recorded test(s)"
+            )
+        elif workers:
+            typer.echo("Pytest schedule: no duration history; using xdist defaults")
+        with _env_overrides(env):
+            yield workers, args
+        timings = read_run_timings(results)
+        if timings is None or not timings.durations:
+            typer.echo("Pytest schedule: no test durations were recorded", err=True)
+            return
+        durations = {**history, **timings.durations} if partial else timings.durations
+        save_durations(durations_file, durations)
+        _report_makespan(plan, timings)
+
+
+def _impact_selection(directory: Path) -> Selection | None:
+    """Return the selection for this change, or ``None`` to run everything."""
+    impact_map = load_impact_map(directory / MAP_NAME)
+    if impact_map is None or not (directory / BASELINE_NAME).is_file():
+        typer.echo("Test impact: no recorded map and baseline; running all tests")
+        return None
+    changes = changed_files(impact_map.sha)
+    if changes is None:
+        typer.echo(
+            f"Test impact: cannot diff against {impact_map.sha[:12]}; running all tests"
+        )
+        return None
+    selection = plan_selection(impact_map, changes)
+    if selection.full:
+        typer.echo(f"Test impact: {selection.reason}; running all tests")
+        return None
+    typer.echo(
+        f"Test impact: {len(changes)} changed file(s) since "
+        f"{impact_map.sha[:12]} select {len(selection.nodeids)} of "
+        f"{len(impact_map.tests)} recorded test(s) and "
+        f"{len(selection.paths)} new test file(s)"
+    )
+    return selection
+
+
+@contextlib.contextmanager
+def _test_impact(fmt: str, lang: str, out: Path) -> cabc.Iterator[ImpactRun]:
+    """Record the test-impact map, or run only the tests a change affects.
+
+    Does nothing unless ``TEST_IMPACT_DIR`` is set, the project is Python
+    only and the report is Cobertura. In ``record`` mode the
+    ``generate_coverage_impact`` plugin records which files each test
+    executes; after a successful run the map and a copy of the report are
+    stored in the directory and ``recorded`` is set. In ``select`` mode
+    :func:`impact_selection.plan_selection` deselects the unaffected tests and
+    the partial report is laid over the stored baseline; when nothing can be
+    selected safely the full suite runs and nothing is stored.
+    """
+    raw = os.getenv(IMPACT_DIR_ENV, "").strip()
+    if not raw:
+        yield ImpactRun()
+        return
+    if lang != "python" or fmt != "cobertura":
+        typer.echo(
+            "Test impact: needs a Python-only project with a Cobertura report; "
+            "running all tests"
+        )
+        yield ImpactRun()
+        return
+    directory = Path(raw)
+    mode = os.getenv(IMPACT_MODE_ENV, "").strip().lower() or "record"
+    if mode == "select":
+        selection = _impact_selection(directory)
+        if selection is None:
+            yield ImpactRun()
+            return
+        baseline = directory / BASELINE_NAME
+        if selection.empty:
+            typer.echo("Test impact: no test is affected; reusing the baseline")
+            yield ImpactRun(skip_tests=True, partial=True)
+            overlay_baseline(baseline, None, out, selection.replaced)
+            return
+        with tempfile.TemporaryDirectory(prefix="test-impact-") as tmp:
+            selection_path = Path(tmp) / "selection.json"
+            write_selection(selection_path, selection)
+            env = {"PYTHONPATH": plugin_pythonpath(), SELECT_ENV: str(selection_path)}
+            with _env_overrides(env):
+                yield ImpactRun(("-p", IMPACT_PLUGIN_NAME), partial=True)
+        overlay_baseline(baseline, out, out, selection.replaced)
+        return
+    run = ImpactRun(("-p", IMPACT_PLUGIN_NAME))
+    with tempfile.TemporaryDirectory(prefix="test-impact-") as tmp:
+        env = {"PYTHONPATH": plugin_pythonpath(), RECORD_ENV: tmp}
+        with _env_overrides(env):
+            yield run
+        sha = current_commit()
+        impact_map = collect_impact_map(Path(tmp), sha or "")
+    if sha is None or not impact_map.tests:
+        typer.echo("Test impact: no map was recorded", err=True)
+        return
+    run.recorded = directory / MAP_NAME
+    save_impact_map(run.recorded, impact_map)
+    shutil.copyfile(out, directory / BASELINE_NAME)
+    typer.echo(
+        f"Test impact: recorded {len(impact_map.tests)} test(s) over "
+        f"{len(impact_map.files())} file(s) at {sha[:12]}"
+    )
+
+
 def _resolve_pytest_workers(pytest_workers: str | None) -> str:
     """Resolve and validate the pytest-workers value; raise ValueError on invalid.
 
@@ -496,15 +813,23 @@ def _resolve_inputs(
     resolved_lang = lang or _required_env("DETECTED_LANG")
     resolved_fmt = fmt or _required_env("DETECTED_FMT")
     resolved_github_output = github_output or Path(_required_env("GITHUB_OUTPUT"))
+    if resolved_lang == "mixed" and resolved_fmt == "lcov":
+        # slipcover cannot write LCOV; the merge step converts its Cobertura
+        # report to match the Rust tracefile.
+        resolved_fmt = "cobertura"
     out = _resolve_output_path(resolved_output_path, resolved_lang)
     return out, resolved_fmt, resolved_github_output
 
 
-def _emit_github_output(path: Path, percent: str, github_output: Path) -> None:
+def _emit_github_output(
+    path: Path, percent: str, github_output: Path, impact_map: Path | None = None
+) -> None:
     """Write coverage outputs for later GitHub Actions steps."""
     with github_output.open("a") as fh:
         fh.write(f"file={path}\n")
         fh.write(f"percent={percent}\n")
+        if impact_map is not None:
+            fh.write(f"impact_map={impact_map}\n")
 
 
 _OutputPathOption = typ.Annotated[
@@ -558,24 +883,44 @@ def main(
     baseline_file: _BaselineFileOption = None,
     pytest_workers: _PytestWorkersOption = None,
 ) -> None:
-    """Run slipcover coverage and write the result to ``GITHUB_OUTPUT``."""
+    """Run slipcover coverage and write the result to ``GITHUB_OUTPUT``.
+
+    The venv, test, report and parse phases are timed by :mod:`phase_timing`.
+    With ``TEST_IMPACT_DIR`` set, :func:`_test_impact` may narrow the run to
+    the tests a change affects.
+    """
     out, fmt, github_output = _resolve_inputs(output_path, lang, fmt, github_output)
-    try:
-        workers = _resolve_pytest_workers(pytest_workers)
-    except ValueError as exc:
-        typer.echo(str(exc), err=True)
-        raise typer.Exit(2) from exc
-    if workers:
-        typer.echo(f"Pytest workers: {workers} (parallel via pytest-xdist)")
-    else:
-        typer.echo("Pytest workers: disabled (serial pytest run)")
-    out.parent.mkdir(parents=True, exist_ok=True)
-    percent = _run_coverage(fmt, out, workers)
-    typer.echo(f"Current coverage: {percent}%")
-    previous = read_previous_coverage(baseline_file)
-    if previous is not None:
-        typer.echo(f"Previous coverage: {previous}%")
-    _emit_github_output(out, percent, github_output)
+    with phase_timing.recording("run_python", github_output=github_output):
+        try:
+            workers = _resolve_pytest_workers(pytest_workers)
+        except ValueError as exc:
+            typer.echo(str(exc), err=True)
+            raise typer.Exit(2) from exc
+        if workers:
+            typer.echo(f"Pytest workers: {workers} (parallel via pytest-xdist)")
+        else:
+            typer.echo("Pytest workers: disabled (serial pytest run)")
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with _test_impact(fmt, lang or os.getenv("DETECTED_LANG", ""), out) as impact:
+            if not impact.skip_tests:
+                with _duration_schedule(workers, partial=impact.partial) as (
+                    scheduled_workers,
+                    pytest_args,
+                ):
+                    percent = _run_coverage(
+                        fmt,
+                        out,
+                        scheduled_workers,
+                        [*pytest_args, *impact.pytest_args],
+                    )
+        if impact.partial:
+            # The report now combines the selected tests with the baseline.
+            percent = get_line_coverage_percent_from_cobertura(out)
+        typer.echo(f"Current coverage: {percent}%")
+        previous = read_previous_coverage(baseline_file)
+        if previous is not None:
+            typer.echo(f"Previous coverage: {previous}%")
+        _emit_github_output(out, percent, github_output, impact.recorded)
 
 
 if __name__ == "__main__":
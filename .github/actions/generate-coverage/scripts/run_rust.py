@@ -14,37 +14,34 @@ import os
 import re
 import selectors
 import shlex
-import subprocess
 import sys
 import threading
 import time
 import typing as typ
-from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
+from types import MappingProxyType
 
 import _cargo_runner
+import phase_timing
 import typer
-from _cargo_runner import _run_cargo
+from _cargo_runner import CapturePolicy, _run_cargo
 from _cranelift import _CARGO_COVERAGE_ENV_UNSETS, get_cargo_coverage_env
-from cmd_utils_loader import run_cmd
+from cmd_utils_loader import load_cargo_utils
 from common import _env_bool, _required_env
-from coverage_parsers import get_line_coverage_percent_from_lcov
+from coverage_parsers import (
+    get_line_coverage_percent_from_cobertura,
+    get_line_coverage_percent_from_lcov,
+    read_lcov_totals,
+)
 from plumbum.cmd import cargo
-from plumbum.commands.processes import ProcessExecutionError
 from shared_utils import read_previous_coverage
 
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from coverage_parsers import LcovSummary
+
 logger = logging.getLogger(__name__)
 _cargo_runner_run_cargo = _run_cargo
 
-try:  # runtime import for graceful fallback
-    from lxml import etree
-except ImportError as exc:  # pragma: no cover - fail fast if dependency missing
-    typer.echo(
-        "lxml is required for Cobertura parsing. Install with 'pip install lxml'.",
-        err=True,
-    )
-    raise typer.Exit(1) from exc
-
 if os.name == "nt":
     debug = os.getenv("RUN_RUST_DEBUG")
     if debug:
@@ -96,6 +93,7 @@ def _run_cargo(
     *,
     env_overrides: typ.Mapping[str, str] | None = None,
     env_unsets: typ.Iterable[str] = (),
+    capture: CapturePolicy | None = None,
 ) -> str:
     """Run ``cargo`` with ``args`` streaming output and return ``stdout``.
 
@@ -119,11 +117,15 @@ def _run_cargo(
         Unsets are performed before overrides, so ``env_overrides`` can
         unconditionally set a variable that may or may not have been
         inherited.
+    capture : CapturePolicy | None, optional
+        Which stdout lines to return. When ``None`` (the default) every line
+        is kept. ``RUN_RUST_CAPTURE=full`` overrides any policy.
 
     Returns
     -------
     str
-        Captured stdout from the ``cargo`` invocation.
+        Retained stdout lines from the ``cargo`` invocation, joined by
+        newlines.
     """
     _cargo_runner.cargo = cargo
     _cargo_runner.selectors = selectors
@@ -134,9 +136,45 @@ def _run_cargo(
         args,
         env_overrides=env_overrides,
         env_unsets=env_unsets,
+        capture=capture,
     )
 
 
+# Only the summary lines carrying a percentage are kept from a coverage run's
+# stdout; passes whose stdout is never read keep nothing.
+_PERCENT_PATTERN = re.compile(
+    r"(?:coverage|Coverage).*?([0-9]+(?:\.[0-9]+)?)%", re.IGNORECASE
+)
+SUMMARY_CAPTURE = CapturePolicy.matching(_PERCENT_PATTERN)
+_DISCARD_CAPTURE = CapturePolicy.last(0)
+_PARTITION_PATTERN = re.compile(r"(?:count|hash|slice):(?P<index>\d+)/(?P<total>\d+)")
+
+# Report formats that can be rendered from one instrumented run, mapped to the
+# file suffix used for their output.
+_REPORT_SUFFIXES: typ.Mapping[str, str] = MappingProxyType(
+    {"lcov": ".info", "cobertura": ".xml"}
+)
+
+
+def _llvm_cov_args(manifest_path: Path, *, use_nextest: bool) -> list[str]:
+    """Return the ``cargo llvm-cov`` prefix shared by every test invocation."""
+    args = ["llvm-cov"]
+    if use_nextest:
+        args.append("nextest")
+    args += ["--manifest-path", str(manifest_path), "--workspace"]
+    return args
+
+
+def _feature_args(features: str, *, with_default: bool) -> list[str]:
+    """Return the cargo feature selection flags."""
+    args: list[str] = []
+    if not with_default:
+        args.append("--no-default-features")
+    if features:
+        args += ["--features", features]
+    return args
+
+
 def get_cargo_coverage_cmd(
     fmt: str,
     out: Path,
@@ -145,6 +183,7 @@ def get_cargo_coverage_cmd(
     manifest_path: Path,
     with_default: bool,
     use_nextest: bool,
+    partition: str = "",
 ) -> list[str]:
     """Return the cargo llvm-cov command arguments.
 
@@ -155,122 +194,153 @@ def get_cargo_coverage_cmd(
     coverage. Other formats keep the flag so the streamed summary output
     remains parseable.
     """
-    args = ["llvm-cov"]
-    if use_nextest:
-        args.append("nextest")
-    args += ["--manifest-path", str(manifest_path), "--workspace"]
+    args = _llvm_cov_args(manifest_path, use_nextest=use_nextest)
     if fmt not in ("lcov", "cobertura"):
         args.append("--summary-only")
-    if not with_default:
-        args.append("--no-default-features")
-    if features:
-        args += ["--features", features]
+    args += _feature_args(features, with_default=with_default)
+    args += _partition_args(partition)
     args += [f"--{fmt}", "--output-path", str(out)]
     return args
 
 
-def extract_percent(output: str) -> str:
-    """Return the coverage percentage extracted from ``output``."""
-    match = re.search(
-        r"(?:coverage|Coverage).*?([0-9]+(?:\.[0-9]+)?)%",
-        output,
-        re.MULTILINE | re.IGNORECASE,
-    )
-    if not match:
-        typer.echo("Could not parse coverage percent", err=True)
-        raise typer.Exit(1)
-    return match[1]
+def get_cargo_no_report_cmd(
+    features: str,
+    *,
+    manifest_path: Path,
+    with_default: bool,
+    use_nextest: bool,
+    partition: str = "",
+    archive: Path | None = None,
+) -> list[str]:
+    """Return the cargo llvm-cov arguments that run tests without reporting.
 
+    Profiles from successive ``--no-report`` runs accumulate in the target
+    directory until rendered by :func:`get_cargo_report_cmd`. With
+    ``archive`` the tests run from that nextest archive instead of being
+    built, so the workspace and feature selection are taken from the archive.
+    """
+    if archive is not None:
+        args = ["llvm-cov", "nextest", "--manifest-path", str(manifest_path)]
+        args += ["--archive-file", str(archive)]
+    else:
+        args = _llvm_cov_args(manifest_path, use_nextest=use_nextest)
+        args += _feature_args(features, with_default=with_default)
+    args += _partition_args(partition)
+    args.append("--no-report")
+    return args
 
-def _format_percent(covered: int, total: int) -> str:
-    """Format coverage counts as a two-decimal-place percentage string."""
-    pct = Decimal(covered) * Decimal(100) / Decimal(total)
-    return str(pct.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
 
+def get_cargo_archive_cmd(
+    archive: Path,
+    features: str,
+    *,
+    manifest_path: Path,
+    with_default: bool,
+) -> list[str]:
+    """Return the arguments building the instrumented nextest ``archive``."""
+    args = ["llvm-cov", "nextest-archive", "--manifest-path", str(manifest_path)]
+    args += ["--workspace", *_feature_args(features, with_default=with_default)]
+    args += ["--archive-file", str(archive)]
+    return args
 
-def get_line_coverage_percent_from_cobertura(xml_file: Path) -> str:
-    """Return overall line coverage % from a Cobertura XML file."""
-    try:
-        root = etree.parse(str(xml_file)).getroot()
-    except (FileNotFoundError, PermissionError) as exc:
-        typer.echo(f"Could not read {xml_file}: {exc}", err=True)
-        raise typer.Exit(1) from exc
-    except etree.XMLSyntaxError as exc:
-        typer.echo(f"Invalid XML in {xml_file}: {exc}", err=True)
-        raise typer.Exit(1) from exc
 
-    try:
-        total = int(typ.cast("float", root.xpath("count(//class/lines/line)")))
-        covered = int(
-            typ.cast("float", root.xpath("count(//class/lines/line[@hits>0])"))
-        )
-    except etree.XPathError as exc:
-        typer.echo(f"Malformed Cobertura data: {exc}", err=True)
-        raise typer.Exit(1) from exc
-
-    if total == 0:
-        try:
-            covered = int(
-                typ.cast("float", root.xpath("number(/coverage/@lines-covered)"))
-            )
-            total = int(typ.cast("float", root.xpath("number(/coverage/@lines-valid)")))
-        except etree.XPathError as exc:
-            typer.echo(f"Cobertura summary missing: {exc}", err=True)
-            raise typer.Exit(1) from exc
+def get_cargo_report_cmd(
+    fmt: str,
+    out: Path,
+    *,
+    manifest_path: Path,
+    archive: Path | None = None,
+) -> list[str]:
+    """Return the arguments rendering accumulated profiles as a ``fmt`` report.
 
-    if total == 0:
-        return "0.00"
+    Profiles recorded from a nextest ``archive`` are matched against the
+    binaries in that archive.
+    """
+    args = ["llvm-cov", "report", "--manifest-path", str(manifest_path)]
+    if archive is not None:
+        args += ["--nextest-archive-file", str(archive)]
+    args += [f"--{fmt}", "--output-path", str(out)]
+    return args
 
-    return _format_percent(covered, total)
 
+def _partition_args(partition: str) -> list[str]:
+    """Return the nextest ``--partition`` flag for ``partition``, if any."""
+    return ["--partition", partition] if partition else []
 
-def _merge_lcov(base: Path, extra: Path) -> None:
-    """Merge two lcov files ensuring they end with ``end_of_record``."""
-    try:
-        base_text = base.read_text()
-        extra_text = extra.read_text()
-    except (FileNotFoundError, PermissionError) as exc:
-        typer.echo(f"Could not read coverage file: {exc}", err=True)
-        raise typer.Exit(1) from exc
-
-    if not base_text.rstrip().endswith("end_of_record"):
-        typer.echo(f"Malformed lcov data in {base}", err=True)
+
+def _resolve_partition(partition: str, *, use_nextest: bool) -> str:
+    """Return the validated ``nextest-partition`` value (empty when unset).
+
+    nextest accepts ``count:M/N``, ``hash:M/N`` and ``slice:M/N``; partitions
+    need cargo-nextest.
+    """
+    partition = partition.strip()
+    if not partition:
+        return ""
+    match = _PARTITION_PATTERN.fullmatch(partition)
+    if match is None or not 1 <= int(match["index"]) <= int(match["total"]):
+        typer.echo(
+            f"Invalid nextest-partition: {partition} "
+            "(expected count:M/N, hash:M/N or slice:M/N)",
+            err=True,
+        )
         raise typer.Exit(1)
-    if not extra_text.rstrip().endswith("end_of_record"):
-        typer.echo(f"Malformed lcov data in {extra}", err=True)
+    if not use_nextest:
+        typer.echo("nextest-partition requires use-cargo-nextest", err=True)
         raise typer.Exit(1)
+    return partition
 
-    if not base_text.endswith("\n"):
-        base_text += "\n"
-    if not extra_text.endswith("\n"):
-        extra_text += "\n"
 
-    base.write_text(base_text + extra_text)
+def _is_first_partition(partition: str) -> bool:
+    """Return ``True`` for unpartitioned runs and for partition ``1/N``."""
+    match = _PARTITION_PATTERN.fullmatch(partition)
+    return match is None or match["index"] == "1"
 
 
-def run_cucumber_rs_coverage(
-    out: Path,
-    fmt: str,
-    features: str,
-    *,
-    manifest_path: Path,
-    cargo_env: typ.Mapping[str, str],
-    with_default: bool,
-    use_nextest: bool,
-    cucumber_rs_features: str,
-    cucumber_rs_args: str,
-) -> None:
-    """Run cucumber.rs coverage and merge results into ``out``."""
-    cucumber_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
-    c_args = get_cargo_coverage_cmd(
-        fmt,
-        cucumber_file,
-        features,
-        manifest_path=manifest_path,
-        with_default=with_default,
-        use_nextest=use_nextest,
-    )
-    c_args += [
+def _resolve_archive(
+    archive: Path | None, *, use_nextest: bool, with_cucumber: bool
+) -> Path | None:
+    """Return the nextest archive to build or reuse, or ``None`` to build normally.
+
+    The cucumber.rs pass selects its harness with cargo's ``--test`` flag,
+    which nextest rejects when running from an archive, so archives are not
+    used while it is enabled.
+    """
+    if archive is None or not str(archive).strip():
+        return None
+    if not use_nextest:
+        typer.echo(
+            "::warning::nextest archives need use-cargo-nextest; building normally",
+            err=True,
+        )
+        return None
+    if with_cucumber:
+        typer.echo(
+            "::warning::nextest archives are not used with with-cucumber-rs; "
+            "building normally",
+            err=True,
+        )
+        return None
+    return archive
+
+
+def get_cargo_clean_cmd(manifest_path: Path) -> list[str]:
+    """Return the arguments removing stale coverage profiles for the workspace."""
+    return ["llvm-cov", "clean", "--workspace", "--manifest-path", str(manifest_path)]
+
+
+def extract_percent(output: str) -> str:
+    """Return the coverage percentage extracted from ``output``."""
+    match = _PERCENT_PATTERN.search(output)
+    if not match:
+        typer.echo("Could not parse coverage percent", err=True)
+        raise typer.Exit(1)
+    return match[1]
+
+
+def _cucumber_args(cucumber_rs_features: str, cucumber_rs_args: str) -> list[str]:
+    """Return the trailing arguments that select and configure the cucumber test."""
+    args = [
         "--",
         "--test",
         "cucumber",
@@ -280,33 +350,25 @@ def run_cucumber_rs_coverage(
         cucumber_rs_features,
     ]
     if cucumber_rs_args:
-        c_args += shlex.split(cucumber_rs_args)
+        args += shlex.split(cucumber_rs_args)
+    return args
 
-    _run_cargo(
-        c_args,
-        env_overrides=cargo_env,
-        env_unsets=_CARGO_COVERAGE_ENV_UNSETS,
-    )
 
-    if fmt == "cobertura":
-        from plumbum.cmd import uvx
-
-        try:
-            cmd = uvx["merge-cobertura", str(out), str(cucumber_file)]
-            merged = run_cmd(cmd)
-        except (ProcessExecutionError, subprocess.CalledProcessError) as exc:
-            retcode = getattr(exc, "retcode", getattr(exc, "returncode", None))
-            stderr = getattr(exc, "stderr", "")
-            typer.echo(
-                f"merge-cobertura failed with code {retcode}: {stderr}",
-                err=True,
-            )
-            raise typer.Exit(code=retcode or 1) from exc
-        out.write_text(merged)
-    else:
-        _merge_lcov(out, cucumber_file)
+def _cucumber_target_missing(manifest_path: Path) -> bool:
+    """Return ``True`` when cargo metadata proves there is no cucumber target.
 
-    cucumber_file.unlink()
+    Only consulted in ``CARGO_UTILS_RESOLVER=metadata`` mode; otherwise, or
+    when ``cargo metadata`` is unavailable, the cucumber pass runs as before.
+    """
+    cargo_utils = load_cargo_utils()
+    if cargo_utils.resolver_mode() != "metadata":
+        return False
+    model = cargo_utils.load_workspace_metadata(manifest_path)
+    if model is None:
+        return False
+    return not any(
+        package.has_target("cucumber", "test") for package in model.packages.values()
+    )
 
 
 @contextlib.contextmanager
@@ -364,10 +426,48 @@ def _resolve_output_path(output_path: Path, lang: str) -> Path:
     return output_path
 
 
+def _write_worst_files(
+    summary_path: Path, summary: LcovSummary, limit: int = 10
+) -> None:
+    """Append the least-covered source files to the GitHub step summary."""
+    worst = summary.worst_files(limit)
+    if not worst:
+        return
+    cwd = Path.cwd()
+    lines = [
+        "### Least-covered files",
+        "",
+        "| File | Lines hit | Line % | Branch % |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    for source, totals in worst:
+        path = Path(source)
+        if path.is_relative_to(cwd):
+            path = path.relative_to(cwd)
+        label = path.as_posix().replace("|", "\\|")
+        branch = totals.branch_percent if totals.branches_found else "-"
+        lines.append(
+            f"| `{label}` "
+            f"| {totals.lines_hit}/{totals.lines_found} "
+            f"| {totals.line_percent} | {branch} |"
+        )
+    with summary_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n\n")
+
+
 def _compute_coverage_percent(fmt: str, out: Path, stdout: str) -> str:
-    """Return the coverage percentage for the given output format."""
+    """Return the coverage percentage for the given output format.
+
+    For LCOV output the per-file totals gathered in the same pass are used to
+    publish the least-covered files when ``GITHUB_STEP_SUMMARY`` is set.
+    """
     if fmt == "lcov":
-        return get_line_coverage_percent_from_lcov(out)
+        summary_path = os.getenv("GITHUB_STEP_SUMMARY")
+        if not summary_path:
+            return get_line_coverage_percent_from_lcov(out)
+        summary = read_lcov_totals(out, per_file=True)
+        _write_worst_files(Path(summary_path), summary)
+        return summary.totals.line_percent
     if fmt == "cobertura":
         return get_line_coverage_percent_from_cobertura(out)
     return extract_percent(stdout)
@@ -378,14 +478,162 @@ def _report_coverage(
     previous: str | None,
     github_output: Path,
     out: Path,
+    reports: typ.Mapping[str, Path] | None = None,
 ) -> None:
-    """Echo coverage figures and write them to GITHUB_OUTPUT."""
+    """Echo coverage figures and write them to GITHUB_OUTPUT.
+
+    Each entry of ``reports`` is also written as a ``file_<format>`` output.
+    """
     typer.echo(f"Current coverage: {percent}%")
     if previous is not None:
         typer.echo(f"Previous coverage: {previous}%")
     with github_output.open("a") as fh:
         fh.write(f"file={out}\n")
         fh.write(f"percent={percent}\n")
+        for name, path in (reports or {}).items():
+            fh.write(f"file_{name}={path}\n")
+
+
+def _resolve_formats(fmt: str, extra_formats: str) -> list[str]:
+    """Return ``fmt`` followed by the distinct formats listed in ``extra_formats``.
+
+    ``extra_formats`` is a comma- or whitespace-separated list; only formats
+    that ``cargo llvm-cov report`` writes to a file are accepted.
+    """
+    formats = [fmt]
+    for raw in re.split(r"[\s,]+", extra_formats.strip()):
+        name = raw.lower()
+        if not name or name in formats:
+            continue
+        if name not in _REPORT_SUFFIXES:
+            valid = ", ".join(_REPORT_SUFFIXES)
+            typer.echo(
+                f"Unsupported extra format: {raw} (expected one of: {valid})",
+                err=True,
+            )
+            raise typer.Exit(1)
+        formats.append(name)
+    if len(formats) > 1 and fmt not in _REPORT_SUFFIXES:
+        typer.echo(f"extra-formats cannot be combined with format {fmt}", err=True)
+        raise typer.Exit(1)
+    return formats
+
+
+def _report_paths(out: Path, formats: typ.Sequence[str]) -> dict[str, Path]:
+    """Map each format to its report path; the first format is written to ``out``.
+
+    Extra reports sit beside ``out``, named ``<stem>.<format><suffix>``.
+    """
+    primary, *extras = formats
+    paths = {primary: out}
+    for name in extras:
+        paths[name] = out.with_name(f"{out.stem}.{name}{_REPORT_SUFFIXES[name]}")
+    return paths
+
+
+def _want_cucumber(
+    manifest_path: Path,
+    *,
+    with_cucumber_rs: bool,
+    cucumber_rs_features: str,
+) -> bool:
+    """Return ``True`` when the cucumber.rs pass should run."""
+    if not (with_cucumber_rs and cucumber_rs_features):
+        return False
+    if _cucumber_target_missing(manifest_path):
+        typer.echo(
+            "::warning::with-cucumber-rs is set but no workspace member has "
+            "a 'cucumber' test target; skipping the cucumber pass",
+            err=True,
+        )
+        return False
+    return True
+
+
+def run_shared_build_coverage(
+    reports: typ.Mapping[str, Path],
+    features: str,
+    *,
+    manifest_path: Path,
+    cargo_env: typ.Mapping[str, str],
+    with_default: bool,
+    use_nextest: bool,
+    cucumber_rs_features: str,
+    cucumber_rs_args: str,
+    with_cucumber_rs: bool,
+    partition: str = "",
+    archive: Path | None = None,
+) -> str:
+    """Run every pass against one instrumented build and render each report.
+
+    Stale profiles are cleared, the tests (and the cucumber.rs scenarios when
+    requested) run with ``--no-report`` against the same instrumented build,
+    so their profiles accumulate in one target directory, and
+    ``cargo llvm-cov report`` then renders every entry of ``reports`` from
+    that data. Because the cucumber profiles are included directly, no report
+    merge is needed. ``with_cucumber_rs`` is the already-resolved decision
+    from :func:`_want_cucumber`.
+
+    With ``archive`` the instrumented build is the nextest archive: it is
+    built with ``cargo llvm-cov nextest-archive`` only when the file is
+    missing (for instance on a cache miss) and the tests then run from it, so
+    a restored archive skips compilation entirely. ``partition`` restricts
+    the main test pass to one nextest partition; the cucumber.rs pass is not
+    partitioned.
+
+    Returns
+    -------
+    str
+        Captured stdout of the report for the first format.
+    """
+
+    def cargo_run(
+        phase: str, args: list[str], capture: CapturePolicy = _DISCARD_CAPTURE
+    ) -> str:
+        with phase_timing.span(phase):
+            return _run_cargo(
+                args,
+                env_overrides=cargo_env,
+                env_unsets=_CARGO_COVERAGE_ENV_UNSETS,
+                capture=capture,
+            )
+
+    def no_report(*, partition: str = "", archive: Path | None = None) -> list[str]:
+        return get_cargo_no_report_cmd(
+            features,
+            manifest_path=manifest_path,
+            with_default=with_default,
+            use_nextest=use_nextest,
+            partition=partition,
+            archive=archive,
+        )
+
+    cargo_run("clean", get_cargo_clean_cmd(manifest_path))
+    if archive is not None and not archive.is_file():
+        cargo_run(
+            "archive",
+            get_cargo_archive_cmd(
+                archive,
+                features,
+                manifest_path=manifest_path,
+                with_default=with_default,
+            ),
+        )
+    cargo_run("test", no_report(partition=partition, archive=archive))
+    if with_cucumber_rs:
+        cucumber = _cucumber_args(cucumber_rs_features, cucumber_rs_args)
+        cargo_run("cucumber", [*no_report(), *cucumber])
+    outputs = [
+        cargo_run(
+            "report",
+            get_cargo_report_cmd(
+                name, path, manifest_path=manifest_path, archive=archive
+            ),
+            SUMMARY_CAPTURE,
+        )
+        for name, path in reports.items()
+    ]
+    return outputs[0]
 
 
 def _resolve_bool_input(
@@ -414,8 +662,21 @@ def main(
     cucumber_rs_args: typ.Annotated[str, typer.Option()] = "",
     with_cucumber_rs: typ.Annotated[bool | None, typer.Option()] = None,
     baseline_file: typ.Annotated[Path | None, typer.Option()] = None,
+    extra_formats: typ.Annotated[str, typer.Option()] = "",
+    nextest_archive_file: typ.Annotated[Path | None, typer.Option()] = None,
+    nextest_partition: typ.Annotated[str, typer.Option()] = "",
 ) -> None:
-    """Run cargo llvm-cov and write the output file path to ``GITHUB_OUTPUT``."""
+    """Run cargo llvm-cov and write the output file path to ``GITHUB_OUTPUT``.
+
+    ``extra_formats`` (or ``INPUT_EXTRA_FORMATS``) lists further report formats
+    to render from the same instrumented run. Extra formats and the
+    cucumber.rs pass both use :func:`run_shared_build_coverage`, as does a
+    run with ``nextest_archive_file`` (``INPUT_NEXTEST_ARCHIVE_FILE``), which
+    builds that archive when it is missing and runs the tests from it.
+    ``nextest_partition`` (``INPUT_NEXTEST_PARTITION``) is passed to nextest
+    as ``--partition``; only partition ``1/N`` runs the cucumber.rs pass.
+    The cargo passes and report parsing are timed by :mod:`phase_timing`.
+    """
     output_path = output_path or Path(_required_env("INPUT_OUTPUT_PATH"))
     lang = lang or _required_env("DETECTED_LANG")
     fmt = fmt or _required_env("DETECTED_FMT")
@@ -437,32 +698,40 @@ def main(
     with_cucumber_rs = _resolve_bool_input(
         with_cucumber_rs, "INPUT_WITH_CUCUMBER_RS", default=False
     )
+    if nextest_archive_file is None:
+        archive_env = os.getenv("INPUT_NEXTEST_ARCHIVE_FILE", "").strip()
+        nextest_archive_file = Path(archive_env) if archive_env else None
+    partition = _resolve_partition(
+        nextest_partition or os.getenv("INPUT_NEXTEST_PARTITION", ""),
+        use_nextest=use_nextest,
+    )
     out = _resolve_output_path(output_path, lang)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    args = get_cargo_coverage_cmd(
-        fmt,
+    reports = _report_paths(
         out,
-        features,
-        manifest_path=manifest_path,
-        with_default=with_default,
-        use_nextest=use_nextest,
+        _resolve_formats(fmt, extra_formats or os.getenv("INPUT_EXTRA_FORMATS", "")),
     )
+
     config_context = (
         ensure_nextest_config() if use_nextest else contextlib.nullcontext()
     )
     cargo_env = get_cargo_coverage_env(manifest_path)
-    with config_context:
-        stdout = _run_cargo(
-            args,
-            env_overrides=cargo_env,
-            env_unsets=_CARGO_COVERAGE_ENV_UNSETS,
+    timing = phase_timing.recording("run_rust", github_output=github_output)
+    with timing, config_context:
+        with_cucumber = _is_first_partition(partition) and _want_cucumber(
+            manifest_path,
+            with_cucumber_rs=with_cucumber_rs,
+            cucumber_rs_features=cucumber_rs_features,
         )
-
-        if with_cucumber_rs and cucumber_rs_features:
-            run_cucumber_rs_coverage(
-                out,
-                fmt,
+        archive = _resolve_archive(
+            nextest_archive_file,
+            use_nextest=use_nextest,
+            with_cucumber=with_cucumber_rs and bool(cucumber_rs_features),
+        )
+        if len(reports) > 1 or with_cucumber or archive is not None:
+            stdout = run_shared_build_coverage(
+                reports,
                 features,
                 manifest_path=manifest_path,
                 cargo_env=cargo_env,
@@ -470,10 +739,31 @@ def main(
                 use_nextest=use_nextest,
                 cucumber_rs_features=cucumber_rs_features,
                 cucumber_rs_args=cucumber_rs_args,
+                with_cucumber_rs=with_cucumber,
+                partition=partition,
+                archive=archive,
             )
-    percent = _compute_coverage_percent(fmt, out, stdout)
-    previous = read_previous_coverage(baseline_file)
-    _report_coverage(percent, previous, github_output, out)
+        else:
+            args = get_cargo_coverage_cmd(
+                fmt,
+                out,
+                features,
+                manifest_path=manifest_path,
+                with_default=with_default,
+                use_nextest=use_nextest,
+                partition=partition,
+            )
+            # One invocation builds, tests and reports, so it is one phase.
+            with phase_timing.span("test"):
+                stdout = _run_cargo(
+                    args,
+                    env_overrides=cargo_env,
+                    env_unsets=_CARGO_COVERAGE_ENV_UNSETS,
+                    capture=SUMMARY_CAPTURE,
+                )
+        percent = _compute_coverage_percent(fmt, out, stdout)
+        previous = read_previous_coverage(baseline_file)
+        _report_coverage(percent, previous, github_output, out, reports)
 
 
 if __name__ == "__main__":
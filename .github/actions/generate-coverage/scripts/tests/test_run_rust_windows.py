@@ -110,3 +110,13 @@ def test_pump_cargo_output_windows_streams(
     assert captured_stderr.getvalue() == stderr_payload
     assert not dummy_proc.killed
     assert dummy_proc.wait_timeouts == []
+
+
+def test_line_collector_reassembles_split_chunks() -> None:
+    """Lines and UTF-8 sequences split across chunks are reassembled."""
+    collector = run_rust._LineCollector()
+    payload = "héllo\r\nwörld\npartial".encode()
+    for index in range(len(payload)):
+        collector.feed(payload[index : index + 1])
+
+    assert collector.close() == ["héllo", "wörld", "partial"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
 import typing as typ
@@ -16,11 +17,14 @@ if sys.platform.startswith("win"):
 from test_support.cmd_mox_stub_adapter import StubManager
 
 if typ.TYPE_CHECKING:
+    from types import ModuleType
+
     from cmd_mox import CmdMox
 
 
 ROOT = find_project_root(start=Path(__file__).resolve().parent)
 prepend_to_syspath(ROOT)
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
 
 
 @pytest.fixture
@@ -31,3 +35,28 @@ def shell_stubs(cmd_mox: CmdMox, monkeypatch: pytest.MonkeyPatch) -> StubManager
             "PYTHONPATH", f"{ROOT}{os.pathsep}{os.getenv('PYTHONPATH', '')}"
         )
         yield mgr
+
+
+@pytest.fixture
+def load_script(
+    monkeypatch: pytest.MonkeyPatch,
+) -> typ.Callable[[str], ModuleType]:
+    """Return a loader that imports ``scripts/<name>.py`` for direct testing.
+
+    The scripts directory is prepended to ``sys.path`` so sibling imports
+    resolve, and each loaded module is registered in ``sys.modules`` for the
+    duration of the test.
+    """
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+
+    def load(name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+        if spec is None or spec.loader is None:  # pragma: no cover - defensive
+            msg = f"cannot load {name} from {SCRIPTS_DIR}"
+            raise ImportError(msg)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -84,3 +84,20 @@ def test_run_cmd_missing_symbol(
     msg = str(excinfo.value)
     assert "run_cmd" in msg
     assert str(tmp_path / mod.CMD_UTILS_FILENAME) in msg
+
+
+def test_load_fingerprint_imports_repo_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``load_fingerprint`` imports ``fingerprint.py`` from the repository root."""
+    monkeypatch.delenv("GITHUB_ACTION_PATH", raising=False)
+    # Let monkeypatch restore the real module after the loader replaces it.
+    monkeypatch.setitem(sys.modules, "fingerprint", None)
+    (tmp_path / "fingerprint.py").write_text("MARKER = 'repo'\n")
+    mod = _load_loader(tmp_path, monkeypatch, cmd_utils_content="")
+
+    fingerprint = mod.load_fingerprint()
+
+    assert fingerprint.MARKER == "repo"
+    assert sys.modules["fingerprint"] is fingerprint
+    assert mod.load_fingerprint() is fingerprint
@@ -0,0 +1,124 @@
+"""Tests for the in-process Cobertura merger."""
+
+from __future__ import annotations
+
+import typing as typ
+
+import pytest
+from lxml import etree
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+    from types import ModuleType
+
+MAIN = """<?xml version="1.0" ?>
+<coverage version="7.0" timestamp="1" lines-valid="3" lines-covered="1"
+    line-rate="0.3333" branch-rate="0.5" complexity="0">
+  <sources><source>/work</source></sources>
+  <packages>
+    <package name="app" line-rate="0.3333" branch-rate="0.5" complexity="0">
+      <classes>
+        <class name="main.rs" filename="src/main.rs" line-rate="0.3333"
+            branch-rate="0.5" complexity="0">
+          <methods/>
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="0" branch="true"
+                condition-coverage="50% (1/2)"/>
+            <line number="3" hits="0"/>
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+CUCUMBER = """<?xml version="1.0" ?>
+<coverage version="7.0" timestamp="2" lines-valid="3" lines-covered="3">
+  <sources><source>/work</source></sources>
+  <packages>
+    <package name="app">
+      <classes>
+        <class name="main.rs" filename="src/main.rs">
+          <lines>
+            <line number="2" hits="4" branch="true"
+                condition-coverage="100% (2/2)"/>
+            <line number="4" hits="1"/>
+          </lines>
+        </class>
+        <class name="lib.rs" filename="src/lib.rs">
+          <lines><line number="1" hits="2"/></lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+@pytest.fixture
+def cobertura_merge(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``cobertura_merge`` module for direct testing."""
+    return load_script("cobertura_merge")
+
+
+def _write(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_merge_sums_hits_and_recomputes_totals(
+    tmp_path: Path, cobertura_merge: ModuleType
+) -> None:
+    """Matching classes are merged line by line and root totals recomputed."""
+    main = _write(tmp_path, "main.xml", MAIN)
+    cuke = _write(tmp_path, "cuke.xml", CUCUMBER)
+
+    cobertura_merge.merge_cobertura_files([main, cuke], main)
+
+    root = etree.parse(str(main)).getroot()
+    assert root.get("lines-valid") == "5"
+    assert root.get("lines-covered") == "4"
+    assert root.get("line-rate") == "0.8"
+    assert root.get("branches-valid") == "2"
+    assert root.get("branches-covered") == "2"
+    assert root.get("branch-rate") == "1"
+    assert root.get("timestamp") == "1"
+    assert [s.text for s in root.iter("source")] == ["/work"]
+    classes = root.findall("packages/package/classes/class")
+    assert [c.get("filename") for c in classes] == ["src/main.rs", "src/lib.rs"]
+    lines = {
+        int(line.get("number")): dict(line.attrib)
+        for line in classes[0].iterfind("lines/line")
+    }
+    assert sorted(lines) == [1, 2, 3, 4]
+    assert lines[2]["hits"] == "4"
+    assert lines[2]["condition-coverage"] == "100% (2/2)"
+    assert classes[0].get("line-rate") == "0.75"
+
+
+def test_merge_accepts_many_inputs(tmp_path: Path, cobertura_merge: ModuleType) -> None:
+    """Any number of reports can be merged into a separate output."""
+    inputs = [_write(tmp_path, f"s{i}.xml", CUCUMBER) for i in range(3)]
+    out = tmp_path / "out.xml"
+
+    cobertura_merge.merge_cobertura_files(inputs, out)
+
+    root = etree.parse(str(out)).getroot()
+    hits = [line.get("hits") for line in root.iter("line")]
+    assert hits == ["12", "3", "6"]
+    assert all(path.exists() for path in inputs)
+
+
+def test_merge_rejects_invalid_xml(tmp_path: Path, cobertura_merge: ModuleType) -> None:
+    """Malformed input raises and leaves the output untouched."""
+    main = _write(tmp_path, "main.xml", MAIN)
+    bad = _write(tmp_path, "bad.xml", "<coverage>")
+
+    with pytest.raises(cobertura_merge.CoberturaMergeError, match=r"bad\.xml"):
+        cobertura_merge.merge_cobertura_files([main, bad], main)
+
+    assert main.read_text() == MAIN
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.xml", "main.xml"]
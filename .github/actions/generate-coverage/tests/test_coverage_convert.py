@@ -0,0 +1,247 @@
+"""Tests for the LCOV and Cobertura converter."""
+
+from __future__ import annotations
+
+import typing as typ
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from types import ModuleType
+
+LCOV = """TN:
+SF:/work/src/a.rs
+FN:1,foo
+FN:5,bar
+FNDA:2,foo
+FNDA:0,bar
+FNF:2
+FNH:1
+BRDA:2,0,0,1
+BRDA:2,0,1,-
+BRF:2
+BRH:1
+DA:1,2
+DA:2,1
+DA:5,0
+LF:3
+LH:2
+end_of_record
+SF:/work/src/b.rs
+DA:1,0
+LF:1
+LH:0
+end_of_record
+SF:/work/tests/c.rs
+DA:3,4
+LF:1
+LH:1
+end_of_record
+"""
+
+COBERTURA = """<?xml version="1.0" ?>
+<coverage lines-valid="3" lines-covered="2">
+  <sources><source>/work</source></sources>
+  <packages>
+    <package name="pkg">
+      <classes>
+        <class name="mod.py" filename="pkg/mod.py">
+          <methods>
+            <method name="run" signature="()">
+              <lines><line number="2" hits="3"/></lines>
+            </method>
+          </methods>
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="3" branch="true"
+                condition-coverage="50% (1/2)"/>
+            <line number="4" hits="0"/>
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+@pytest.fixture
+def coverage_convert(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``coverage_convert`` module for direct testing."""
+    return load_script("coverage_convert")
+
+
+def _write(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def _tags(text: str, tag: str) -> list[str]:
+    return [line for line in text.splitlines() if line.startswith(f"{tag}:")]
+
+
+def test_lcov_to_cobertura(tmp_path: Path, coverage_convert: ModuleType) -> None:
+    """LCOV records become classes grouped by directory, with totals."""
+    lcov = _write(tmp_path, "cov.info", LCOV)
+    out = tmp_path / "cov.xml"
+
+    coverage_convert.lcov_to_cobertura(lcov, out, source_root=Path("/work"))
+
+    root = etree.parse(str(out)).getroot()
+    assert root.get("lines-valid") == "5"
+    assert root.get("lines-covered") == "3"
+    assert root.get("branches-valid") == "2"
+    assert root.get("branches-covered") == "1"
+    assert root.findtext("sources/source") == "/work"
+    packages = root.findall("packages/package")
+    assert [p.get("name") for p in packages] == ["src", "tests"]
+    assert packages[0].get("line-rate") == "0.5"
+    classes = root.findall("packages/package/classes/class")
+    assert [c.get("filename") for c in classes] == [
+        "src/a.rs",
+        "src/b.rs",
+        "tests/c.rs",
+    ]
+    line = classes[0].find("lines/line[@number='2']")
+    assert line is not None
+    assert line.get("condition-coverage") == "50% (1/2)"
+    methods = classes[0].findall("methods/method")
+    assert [(m.get("name"), m.find("lines/line").get("hits")) for m in methods] == [
+        ("foo", "2"),
+        ("bar", "0"),
+    ]
+
+
+def test_lcov_function_names_keep_commas(
+    tmp_path: Path, coverage_convert: ModuleType
+) -> None:
+    """Function names containing commas match their ``FNDA`` hit counts."""
+    lcov = _write(
+        tmp_path,
+        "cov.info",
+        "SF:/work/src/a.rs\n"
+        "FN:3,<T as Into<(A, B)>>::into\n"
+        "FN:7,9,pair::<u8, u16>\n"
+        "FNDA:4,<T as Into<(A, B)>>::into\n"
+        "FNDA:1,pair::<u8, u16>\n"
+        "DA:3,4\n"
+        "DA:7,1\n"
+        "end_of_record\n",
+    )
+    out = tmp_path / "cov.xml"
+
+    coverage_convert.lcov_to_cobertura(lcov, out, source_root=Path("/work"))
+
+    methods = etree.parse(str(out)).getroot().findall(".//methods/method")
+    assert [
+        (
+            m.get("name"),
+            m.find("lines/line").get("number"),
+            m.find("lines/line").get("hits"),
+        )
+        for m in methods
+    ] == [("<T as Into<(A, B)>>::into", "3", "4"), ("pair::<u8, u16>", "7", "1")]
+
+
+def test_cobertura_to_lcov(tmp_path: Path, coverage_convert: ModuleType) -> None:
+    """Classes become records with paths joined to the report source."""
+    xml = _write(tmp_path, "cov.xml", COBERTURA)
+    out = tmp_path / "cov.info"
+
+    coverage_convert.cobertura_to_lcov(xml, out)
+
+    assert out.read_text().splitlines() == [
+        "SF:/work/pkg/mod.py",
+        "FN:2,run",
+        "FNDA:3,run",
+        "FNF:1",
+        "FNH:1",
+        "BRDA:2,0,0,1",
+        "BRDA:2,0,1,0",
+        "BRF:2",
+        "BRH:1",
+        "DA:1,1",
+        "DA:2,3",
+        "DA:4,0",
+        "LF:3",
+        "LH:2",
+        "end_of_record",
+    ]
+
+
+def test_round_trip_keeps_line_and_function_hits(
+    tmp_path: Path, coverage_convert: ModuleType
+) -> None:
+    """LCOV survives a round trip through Cobertura for lines and functions."""
+    lcov = _write(tmp_path, "cov.info", LCOV)
+    xml = tmp_path / "cov.xml"
+    back = tmp_path / "back.info"
+
+    coverage_convert.lcov_to_cobertura(lcov, xml)
+    coverage_convert.cobertura_to_lcov(xml, back)
+
+    text = back.read_text()
+    for tag in ("SF", "FN", "FNDA", "DA", "LF", "LH", "BRF", "BRH"):
+        assert _tags(text, tag) == _tags(LCOV, tag)
+
+
+def test_merge_reports_mixes_formats(
+    tmp_path: Path, coverage_convert: ModuleType
+) -> None:
+    """Inputs in either format merge into the requested output format."""
+    lcov = _write(tmp_path, "rust.info", LCOV)
+    xml = _write(tmp_path, "python.xml", COBERTURA)
+
+    as_cobertura = tmp_path / "merged.xml"
+    coverage_convert.merge_reports(
+        [lcov, xml], as_cobertura, "cobertura", source_root=Path("/work")
+    )
+    root = etree.parse(str(as_cobertura)).getroot()
+    assert root.get("lines-valid") == "8"
+    assert root.get("lines-covered") == "5"
+
+    as_lcov = tmp_path / "merged.info"
+    coverage_convert.merge_reports([lcov, xml], as_lcov, "lcov")
+    assert _tags(as_lcov.read_text(), "SF") == [
+        "SF:/work/pkg/mod.py",
+        "SF:/work/src/a.rs",
+        "SF:/work/src/b.rs",
+        "SF:/work/tests/c.rs",
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "merged.info",
+        "merged.xml",
+        "python.xml",
+        "rust.info",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('\ufeff  <?xml version="1.0"?><coverage/>', "cobertura"),
+        ("TN:\nSF:a.rs\nend_of_record\n", "lcov"),
+    ],
+)
+def test_detect_report_format(
+    tmp_path: Path, coverage_convert: ModuleType, content: str, expected: str
+) -> None:
+    """Reports are recognized by their leading bytes."""
+    path = _write(tmp_path, "report", content)
+    assert coverage_convert.detect_report_format(path) == expected
+
+
+def test_cobertura_to_lcov_rejects_invalid_xml(
+    tmp_path: Path, coverage_convert: ModuleType
+) -> None:
+    """Malformed XML raises and leaves no output behind."""
+    bad = _write(tmp_path, "bad.xml", "<coverage><packages>")
+    out = tmp_path / "out.info"
+
+    with pytest.raises(coverage_convert.CoverageConversionError, match=r"bad\.xml"):
+        coverage_convert.cobertura_to_lcov(bad, out)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.xml"]
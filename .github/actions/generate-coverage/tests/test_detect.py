@@ -285,6 +285,19 @@ def test_forced_mixed_accepts_both(
     )
 
 
+def test_mixed_accepts_lcov(
+    setup_project: typ.Callable[[dict[str, str] | None, str | None], tuple[Path, Path]],
+) -> None:
+    """Mixed projects may request LCOV; the reports are converted when merged."""
+    _project_dir, out = setup_project(
+        {"Cargo.toml": "", "pyproject.toml": _REAL_PYPROJECT}
+    )
+
+    detect.main("lcov", out, "", "mixed")
+
+    assert out.read_text() == "lang=mixed\nfmt=lcov\ncargo_manifest=Cargo.toml\n"
+
+
 class _ErrorCase(typ.NamedTuple):
     """A forced-language failure scenario and its expected stderr fragment."""
 
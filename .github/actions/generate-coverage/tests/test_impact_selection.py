@@ -0,0 +1,238 @@
+"""Tests for test impact selection and its pytest plugin."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import typing as typ
+from pathlib import Path
+
+import pytest
+from lxml import etree
+from plumbum import local
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from types import ModuleType
+
+PLUGIN_DIR = Path(__file__).resolve().parents[1] / "scripts" / "pytest_plugin"
+
+
+def _report(*classes: tuple[str, str]) -> str:
+    """Return a Cobertura report with one ``(filename, hits)`` line per class."""
+    body = "".join(
+        f'<class name="{name}" filename="{name}"><methods/>'
+        f'<lines><line number="1" hits="{hits}"/></lines></class>'
+        for name, hits in classes
+    )
+    return (
+        '<?xml version="1.0" ?>\n<coverage version="1">'
+        "<sources><source>.</source></sources>"
+        f'<packages><package name="app"><classes>{body}</classes></package>'
+        "</packages></coverage>\n"
+    )
+
+
+@pytest.fixture
+def impact_selection(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``impact_selection`` module for direct testing."""
+    return load_script("impact_selection")
+
+
+@pytest.fixture
+def impact_map(impact_selection: ModuleType) -> object:
+    """Return a map of three tests over two source modules."""
+    return impact_selection.ImpactMap(
+        "abc123",
+        {
+            "tests/test_a.py::test_a": frozenset({"app/a.py", "tests/test_a.py"}),
+            "tests/test_b.py::test_b": frozenset({"app/b.py", "tests/test_b.py"}),
+            "tests/test_b.py::test_ab": frozenset(
+                {"app/a.py", "app/b.py", "tests/test_b.py"}
+            ),
+        },
+    )
+
+
+def test_map_round_trips_compactly(
+    impact_selection: ModuleType, impact_map: object, tmp_path: Path
+) -> None:
+    """Saved maps load back unchanged; damaged files load as ``None``."""
+    path = tmp_path / "impact" / "map.json.gz"
+    impact_selection.save_impact_map(path, impact_map)
+
+    assert impact_selection.load_impact_map(path) == impact_map
+    path.write_bytes(b"not gzip")
+    assert impact_selection.load_impact_map(path) is None
+    assert impact_selection.load_impact_map(tmp_path / "missing.gz") is None
+
+
+def test_collect_folds_worker_files(
+    impact_selection: ModuleType, tmp_path: Path
+) -> None:
+    """Records from every worker are combined; foreign files are skipped."""
+    (tmp_path / "gw0.json").write_text(
+        json.dumps({"version": 1, "tests": {"t.py::a": ["app/a.py"]}})
+    )
+    (tmp_path / "gw1.json").write_text(
+        json.dumps({"version": 1, "tests": {"t.py::b": ["app/b.py"]}})
+    )
+    (tmp_path / "old.json").write_text(json.dumps({"version": 0, "tests": {}}))
+
+    collected = impact_selection.collect_impact_map(tmp_path, "abc123")
+
+    assert collected.sha == "abc123"
+    assert collected.tests == {
+        "t.py::a": frozenset({"app/a.py"}),
+        "t.py::b": frozenset({"app/b.py"}),
+    }
+
+
+def test_selection_runs_tests_touching_changed_files(
+    impact_selection: ModuleType, impact_map: object
+) -> None:
+    """Changed modules select their tests; new test files run whole."""
+    change = impact_selection.Change
+    selection = impact_selection.plan_selection(
+        impact_map,
+        [
+            change("M", "app/a.py"),
+            change("A", "tests/test_new.py"),
+            change("M", "README.md"),
+            change("M", "docs/guide.txt"),
+        ],
+    )
+
+    assert not selection.full
+    assert selection.nodeids == {"tests/test_a.py::test_a", "tests/test_b.py::test_ab"}
+    assert selection.paths == {"tests/test_new.py"}
+    assert selection.replaced == {"app/a.py", "tests/test_new.py"}
+
+
+def test_selection_is_empty_for_documentation_changes(
+    impact_selection: ModuleType, impact_map: object
+) -> None:
+    """Changes no test can observe select nothing."""
+    selection = impact_selection.plan_selection(
+        impact_map, [impact_selection.Change("M", "docs/index.md")]
+    )
+
+    assert selection.empty
+
+
+@pytest.mark.parametrize(
+    ("status", "path"),
+    [
+        ("M", "conftest.py"),
+        ("M", "tests/conftest.py"),
+        ("M", "pyproject.toml"),
+        ("M", "uv.lock"),
+        ("A", "requirements-dev.txt"),
+        ("M", "app/constants.py"),
+        ("M", "tests/data/sample.json"),
+    ],
+)
+def test_selection_falls_back_to_full_run(
+    impact_selection: ModuleType, impact_map: object, status: str, path: str
+) -> None:
+    """Configuration, unmapped modules and data files run the whole suite."""
+    selection = impact_selection.plan_selection(
+        impact_map, [impact_selection.Change(status, path)]
+    )
+
+    assert selection.full
+    assert path in (selection.reason or "")
+
+
+def test_overlay_replaces_changed_files_only(
+    impact_selection: ModuleType, tmp_path: Path
+) -> None:
+    """Changed files come from the partial run and deleted ones are dropped."""
+    baseline = tmp_path / "baseline.xml"
+    baseline.write_text(_report(("app/a.py", "0"), ("app/b.py", "3"), ("gone.py", "1")))
+    partial = tmp_path / "partial.xml"
+    partial.write_text(_report(("app/a.py", "5"), ("app/b.py", "0")))
+
+    impact_selection.overlay_baseline(
+        baseline, partial, partial, frozenset({"app/a.py", "gone.py"})
+    )
+
+    root = etree.parse(str(partial)).getroot()
+    hits = {
+        cls.get("filename"): cls.find("lines/line").get("hits")
+        for cls in root.iter("class")
+    }
+    assert hits == {"app/a.py": "5", "app/b.py": "3"}
+    assert root.get("lines-covered") == "2"
+    assert root.get("lines-valid") == "2"
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="sys.monitoring requires Python 3.12"
+)
+def test_plugin_records_and_applies_selection(
+    impact_selection: ModuleType, tmp_path: Path
+) -> None:
+    """The plugin maps tests to files, and a selection deselects the rest."""
+    project = tmp_path / "project"
+    (project / "app").mkdir(parents=True)
+    (project / "app" / "__init__.py").write_text("")
+    (project / "app" / "common.py").write_text("def base():\n    return 1\n")
+    (project / "app" / "a.py").write_text(
+        "from app import common\n\n\ndef one():\n    return common.base()\n"
+    )
+    (project / "app" / "b.py").write_text(
+        "from app import common\n\n\ndef two():\n    return common.base() + 1\n"
+    )
+    (project / "test_app.py").write_text(
+        "from app import a, b\n\n\n"
+        "def test_a():\n    assert a.one() == 1\n\n\n"
+        "def test_b():\n    assert b.two() == 2\n"
+    )
+    record_dir = tmp_path / "record"
+    record_dir.mkdir()
+    pythonpath = os.pathsep.join([str(PLUGIN_DIR), str(project)])
+    command = local[sys.executable][
+        "-m",
+        "pytest",
+        "-q",
+        "-p",
+        impact_selection.PLUGIN_NAME,
+        "-p",
+        "no:randomly",
+        "-p",
+        "no:cacheprovider",
+        "-p",
+        "no:xdist",
+        str(project),
+    ]
+    env = {"PYTHONPATH": pythonpath, impact_selection.RECORD_ENV: str(record_dir)}
+    with local.cwd(project), local.env(**env):
+        returncode, stdout, stderr = command.run(retcode=None)
+    assert returncode == 0, stdout + stderr
+
+    recorded = impact_selection.collect_impact_map(record_dir, "abc123")
+    assert recorded.tests == {
+        "test_app.py::test_a": frozenset({"app/a.py", "app/common.py", "test_app.py"}),
+        "test_app.py::test_b": frozenset({"app/b.py", "app/common.py", "test_app.py"}),
+    }
+
+    selection = impact_selection.plan_selection(
+        recorded, [impact_selection.Change("M", "app/b.py")]
+    )
+    selection_path = tmp_path / "selection.json"
+    impact_selection.write_selection(selection_path, selection)
+    env = {"PYTHONPATH": pythonpath, impact_selection.SELECT_ENV: str(selection_path)}
+    with local.cwd(project), local.env(**env):
+        returncode, stdout, stderr = command.run(retcode=None)
+    assert returncode == 0, stdout + stderr
+    assert "1 passed, 1 deselected" in stdout
+
+    env = {
+        "PYTHONPATH": pythonpath,
+        impact_selection.RECORD_ENV: str(tmp_path / "missing"),
+    }
+    with local.cwd(project), local.env(**env):
+        returncode, stdout, stderr = command.run(retcode=None)
+    assert returncode == 0, stdout + stderr
+    assert "could not record the impact map" in stdout + stderr
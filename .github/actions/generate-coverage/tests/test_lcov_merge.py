@@ -0,0 +1,172 @@
+"""Tests for the streaming LCOV merger."""
+
+from __future__ import annotations
+
+import typing as typ
+
+import pytest
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+    from types import ModuleType
+
+
+MAIN = """TN:
+SF:src/a.rs
+FN:1,foo
+FN:5,bar
+FNDA:1,foo
+FNDA:0,bar
+FNF:2
+FNH:1
+BRDA:2,0,0,1
+BRDA:2,0,1,-
+BRF:2
+BRH:1
+DA:1,1
+DA:2,0
+LF:2
+LH:1
+end_of_record
+SF:src/c.rs
+DA:1,1
+LF:1
+LH:1
+end_of_record
+"""
+
+CUCUMBER = """TN:
+SF:src/a.rs
+FN:5,bar
+FNDA:3,bar
+FNF:1
+FNH:1
+BRDA:2,0,1,2
+BRF:1
+BRH:1
+DA:2,4
+DA:3,0
+LF:2
+LH:1
+end_of_record
+SF:src/b.rs
+DA:1,0
+LF:1
+LH:0
+end_of_record
+"""
+
+
+@pytest.fixture
+def lcov_merge(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``lcov_merge`` module for direct testing."""
+    return load_script("lcov_merge")
+
+
+def _write(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_merge_sums_duplicate_records(tmp_path: Path, lcov_merge: ModuleType) -> None:
+    """Records for the same file are combined and summaries recomputed."""
+    main = _write(tmp_path, "main.info", MAIN)
+    cuke = _write(tmp_path, "cuke.info", CUCUMBER)
+
+    lcov_merge.merge_lcov_files([main, cuke], main)
+
+    text = main.read_text()
+    assert text.count("SF:src/a.rs") == 1
+    a_record = text.split("end_of_record")[0]
+    assert a_record.splitlines() == [
+        "TN:",
+        "SF:src/a.rs",
+        "FN:1,foo",
+        "FN:5,bar",
+        "FNDA:1,foo",
+        "FNDA:3,bar",
+        "FNF:2",
+        "FNH:2",
+        "BRDA:2,0,0,1",
+        "BRDA:2,0,1,2",
+        "BRF:2",
+        "BRH:2",
+        "DA:1,1",
+        "DA:2,4",
+        "DA:3,0",
+        "LF:3",
+        "LH:2",
+    ]
+
+
+def test_merge_copies_unique_records_in_path_order(
+    tmp_path: Path, lcov_merge: ModuleType
+) -> None:
+    """Records present in one input are copied verbatim, sorted by path."""
+    main = _write(tmp_path, "main.info", MAIN)
+    cuke = _write(tmp_path, "cuke.info", CUCUMBER)
+    out = tmp_path / "out.info"
+
+    lcov_merge.merge_lcov_files([main, cuke], out)
+
+    text = out.read_text()
+    sources = [line for line in text.splitlines() if line.startswith("SF:")]
+    assert sources == ["SF:src/a.rs", "SF:src/b.rs", "SF:src/c.rs"]
+    assert "SF:src/c.rs\nDA:1,1\nLF:1\nLH:1\nend_of_record\n" in text
+    assert main.read_text() == MAIN
+
+
+def test_merge_handles_unsorted_and_many_inputs(
+    tmp_path: Path, lcov_merge: ModuleType
+) -> None:
+    """Unsorted shards are sorted before merging, for any number of inputs."""
+    shards = [
+        _write(tmp_path, "s1.info", "SF:z.rs\nDA:1,1\nend_of_record\n"),
+        _write(
+            tmp_path,
+            "s2.info",
+            "SF:z.rs\nDA:1,2\nend_of_record\nSF:a.rs\nDA:1,0\nend_of_record\n",
+        ),
+        _write(tmp_path, "s3.info", "SF:a.rs\nDA:1,5\nend_of_record\n"),
+    ]
+    out = tmp_path / "out.info"
+
+    lcov_merge.merge_lcov_files(shards, out)
+
+    assert out.read_text() == (
+        "SF:a.rs\nDA:1,5\nLF:1\nLH:1\nend_of_record\n"
+        "SF:z.rs\nDA:1,3\nLF:1\nLH:1\nend_of_record\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("", "no records found"),
+        ("SF:a.rs\nDA:1,1\n", "missing final end_of_record"),
+    ],
+)
+def test_merge_rejects_malformed_input(
+    tmp_path: Path, lcov_merge: ModuleType, content: str, message: str
+) -> None:
+    """Empty or truncated inputs raise without touching the output."""
+    main = _write(tmp_path, "main.info", MAIN)
+    bad = _write(tmp_path, "bad.info", content)
+
+    with pytest.raises(lcov_merge.LcovFormatError, match=message):
+        lcov_merge.merge_lcov_files([main, bad], main)
+
+    assert main.read_text() == MAIN
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.info", "main.info"]
+
+
+def test_merge_rejects_unparsable_counts(
+    tmp_path: Path, lcov_merge: ModuleType
+) -> None:
+    """A bad ``DA`` line in a duplicated record names the offending input."""
+    main = _write(tmp_path, "main.info", MAIN)
+    bad = _write(tmp_path, "bad.info", "SF:src/a.rs\nDA:1,x\nend_of_record\n")
+
+    with pytest.raises(lcov_merge.LcovFormatError, match=r"bad\.info"):
+        lcov_merge.merge_lcov_files([main, bad], tmp_path / "out.info")
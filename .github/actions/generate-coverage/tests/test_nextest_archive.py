@@ -0,0 +1,213 @@
+"""Tests for the nextest archive cache key."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import typing as typ
+
+import pytest
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+    from types import ModuleType
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is required for source digests"
+)
+
+
+@pytest.fixture
+def nextest_archive(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``nextest_archive`` module for direct testing."""
+    return load_script("nextest_archive")
+
+
+def _git(repo: Path, *args: str) -> None:
+    git = shutil.which("git")
+    assert git is not None
+    proc = subprocess.Popen(  # noqa: S603 - test helper with fixed argv
+        [git, "-C", str(repo), *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.wait() == 0
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Return a minimal Cargo workspace tracked by a git index in ``tmp_path``."""
+    root = tmp_path / "crate"
+    (root / "src").mkdir(parents=True)
+    (root / "Cargo.toml").write_text('[package]\nname = "demo"\n')
+    (root / "Cargo.lock").write_text("version = 3\n")
+    (root / "src" / "lib.rs").write_text("pub fn one() -> u8 { 1 }\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    return root
+
+
+def _key(module: ModuleType, root: Path, **overrides: object) -> str:
+    options: dict[str, object] = {
+        "features": "",
+        "with_default": True,
+        "toolchain": "rustc 1.89.0",
+    }
+    options.update(overrides)
+    return module.archive_key(root / "Cargo.toml", **options)
+
+
+def test_key_is_stable_and_ignores_build_output(
+    nextest_archive: ModuleType, workspace: Path
+) -> None:
+    """Build output, untracked and non-source files do not change the key."""
+    before = _key(nextest_archive, workspace)
+
+    (workspace / "target" / "debug").mkdir(parents=True)
+    (workspace / "target" / "debug" / "build.rs").write_text("// generated\n")
+    (workspace / "README.md").write_text("# demo\n")
+    (workspace / "docs").mkdir()
+    (workspace / "docs" / "guide.md").write_text("# guide\n")
+    (workspace / ".github").mkdir()
+    (workspace / ".github" / "ci.yml").write_text("on: push\n")
+    _git(workspace, "add", "README.md", "docs", ".github")
+    (workspace / "Cargo.lock").write_text("# regenerated\nversion   =   3\n")
+
+    assert _key(nextest_archive, workspace) == before
+    assert len(before) == 32
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda root: (root / "src" / "lib.rs").write_text("pub fn two() {}\n"),
+        lambda root: (root / "tests").mkdir() or (root / "tests" / "it.rs").touch(),
+        lambda root: (root / "Cargo.lock").write_text("version = 4\n"),
+        lambda root: (
+            (root / ".cargo").mkdir()
+            or (root / ".cargo" / "config.toml").write_text("[build]\n")
+        ),
+        lambda root: (root / "pyproject.toml").write_text("[tool.maturin]\n"),
+        lambda root: (root / "src" / "fixture.json").write_text("{}\n"),
+        lambda root: (root / "proto").mkdir() or (root / "proto" / "x.proto").touch(),
+    ],
+    ids=[
+        "source",
+        "new-test",
+        "lockfile",
+        "cargo-config",
+        "pyproject",
+        "include-str",
+        "build-input",
+    ],
+)
+def test_key_changes_with_build_inputs(
+    nextest_archive: ModuleType,
+    workspace: Path,
+    change: typ.Callable[[Path], object],
+) -> None:
+    """Editing any file that reaches the test binaries invalidates the key."""
+    before = _key(nextest_archive, workspace)
+    change(workspace)
+    _git(workspace, "add", "-A", ".")
+    assert _key(nextest_archive, workspace) != before
+
+
+def test_key_changes_with_build_options(
+    nextest_archive: ModuleType, workspace: Path
+) -> None:
+    """Features, default features and the toolchain are part of the key."""
+    base = _key(nextest_archive, workspace)
+    variants = {
+        _key(nextest_archive, workspace, features="fast"),
+        _key(nextest_archive, workspace, with_default=False),
+        _key(nextest_archive, workspace, toolchain="rustc 1.90.0"),
+    }
+    assert base not in variants
+    assert len(variants) == 3
+
+
+def test_member_key_includes_workspace_lockfile(
+    nextest_archive: ModuleType, tmp_path: Path
+) -> None:
+    """A member crate is keyed on the lockfile of its enclosing workspace."""
+    (tmp_path / "Cargo.lock").write_text("version = 3\n")
+    member = tmp_path / "member"
+    member.mkdir()
+    (member / "Cargo.toml").write_text('[package]\nname = "member"\n')
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    before = _key(nextest_archive, member)
+
+    (tmp_path / "Cargo.lock").write_text("version = 4\n")
+
+    assert _key(nextest_archive, member) != before
+
+
+def test_member_key_includes_workspace_files(
+    nextest_archive: ModuleType, tmp_path: Path
+) -> None:
+    """Files above a member crate, such as ``.cargo/config.toml``, count too."""
+    (tmp_path / "Cargo.lock").write_text("version = 3\n")
+    member = tmp_path / "member"
+    member.mkdir()
+    (member / "Cargo.toml").write_text('[package]\nname = "member"\n')
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    before = _key(nextest_archive, member)
+
+    (tmp_path / ".cargo").mkdir()
+    (tmp_path / ".cargo" / "config.toml").write_text("[build]\n")
+    _git(tmp_path, "add", ".cargo")
+
+    assert _key(nextest_archive, member) != before
+
+
+def test_main_writes_key_and_path(
+    nextest_archive: ModuleType,
+    workspace: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``main`` writes the key and an archive path under ``RUNNER_TEMP``."""
+    runner_temp = tmp_path / "runner"
+    github_output = tmp_path / "gh.txt"
+    monkeypatch.setenv("RUNNER_TEMP", str(runner_temp))
+    monkeypatch.setattr(nextest_archive, "_toolchain_version", lambda: "rustc 1.89")
+
+    nextest_archive.main(
+        workspace / "Cargo.toml",
+        "fast",
+        with_default=True,
+        github_output=github_output,
+    )
+
+    outputs = dict(
+        line.split("=", 1) for line in github_output.read_text().splitlines()
+    )
+    key = _key(nextest_archive, workspace, features="fast", toolchain="rustc 1.89")
+    assert outputs == {
+        "key": key,
+        "path": str(runner_temp / "nextest-archive" / f"coverage-{key}.tar.zst"),
+    }
+    assert (runner_temp / "nextest-archive").is_dir()
+
+
+def test_main_skips_outputs_outside_a_work_tree(
+    nextest_archive: ModuleType,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Without git metadata no key is written, so the archive is not used."""
+    root = tmp_path / "crate"
+    root.mkdir()
+    (root / "Cargo.toml").write_text('[package]\nname = "demo"\n')
+    github_output = tmp_path / "gh.txt"
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+    monkeypatch.setattr(nextest_archive, "_toolchain_version", lambda: "rustc 1.89")
+
+    nextest_archive.main(root / "Cargo.toml", "", github_output=github_output)
+
+    assert not github_output.exists()
+    assert "::warning::nextest archive disabled" in capsys.readouterr().err
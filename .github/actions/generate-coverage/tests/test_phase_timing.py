@@ -0,0 +1,114 @@
+"""Tests for the coverage phase timing recorder."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import typing as typ
+
+import pytest
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+    from types import ModuleType
+
+
+@pytest.fixture
+def phase_timing(
+    monkeypatch: pytest.MonkeyPatch, load_script: typ.Callable[[str], ModuleType]
+) -> ModuleType:
+    """Load and return the ``phase_timing`` module for direct testing."""
+    for name in ("GITHUB_OUTPUT", "GITHUB_STEP_SUMMARY", "COVERAGE_TIMINGS_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    return load_script("phase_timing")
+
+
+def _clock(*ticks: float) -> typ.Callable[[], float]:
+    """Return a clock yielding ``ticks`` and then repeating the last one."""
+    values = itertools.chain(ticks, itertools.repeat(ticks[-1]))
+    return lambda: next(values)
+
+
+def test_spans_are_summed_and_timed_exclusively(phase_timing: ModuleType) -> None:
+    """Repeated spans add up and nested time is not counted twice."""
+    clock = _clock(0.0, 1.0, 2.0, 5.0, 9.0, 10.0, 12.0, 15.0)
+    with phase_timing.recording("demo", clock=clock) as recorder:
+        # test runs 1.0 .. 9.0, with parse nested in it from 2.0 .. 5.0.
+        with phase_timing.span("test"), phase_timing.span("parse"):
+            pass
+        with phase_timing.span("parse"):  # 10.0 .. 12.0
+            pass
+
+    assert recorder.phases == {"parse": 5.0, "test": 5.0}
+    assert recorder.breakdown(15.0) == {"parse": 5.0, "test": 5.0, "other": 5.0}
+
+
+def test_span_without_recording_is_a_no_op(phase_timing: ModuleType) -> None:
+    """Instrumented library code runs unchanged outside a recording."""
+
+    @phase_timing.span("parse")
+    def parse() -> str:
+        return "parsed"
+
+    assert parse() == "parsed"
+    with phase_timing.recording("demo", clock=_clock(0.0)) as recorder:
+        pass
+    assert recorder.phases == {}
+
+
+def test_recording_publishes_outputs_summary_and_json(
+    phase_timing: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A successful run writes step outputs, a summary table and a JSON file."""
+    summary = tmp_path / "summary.md"
+    github_output = tmp_path / "gh.txt"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+    monkeypatch.setenv("COVERAGE_TIMINGS_DIR", str(tmp_path / "timings"))
+    monkeypatch.setenv("GITHUB_REPOSITORY", "octo/repo")
+    monkeypatch.setenv("GITHUB_RUN_ID", "42")
+
+    clock = _clock(0.0, 1.0, 7.0, 8.0)
+    with (
+        phase_timing.recording("run_rust", github_output=github_output, clock=clock),
+        phase_timing.span("report"),
+    ):
+        pass
+
+    timings_file = tmp_path / "timings" / "run_rust.json"
+    assert github_output.read_text().splitlines() == [
+        "timing_report=6.000",
+        "timing_other=2.000",
+        "timing_total=8.000",
+        'timings={"report":6.0,"other":2.0}',
+        f"timings_file={timings_file}",
+    ]
+    document = json.loads(timings_file.read_text())
+    assert document["script"] == "run_rust"
+    assert document["repository"] == "octo/repo"
+    assert document["run_id"] == "42"
+    assert document["job"] is None
+    assert document["total_seconds"] == 8.0
+    assert document["phases"] == {"report": 6.0, "other": 2.0}
+    table = summary.read_text()
+    assert "### Coverage timings: `run_rust`" in table
+    assert "| report | 6.00 | 75% |" in table
+    assert "| **total** | **8.00** | |" in table
+
+
+def test_failed_run_keeps_summary_but_writes_no_outputs(
+    phase_timing: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Failures are timed in the summary but leave ``GITHUB_OUTPUT`` alone."""
+    summary = tmp_path / "summary.md"
+    github_output = tmp_path / "gh.txt"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+
+    with (
+        pytest.raises(RuntimeError),
+        phase_timing.recording("run_python", github_output=github_output),
+        phase_timing.span("test"),
+    ):
+        raise RuntimeError
+
+    assert not github_output.exists()
+    assert "| test |" in summary.read_text()
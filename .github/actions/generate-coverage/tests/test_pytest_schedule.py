@@ -0,0 +1,231 @@
+"""Tests for duration-aware pytest-xdist scheduling."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import typing as typ
+
+import pytest
+from plumbum import local
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+    from types import ModuleType
+
+
+@pytest.fixture
+def pytest_schedule(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``pytest_schedule`` module for direct testing."""
+    return load_script("pytest_schedule")
+
+
+def test_plan_balances_modules_longest_first(pytest_schedule: ModuleType) -> None:
+    """Modules are assigned to the least-loaded worker, longest first."""
+    durations = {
+        "tests/test_a.py::test_one": 3.0,
+        "tests/test_a.py::test_two": 1.0,
+        "tests/test_b.py::test_b": 3.0,
+        "tests/test_c.py::test_c": 2.0,
+        "tests/test_d.py::test_d": 1.0,
+    }
+
+    plan = pytest_schedule.plan_schedule(durations, "2", cpu_count=8)
+
+    assert plan.workers == "2"
+    assert sorted(plan.loads) == [5.0, 5.0]
+    assert plan.predicted_makespan == 5.0
+    assert plan.groups["tests/test_a.py"] != plan.groups["tests/test_b.py"]
+    assert set(plan.groups) == {
+        "tests/test_a.py",
+        "tests/test_b.py",
+        "tests/test_c.py",
+        "tests/test_d.py",
+    }
+
+
+def test_plan_splits_oversized_modules(pytest_schedule: ModuleType) -> None:
+    """A module longer than an even share is scheduled test by test."""
+    durations = {
+        "tests/test_slow.py::test_one": 4.0,
+        "tests/test_slow.py::test_two": 4.0,
+        "tests/test_fast.py::test_fast": 2.0,
+    }
+
+    plan = pytest_schedule.plan_schedule(durations, "2", cpu_count=8)
+
+    assert "tests/test_slow.py" not in plan.groups
+    assert (
+        plan.groups["tests/test_slow.py::test_one"]
+        != plan.groups["tests/test_slow.py::test_two"]
+    )
+    assert plan.predicted_makespan == 6.0
+
+
+def test_plan_caps_auto_workers_at_useful_count(pytest_schedule: ModuleType) -> None:
+    """``auto`` uses no more workers than the longest test can keep busy."""
+    durations = {
+        "tests/test_a.py::test_a": 1.0,
+        "tests/test_b.py::test_b": 1.0,
+        "tests/test_c.py::test_c": 1.0,
+    }
+
+    auto = pytest_schedule.plan_schedule(durations, "auto", cpu_count=16)
+    explicit = pytest_schedule.plan_schedule(durations, "16", cpu_count=2)
+
+    assert auto.workers == "3"
+    assert explicit.workers == "16"
+
+
+@pytest.mark.parametrize(
+    ("durations", "workers"),
+    [({}, "auto"), ({"tests/test_a.py::test_a": 1.0}, "")],
+)
+def test_plan_keeps_defaults_without_history_or_workers(
+    pytest_schedule: ModuleType, durations: dict[str, float], workers: str
+) -> None:
+    """Serial runs and runs without history are left to pytest-xdist."""
+    assert pytest_schedule.plan_schedule(durations, workers, cpu_count=4) is None
+
+
+def test_durations_round_trip_and_reject_bad_files(
+    tmp_path: Path, pytest_schedule: ModuleType
+) -> None:
+    """Durations survive a save/load cycle; unusable files load as empty."""
+    path = tmp_path / "durations.json"
+    pytest_schedule.save_durations(path, {"t.py::b": 1.23456, "t.py::a": 2.0})
+
+    assert pytest_schedule.load_durations(path) == {"t.py::a": 2.0, "t.py::b": 1.235}
+    assert list(tmp_path.iterdir()) == [path]
+
+    path.write_text(json.dumps({"version": 99, "durations": {"t.py::a": 1}}))
+    assert pytest_schedule.load_durations(path) == {}
+    path.write_text("not json")
+    assert pytest_schedule.load_durations(path) == {}
+    assert pytest_schedule.load_durations(tmp_path / "missing.json") == {}
+
+
+def test_plugin_groups_tests_and_records_durations(
+    tmp_path: Path, pytest_schedule: ModuleType
+) -> None:
+    """The plugin applies the plan under loadgroup and records every test."""
+    pytest.importorskip("xdist")
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "test_one.py").write_text(
+        "def test_a():\n    pass\n\n\ndef test_b():\n    pass\n"
+    )
+    (project / "test_two.py").write_text("def test_c():\n    pass\n")
+    plan = pytest_schedule.SchedulePlan(
+        workers="2",
+        groups={"test_one.py": "gencov-0", "test_two.py::test_c": "gencov-1"},
+        loads=(2.0, 1.0),
+    )
+    plan_path = tmp_path / "plan.json"
+    pytest_schedule.write_plan(plan_path, plan)
+    results = tmp_path / "timings.json"
+    env = {
+        "PYTHONPATH": os.pathsep.join(
+            [str(pytest_schedule.PLUGIN_DIR), os.environ.get("PYTHONPATH", "")]
+        ),
+        pytest_schedule.PLAN_ENV: str(plan_path),
+        pytest_schedule.RESULTS_ENV: str(results),
+    }
+    command = local[sys.executable][
+        "-m",
+        "pytest",
+        "-q",
+        "-p",
+        pytest_schedule.PLUGIN_NAME,
+        "-p",
+        "no:randomly",
+        "-p",
+        "no:cacheprovider",
+        "-n",
+        "2",
+        "--dist",
+        "loadgroup",
+        str(project),
+    ]
+    with local.cwd(project), local.env(**env):
+        returncode, stdout, stderr = command.run(retcode=None)
+
+    assert returncode == 0, stdout + stderr
+    timings = pytest_schedule.read_run_timings(results)
+    assert timings is not None
+    assert sorted(timings.durations) == [
+        "test_one.py::test_a",
+        "test_one.py::test_b",
+        "test_two.py::test_c",
+    ]
+    assert set(timings.workers) <= {"gw0", "gw1"}
+    assert timings.actual_makespan >= 0
+
+
+def test_plugin_keeps_existing_xdist_groups(
+    tmp_path: Path, pytest_schedule: ModuleType
+) -> None:
+    """A module's own ``xdist_group`` still pins its tests to one worker."""
+    pytest.importorskip("xdist")
+    project = tmp_path / "project"
+    project.mkdir()
+    workers = tmp_path / "workers"
+    workers.mkdir()
+    (project / "test_db.py").write_text(
+        "import os\n"
+        "import pathlib\n\n"
+        "import pytest\n\n"
+        'pytestmark = pytest.mark.xdist_group("db")\n\n\n'
+        "@pytest.mark.parametrize('n', range(6))\n"
+        "def test_db(n):\n"
+        f"    out = pathlib.Path(r'{workers}') / str(n)\n"
+        "    out.write_text(os.environ['PYTEST_XDIST_WORKER'])\n"
+    )
+    (project / "test_other.py").write_text("def test_other():\n    pass\n")
+    plan = pytest_schedule.SchedulePlan(
+        workers="2",
+        groups={
+            "test_db.py": "gencov-0",
+            "test_db.py::test_db[3]": "gencov-1",
+            "test_other.py": "gencov-1",
+        },
+        loads=(2.0, 1.0),
+    )
+    plan_path = tmp_path / "plan.json"
+    pytest_schedule.write_plan(plan_path, plan)
+    results = tmp_path / "timings.json"
+    env = {
+        "PYTHONPATH": os.pathsep.join(
+            [str(pytest_schedule.PLUGIN_DIR), os.environ.get("PYTHONPATH", "")]
+        ),
+        pytest_schedule.PLAN_ENV: str(plan_path),
+        pytest_schedule.RESULTS_ENV: str(results),
+    }
+    command = local[sys.executable][
+        "-m",
+        "pytest",
+        "-q",
+        "-p",
+        pytest_schedule.PLUGIN_NAME,
+        "-p",
+        "no:randomly",
+        "-p",
+        "no:cacheprovider",
+        "-n",
+        "2",
+        "--dist",
+        "loadgroup",
+        str(project),
+    ]
+    with local.cwd(project), local.env(**env):
+        returncode, stdout, stderr = command.run(retcode=None)
+
+    assert returncode == 0, stdout + stderr
+    assert len({path.read_text() for path in workers.iterdir()}) == 1
+    timings = pytest_schedule.read_run_timings(results)
+    assert timings is not None
+    assert sorted(timings.durations) == [
+        *(f"test_db.py::test_db[{n}]" for n in range(6)),
+        "test_other.py::test_other",
+    ]
@@ -0,0 +1,200 @@
+"""Tests for the concurrent mixed-language coverage runner."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import textwrap
+import time
+import typing as typ
+from pathlib import Path
+
+import pytest
+import typer
+
+if typ.TYPE_CHECKING:  # pragma: no cover - type hints only
+    from types import ModuleType
+
+
+def _cobertura(filename: str, hits: int) -> str:
+    return (
+        '<?xml version="1.0" ?>\n'
+        '<coverage><sources><source>.</source></sources><packages><package name="p">'
+        f'<classes><class name="c" filename="{filename}"><lines>'
+        f'<line number="1" hits="{hits}"/><line number="2" hits="0"/>'
+        "</lines></class></classes></package></packages></coverage>\n"
+    )
+
+
+@pytest.fixture
+def run_mixed(load_script: typ.Callable[[str], ModuleType]) -> ModuleType:
+    """Load and return the ``run_mixed`` module for direct testing."""
+    return load_script("run_mixed")
+
+
+def _child(tmp_path: Path, name: str, body: str) -> Path:
+    script = tmp_path / f"fake_{name}.py"
+    script.write_text(
+        "import os, sys, time\n"
+        "from pathlib import Path\n"
+        "out = Path(os.environ['GITHUB_OUTPUT'])\n" + textwrap.dedent(body)
+    )
+    return script
+
+
+def _reporting_child(tmp_path: Path, name: str, source: str, percent: str) -> Path:
+    report = tmp_path / f"{name}.xml"
+    report.write_text(_cobertura(source, 1))
+    return _child(
+        tmp_path,
+        name,
+        f"""
+        print("running {name}")
+        print("::warning::{name} note", file=sys.stderr)
+        with out.open("a") as fh:
+            fh.write("file={report}\\n")
+            fh.write("percent={percent}\\n")
+        """,
+    )
+
+
+def _setup(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    run_mixed: ModuleType,
+    children: dict[str, Path],
+) -> Path:
+    github_output = tmp_path / "gh.txt"
+    monkeypatch.setattr(run_mixed, "CHILD_SCRIPTS", children)
+    monkeypatch.setenv("INPUT_OUTPUT_PATH", str(tmp_path / "merged.xml"))
+    monkeypatch.setenv("DETECTED_FMT", "cobertura")
+    monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
+    monkeypatch.chdir(tmp_path)
+    return github_output
+
+
+def test_run_mixed_merges_concurrent_reports(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    run_mixed: ModuleType,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Both children run, their output is prefixed and reports are merged."""
+    github_output = _setup(
+        monkeypatch,
+        tmp_path,
+        run_mixed,
+        {
+            "rust": _reporting_child(tmp_path, "rust", "src/lib.rs", "50.00"),
+            "python": _reporting_child(tmp_path, "python", "pkg/mod.py", "50.00"),
+        },
+    )
+
+    run_mixed.main()
+
+    captured = capsys.readouterr()
+    assert "[rust] running rust" in captured.out
+    assert "[python] running python" in captured.out
+    assert "::warning::rust note" in captured.err
+    merged = (tmp_path / "merged.xml").read_text()
+    assert 'filename="src/lib.rs"' in merged
+    assert 'filename="pkg/mod.py"' in merged
+    assert not (tmp_path / "rust.xml").exists()
+    assert not (tmp_path / "python.xml").exists()
+    lines = github_output.read_text().splitlines()
+    assert [line for line in lines if not line.startswith("timing")] == [
+        f"file={tmp_path / 'merged.xml'}",
+        "rust_percent=50.00",
+        "python_percent=50.00",
+    ]
+    assert any(line.startswith("timing_suites=") for line in lines)
+
+
+def _process_gone(pid: int, timeout: float = 10.0) -> bool:
+    """Return ``True`` once ``pid`` has exited or is a zombie awaiting reaping."""
+    deadline = time.monotonic() + timeout
+    stat = Path(f"/proc/{pid}/stat")
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        with contextlib.suppress(OSError):
+            if stat.read_text().rpartition(")")[2].split()[0] == "Z":
+                return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX-only")
+def test_run_mixed_fails_fast(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, run_mixed: ModuleType
+) -> None:
+    """A failing child stops its sibling's process group; its exit code is kept."""
+    pid_file = tmp_path / "grandchild.pid"
+    _setup(
+        monkeypatch,
+        tmp_path,
+        run_mixed,
+        {
+            "rust": _child(
+                tmp_path,
+                "rust",
+                f"""
+                import subprocess
+                grandchild = subprocess.Popen(
+                    [sys.executable, "-c", "import time; time.sleep(60)"]
+                )
+                pending = Path(r"{pid_file}.tmp")
+                pending.write_text(str(grandchild.pid))
+                pending.replace(r"{pid_file}")
+                time.sleep(60)
+                """,
+            ),
+            "python": _child(
+                tmp_path,
+                "python",
+                f"""
+                while not Path(r"{pid_file}").exists():
+                    time.sleep(0.05)
+                sys.exit(3)
+                """,
+            ),
+        },
+    )
+    monkeypatch.setattr(run_mixed, "STOP_GRACE_SECONDS", 2.0)
+
+    start = time.monotonic()
+    with pytest.raises(typer.Exit) as excinfo:
+        run_mixed.main()
+
+    assert excinfo.value.exit_code == 3
+    assert time.monotonic() - start < 30
+    assert not (tmp_path / "merged.xml").exists()
+    assert _process_gone(int(pid_file.read_text()))
+
+
+def test_run_mixed_wait_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    run_mixed: ModuleType,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``RUN_MIXED_WAIT_TIMEOUT`` bounds the combined run."""
+    _setup(
+        monkeypatch,
+        tmp_path,
+        run_mixed,
+        {
+            "rust": _child(tmp_path, "rust", "time.sleep(60)\n"),
+            "python": _child(tmp_path, "python", "time.sleep(60)\n"),
+        },
+    )
+    monkeypatch.setenv("RUN_MIXED_WAIT_TIMEOUT", "0.5")
+
+    with pytest.raises(typer.Exit) as excinfo:
+        run_mixed.main()
+
+    assert excinfo.value.exit_code == 1
+    assert "did not finish within 0.5s" in capsys.readouterr().err
@@ -14,8 +14,10 @@ import hashlib
 import importlib.util
 import io
 import itertools
+import json
 import os
 import sys
+import types
 import typing as typ
 from pathlib import Path
 
@@ -544,6 +546,7 @@ def _run_rust_main_variant(
         *,
         env_overrides: typ.Mapping[str, str] | None = None,
         env_unsets: typ.Iterable[str] = (),
+        capture: object = None,
     ) -> str:
         recorded["args"] = args
         recorded["env_overrides"] = dict(env_overrides or {})
@@ -599,6 +602,383 @@ def test_run_rust_main_nextest_variants(
         assert "Cargo.toml" in args
 
 
+def test_run_rust_main_keeps_only_summary_lines(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """The coverage run retains summary lines; discarded passes keep nothing."""
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "cov.lcov"
+    output.write_text("LF:10\nLH:10\n")
+    captures: list[tuple[str, object]] = []
+
+    def fake_run_cargo(args: list[str], **kwargs: object) -> str:
+        captures.append((args[1], kwargs.get("capture")))
+        return ""
+
+    monkeypatch.setattr(run_rust_module, "_run_cargo", fake_run_cargo)
+    monkeypatch.setattr(run_rust_module, "_cucumber_target_missing", lambda _p: False)
+
+    run_rust_module.main(
+        output,
+        "",
+        with_default=True,
+        use_nextest=False,
+        lang="rust",
+        fmt="lcov",
+        manifest_path=Path("Cargo.toml"),
+        github_output=tmp_path / "gh.txt",
+        cucumber_rs_features="tests/features",
+        with_cucumber_rs=True,
+    )
+
+    summary = run_rust_module.SUMMARY_CAPTURE
+    discard = run_rust_module.CapturePolicy.last(0)
+    assert captures == [
+        ("clean", discard),
+        ("--manifest-path", discard),
+        ("--manifest-path", discard),
+        ("report", summary),
+    ]
+    assert summary.pattern is not None
+    assert summary.pattern.search("TOTAL  Coverage: 81.5%")
+
+
+def _run_rust_main_extra_formats(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+    *,
+    with_cucumber_rs: bool = False,
+) -> tuple[list[list[str]], Path, Path]:
+    """Run ``main`` with an extra format and return every cargo call."""
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "cov.lcov"
+    output.write_text("LF:4\nLH:3\n")
+    github_output = tmp_path / "gh.txt"
+    calls: list[list[str]] = []
+
+    def fake_run_cargo(
+        args: list[str],
+        *,
+        env_overrides: typ.Mapping[str, str] | None = None,
+        env_unsets: typ.Iterable[str] = (),
+        capture: object = None,
+    ) -> str:
+        calls.append(args)
+        return ""
+
+    monkeypatch.setattr(run_rust_module, "_run_cargo", fake_run_cargo)
+
+    run_rust_module.main(
+        output,
+        "fast",
+        with_default=True,
+        use_nextest=False,
+        lang="rust",
+        fmt="lcov",
+        manifest_path=Path("Cargo.toml"),
+        github_output=github_output,
+        cucumber_rs_features="tests/features" if with_cucumber_rs else "",
+        cucumber_rs_args="",
+        with_cucumber_rs=with_cucumber_rs,
+        baseline_file=None,
+        extra_formats="Cobertura, lcov",
+    )
+    return calls, github_output, output
+
+
+def test_run_rust_main_extra_formats_share_one_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """Extra formats are rendered from one ``--no-report`` test run."""
+    calls, github_output, output = _run_rust_main_extra_formats(
+        tmp_path, monkeypatch, run_rust_module
+    )
+
+    extra = tmp_path / "cov.cobertura.xml"
+    assert calls == [
+        ["llvm-cov", "clean", "--workspace", "--manifest-path", "Cargo.toml"],
+        [
+            "llvm-cov",
+            "--manifest-path",
+            "Cargo.toml",
+            "--workspace",
+            "--features",
+            "fast",
+            "--no-report",
+        ],
+        [
+            "llvm-cov",
+            "report",
+            "--manifest-path",
+            "Cargo.toml",
+            "--lcov",
+            "--output-path",
+            str(output),
+        ],
+        [
+            "llvm-cov",
+            "report",
+            "--manifest-path",
+            "Cargo.toml",
+            "--cobertura",
+            "--output-path",
+            str(extra),
+        ],
+    ]
+    data = github_output.read_text().splitlines()
+    assert f"file={output}" in data
+    assert "percent=75.00" in data
+    assert f"file_lcov={output}" in data
+    assert f"file_cobertura={extra}" in data
+
+
+def test_run_rust_main_records_phase_timings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """Each cargo pass and the report parsing are published as timings."""
+    _calls, github_output, _output = _run_rust_main_extra_formats(
+        tmp_path, monkeypatch, run_rust_module
+    )
+
+    outputs = dict(
+        line.split("=", 1) for line in github_output.read_text().splitlines()
+    )
+    phases = json.loads(outputs["timings"])
+    assert {"clean", "test", "report", "parse"} <= set(phases)
+    assert all(f"timing_{name}" in outputs for name in phases)
+    assert float(outputs["timing_total"]) >= sum(phases.values()) - 0.01
+
+
+def test_run_rust_main_extra_formats_include_cucumber_profiles(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """The cucumber pass joins the shared run instead of writing its own report."""
+    calls, _github_output, _output = _run_rust_main_extra_formats(
+        tmp_path, monkeypatch, run_rust_module, with_cucumber_rs=True
+    )
+
+    assert [call[1] for call in calls] == [
+        "clean",
+        "--manifest-path",
+        "--manifest-path",
+        "report",
+        "report",
+    ]
+    cucumber = calls[2]
+    assert cucumber[: len(calls[1])] == calls[1]
+    assert cucumber[len(calls[1]) :] == [
+        "--",
+        "--test",
+        "cucumber",
+        "--",
+        "cucumber",
+        "--features",
+        "tests/features",
+    ]
+    assert not list(tmp_path.glob("*.cucumber*"))
+
+
+def _run_rust_main_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+    *,
+    partition: str = "",
+    with_cucumber_rs: bool = False,
+) -> tuple[list[list[str]], Path, Path]:
+    """Run ``main`` with a nextest archive and return every cargo call."""
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "cov.lcov"
+    output.write_text("LF:4\nLH:3\n")
+    archive = tmp_path / "archive" / "coverage.tar.zst"
+    calls: list[list[str]] = []
+
+    def fake_run_cargo(
+        args: list[str],
+        *,
+        env_overrides: typ.Mapping[str, str] | None = None,
+        env_unsets: typ.Iterable[str] = (),
+        capture: object = None,
+    ) -> str:
+        calls.append(args)
+        return ""
+
+    monkeypatch.setattr(run_rust_module, "_run_cargo", fake_run_cargo)
+
+    run_rust_module.main(
+        output,
+        "fast",
+        with_default=True,
+        use_nextest=True,
+        lang="rust",
+        fmt="lcov",
+        manifest_path=Path("Cargo.toml"),
+        github_output=tmp_path / "gh.txt",
+        cucumber_rs_features="tests/features" if with_cucumber_rs else "",
+        cucumber_rs_args="",
+        with_cucumber_rs=with_cucumber_rs,
+        baseline_file=None,
+        nextest_archive_file=archive,
+        nextest_partition=partition,
+    )
+    return calls, archive, output
+
+
+def test_run_rust_main_builds_missing_nextest_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """A missing archive is built once and the partition runs from it."""
+    calls, archive, output = _run_rust_main_archive(
+        tmp_path, monkeypatch, run_rust_module, partition="count:2/3"
+    )
+
+    assert calls == [
+        ["llvm-cov", "clean", "--workspace", "--manifest-path", "Cargo.toml"],
+        [
+            "llvm-cov",
+            "nextest-archive",
+            "--manifest-path",
+            "Cargo.toml",
+            "--workspace",
+            "--features",
+            "fast",
+            "--archive-file",
+            str(archive),
+        ],
+        [
+            "llvm-cov",
+            "nextest",
+            "--manifest-path",
+            "Cargo.toml",
+            "--archive-file",
+            str(archive),
+            "--partition",
+            "count:2/3",
+            "--no-report",
+        ],
+        [
+            "llvm-cov",
+            "report",
+            "--manifest-path",
+            "Cargo.toml",
+            "--nextest-archive-file",
+            str(archive),
+            "--lcov",
+            "--output-path",
+            str(output),
+        ],
+    ]
+
+
+def test_run_rust_main_reuses_existing_nextest_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """A restored archive is run directly without compiling the tests."""
+    archive = tmp_path / "archive" / "coverage.tar.zst"
+    archive.parent.mkdir()
+    archive.write_bytes(b"archive")
+
+    calls, _archive, _output = _run_rust_main_archive(
+        tmp_path, monkeypatch, run_rust_module
+    )
+
+    assert [call[1] for call in calls] == ["clean", "nextest", "report"]
+    assert "--partition" not in calls[1]
+
+
+def test_run_rust_main_skips_archive_with_cucumber(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The cucumber.rs pass needs ``--test``, so the archive is not used."""
+    calls, archive, _output = _run_rust_main_archive(
+        tmp_path, monkeypatch, run_rust_module, with_cucumber_rs=True
+    )
+
+    assert [call[1] for call in calls] == ["clean", "nextest", "nextest", "report"]
+    assert all(str(archive) not in call for call in calls)
+    assert "::warning::nextest archives are not used" in capsys.readouterr().err
+
+
+def test_run_rust_main_runs_cucumber_in_first_partition_only(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """Later partitions leave the cucumber.rs pass to partition 1."""
+    calls, _archive, _output = _run_rust_main_archive(
+        tmp_path,
+        monkeypatch,
+        run_rust_module,
+        partition="hash:2/2",
+        with_cucumber_rs=True,
+    )
+
+    [call] = calls
+    assert call[:2] == ["llvm-cov", "nextest"]
+    assert "--test" not in call
+    assert call[call.index("--partition") + 1] == "hash:2/2"
+
+
+@pytest.mark.parametrize(
+    ("partition", "use_nextest", "message"),
+    [
+        ("count:0/3", True, "Invalid nextest-partition: count:0/3"),
+        ("count:4/3", True, "Invalid nextest-partition: count:4/3"),
+        ("3", True, "Invalid nextest-partition: 3"),
+        ("count:1/3", False, "nextest-partition requires use-cargo-nextest"),
+    ],
+)
+def test_resolve_partition_rejects_invalid_values(
+    run_rust_module: ModuleType,
+    capsys: pytest.CaptureFixture[str],
+    partition: str,
+    use_nextest: bool,  # noqa: FBT001 - parametrized flag
+    message: str,
+) -> None:
+    """Malformed partitions and partitions without nextest exit with 1."""
+    with pytest.raises(run_rust_module.typer.Exit) as excinfo:
+        run_rust_module._resolve_partition(partition, use_nextest=use_nextest)
+    assert _exit_code(excinfo.value) == 1
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("fmt", "extra", "message"),
+    [
+        ("lcov", "html", "Unsupported extra format: html"),
+        ("text", "lcov", "cannot be combined with format text"),
+    ],
+)
+def test_resolve_formats_rejects_unsupported(
+    run_rust_module: ModuleType,
+    capsys: pytest.CaptureFixture[str],
+    fmt: str,
+    extra: str,
+    message: str,
+) -> None:
+    """Only file formats can be rendered from a shared run."""
+    with pytest.raises(run_rust_module.typer.Exit) as excinfo:
+        run_rust_module._resolve_formats(fmt, extra)
+    assert _exit_code(excinfo.value) == 1
+    assert message in capsys.readouterr().err
+
+
 def test_run_rust_cranelift_project_uses_llvm_codegen_env(
     tmp_path: Path,
     shell_stubs: StubManager,
@@ -853,6 +1233,39 @@ def test_run_cargo_windows_closes_streams(
     assert stderr.close_calls >= 1
 
 
+@pytest.mark.parametrize(
+    ("policy", "capture_env", "expected"),
+    [
+        ("last", "", "three\nCoverage: 75%"),
+        ("matching", "", "Coverage: 75%"),
+        ("discard", "", ""),
+        ("discard", "full", "one\ntwo\nthree\nCoverage: 75%"),
+    ],
+)
+def test_run_cargo_capture_policy(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    policy: str,
+    capture_env: str,
+    expected: str,
+) -> None:
+    """``_run_cargo`` echoes every line but returns only what the policy keeps."""
+    mod = _load_module(monkeypatch, "run_rust")
+    monkeypatch.setattr(mod.os, "name", "nt")
+    monkeypatch.setattr(mod.typer, "echo", lambda *_a, **_k: None)
+    monkeypatch.setenv("RUN_RUST_CAPTURE", capture_env)
+    payload = "one\ntwo\nthree\nCoverage: 75%\n"
+    monkeypatch.setattr(mod, "cargo", _make_fake_cargo(payload, ""))
+    capture = {
+        "last": mod.CapturePolicy.last(2),
+        "matching": mod.SUMMARY_CAPTURE,
+        "discard": mod.CapturePolicy.last(0),
+    }[policy]
+
+    assert mod._run_cargo(["llvm-cov"], capture=capture) == expected
+    assert capsys.readouterr().out == payload
+
+
 def test_run_cargo_passes_env_overrides(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -996,46 +1409,12 @@ def test_run_cargo_invalid_timeout_does_not_spawn(
     assert ("::error::RUN_RUST_CARGO_WAIT_TIMEOUT must be a number", True) in messages
 
 
-def _make_cucumber_spy(
-    calls: list[dict[str, object]],
-) -> typ.Callable[..., None]:
-    """Return a ``run_cucumber_rs_coverage`` spy that records its call arguments."""
-
-    def _spy(
-        out: Path,
-        fmt: str,
-        features: str,
-        *,
-        manifest_path: Path,
-        cargo_env: typ.Mapping[str, str],
-        with_default: bool,
-        use_nextest: bool,
-        cucumber_rs_features: str,
-        cucumber_rs_args: str,
-    ) -> None:
-        calls.append(
-            {
-                "out": out,
-                "fmt": fmt,
-                "features": features,
-                "manifest_path": manifest_path,
-                "cargo_env": dict(cargo_env),
-                "with_default": with_default,
-                "use_nextest": use_nextest,
-                "cucumber_rs_features": cucumber_rs_features,
-                "cucumber_rs_args": cucumber_rs_args,
-            }
-        )
-
-    return _spy
-
-
 def test_main_reuses_cargo_env_for_cucumber(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
     run_rust_module: ModuleType,
 ) -> None:
-    """``main`` computes cargo env once and threads it into cucumber coverage."""
+    """``main`` computes cargo env once and threads it into every cargo pass."""
     monkeypatch.chdir(tmp_path)
     output = tmp_path / "cov.lcov"
     output.write_text("LF:10\nLH:10\n", encoding="utf-8")
@@ -1043,7 +1422,7 @@ def test_main_reuses_cargo_env_for_cucumber(
     cargo_env = {"CARGO_PROFILE_DEV_CODEGEN_BACKEND": "llvm"}
     env_calls: list[Path] = []
     run_cargo_env_calls: list[typ.Mapping[str, str] | None] = []
-    cucumber_calls: list[dict[str, object]] = []
+    cargo_calls: list[list[str]] = []
 
     def fake_get_cargo_coverage_env(manifest_path: Path) -> dict[str, str]:
         env_calls.append(manifest_path)
@@ -1054,18 +1433,17 @@ def test_main_reuses_cargo_env_for_cucumber(
         *,
         env_overrides: typ.Mapping[str, str] | None = None,
         env_unsets: typ.Iterable[str] = (),
+        capture: object = None,
     ) -> str:
-        _ = (args, env_unsets)
+        _ = env_unsets
+        cargo_calls.append(args)
         run_cargo_env_calls.append(env_overrides)
         return "Coverage: 100%"
 
-    cucumber_spy = _make_cucumber_spy(cucumber_calls)
-
     monkeypatch.setattr(
         run_rust_module, "get_cargo_coverage_env", fake_get_cargo_coverage_env
     )
     monkeypatch.setattr(run_rust_module, "_run_cargo", fake_run_cargo)
-    monkeypatch.setattr(run_rust_module, "run_cucumber_rs_coverage", cucumber_spy)
 
     manifest_path = Path("rust-toy-app/Cargo.toml")
     run_rust_module.main(
@@ -1084,9 +1462,55 @@ def test_main_reuses_cargo_env_for_cucumber(
     )
 
     assert env_calls == [manifest_path]
-    assert run_cargo_env_calls == [cargo_env]
-    assert len(cucumber_calls) == 1
-    assert cucumber_calls[0]["cargo_env"] == cargo_env
+    assert run_cargo_env_calls == [cargo_env] * 4
+    assert sum("cucumber" in args for args in cargo_calls) == 1
+
+
+def test_main_skips_cucumber_without_target_in_metadata_mode(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    run_rust_module: ModuleType,
+) -> None:
+    """A cargo model without a ``cucumber`` test target skips that pass."""
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "cov.lcov"
+    output.write_text("LF:10\nLH:10\n", encoding="utf-8")
+    cargo_calls: list[list[str]] = []
+    package = types.SimpleNamespace(has_target=lambda name, kind: False)
+    fake_cargo_utils = types.SimpleNamespace(
+        resolver_mode=lambda: "metadata",
+        load_workspace_metadata=lambda _path: types.SimpleNamespace(
+            packages={Path("Cargo.toml"): package}
+        ),
+    )
+
+    monkeypatch.setattr(run_rust_module, "load_cargo_utils", lambda: fake_cargo_utils)
+    monkeypatch.setattr(run_rust_module, "get_cargo_coverage_env", lambda _path: {})
+    monkeypatch.setattr(
+        run_rust_module,
+        "_run_cargo",
+        lambda args, **_kwargs: cargo_calls.append(args) or "Coverage: 100%",
+    )
+
+    run_rust_module.main(
+        output,
+        "",
+        with_default=True,
+        use_nextest=False,
+        lang="rust",
+        fmt="lcov",
+        manifest_path=Path("Cargo.toml"),
+        github_output=tmp_path / "gh.txt",
+        cucumber_rs_features="tests/features",
+        cucumber_rs_args="",
+        with_cucumber_rs=True,
+        baseline_file=None,
+    )
+
+    assert len(cargo_calls) == 1
+    assert "cucumber" not in cargo_calls[0]
+    assert "no workspace member has a 'cucumber' test target" in capsys.readouterr().err
 
 
 def test_run_cargo_windows_nonzero_exit(
@@ -1171,10 +1595,10 @@ def test_run_cargo_windows_pump_exception(
     monkeypatch.setattr(mod.typer, "echo", lambda *_args, **_kwargs: None)
 
     class BoomIO(io.StringIO):
-        """Stream stub whose ``readline`` always raises."""
+        """Stream stub whose ``read`` always raises."""
 
-        def readline(self) -> str:
-            """Raise a runtime error when the pump reads a line."""
+        def read(self, size: int | None = -1) -> str:
+            """Raise a runtime error when the pump reads a chunk."""
             message = "boom in pump"
             raise RuntimeError(message)
 
@@ -1265,9 +1689,7 @@ def test_run_rust_with_cucumber(tmp_path: Path, shell_stubs: StubManager) -> Non
     out = tmp_path / "cov.lcov"
     gh = tmp_path / "gh.txt"
 
-    cuc_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
     out.write_text("TN:test\nend_of_record\n")
-    cuc_file.write_text("TN:cuke\nend_of_record\n")
 
     shell_stubs.register(
         "cargo",
@@ -1294,16 +1716,13 @@ def test_run_rust_with_cucumber(tmp_path: Path, shell_stubs: StubManager) -> Non
     assert returncode == 0
 
     calls = shell_stubs.calls_of("cargo")
-    assert len(calls) == 2
-    cuc_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
-    expected_second = [
+    assert len(calls) == 4
+    expected_cucumber = [
         "llvm-cov",
         "--manifest-path",
         "rust-toy-app/Cargo.toml",
         "--workspace",
-        "--lcov",
-        "--output-path",
-        str(cuc_file),
+        "--no-report",
         "--",
         "--test",
         "cucumber",
@@ -1314,9 +1733,18 @@ def test_run_rust_with_cucumber(tmp_path: Path, shell_stubs: StubManager) -> Non
         "--tag",
         "fast",
     ]
-    assert calls[1].argv == expected_second
-    assert out.read_text() == "TN:test\nend_of_record\nTN:cuke\nend_of_record\n"
-    assert not cuc_file.exists()
+    assert calls[0].argv[:2] == ["llvm-cov", "clean"]
+    assert calls[2].argv == expected_cucumber
+    assert calls[3].argv == [
+        "llvm-cov",
+        "report",
+        "--manifest-path",
+        "rust-toy-app/Cargo.toml",
+        "--lcov",
+        "--output-path",
+        str(out),
+    ]
+    assert not list(tmp_path.glob("*.cucumber*"))
 
 
 def test_run_rust_with_cucumber_nextest(
@@ -1328,9 +1756,7 @@ def test_run_rust_with_cucumber_nextest(
     out = tmp_path / "cov.lcov"
     gh = tmp_path / "gh.txt"
 
-    cuc_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
     out.write_text("TN:test\nend_of_record\n")
-    cuc_file.write_text("TN:cuke\nend_of_record\n")
 
     shell_stubs.register(
         "cargo",
@@ -1358,44 +1784,43 @@ def test_run_rust_with_cucumber_nextest(
     assert returncode == 0
 
     calls = shell_stubs.calls_of("cargo")
-    assert len(calls) == 2
-    assert calls[0].argv[0] == "llvm-cov"
-    assert calls[0].argv[1] == "nextest"
-    assert calls[1].argv[0] == "llvm-cov"
-    assert calls[1].argv[1] == "nextest"
-    assert "--manifest-path" in calls[0].argv
-    assert "--manifest-path" in calls[1].argv
-    assert "rust-toy-app/Cargo.toml" in calls[0].argv
-    assert "rust-toy-app/Cargo.toml" in calls[1].argv
-    assert out.read_text() == "TN:test\nend_of_record\nTN:cuke\nend_of_record\n"
-    assert not cuc_file.exists()
+    assert len(calls) == 4
+    for call in calls[1:3]:
+        assert call.argv[:2] == ["llvm-cov", "nextest"]
+        assert "--no-report" in call.argv
+        assert "rust-toy-app/Cargo.toml" in call.argv
+    assert "cucumber" in calls[2].argv
+    assert calls[3].argv[:2] == ["llvm-cov", "report"]
+    assert not list(tmp_path.glob("*.cucumber*"))
     assert not (tmp_path / ".config" / "nextest.toml").exists()
 
 
+def _cobertura(filename: str, *lines: tuple[int, int]) -> str:
+    """Return a minimal Cobertura report for ``filename`` with ``lines``."""
+    body = "".join(f'<line number="{n}" hits="{h}"/>' for n, h in lines)
+    return (
+        '<coverage lines-valid="0" lines-covered="0">'
+        "<sources><source>.</source></sources><packages>"
+        f'<package name="pkg"><classes><class name="{filename}" '
+        f'filename="{filename}"><methods/><lines>{body}</lines></class>'
+        "</classes></package></packages></coverage>"
+    )
+
+
 def test_run_rust_with_cucumber_cobertura(
     tmp_path: Path, shell_stubs: StubManager
 ) -> None:
-    """Cobertura format merges cucumber coverage using ``merge-cobertura``."""
+    """Cobertura reports include cucumber profiles without a merge."""
     out = tmp_path / "cov.xml"
     gh = tmp_path / "gh.txt"
 
-    cuc_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
-    out.write_text("<cov/>")
-    cuc_file.write_text("<cuke/>")
+    report = _cobertura("src/lib.rs", (1, 1), (2, 3))
+    out.write_text(report)
 
     shell_stubs.register(
         "cargo",
         default=DefaultResponse(stdout="Coverage: 100%\n"),
     )
-    shell_stubs.register(
-        "uvx",
-        variants=[
-            {
-                "match": ["merge-cobertura", str(out), str(cuc_file)],
-                "stdout": "<coverage lines-covered='1' lines-valid='1'/>",
-            }
-        ],
-    )
 
     env = {
         **shell_stubs.env,
@@ -1416,59 +1841,16 @@ def test_run_rust_with_cucumber_cobertura(
     returncode, _, _ = run_script(script, env)
     assert returncode == 0
 
-    uvx_calls = shell_stubs.calls_of("uvx")
-    assert uvx_calls
-    assert uvx_calls[0].argv == ["merge-cobertura", str(out), str(cuc_file)]
-    assert out.read_text() == "<coverage lines-covered='1' lines-valid='1'/>"
-    assert not cuc_file.exists()
-
-
-def test_run_rust_with_cucumber_cobertura_merge_failure(
-    tmp_path: Path, shell_stubs: StubManager
-) -> None:
-    """Failures from ``merge-cobertura`` exit with its code."""
-    out = tmp_path / "cov.xml"
-    gh = tmp_path / "gh.txt"
-
-    cuc_file = out.with_name(f"{out.stem}.cucumber{out.suffix}")
-    out.write_text("<cov/>")
-    cuc_file.write_text("<cuke/>")
-
-    shell_stubs.register(
-        "cargo",
-        default=DefaultResponse(stdout="Coverage: 100%\n"),
-    )
-    shell_stubs.register(
-        "uvx",
-        variants=[
-            {
-                "match": ["merge-cobertura", str(out), str(cuc_file)],
-                "stderr": "oops",
-                "exit_code": 3,
-            }
-        ],
-    )
-
-    env = {
-        **shell_stubs.env,
-        "INPUT_OUTPUT_PATH": str(out),
-        "DETECTED_LANG": "rust",
-        "DETECTED_FMT": "cobertura",
-        "DETECTED_CARGO_MANIFEST": "rust-toy-app/Cargo.toml",
-        "INPUT_FEATURES": "",
-        "INPUT_WITH_DEFAULT_FEATURES": "true",
-        "INPUT_USE_CARGO_NEXTEST": "false",
-        "INPUT_WITH_CUCUMBER_RS": "true",
-        "INPUT_CUCUMBER_RS_FEATURES": "tests/features",
-        "INPUT_CUCUMBER_RS_ARGS": "",
-        "GITHUB_OUTPUT": str(gh),
-    }
-
-    script = Path(__file__).resolve().parents[1] / "scripts" / "run_rust.py"
-    returncode, _, stderr = run_script(script, env)
-    assert returncode == 3
-    assert "merge-cobertura failed" in stderr
-    assert cuc_file.exists()
+    calls = shell_stubs.calls_of("cargo")
+    assert [call.argv[1] for call in calls] == [
+        "clean",
+        "--manifest-path",
+        "--manifest-path",
+        "report",
+    ]
+    assert "--cobertura" in calls[3].argv
+    assert out.read_text() == report
+    assert "percent=100.00" in gh.read_text()
 
 
 def test_run_rust_failure(tmp_path: Path, shell_stubs: StubManager) -> None:
@@ -1810,26 +2192,15 @@ def test_install_nextest_checksum_mismatch(
     assert "cargo-nextest checksum mismatch" in capsys.readouterr().err
 
 
-def test_merge_cobertura(tmp_path: Path, shell_stubs: StubManager) -> None:
+def test_merge_cobertura(tmp_path: Path) -> None:
     """``merge_cobertura.py`` merges two files and removes them."""
     rust = tmp_path / "r.xml"
     py = tmp_path / "p.xml"
-    rust.write_text("<r/>")
-    py.write_text("<p/>")
+    rust.write_text(_cobertura("src/lib.rs", (1, 1), (2, 0)))
+    py.write_text(_cobertura("pkg/mod.py", (1, 0)))
     out = tmp_path / "merged.xml"
 
-    shell_stubs.register(
-        "uvx",
-        variants=[
-            {
-                "match": ["merge-cobertura", str(rust), str(py)],
-                "stdout": "<merged/>",
-            }
-        ],
-    )
-
     env = {
-        **shell_stubs.env,
         "RUST_FILE": str(rust),
         "PYTHON_FILE": str(py),
         "OUTPUT_PATH": str(out),
@@ -1837,12 +2208,37 @@ def test_merge_cobertura(tmp_path: Path, shell_stubs: StubManager) -> None:
     script = Path(__file__).resolve().parents[1] / "scripts" / "merge_cobertura.py"
     returncode, _, _ = run_script(script, env)
     assert returncode == 0
-    assert out.read_text() == "<merged/>"
+    merged = out.read_text()
+    assert 'lines-valid="3"' in merged
+    assert 'lines-covered="1"' in merged
+    assert 'filename="src/lib.rs"' in merged
+    assert 'filename="pkg/mod.py"' in merged
+    assert not rust.exists()
+    assert not py.exists()
+
+
+def test_merge_cobertura_converts_to_lcov(tmp_path: Path) -> None:
+    """``merge_cobertura.py`` merges an LCOV and a Cobertura report as LCOV."""
+    rust = tmp_path / "r.info"
+    py = tmp_path / "p.xml"
+    rust.write_text("SF:src/lib.rs\nDA:1,1\nDA:2,0\nLF:2\nLH:1\nend_of_record\n")
+    py.write_text(_cobertura("pkg/mod.py", (1, 0), (2, 3)))
+    out = tmp_path / "merged.info"
+
+    env = {
+        "RUST_FILE": str(rust),
+        "PYTHON_FILE": str(py),
+        "OUTPUT_PATH": str(out),
+        "OUTPUT_FORMAT": "lcov",
+    }
+    script = Path(__file__).resolve().parents[1] / "scripts" / "merge_cobertura.py"
+    returncode, _, stderr = run_script(script, env)
+    assert returncode == 0, stderr
+    merged = out.read_text()
+    assert "SF:pkg/mod.py\nDA:1,0\nDA:2,3\nLF:2\nLH:1\n" in merged
+    assert "SF:src/lib.rs\n" in merged
     assert not rust.exists()
     assert not py.exists()
-    calls = shell_stubs.calls_of("uvx")
-    assert calls
-    assert calls[0].argv[:1] == ["merge-cobertura"]
 
 
 @pytest.mark.parametrize(
@@ -1882,16 +2278,64 @@ def test_lcov_permission_error(
     lcov = tmp_path / "deny.lcov"
     lcov.write_text("LF:1\nLH:1\n")
 
-    def bad_read_text(*_: object, **__: object) -> str:
+    def bad_open(*_: object, **__: object) -> typ.NoReturn:
         message = "nope"
         raise PermissionError(message)
 
-    monkeypatch.setattr(Path, "read_text", bad_read_text, raising=False)
+    monkeypatch.setattr(Path, "open", bad_open, raising=False)
     with pytest.raises(run_rust_module.typer.Exit) as excinfo:
         run_rust_module.get_line_coverage_percent_from_lcov(lcov)
     assert _exit_code(excinfo.value) == 1
 
 
+def test_lcov_totals_per_file(tmp_path: Path, run_rust_module: ModuleType) -> None:
+    """``read_lcov_totals`` sums every summary tag and breaks them down per file."""
+    lcov = tmp_path / "cov.lcov"
+    lcov.write_bytes(
+        b"SF:src/a.rs\nFNF:2\nFNH:1\nBRF:4\nBRH:3\nDA:1,1\nLF:10\nLH:9\n"
+        b"end_of_record\n"
+        b"SF:src/b.rs\r\nLF:4\r\nLH:1\r\nend_of_record\r\n"
+        b"SF:src/empty.rs\nLF:0\nLH:0\nend_of_record\n"
+    )
+    import coverage_parsers
+
+    summary = coverage_parsers.read_lcov_totals(lcov, per_file=True)
+
+    totals = summary.totals
+    assert (totals.lines_hit, totals.lines_found) == (10, 14)
+    assert (totals.branches_hit, totals.branches_found) == (3, 4)
+    assert (totals.functions_hit, totals.functions_found) == (1, 2)
+    assert totals.line_percent == "71.43"
+    assert [name for name, _ in summary.worst_files(5)] == ["src/b.rs", "src/a.rs"]
+    assert not coverage_parsers.read_lcov_totals(lcov).files
+    assert run_rust_module.get_line_coverage_percent_from_lcov(lcov) == "71.43"
+
+
+def test_lcov_worst_files_step_summary(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_rust_module: ModuleType,
+) -> None:
+    """LCOV runs publish their least-covered files to the step summary."""
+    lcov = tmp_path / "cov.lcov"
+    lcov.write_text(
+        f"SF:{tmp_path / 'src' / 'a.rs'}\nLF:2\nLH:2\nend_of_record\n"
+        "SF:src/b|c.rs\nBRF:2\nBRH:1\nLF:4\nLH:1\nend_of_record\n"
+    )
+    summary = tmp_path / "summary.md"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+    monkeypatch.chdir(tmp_path)
+
+    percent = run_rust_module._compute_coverage_percent("lcov", lcov, "")
+
+    assert percent == "50.00"
+    assert summary.read_text().splitlines()[4:] == [
+        "| `src/b\\|c.rs` | 1/4 | 25.00 | 50.00 |",
+        "| `src/a.rs` | 2/2 | 100.00 | - |",
+        "",
+    ]
+
+
 @pytest.fixture
 def run_python_module(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
     """Return a freshly loaded ``run_python`` module for testing."""
@@ -2309,6 +2753,82 @@ def test_ensure_coverage_venv_sets_uv_project_environment_for_sync(
     assert "UV_PROJECT_ENVIRONMENT" not in os.environ
 
 
+def _stamped_coverage_venv(
+    tmp_path: Path,
+    run_python_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> VenvTestSetup:
+    """Return a reusable venv whose first install has written its stamp."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    (tmp_path / "uv.lock").write_text("version = 1\n")
+    setup = _setup_coverage_venv_test(
+        tmp_path, run_python_module, monkeypatch, python_to_create=None
+    )
+    python = setup.coverage_venv / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.touch()
+    (setup.coverage_venv / "pyvenv.cfg").write_text("version_info = 3.12.3\n")
+    run_python_module._ensure_coverage_venv()
+    assert (setup.coverage_venv / run_python_module.VENV_STAMP_NAME).is_file()
+    setup.recorded.clear()
+    return setup
+
+
+def test_ensure_coverage_venv_skips_installs_when_stamp_matches(
+    tmp_path: Path,
+    run_python_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A cached venv with a matching stamp runs neither uv sync nor uv pip."""
+    setup = _stamped_coverage_venv(tmp_path, run_python_module, monkeypatch)
+
+    python = run_python_module._ensure_coverage_venv()
+
+    assert python == str((setup.coverage_venv / "bin" / "python").resolve())
+    assert setup.recorded == []
+
+
+@pytest.mark.parametrize(
+    ("change", "expected"),
+    [
+        ("tooling", ["pip"]),
+        ("lockfile", ["sync", "pip"]),
+        ("lockfile-format", []),
+        ("python", ["sync", "pip"]),
+    ],
+)
+def test_ensure_coverage_venv_reinstalls_changed_portion(
+    tmp_path: Path,
+    run_python_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    change: str,
+    expected: list[str],
+) -> None:
+    """Only the installs affected by a stamp mismatch are repeated."""
+    setup = _stamped_coverage_venv(tmp_path, run_python_module, monkeypatch)
+    if change == "tooling":
+        monkeypatch.setattr(
+            run_python_module,
+            "TOOLING_PACKAGES",
+            (*run_python_module.TOOLING_PACKAGES, "pytest-timeout"),
+        )
+    elif change == "lockfile":
+        (tmp_path / "uv.lock").write_text("version = 2\n")
+    elif change == "lockfile-format":
+        (tmp_path / "uv.lock").write_text("# regenerated\nversion   =   1\n")
+    else:
+        (setup.coverage_venv / "pyvenv.cfg").write_text("version_info = 3.13.0\n")
+
+    run_python_module._ensure_coverage_venv()
+
+    assert [parts[1] for parts in setup.recorded] == expected
+    stamp = json.loads(
+        (setup.coverage_venv / run_python_module.VENV_STAMP_NAME).read_text()
+    )
+    assert stamp["tooling"] == [*run_python_module.TOOLING_PACKAGES]
+
+
 def test_coverage_python_cmd_prepares_tools_once(
     tmp_path: Path,
     run_python_module: ModuleType,
@@ -2702,6 +3222,244 @@ def test_tmp_coveragepy_xml_invokes_venv_python(
     assert parts[-5:] == ["-m", "coverage", "xml", "-o", str(xml_path)]
 
 
+def test_run_python_mixed_lcov_requests_cobertura(
+    tmp_path: Path, run_python_module: ModuleType
+) -> None:
+    """Mixed LCOV runs ask slipcover for Cobertura; the merge converts it."""
+    out, fmt, _github_output = run_python_module._resolve_inputs(
+        tmp_path / "lcov.info", "mixed", "lcov", tmp_path / "gh.txt"
+    )
+
+    assert fmt == "cobertura"
+    assert out == tmp_path / "lcov.python.info"
+
+
+def test_duration_schedule_plans_and_records(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+) -> None:
+    """Recorded durations pick the workers and the new ones replace them."""
+    durations = tmp_path / "durations.json"
+    durations.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "durations": {
+                    "tests/test_a.py::test_a": 2.0,
+                    "tests/test_b.py::test_b": 1.0,
+                },
+            }
+        )
+    )
+    summary = tmp_path / "summary.md"
+    monkeypatch.setenv("PYTEST_DURATIONS_FILE", str(durations))
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+    monkeypatch.setattr(run_python_module.os, "cpu_count", lambda: 8)
+
+    with run_python_module._duration_schedule("auto") as (workers, args):
+        assert workers == "2"
+        assert args == ["-p", "generate_coverage_schedule", "--dist", "loadgroup"]
+        plan = json.loads(
+            Path(os.environ["GENERATE_COVERAGE_SCHEDULE_PLAN"]).read_text()
+        )
+        assert plan["groups"] == {
+            "tests/test_a.py": "gencov-0",
+            "tests/test_b.py": "gencov-1",
+        }
+        plugin_dir = Path(os.environ["PYTHONPATH"].split(os.pathsep)[0])
+        assert (plugin_dir / "generate_coverage_schedule.py").is_file()
+        Path(os.environ["GENERATE_COVERAGE_DURATIONS_OUT"]).write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "durations": {"tests/test_a.py::test_a": 2.5},
+                    "workers": {"gw0": 2.5, "gw1": 0.0},
+                }
+            )
+        )
+
+    assert "GENERATE_COVERAGE_SCHEDULE_PLAN" not in os.environ
+    assert json.loads(durations.read_text())["durations"] == {
+        "tests/test_a.py::test_a": 2.5
+    }
+    assert "| 2 | 2.0s | 2.5s |" in summary.read_text()
+
+
+def test_duration_schedule_disabled_without_file(
+    monkeypatch: pytest.MonkeyPatch, run_python_module: ModuleType
+) -> None:
+    """Without ``PYTEST_DURATIONS_FILE`` the run is left unchanged."""
+    monkeypatch.delenv("PYTEST_DURATIONS_FILE", raising=False)
+
+    with run_python_module._duration_schedule("auto") as (workers, args):
+        assert (workers, args) == ("auto", [])
+
+
+def test_duration_schedule_keeps_history_for_partial_runs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+) -> None:
+    """A partial run updates the durations it measured and keeps the rest."""
+    durations = tmp_path / "durations.json"
+    durations.write_text(
+        json.dumps({"version": 1, "durations": {"t.py::a": 1.0, "t.py::b": 2.0}})
+    )
+    monkeypatch.setenv("PYTEST_DURATIONS_FILE", str(durations))
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    with run_python_module._duration_schedule("", partial=True):
+        Path(os.environ["GENERATE_COVERAGE_DURATIONS_OUT"]).write_text(
+            json.dumps(
+                {"version": 1, "durations": {"t.py::a": 3.0}, "workers": {"main": 3}}
+            )
+        )
+
+    assert json.loads(durations.read_text())["durations"] == {
+        "t.py::a": 3.0,
+        "t.py::b": 2.0,
+    }
+
+
+_IMPACT_REPORT = """<?xml version="1.0" ?>
+<coverage version="1"><sources><source>.</source></sources>
+<packages><package name="app"><classes>{classes}</classes></package></packages>
+</coverage>
+"""
+
+
+def _impact_report(path: Path, **hits: int) -> None:
+    """Write a Cobertura report with one line per ``app/<name>.py`` class."""
+    classes = "".join(
+        f'<class name="{name}" filename="app/{name}.py"><methods/>'
+        f'<lines><line number="1" hits="{count}"/></lines></class>'
+        for name, count in hits.items()
+    )
+    path.write_text(_IMPACT_REPORT.format(classes=classes), encoding="utf-8")
+
+
+def _impact_dir(tmp_path: Path, run_python_module: ModuleType) -> Path:
+    """Return a test-impact directory holding a map and its baseline."""
+    impact_selection = sys.modules["impact_selection"]
+    directory = tmp_path / "impact"
+    impact_selection.save_impact_map(
+        directory / impact_selection.MAP_NAME,
+        impact_selection.ImpactMap(
+            "abc123",
+            {
+                "tests/test_a.py::test_a": frozenset({"app/a.py"}),
+                "tests/test_b.py::test_b": frozenset({"app/b.py"}),
+            },
+        ),
+    )
+    _impact_report(directory / impact_selection.BASELINE_NAME, a=1, b=0)
+    return directory
+
+
+def test_test_impact_records_map_and_baseline(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+) -> None:
+    """A successful record run stores the map and a copy of the report."""
+    directory = tmp_path / "impact"
+    out = tmp_path / "cov.xml"
+    monkeypatch.setenv("TEST_IMPACT_DIR", str(directory))
+    monkeypatch.setenv("TEST_IMPACT_MODE", "record")
+    monkeypatch.setattr(run_python_module, "current_commit", lambda: "abc123")
+
+    with run_python_module._test_impact("cobertura", "python", out) as impact:
+        assert impact.pytest_args == ("-p", "generate_coverage_impact")
+        assert not impact.partial
+        Path(os.environ["GENERATE_COVERAGE_IMPACT_OUT"], "main.json").write_text(
+            json.dumps({"version": 1, "tests": {"t.py::a": ["app/a.py"]}})
+        )
+        _impact_report(out, a=1)
+
+    impact_selection = sys.modules["impact_selection"]
+    assert impact.recorded == directory / impact_selection.MAP_NAME
+    recorded = impact_selection.load_impact_map(impact.recorded)
+    assert recorded.sha == "abc123"
+    assert recorded.tests == {"t.py::a": frozenset({"app/a.py"})}
+    assert (directory / impact_selection.BASELINE_NAME).read_text() == out.read_text()
+    assert "GENERATE_COVERAGE_IMPACT_OUT" not in os.environ
+
+
+def test_test_impact_overlays_selected_run_on_baseline(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+) -> None:
+    """A pull request runs the affected tests and keeps baseline data for the rest."""
+    directory = _impact_dir(tmp_path, run_python_module)
+    change = sys.modules["impact_selection"].Change
+    out = tmp_path / "cov.xml"
+    monkeypatch.setenv("TEST_IMPACT_DIR", str(directory))
+    monkeypatch.setenv("TEST_IMPACT_MODE", "select")
+    monkeypatch.setattr(
+        run_python_module, "changed_files", lambda _sha: [change("M", "app/b.py")]
+    )
+
+    with run_python_module._test_impact("cobertura", "python", out) as impact:
+        assert impact.partial
+        assert not impact.skip_tests
+        selection = json.loads(
+            Path(os.environ["GENERATE_COVERAGE_IMPACT_SELECT"]).read_text()
+        )
+        assert selection["nodeids"] == ["tests/test_b.py::test_b"]
+        _impact_report(out, a=0, b=4)
+
+    assert impact.recorded is None
+    assert run_python_module.get_line_coverage_percent_from_cobertura(out) == "100.00"
+
+
+def test_test_impact_skips_tests_when_nothing_is_affected(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+) -> None:
+    """A change no test can observe reuses the baseline report."""
+    directory = _impact_dir(tmp_path, run_python_module)
+    change = sys.modules["impact_selection"].Change
+    out = tmp_path / "cov.xml"
+    monkeypatch.setenv("TEST_IMPACT_DIR", str(directory))
+    monkeypatch.setenv("TEST_IMPACT_MODE", "select")
+    monkeypatch.setattr(
+        run_python_module, "changed_files", lambda _sha: [change("M", "README.md")]
+    )
+
+    with run_python_module._test_impact("cobertura", "python", out) as impact:
+        assert impact.skip_tests
+
+    assert run_python_module.get_line_coverage_percent_from_cobertura(out) == "50.00"
+
+
+@pytest.mark.parametrize(
+    ("fmt", "lang", "mode"),
+    [
+        ("cobertura", "mixed", "select"),
+        ("coveragepy", "python", "select"),
+        ("cobertura", "python", "select"),
+    ],
+    ids=["mixed", "coveragepy", "no-map"],
+)
+def test_test_impact_runs_everything_when_unavailable(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_python_module: ModuleType,
+    fmt: str,
+    lang: str,
+    mode: str,
+) -> None:
+    """Mixed projects, coverage.py data and missing maps run the full suite."""
+    monkeypatch.setenv("TEST_IMPACT_DIR", str(tmp_path / "impact"))
+    monkeypatch.setenv("TEST_IMPACT_MODE", mode)
+
+    with run_python_module._test_impact(fmt, lang, tmp_path / "cov.xml") as impact:
+        assert impact == run_python_module.ImpactRun()
+
+
 def test_run_python_cobertura_passes_out_flag(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -2826,6 +3584,35 @@ def test_cobertura_detail(tmp_path: Path, run_python_module: ModuleType) -> None
     assert pct == "50.00"
 
 
+def test_cobertura_totals_count_branches(
+    tmp_path: Path, run_python_module: ModuleType
+) -> None:
+    """Branch totals come from ``condition-coverage``; method lines are skipped."""
+    xml = tmp_path / "branches.xml"
+    xml.write_text(
+        """
+<coverage branches-covered='9' branches-valid='9'>
+  <packages><package><classes><class>
+    <methods><method><lines><line hits='5'/></lines></method></methods>
+    <lines>
+      <line hits='2' branch='true' condition-coverage='50% (1/2)'/>
+      <line hits='0' branch='true' condition-coverage='0% (0/4)'/>
+      <line hits='3'/>
+    </lines>
+  </class></classes></package></packages>
+</coverage>
+        """
+    )
+    import coverage_parsers
+
+    totals = coverage_parsers.read_cobertura_totals(xml)
+    assert (totals.lines_covered, totals.lines_valid) == (2, 3)
+    assert (totals.branches_covered, totals.branches_valid) == (1, 6)
+    assert totals.line_percent == "66.67"
+    assert totals.branch_percent == "16.67"
+    assert run_python_module.get_line_coverage_percent_from_cobertura(xml) == "66.67"
+
+
 def test_cobertura_root_totals(tmp_path: Path, run_python_module: ModuleType) -> None:
     """``get_line_coverage_percent_from_cobertura`` falls back to root totals."""
     xml = tmp_path / "root.xml"
@@ -3027,7 +3814,7 @@ def test_cobertura_permission_error(
 
     import coverage_parsers
 
-    monkeypatch.setattr(coverage_parsers.etree, "parse", raise_permission_error)
+    monkeypatch.setattr(coverage_parsers._etree(), "iterparse", raise_permission_error)
 
     with pytest.raises(run_python_module.typer.Exit) as excinfo:
         run_python_module.get_line_coverage_percent_from_cobertura(xml)
@@ -3082,6 +3869,31 @@ def test_generate_coverage_ensures_binstall_before_llvm_cov() -> None:
     )
 
 
+def test_generate_coverage_scripts_run_through_optional_worker() -> None:
+    """Script steps use the worker runner only after it was started."""
+    steps = _generate_coverage_steps()
+    start = next(step for step in steps if step.get("id") == "script-worker")
+    runner = "${{ steps.script-worker.outputs.run || 'uv run --script' }}"
+    script_steps = [
+        step
+        for step in steps
+        if "/scripts/" in str(step.get("run", "")) and step.get("id") != "script-worker"
+    ]
+
+    assert start.get("if") == (
+        "inputs.script-worker == 'true' && runner.os != 'Windows'"
+    )
+    assert steps.index(start) < min(steps.index(step) for step in script_steps)
+    assert all(
+        f'{runner} "${{{{ github.action_path }}}}/scripts/' in str(step["run"])
+        for step in script_steps
+    )
+    assert not any(
+        "uv run --script" in str(step["run"]).replace(runner, "")
+        for step in script_steps
+    )
+
+
 def test_generate_coverage_binstall_is_not_nextest_only() -> None:
     """cargo-llvm-cov also needs cargo-binstall when nextest is disabled."""
     step = _generate_coverage_step("Ensure cargo-binstall")
@@ -3372,6 +4184,10 @@ def _python_integration_env(
     assert python_env["DETECTED_FMT"] == "${{ steps.detect.outputs.fmt }}"
     assert python_env["BASELINE_PYTHON_FILE"] == "${{ inputs.baseline-python-file }}"
     assert python_env["INPUT_PYTEST_WORKERS"] == "${{ inputs.pytest-workers }}"
+    assert python_env["PYTEST_DURATIONS_FILE"] == (
+        "${{ inputs.pytest-durations == 'true' && "
+        "format('{0}/pytest-durations.json', runner.temp) || '' }}"
+    )
     out = tmp_path / "cov.xml"
     gh = tmp_path / "gh.txt"
     out.write_text("<coverage lines-covered='1' lines-valid='1'/>", encoding="utf-8")
@@ -3441,7 +4257,12 @@ def test_run_python_integration_cobertura_success(
     assert "coverage" in pip_args
     gh = tmp_path / "gh.txt"
     assert gh.exists(), "GITHUB_OUTPUT file must be written"
-    gh_content = gh.read_text(encoding="utf-8")
+    # Phase timings vary from run to run; they are covered in test_phase_timing.
+    gh_content = "".join(
+        line
+        for line in gh.read_text(encoding="utf-8").splitlines(keepends=True)
+        if not line.startswith("timing")
+    )
     assert gh_content.replace(tmp_path.as_posix(), "<TMP>") == snapshot(
         name="run_python_cobertura_github_output"
     )
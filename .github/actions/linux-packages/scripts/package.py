@@ -32,14 +32,18 @@ import shlex
 import stat
 import sys
 import typing as typ
+from functools import cache
 from pathlib import Path
 
 import cyclopts
-import yaml
 from cyclopts import App, Parameter
 from plumbum.commands.processes import ProcessExecutionError
 
 if typ.TYPE_CHECKING:
+    from types import ModuleType
+
+    import yaml
+
     from .architectures import UnsupportedTargetError, nfpm_arch_for_target
     from .script_utils import (
         ensure_directory,
@@ -154,7 +158,13 @@ def _represent_octal_int(dumper: yaml.Dumper, data: OctalInt) -> yaml.ScalarNode
     )
 
 
-yaml.SafeDumper.add_representer(OctalInt, _represent_octal_int)
+@cache
+def _yaml() -> ModuleType:
+    """Import :mod:`yaml` on first use and register the octal representer."""
+    import yaml
+
+    yaml.SafeDumper.add_representer(OctalInt, _represent_octal_int)
+    return yaml
 
 
 def infer_section(path: Path, default: str) -> str:
@@ -406,7 +416,7 @@ def main(
     }
 
     config_out_path.write_text(
-        yaml.safe_dump(config, sort_keys=False, allow_unicode=True),
+        _yaml().safe_dump(config, sort_keys=False, allow_unicode=True),
         encoding="utf-8",
     )
     print(f"Wrote {config_out_path}")
@@ -13,7 +13,6 @@ from pathlib import Path  # noqa: TC003 - used at runtime
 
 import typer
 from plumbum.cmd import cargo
-from plumbum.commands.processes import ProcessExecutionError
 
 from cmd_utils_importer import import_cmd_utils
 
@@ -31,6 +30,10 @@ def extract_percent(output: str) -> str:
 
 ARGS_OPT = typer.Option("", envvar="INPUT_ARGS")
 OUTPUT_OPT = typer.Option(..., envvar="GITHUB_OUTPUT")
+# Only lines carrying a percentage are retained; the rest of the (potentially
+# very large) llvm-cov output is streamed to the console and discarded.
+PERCENT_LINE_PATTERN = r"[0-9]+(?:\.[0-9]+)?%"
+STDERR_TAIL_LINES = 50
 
 
 def main(
@@ -42,20 +45,20 @@ def main(
     cmd = cargo["llvm-cov", "--summary-only"]
     if args:
         cmd = cmd[shlex.split(args)]
-    try:
-        outcome = cmd_utils.run_cmd(cmd, method="run")
-    except ProcessExecutionError as exc:  # Should not happen but guard anyway
-        result = cmd_utils.process_error_to_run_result(exc)
-    else:
-        result = cmd_utils.coerce_run_result(outcome)
+    result = cmd_utils.run_cmd(
+        cmd,
+        method="stream",
+        tail_lines=STDERR_TAIL_LINES,
+        patterns=[PERCENT_LINE_PATTERN],
+    )
     if result.returncode != 0:
+        stderr = "\n".join(result.stderr_tail)
         typer.echo(
-            f"cargo llvm-cov failed with code {result.returncode}: {result.stderr}",
+            f"cargo llvm-cov failed with code {result.returncode}: {stderr}",
             err=True,
         )
         raise typer.Exit(code=result.returncode)
-    typer.echo(result.stdout)
-    percent = extract_percent(result.stdout)
+    percent = extract_percent("\n".join(result.matches))
     with github_output.open("a") as fh:
         fh.write(f"percent={percent}\n")
 
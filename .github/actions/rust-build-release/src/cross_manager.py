@@ -171,6 +171,7 @@ def ensure_cross(required_cross_version: str) -> tuple[str | None, str | None]:
                 cross_exec,
                 ["--version"],
                 allowed_names=("cross", "cross.exe"),
+                cached=True,
             )
             version_line = result.stdout.strip().split("\n")[0]
             if version_line.startswith("cross "):
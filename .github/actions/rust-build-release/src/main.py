@@ -22,7 +22,6 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 prepend_project_root(sigil="cmd_utils_importer.py", start=_SCRIPT_DIR)
 
 import typer
-from cross_manager import ensure_cross
 from plumbum import local
 from plumbum.commands.processes import (
     ProcessExecutionError,
@@ -183,6 +182,7 @@ def _list_installed_toolchains(rustup_exec: str) -> list[str]:
         ["toolchain", "list"],
         allowed_names=("rustup", "rustup.exe"),
         method="run",
+        cached=True,
     )
     installed = result.stdout.splitlines()
     return [line.split()[0] for line in installed if line.strip()]
@@ -347,6 +347,17 @@ def _ensure_target_installed(
     return True
 
 
+def ensure_cross(required_cross_version: str) -> tuple[str | None, str | None]:
+    """Return the path and version of ``cross``, installing it when needed.
+
+    :mod:`cross_manager` pulls in :mod:`packaging` and the download helpers, so
+    it is imported here rather than at module load.
+    """
+    from cross_manager import ensure_cross as _ensure_cross
+
+    return _ensure_cross(required_cross_version)
+
+
 def _decide_cross_usage(
     toolchain_name: str,
     target: str,
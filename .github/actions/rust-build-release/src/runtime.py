@@ -155,6 +155,7 @@ def _run_probe(
             args,
             allowed_names=allowed_names,
             method="run",
+            cached=True,
             cwd=cwd,
             timeout=PROBE_TIMEOUT,
         )
@@ -284,6 +285,7 @@ def detect_host_target(
             allowed_names=("rustc", "rustc.exe"),
             timeout=PROBE_TIMEOUT,
             method="run",
+            cached=True,
         )
     except (ProcessExecutionError, ProcessTimedOut, OSError):
         return default
@@ -32,10 +32,14 @@ if typ.TYPE_CHECKING:  # pragma: no cover - typing only
         ) -> object: ...
 
     run_cmd = typ.cast("_RunCmd", cmd_utils.run_cmd)
+    run_cached = cmd_utils.run_cached
     coerce_run_result = cmd_utils.coerce_run_result
+    DEFAULT_CACHE_TTL = cmd_utils.DEFAULT_CACHE_TTL
 else:
     coerce_run_result = _cmd_utils.coerce_run_result
+    run_cached = _cmd_utils.run_cached
     run_cmd = _cmd_utils.run_cmd
+    DEFAULT_CACHE_TTL = _cmd_utils.DEFAULT_CACHE_TTL
 
 
 class UnexpectedExecutableError(ValueError):
@@ -67,6 +71,9 @@ def run_validated(
     allowed_names: tuple[str, ...],
     method: typ.Literal["run"] = "run",
     env: cabc.Mapping[str, str] | None = None,
+    cached: bool = False,
+    ttl: float = DEFAULT_CACHE_TTL,
+    tags: cabc.Iterable[str] = (),
     **run_kwargs: object,
 ) -> cmd_utils.RunResult: ...
 
@@ -79,6 +86,9 @@ def run_validated(
     allowed_names: tuple[str, ...],
     method: typ.Literal["call", "run_fg"],
     env: cabc.Mapping[str, str] | None = None,
+    cached: typ.Literal[False] = False,
+    ttl: float = DEFAULT_CACHE_TTL,
+    tags: cabc.Iterable[str] = (),
     **run_kwargs: object,
 ) -> object: ...
 
@@ -90,11 +100,24 @@ def run_validated(
     allowed_names: tuple[str, ...],
     method: RunMethod = "run",
     env: cabc.Mapping[str, str] | None = None,
+    cached: bool = False,
+    ttl: float = DEFAULT_CACHE_TTL,
+    tags: cabc.Iterable[str] = (),
     **run_kwargs: object,
 ) -> object:
-    """Execute *executable* with *args* after validating its basename."""
+    """Execute *executable* with *args* after validating its basename.
+
+    When *cached* is true the command must be a read-only probe; its
+    ``run`` result is served through :func:`cmd_utils.run_cached` with
+    *ttl* and *tags*, which are ignored otherwise.
+    """
     exec_path = ensure_allowed_executable(executable, allowed_names)
     command = local[exec_path][list(args)] if args else local[exec_path]
+    if cached:
+        if method != "run":
+            msg = "cached execution requires method='run'"
+            raise ValueError(msg)
+        return run_cached(command, env=env, ttl=ttl, tags=tags, **run_kwargs)
     result = run_cmd(command, method=method, env=env, **run_kwargs)
     if method == "run":
         return coerce_run_result(typ.cast("cabc.Sequence[object]", result))
@@ -104,3 +104,58 @@ def test_run_validated_raises_for_unexpected_executable(
             allowed_names=("docker", "docker.exe"),
             method="run",
         )
+
+
+def test_run_validated_cached_delegates_to_run_cached(
+    utils_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Cached probes should be routed through cmd_utils.run_cached."""
+    exe_path = tmp_path / "rustup"
+    exe_path.write_text("", encoding="utf-8")
+    captured: list[tuple[list[str], dict[str, object]]] = []
+
+    def fake_run_cached(cmd: SupportsFormulate, **kwargs: object) -> object:
+        captured.append((list(cmd.formulate()), dict(kwargs)))
+        return RunResult(0, "stable", "")
+
+    monkeypatch.setattr(utils_module, "run_cached", fake_run_cached)
+
+    result = utils_module.run_validated(
+        exe_path,
+        ["toolchain", "list"],
+        allowed_names=("rustup", "rustup.exe"),
+        cached=True,
+        timeout=2,
+    )
+
+    assert result == RunResult(0, "stable", "")
+    assert captured == [
+        (
+            [str(exe_path), "toolchain", "list"],
+            {
+                "env": None,
+                "ttl": utils_module.DEFAULT_CACHE_TTL,
+                "tags": (),
+                "timeout": 2,
+            },
+        )
+    ]
+
+
+def test_run_validated_cached_requires_run_method(
+    utils_module: ModuleType, tmp_path: Path
+) -> None:
+    """Only captured ``run`` results can be cached."""
+    exe_path = tmp_path / "rustup"
+    exe_path.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="method='run'"):
+        utils_module.run_validated(
+            exe_path,
+            ["toolchain", "list"],
+            allowed_names=("rustup", "rustup.exe"),
+            method="call",
+            cached=True,
+        )
@@ -516,12 +516,27 @@ def _read_manifest_metadata(config: StagingConfig) -> dict[str, typ.Any]:
 
 def _resolve_binstall_metadata(config: StagingConfig) -> _BinstallMetadata:
     """Resolve package, version, and binary names for cargo-binstall archives."""
-    from cargo_utils import ManifestError, get_package_field, resolve_version
+    from cargo_utils import (
+        ManifestError,
+        get_package_field,
+        metadata_package,
+        resolve_version,
+    )
 
     manifest: dict[str, typ.Any] | None = None
     manifest_path = _resolve_manifest_path(config)
     binstall = config.binstall
 
+    if (
+        not (binstall.package_name and binstall.version)
+        and (resolved := metadata_package(manifest_path)) is not None
+    ):
+        return _BinstallMetadata(
+            package_name=binstall.package_name or resolved.name,
+            version=binstall.version or resolved.version,
+            bin_name=binstall.bin_name or config.bin_name,
+        )
+
     def _manifest() -> dict[str, typ.Any]:
         nonlocal manifest
         if manifest is None:
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import re
 import typing as typ
+from functools import cache
 from pathlib import Path
 from uuid import UUID, uuid5
 
-from jinja2 import Environment, StrictUndefined, select_autoescape
+if typ.TYPE_CHECKING:
+    from jinja2 import Environment
 
 __all__ = [
     "FileSpecification",
@@ -19,15 +21,20 @@ __all__ = [
 ]
 
 
-_env = Environment(
-    autoescape=select_autoescape(default_for_string=True),
-    undefined=StrictUndefined,
-)
+@cache
+def _environment() -> Environment:
+    """Return the shared Jinja environment, importing :mod:`jinja2` lazily."""
+    from jinja2 import Environment, StrictUndefined, select_autoescape
+
+    return Environment(
+        autoescape=select_autoescape(default_for_string=True),
+        undefined=StrictUndefined,
+    )
 
 
 def render(jinja_template_string: str, /, **context: object) -> str:
     """Render ``jinja_template_string`` with the shared environment."""
-    return _env.from_string(jinja_template_string).render(**context)
+    return _environment().from_string(jinja_template_string).render(**context)
 
 
 _DEFAULT_TEMPLATE = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
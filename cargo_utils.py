@@ -30,15 +30,44 @@ Resolving workspace-inherited versions::
     ...     version = get_workspace_version(root)
     ...     print(f"Workspace version: {version}")
     Workspace version: 2.0.0
+
+Resolving any inherited field through a shared :class:`ManifestIndex`::
+
+    >>> index = ManifestIndex()
+    >>> index.resolve_field(Path("crates/member/Cargo.toml"), "license")
+    'ISC'
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import threading
 import tomllib
 import typing as typ
+from pathlib import Path
 
 if typ.TYPE_CHECKING:
-    from pathlib import Path
+    import collections.abc as cabc
+
+SNAPSHOT_ENV_VAR = "CARGO_UTILS_MANIFEST_SNAPSHOT"
+"""Environment variable naming the on-disk snapshot for the shared index."""
+
+RESOLVER_ENV_VAR = "CARGO_UTILS_RESOLVER"
+"""Set to ``metadata`` to answer package queries from ``cargo metadata``."""
+
+METADATA_CACHE_ENV_VAR = "CARGO_UTILS_METADATA_CACHE_DIR"
+"""Directory for cached ``cargo metadata`` output shared between steps."""
+
+_SNAPSHOT_VERSION = 1
+_CARGO_METADATA_TIMEOUT = 120
 
 
 class ManifestError(Exception):
@@ -216,7 +245,8 @@ def find_workspace_root(start_dir: Path) -> Path | None:
     """Locate the nearest ancestor Cargo.toml that declares a workspace.
 
     Searches upward from ``start_dir`` for a ``Cargo.toml`` containing
-    a ``[workspace]`` table.
+    a ``[workspace]`` table. Manifests are parsed through the shared
+    :class:`ManifestIndex`, so repeated searches do not re-read them.
 
     Parameters
     ----------
@@ -234,20 +264,7 @@ def find_workspace_root(start_dir: Path) -> Path | None:
     >>> root
     PosixPath('/project/Cargo.toml')
     """
-    directory = start_dir.resolve()
-    while True:
-        candidate = directory / "Cargo.toml"
-        if candidate.exists():
-            try:
-                with candidate.open("rb") as handle:
-                    data = tomllib.load(handle)
-            except (OSError, tomllib.TOMLDecodeError):
-                data = None
-            if isinstance(data, dict) and isinstance(data.get("workspace"), dict):
-                return candidate
-        if directory.parent == directory:
-            return None
-        directory = directory.parent
+    return default_index().workspace_root(start_dir)
 
 
 def get_workspace_version(root_manifest: Path) -> str | None:
@@ -270,16 +287,8 @@ def get_workspace_version(root_manifest: Path) -> str | None:
     '2.0.0'
     """
     try:
-        with root_manifest.open("rb") as handle:
-            data = tomllib.load(handle)
-    except (OSError, tomllib.TOMLDecodeError):
-        return None
-
-    workspace = data.get("workspace")
-    if not isinstance(workspace, dict):
-        return None
-    package = workspace.get("package")
-    if not isinstance(package, dict):
+        package = default_index().workspace_package(root_manifest)
+    except ManifestError:
         return None
     version = package.get("version")
     return version.strip() if isinstance(version, str) else None
@@ -300,21 +309,27 @@ def _is_workspace_inherited(version: object) -> bool:
     return isinstance(version, dict) and version.get("workspace") is True
 
 
-def _resolve_inherited_version(manifest_path: Path) -> str:
+def _resolve_inherited_version(
+    manifest_path: Path, index: ManifestIndex | None = None
+) -> str:
     """Resolve the version from the workspace root manifest."""
-    workspace_root = find_workspace_root(manifest_path.parent)
+    index = default_index() if index is None else index
+    workspace_root = index.workspace_root(manifest_path.parent)
     if workspace_root is None:
         raise ManifestError(
             manifest_path,
             "Could not locate workspace root for inherited version",
         )
-    workspace_version = get_workspace_version(workspace_root)
-    if workspace_version is None:
+    try:
+        version = index.workspace_package(workspace_root).get("version")
+    except ManifestError:
+        version = None
+    if not isinstance(version, str):
         raise ManifestError(
             workspace_root,
             "Workspace manifest missing [workspace.package].version",
         )
-    return workspace_version
+    return version.strip()
 
 
 def _require_version_string(version: object, manifest_path: Path) -> str:
@@ -373,12 +388,600 @@ def resolve_version(
     return _require_version_string(version, manifest_path)
 
 
+def _atomic_write_json(target: Path, payload: object) -> None:
+    """Write *payload* as JSON to *target* via a same-directory rename."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        Path(tmp_name).replace(target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class _Entry(typ.NamedTuple):
+    """A parsed manifest together with the stat signature it was read at."""
+
+    mtime_ns: int
+    size: int
+    data: dict[str, typ.Any]
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for a regular file, or ``None``."""
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(info.st_mode):
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+class ManifestIndex:
+    """Memoized, workspace-aware view over Cargo manifests.
+
+    Each ``Cargo.toml`` is parsed at most once per ``(path, mtime, size)``
+    signature; an edited manifest is re-read on next access. On top of the
+    parse cache the index answers workspace queries (root, members,
+    ``[workspace.package]``) and resolves ``field.workspace = true``
+    inheritance for any ``[package]`` field. Member-to-root lookups are
+    remembered, so resolving further fields for a manifest costs dictionary
+    lookups plus a ``stat`` per manifest involved.
+
+    Parameters
+    ----------
+    snapshot : Path, optional
+        JSON file holding parsed manifests from an earlier process. Entries
+        are reused only while the manifest's mtime and size still match,
+        and :meth:`save` writes the current cache back.
+
+    Notes
+    -----
+    Returned manifest dictionaries are shared with the cache and must be
+    treated as read-only; use :func:`read_manifest` for a private copy.
+    The index is safe to share between threads.
+
+    Examples
+    --------
+    >>> index = ManifestIndex()
+    >>> root = index.workspace_root(Path("crates/member"))
+    >>> [path.parent.name for path in index.members(root)]
+    ['cli', 'core']
+    >>> index.resolve_field(Path("crates/cli/Cargo.toml"), "edition")
+    '2021'
+    """
+
+    def __init__(self, *, snapshot: Path | None = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, _Entry] = {}
+        self._roots: dict[Path, Path | None] = {}
+        self.snapshot = snapshot
+        if snapshot is not None:
+            self._load_snapshot(snapshot)
+
+    @staticmethod
+    def _key(path: Path) -> Path:
+        return Path(os.path.abspath(path))  # noqa: PTH100 - avoid resolve() syscalls
+
+    def manifest(self, path: Path) -> dict[str, typ.Any]:
+        """Return the parsed manifest at *path*, parsing it on first use.
+
+        Parameters
+        ----------
+        path : Path
+            Path to a ``Cargo.toml`` file.
+
+        Returns
+        -------
+        dict[str, Any]
+            The parsed TOML document (shared; do not mutate).
+
+        Raises
+        ------
+        ManifestError
+            If the file does not exist or contains invalid TOML.
+        """
+        key = self._key(path)
+        signature = _stat_key(key)
+        if signature is None:
+            msg = f"Manifest not found: {path}"
+            raise ManifestError(path, msg)
+        cached = self._entries.get(key)
+        if cached is not None and (cached.mtime_ns, cached.size) == signature:
+            return cached.data
+        data = read_manifest(path)
+        with self._lock:
+            self._entries[key] = _Entry(*signature, data)
+        return data
+
+    def _declares_workspace(self, candidate: Path) -> bool:
+        try:
+            data = self.manifest(candidate)
+        except ManifestError:
+            return False
+        return isinstance(data.get("workspace"), dict)
+
+    def workspace_root(self, start_dir: Path) -> Path | None:
+        """Return the nearest ancestor manifest declaring ``[workspace]``.
+
+        Parameters
+        ----------
+        start_dir : Path
+            Directory from which to begin the upward search.
+
+        Returns
+        -------
+        Path or None
+            The workspace root manifest, or ``None`` if none is found.
+        """
+        directory = start_dir.resolve()
+        remembered = self._roots.get(directory)
+        if remembered is not None and self._declares_workspace(remembered):
+            return remembered
+        walked: list[Path] = []
+        root: Path | None = None
+        while True:
+            walked.append(directory)
+            candidate = directory / "Cargo.toml"
+            if candidate.exists() and self._declares_workspace(candidate):
+                root = candidate
+                break
+            if directory.parent == directory:
+                break
+            directory = directory.parent
+        if root is not None:
+            with self._lock:
+                self._roots.update(dict.fromkeys(walked, root))
+        return root
+
+    def _workspace_table(self, root_manifest: Path) -> dict[str, typ.Any]:
+        workspace = self.manifest(root_manifest).get("workspace")
+        if not isinstance(workspace, dict):
+            raise ManifestError(root_manifest, "Manifest missing [workspace] table")
+        return workspace
+
+    def workspace_package(self, root_manifest: Path) -> dict[str, typ.Any]:
+        """Return the ``[workspace.package]`` table of *root_manifest*.
+
+        Returns an empty mapping when the workspace defines no shared
+        package metadata.
+
+        Raises
+        ------
+        ManifestError
+            If the manifest cannot be read or has no ``[workspace]`` table.
+        """
+        package = self._workspace_table(root_manifest).get("package")
+        return package if isinstance(package, dict) else {}
+
+    def members(self, root_manifest: Path) -> list[Path]:
+        """Return the member manifests of the workspace at *root_manifest*.
+
+        ``[workspace].members`` globs are expanded relative to the root,
+        ``[workspace].exclude`` entries are removed, and the root manifest
+        itself is included when it also declares a ``[package]``.
+
+        Raises
+        ------
+        ManifestError
+            If the manifest cannot be read or has no ``[workspace]`` table.
+        """
+        workspace = self._workspace_table(root_manifest)
+        base = self._key(root_manifest).parent
+        excluded = {
+            self._key(base / entry)
+            for entry in workspace.get("exclude", [])
+            if isinstance(entry, str)
+        }
+        found: dict[Path, None] = {}
+        if isinstance(self.manifest(root_manifest).get("package"), dict):
+            found[self._key(root_manifest)] = None
+        for pattern in workspace.get("members", []):
+            if not isinstance(pattern, str):
+                continue
+            for directory in sorted(base.glob(pattern)):
+                manifest = self._key(directory / "Cargo.toml")
+                if manifest.parent in excluded or not manifest.is_file():
+                    continue
+                found[manifest] = None
+        return list(found)
+
+    def resolve_field(self, manifest_path: Path, field: str) -> object:
+        """Return ``[package].<field>`` with workspace inheritance applied.
+
+        Parameters
+        ----------
+        manifest_path : Path
+            Path to the member ``Cargo.toml``.
+        field : str
+            Package field name, e.g. ``"version"``, ``"license"`` or
+            ``"rust-version"``.
+
+        Returns
+        -------
+        object
+            The member's own value or, for ``{ workspace = true }``, the
+            value from ``[workspace.package]``. ``None`` when the member does
+            not set the field. Path-valued fields such as ``readme`` are
+            returned verbatim, relative to the workspace root.
+
+        Raises
+        ------
+        ManifestError
+            If the manifest lacks ``[package]``, or the field is inherited but
+            no workspace root or ``[workspace.package]`` entry provides it.
+        """
+        package = _require_package_table(self.manifest(manifest_path), manifest_path)
+        value = package.get(field)
+        if not _is_workspace_inherited(value):
+            return value
+        root = self.workspace_root(manifest_path.parent)
+        if root is None:
+            raise ManifestError(
+                manifest_path,
+                f"Could not locate workspace root for inherited {field}",
+            )
+        shared = self.workspace_package(root)
+        if field not in shared:
+            raise ManifestError(
+                root, f"Workspace manifest missing [workspace.package].{field}"
+            )
+        return shared[field]
+
+    def resolve_version(self, manifest_path: Path) -> str:
+        """Return the package version of *manifest_path*, resolving inheritance.
+
+        Raises
+        ------
+        ManifestError
+            If the version is missing, empty or cannot be inherited.
+        """
+        package = _require_package_table(self.manifest(manifest_path), manifest_path)
+        version = package.get("version")
+        if _is_workspace_inherited(version):
+            return _resolve_inherited_version(manifest_path, self)
+        return _require_version_string(version, manifest_path)
+
+    def _load_snapshot(self, snapshot: Path) -> None:
+        try:
+            payload = json.loads(snapshot.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _SNAPSHOT_VERSION:
+            return
+        entries = payload.get("manifests")
+        if not isinstance(entries, dict):
+            return
+        for raw_path, raw in entries.items():
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                self._entries[Path(raw_path)] = _Entry(
+                    int(raw["mtime_ns"]), int(raw["size"]), dict(raw["data"])
+                )
+
+    def _snapshot_payload(self) -> dict[str, typ.Any]:
+        manifests: dict[str, typ.Any] = {}
+        for path, entry in list(self._entries.items()):
+            record = {
+                "mtime_ns": entry.mtime_ns,
+                "size": entry.size,
+                "data": entry.data,
+            }
+            try:
+                json.dumps(record)
+            except (TypeError, ValueError):
+                continue  # TOML datetimes have no JSON form; re-parse next time
+            manifests[str(path)] = record
+        return {"version": _SNAPSHOT_VERSION, "manifests": manifests}
+
+    def save(self, snapshot: Path | None = None) -> Path | None:
+        """Write the parsed manifests to *snapshot* for a later process.
+
+        Parameters
+        ----------
+        snapshot : Path, optional
+            Destination file; defaults to the path given at construction.
+
+        Returns
+        -------
+        Path or None
+            The file written, or ``None`` when no destination is configured.
+        """
+        target = self.snapshot if snapshot is None else snapshot
+        if target is None:
+            return None
+        _atomic_write_json(target, self._snapshot_payload())
+        return target
+
+
+_DEFAULT_INDEX: ManifestIndex | None = None
+
+
+def default_index() -> ManifestIndex:
+    """Return the process-wide :class:`ManifestIndex`.
+
+    When ``CARGO_UTILS_MANIFEST_SNAPSHOT`` names a file, the index starts
+    from that snapshot and writes it back at interpreter exit, so later steps
+    in the same job start warm.
+    """
+    global _DEFAULT_INDEX
+    if _DEFAULT_INDEX is None:
+        raw = os.environ.get(SNAPSHOT_ENV_VAR, "").strip()
+        snapshot = Path(raw) if raw else None
+        _DEFAULT_INDEX = ManifestIndex(snapshot=snapshot)
+        if snapshot is not None:
+            atexit.register(_save_default_index)
+    return _DEFAULT_INDEX
+
+
+def _save_default_index() -> None:
+    if _DEFAULT_INDEX is not None:
+        with contextlib.suppress(OSError):
+            _DEFAULT_INDEX.save()
+
+
+def iter_member_versions(
+    root_manifest: Path, index: ManifestIndex | None = None
+) -> cabc.Iterator[tuple[Path, str]]:
+    """Yield ``(manifest, version)`` for every workspace member.
+
+    Parameters
+    ----------
+    root_manifest : Path
+        Path to the workspace root ``Cargo.toml``.
+    index : ManifestIndex, optional
+        Index to use; defaults to :func:`default_index`.
+
+    Raises
+    ------
+    ManifestError
+        If a member's version cannot be resolved.
+    """
+    index = default_index() if index is None else index
+    for member in index.members(root_manifest):
+        yield member, index.resolve_version(member)
+
+
+class TargetMetadata(typ.NamedTuple):
+    """A build target reported by ``cargo metadata``."""
+
+    name: str
+    kinds: tuple[str, ...]
+    src_path: Path
+
+
+class PackageMetadata(typ.NamedTuple):
+    """Resolved metadata for one workspace member."""
+
+    name: str
+    version: str
+    manifest_path: Path
+    description: str | None
+    targets: tuple[TargetMetadata, ...]
+
+    @property
+    def bin_names(self) -> tuple[str, ...]:
+        """Return the names of the package's binary targets in cargo order."""
+        return tuple(t.name for t in self.targets if "bin" in t.kinds)
+
+    def has_target(self, name: str, kind: str) -> bool:
+        """Return ``True`` when the package has a *kind* target called *name*."""
+        return any(t.name == name and kind in t.kinds for t in self.targets)
+
+
+class WorkspaceMetadata(typ.NamedTuple):
+    """In-memory model of a workspace built from one ``cargo metadata`` run."""
+
+    root: Path
+    packages: dict[Path, PackageMetadata]
+
+    def package(self, manifest_path: Path) -> PackageMetadata | None:
+        """Return the member whose manifest is *manifest_path*, if any."""
+        return self.packages.get(Path(os.path.abspath(manifest_path)))  # noqa: PTH100
+
+    def by_name(self, name: str) -> PackageMetadata | None:
+        """Return the member called *name*, if any."""
+        return next((p for p in self.packages.values() if p.name == name), None)
+
+    @classmethod
+    def from_cargo_json(cls, payload: dict[str, typ.Any]) -> WorkspaceMetadata:
+        """Build the model from ``cargo metadata --format-version 1`` output.
+
+        Raises
+        ------
+        KeyError, TypeError, ValueError
+            If *payload* does not have the documented shape.
+        """
+        members = set(payload.get("workspace_members") or ())
+        packages: dict[Path, PackageMetadata] = {}
+        for raw in payload["packages"]:
+            if members and raw["id"] not in members:
+                continue
+            manifest = Path(os.path.abspath(raw["manifest_path"]))  # noqa: PTH100
+            description = raw.get("description")
+            packages[manifest] = PackageMetadata(
+                name=str(raw["name"]),
+                version=str(raw["version"]),
+                manifest_path=manifest,
+                description=description.strip()
+                if isinstance(description, str)
+                else None,
+                targets=tuple(
+                    TargetMetadata(
+                        name=str(target["name"]),
+                        kinds=tuple(str(kind) for kind in target["kind"]),
+                        src_path=Path(target["src_path"]),
+                    )
+                    for target in raw.get("targets", ())
+                ),
+            )
+        return cls(root=Path(payload["workspace_root"]), packages=packages)
+
+
+_METADATA_MEMO: dict[tuple[Path, str], WorkspaceMetadata] = {}
+
+
+def resolver_mode() -> str:
+    """Return the configured resolver: ``"metadata"`` or ``"toml"``."""
+    mode = os.environ.get(RESOLVER_ENV_VAR, "").strip().lower()
+    return "metadata" if mode == "metadata" else "toml"
+
+
+def _metadata_cache_key(root_manifest: Path, index: ManifestIndex) -> str:
+    """Hash ``Cargo.lock`` and the member manifests' stat signatures."""
+    digest = hashlib.sha256()
+    lock = root_manifest.parent / "Cargo.lock"
+    try:
+        digest.update(lock.read_bytes())
+    except OSError:
+        digest.update(b"<no Cargo.lock>")
+    manifests = [root_manifest]
+    if isinstance(index.manifest(root_manifest).get("workspace"), dict):
+        manifests.extend(index.members(root_manifest))
+    for manifest in sorted({Path(os.path.abspath(m)) for m in manifests}):  # noqa: PTH100
+        digest.update(f"\0{manifest}\0{_stat_key(manifest)}".encode())
+    return digest.hexdigest()
+
+
+def _run_cargo_metadata(root_manifest: Path) -> dict[str, typ.Any] | None:
+    """Run ``cargo metadata`` for *root_manifest*; ``None`` on any failure."""
+    cargo = shutil.which("cargo")
+    if cargo is None:
+        return None
+    argv = [
+        cargo,
+        "metadata",
+        "--format-version",
+        "1",
+        "--no-deps",
+        "--offline",
+        "--manifest-path",
+        str(root_manifest),
+    ]
+    try:
+        proc = subprocess.Popen(  # noqa: S603 - fixed argv, resolved cargo
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    try:
+        stdout, _ = proc.communicate(timeout=_CARGO_METADATA_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None
+    if proc.returncode != 0:
+        return None
+    try:
+        payload = json.loads(stdout)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def load_workspace_metadata(
+    manifest_path: Path,
+    *,
+    index: ManifestIndex | None = None,
+    cache_dir: Path | None = None,
+) -> WorkspaceMetadata | None:
+    """Return the ``cargo metadata`` model for the workspace of *manifest_path*.
+
+    ``cargo metadata --format-version 1 --no-deps`` runs once per workspace
+    state. Results are memoized in-process and, when *cache_dir* (or
+    ``CARGO_UTILS_METADATA_CACHE_DIR``) is set, on disk, keyed by the
+    ``Cargo.lock`` digest plus the mtime and size of every member manifest,
+    so later steps in the same job reuse them.
+
+    Parameters
+    ----------
+    manifest_path : Path
+        Any manifest in the workspace; the workspace root is located first.
+    index : ManifestIndex, optional
+        Index used to find the root and members; defaults to
+        :func:`default_index`.
+    cache_dir : Path, optional
+        Directory for the on-disk cache.
+
+    Returns
+    -------
+    WorkspaceMetadata or None
+        ``None`` when cargo is not on ``PATH``, fails, or the manifests cannot
+        be read; callers then fall back to the TOML resolver.
+    """
+    index = default_index() if index is None else index
+    try:
+        root = index.workspace_root(manifest_path.parent) or manifest_path
+        key = _metadata_cache_key(root, index)
+    except ManifestError:
+        return None
+    memo_key = (Path(os.path.abspath(root)), key)  # noqa: PTH100
+    if (cached := _METADATA_MEMO.get(memo_key)) is not None:
+        return cached
+
+    if cache_dir is None:
+        raw_dir = os.environ.get(METADATA_CACHE_ENV_VAR, "").strip()
+        cache_dir = Path(raw_dir) if raw_dir else None
+    cache_file = None if cache_dir is None else cache_dir / f"cargo-metadata-{key}.json"
+
+    payload: dict[str, typ.Any] | None = None
+    if cache_file is not None:
+        with contextlib.suppress(OSError, ValueError):
+            payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    from_disk = payload is not None
+    if payload is None:
+        payload = _run_cargo_metadata(root)
+    if payload is None:
+        return None
+    try:
+        model = WorkspaceMetadata.from_cargo_json(payload)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if cache_file is not None and not from_disk:
+        with contextlib.suppress(OSError):
+            _atomic_write_json(cache_file, payload)
+    _METADATA_MEMO[memo_key] = model
+    return model
+
+
+def metadata_package(manifest_path: Path) -> PackageMetadata | None:
+    """Return cargo-resolved metadata for *manifest_path* in metadata mode.
+
+    Returns ``None`` unless ``CARGO_UTILS_RESOLVER=metadata`` is set and
+    ``cargo metadata`` describes the manifest, in which case callers continue
+    with the TOML helpers in this module.
+    """
+    if resolver_mode() != "metadata":
+        return None
+    model = load_workspace_metadata(manifest_path)
+    return None if model is None else model.package(manifest_path)
+
+
 __all__ = [
+    "METADATA_CACHE_ENV_VAR",
+    "RESOLVER_ENV_VAR",
+    "SNAPSHOT_ENV_VAR",
     "ManifestError",
+    "ManifestIndex",
+    "PackageMetadata",
+    "TargetMetadata",
+    "WorkspaceMetadata",
+    "default_index",
     "find_workspace_root",
     "get_bin_name",
     "get_package_field",
     "get_workspace_version",
+    "iter_member_versions",
+    "load_workspace_metadata",
+    "metadata_package",
     "read_manifest",
     "resolve_version",
+    "resolver_mode",
 ]
@@ -2,8 +2,9 @@ r"""Utilities for running plumbum command invocations.
 
 This module provides :func:`run_cmd`, a unified interface for executing
 plumbum commands with optional environment overrides and multiple execution
-strategies (``call`` by default, plus ``run`` and ``run_fg``). Each invocation
-is echoed before execution to aid debugging in CI logs or local terminals.
+strategies (``call`` by default, plus ``run``, ``run_fg`` and ``stream``). Each
+invocation is echoed before execution to aid debugging in CI logs or local
+terminals.
 
 Examples
 --------
@@ -39,6 +40,19 @@ Inspecting exit status and stderr with the ``run`` method::
     >>> failure.stderr
     'oops'
 
+Streaming output live while keeping only a bounded tail and matching lines::
+
+    >>> summary = run_cmd(
+    ...     local["cargo"]["llvm-cov", "--summary-only"],
+    ...     method="stream",
+    ...     tail_lines=50,
+    ...     patterns=[r"^TOTAL"],
+    ... )
+    $ cargo llvm-cov --summary-only
+    # Output streams to stdout/stderr as the command runs
+    >>> summary.matches
+    ('TOTAL  ...  87.50%',)
+
 Enforcing a timeout for long-running processes::
 
     >>> run_cmd(
@@ -48,21 +62,69 @@ Enforcing a timeout for long-running processes::
     ... )
     Traceback (most recent call last):
     ProcessTimedOut: ...
+
+Running independent commands concurrently with :func:`run_many`, which
+buffers each command's output and returns results in input order::
+
+    >>> results = run_many(
+    ...     [local["rustup"]["--version"], local["docker"]["info"]],
+    ...     method="run",
+    ...     max_concurrency=2,
+    ... )
+    $ rustup --version
+    $ docker info
+    >>> [result.returncode for result in results]
+    [0, 0]
+
+Reusing results of read-only probes within a job by pointing
+``CMD_UTILS_CACHE_DIR`` at a job-scoped directory; state-mutating commands
+such as ``rustup target add`` invalidate the related entries::
+
+    $ export CMD_UTILS_CACHE_DIR="$RUNNER_TEMP/cmd-utils-cache"
+    >>> run_cached(local["rustup"]["toolchain", "list"]).stdout
+    $ rustup toolchain list
+    'stable-x86_64-unknown-linux-gnu (default)\n'
+    >>> run_cached(local["rustup"]["toolchain", "list"]).stdout
+    $ rustup toolchain list (cached)
+    'stable-x86_64-unknown-linux-gnu (default)\n'
+
+Tracing every invocation by pointing ``CMD_UTILS_TRACE`` at a JSONL file,
+then rendering the slowest commands into the job summary::
+
+    $ export CMD_UTILS_TRACE="$RUNNER_TEMP/cmd-trace.jsonl"
+    >>> run_cmd(local["cargo"]["--version"])
+    $ cargo --version
+    'cargo 1.89.0\n'
+    >>> write_trace_summary()  # appends to GITHUB_STEP_SUMMARY
+    True
 """
 
 from __future__ import annotations
 
 import ast
+import asyncio
+import collections
 import collections.abc as cabc
+import contextlib
+import hashlib
+import json
 import os
+import re
+import shlex
+import shutil
 import subprocess
+import sys
+import threading
+import time
 import typing as typ
+from pathlib import Path
 
 import typer
 from plumbum import local
 from plumbum.commands.processes import ProcessExecutionError, ProcessTimedOut
 
-RunMethod = typ.Literal["call", "run", "run_fg"]
+RunMethod = typ.Literal["call", "run", "run_fg", "stream"]
+AsyncRunMethod = typ.Literal["call", "run"]
 
 
 class RunResult(typ.NamedTuple):
@@ -73,6 +135,19 @@ class RunResult(typ.NamedTuple):
     stderr: str
 
 
+class StreamResult(typ.NamedTuple):
+    """Bounded summary of a command executed with ``method="stream"``.
+
+    Only the last ``tail_lines`` lines of each stream are retained, plus every
+    stdout line matching one of the caller-supplied ``patterns``.
+    """
+
+    returncode: int
+    stdout_tail: tuple[str, ...]
+    stderr_tail: tuple[str, ...]
+    matches: tuple[str, ...]
+
+
 @typ.runtime_checkable
 class SupportsFormulate(typ.Protocol):
     """Objects that expose a shell representation via ``formulate``."""
@@ -109,6 +184,16 @@ class SupportsRunFg(SupportsFormulate, typ.Protocol):
         ...
 
 
+@typ.runtime_checkable
+class SupportsPopen(SupportsFormulate, typ.Protocol):
+    """Commands that can spawn a :class:`subprocess.Popen` via :meth:`popen`."""
+
+    def popen(
+        self, *args: object, **kwargs: object
+    ) -> subprocess.Popen[bytes]:  # pragma: no cover - protocol
+        ...
+
+
 @typ.runtime_checkable
 class SupportsAnd(SupportsFormulate, typ.Protocol):
     """Commands that can be combined with ``FG`` using ``&``."""
@@ -226,6 +311,249 @@ def _apply_environment(
     return typ.cast("SupportsFormulate", cmd.with_env(**runtime_env))
 
 
+TRACE_ENV_VAR: typ.Final[str] = "CMD_UTILS_TRACE"
+_TRACE_SUMMARY_LIMIT: typ.Final[int] = 15
+_TRACE_COMMAND_WIDTH: typ.Final[int] = 120
+
+
+def _trace_target() -> Path | None:
+    """Return the JSONL trace path named by ``CMD_UTILS_TRACE``, if any."""
+    raw = os.environ.get(TRACE_ENV_VAR, "").strip()
+    return Path(raw).expanduser() if raw else None
+
+
+def _peak_child_rss_bytes() -> int | None:
+    """Return the peak RSS of reaped child processes, or ``None`` on Windows.
+
+    ``ru_maxrss`` is reported in kibibytes on Linux and bytes on macOS; the
+    value is a high-water mark across every child reaped so far.
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows has no resource module
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def _byte_count(value: object) -> int | None:
+    """Return the encoded size of captured output, or ``None`` if uncaptured."""
+    if value is None:
+        return None
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    return len(str(value).encode("utf-8", errors="replace"))
+
+
+class _TraceSpan:
+    """A single traced command invocation awaiting completion.
+
+    A plain class rather than a dataclass: the loaders execute this module
+    without registering it in :data:`sys.modules`, which dataclasses require.
+    """
+
+    __slots__ = ("argv", "clock", "method", "path", "started")
+
+    def __init__(
+        self,
+        path: Path,
+        argv: list[str],
+        method: str,
+        started: float,
+        clock: float,
+    ) -> None:
+        self.path = path
+        self.argv = argv
+        self.method = method
+        self.started = started
+        self.clock = clock
+
+    @classmethod
+    def begin(cls, cmd: SupportsFormulate, method: str) -> _TraceSpan | None:
+        """Start a span for *cmd* when tracing is enabled."""
+        path = _trace_target()
+        if path is None:
+            return None
+        argv = [str(part) for part in cmd.formulate()]
+        return cls(path, argv, method, time.time(), time.perf_counter())
+
+    def finish(
+        self,
+        returncode: int | None,
+        stdout: object = None,
+        stderr: object = None,
+    ) -> None:
+        """Append the completed invocation to the trace file."""
+        record = {
+            "argv": self.argv,
+            "method": self.method,
+            "start": self.started,
+            "end": time.time(),
+            "duration": time.perf_counter() - self.clock,
+            "returncode": returncode,
+            "peak_child_rss_bytes": _peak_child_rss_bytes(),
+            "stdout_bytes": _byte_count(stdout),
+            "stderr_bytes": _byte_count(stderr),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record, sort_keys=True) + "\n")
+        except OSError as exc:
+            typer.echo(
+                f"::warning::Could not write command trace {self.path}: {exc}",
+                err=True,
+            )
+
+    def finish_with_error(self, exc: BaseException) -> None:
+        """Record a failed invocation using whatever *exc* captured."""
+        if isinstance(exc, ProcessExecutionError):
+            self.finish(
+                exc.retcode if isinstance(exc.retcode, int) else None,
+                getattr(exc, "stdout", None),
+                getattr(exc, "stderr", None),
+            )
+        else:
+            self.finish(None)
+
+
+def _outcome_fields(
+    outcome: object, run_kwargs: cabc.Mapping[str, object]
+) -> tuple[int | None, object, object]:
+    """Return ``(returncode, stdout, stderr)`` for a handler's return value."""
+    if isinstance(outcome, RunResult):
+        return outcome.returncode, outcome.stdout, outcome.stderr
+    if isinstance(outcome, StreamResult):
+        return outcome.returncode, None, None
+    returncode = None if "retcode" in run_kwargs else 0
+    if isinstance(outcome, str | bytes):
+        return returncode, outcome, None
+    return returncode, None, None
+
+
+def load_trace(trace_path: Path) -> list[dict[str, typ.Any]]:
+    """Return the records in *trace_path*, skipping malformed lines."""
+    records: list[dict[str, typ.Any]] = []
+    try:
+        lines = trace_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return records
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+def _format_optional(value: object, scale: float = 1.0, digits: int = 0) -> str:
+    """Format a numeric trace field, rendering missing values as a dash."""
+    if not isinstance(value, int | float):
+        return "-"
+    return f"{value / scale:.{digits}f}"
+
+
+def _format_trace_command(argv: object) -> str:
+    """Render *argv* as a Markdown-safe inline code span."""
+    parts = [str(part) for part in argv] if isinstance(argv, list) else [str(argv)]
+    text = shlex.join(parts)
+    if len(text) > _TRACE_COMMAND_WIDTH:
+        text = f"{text[: _TRACE_COMMAND_WIDTH - 3]}..."
+    return "`" + text.replace("`", "'").replace("|", "\\|") + "`"
+
+
+def render_trace_summary(
+    records: cabc.Sequence[cabc.Mapping[str, typ.Any]],
+    *,
+    limit: int = _TRACE_SUMMARY_LIMIT,
+) -> str:
+    """Return a Markdown table of the slowest traced commands.
+
+    Parameters
+    ----------
+    records : Sequence[Mapping[str, Any]]
+        Trace records as produced by :func:`load_trace`.
+    limit : int, optional
+        Maximum number of rows to render.
+
+    Returns
+    -------
+    str
+        Markdown with a heading, totals line, and table sorted by duration.
+    """
+    ordered = sorted(
+        records, key=lambda record: float(record.get("duration") or 0), reverse=True
+    )
+    total = sum(float(record.get("duration") or 0) for record in records)
+    lines = [
+        "### Slowest commands",
+        "",
+        f"{len(records)} commands traced, {total:.2f}s in total.",
+        "",
+        "| Duration (s) | Exit | Method | Peak child RSS (MiB) "
+        "| stdout (bytes) | stderr (bytes) | Command |",
+        "| ---: | ---: | --- | ---: | ---: | ---: | --- |",
+    ]
+    lines.extend(
+        "| "
+        + " | ".join(
+            (
+                _format_optional(record.get("duration"), digits=2),
+                _format_optional(record.get("returncode")),
+                str(record.get("method", "")),
+                _format_optional(
+                    record.get("peak_child_rss_bytes"), scale=1024 * 1024, digits=1
+                ),
+                _format_optional(record.get("stdout_bytes")),
+                _format_optional(record.get("stderr_bytes")),
+                _format_trace_command(record.get("argv", [])),
+            )
+        )
+        + " |"
+        for record in ordered[:limit]
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_trace_summary(
+    trace_path: Path | None = None,
+    summary_path: Path | None = None,
+    *,
+    limit: int = _TRACE_SUMMARY_LIMIT,
+) -> bool:
+    """Append the slowest-commands table to ``GITHUB_STEP_SUMMARY``.
+
+    Parameters
+    ----------
+    trace_path : Path | None, optional
+        Trace file to render. Defaults to ``CMD_UTILS_TRACE``.
+    summary_path : Path | None, optional
+        Markdown file to append to. Defaults to ``GITHUB_STEP_SUMMARY``.
+    limit : int, optional
+        Maximum number of rows to render.
+
+    Returns
+    -------
+    bool
+        ``True`` when a table was written; ``False`` when tracing is disabled,
+        no summary file is configured, or the trace holds no records.
+    """
+    trace_path = trace_path or _trace_target()
+    if summary_path is None:
+        raw_summary = os.environ.get("GITHUB_STEP_SUMMARY", "").strip()
+        summary_path = Path(raw_summary) if raw_summary else None
+    if trace_path is None or summary_path is None:
+        return False
+    records = load_trace(trace_path)
+    if not records:
+        return False
+    with summary_path.open("a", encoding="utf-8") as handle:
+        handle.write(render_trace_summary(records, limit=limit))
+    return True
+
+
 def run_cmd(
     cmd: object,
     *,
@@ -245,7 +573,17 @@ def run_cmd(
     if handler is None:
         msg = f"Unknown run method: {method}"
         raise ValueError(msg)
-    return handler(prepared, run_kwargs)
+    _invalidate_for_mutation(cmd)
+    span = _TraceSpan.begin(cmd, method)
+    if span is None:
+        return handler(prepared, run_kwargs)
+    try:
+        outcome = handler(prepared, run_kwargs)
+    except BaseException as exc:
+        span.finish_with_error(exc)
+        raise
+    span.finish(*_outcome_fields(outcome, run_kwargs))
+    return outcome
 
 
 def _call_handler(command: SupportsFormulate, run_kwargs: dict[str, object]) -> object:
@@ -302,20 +640,577 @@ def _run_fg_handler(
     raise TypeError(msg)
 
 
+_DEFAULT_STREAM_TAIL: typ.Final[int] = 200
+
+
+def _compile_patterns(raw: object) -> tuple[re.Pattern[str], ...]:
+    """Normalize the ``patterns`` stream option into compiled expressions."""
+    if raw is None:
+        return ()
+    if isinstance(raw, str | re.Pattern):
+        raw = (raw,)
+    if not isinstance(raw, cabc.Iterable):
+        msg = "patterns must be a string, compiled pattern, or iterable of them"
+        raise TypeError(msg)
+    return tuple(
+        pattern if isinstance(pattern, re.Pattern) else re.compile(str(pattern))
+        for pattern in raw
+    )
+
+
+def _tee_stream(
+    source: typ.IO[bytes],
+    *,
+    to_stderr: bool,
+    tail: collections.deque[str],
+    patterns: tuple[re.Pattern[str], ...],
+    matches: list[str],
+) -> None:
+    """Echo *source* line by line, keeping a bounded tail and pattern hits."""
+    for raw_line in iter(source.readline, b""):
+        line = raw_line.decode("utf-8", errors="replace")
+        typer.echo(line, nl=False, err=to_stderr)
+        stripped = line.rstrip("\r\n")
+        tail.append(stripped)
+        if any(pattern.search(stripped) for pattern in patterns):
+            matches.append(stripped)
+
+
+def _stream_handler(
+    command: SupportsFormulate, run_kwargs: dict[str, object]
+) -> StreamResult:
+    """Run *command*, teeing output live while retaining bounded state.
+
+    Accepts ``tail_lines`` (default 200), ``patterns`` (matched against stdout
+    lines with :func:`re.search`) and ``timeout`` keyword arguments.
+    """
+    if not isinstance(command, SupportsPopen):
+        msg = "Command does not support popen()"
+        raise TypeError(msg)
+    options = dict(run_kwargs)
+    tail_lines = int(typ.cast("int", options.pop("tail_lines", _DEFAULT_STREAM_TAIL)))
+    patterns = _compile_patterns(options.pop("patterns", None))
+    raw_timeout = options.pop("timeout", None)
+    timeout = float(raw_timeout) if isinstance(raw_timeout, int | float) else None
+    if options:
+        invalid = ", ".join(sorted(options))
+        msg = f"Streaming execution does not accept keyword arguments: {invalid}"
+        raise TypeError(msg)
+
+    stdout_tail: collections.deque[str] = collections.deque(maxlen=tail_lines)
+    stderr_tail: collections.deque[str] = collections.deque(maxlen=tail_lines)
+    matches: list[str] = []
+    proc = command.popen(
+        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    pumps = [
+        threading.Thread(
+            target=_tee_stream,
+            args=(stream,),
+            kwargs={
+                "to_stderr": to_stderr,
+                "tail": tail,
+                "patterns": stream_patterns,
+                "matches": matches,
+            },
+            daemon=True,
+        )
+        for stream, to_stderr, tail, stream_patterns in (
+            (proc.stdout, False, stdout_tail, patterns),
+            (proc.stderr, True, stderr_tail, ()),
+        )
+    ]
+    for pump in pumps:
+        pump.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        proc.kill()
+        proc.wait()
+        argv = [str(part) for part in command.formulate()]
+        msg = f"Process did not terminate within {timeout} seconds"
+        raise ProcessTimedOut(msg, argv) from exc
+    finally:
+        for pump in pumps:
+            pump.join()
+    return StreamResult(
+        returncode, tuple(stdout_tail), tuple(stderr_tail), tuple(matches)
+    )
+
+
 _MethodHandler = cabc.Callable[[SupportsFormulate, dict[str, object]], object]
 
 _RUN_HANDLERS: dict[RunMethod, _MethodHandler] = {
     "call": _call_handler,
     "run": typ.cast("_MethodHandler", _run_handler),
     "run_fg": _run_fg_handler,
+    "stream": typ.cast("_MethodHandler", _stream_handler),
+}
+
+
+def _default_concurrency() -> int:
+    """Return the default fan-out width for :func:`run_many`."""
+    return max(1, os.cpu_count() or 1)
+
+
+def _effective_env(
+    cmd: SupportsFormulate,
+    env: cabc.Mapping[str, str] | None,
+) -> dict[str, str]:
+    """Return the full environment a ``run_cmd`` invocation would observe.
+
+    Mirrors :func:`_apply_environment`: the runtime overlay from
+    :func:`_collect_runtime_env` is layered over plumbum's ``local.env``, and
+    any variables bound with ``cmd.with_env`` take precedence.
+    """
+    plumbum_env = typ.cast("cabc.Mapping[str, str]", local.env)
+    resolved = {key: str(value) for key, value in plumbum_env.items()}
+    resolved |= _collect_runtime_env(env) or {}
+    bound_env = getattr(cmd, "env", None)
+    if isinstance(bound_env, cabc.Mapping):
+        resolved |= {str(key): str(value) for key, value in bound_env.items()}
+    return resolved
+
+
+async def _terminate_process(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and reap it, suppressing races with a natural exit."""
+    with contextlib.suppress(ProcessLookupError):
+        proc.kill()
+    with contextlib.suppress(ProcessLookupError):
+        await proc.wait()
+
+
+async def run_cmd_async(
+    cmd: object,
+    *,
+    method: AsyncRunMethod = "call",
+    env: cabc.Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> str | RunResult:
+    """Execute ``cmd`` on the running event loop after echoing it.
+
+    The command's stdout and stderr are buffered in full and only surfaced
+    through the return value (or the raised exception), so concurrent
+    invocations never interleave their output in CI logs.
+
+    Parameters
+    ----------
+    cmd : object
+        A plumbum command invocation, e.g. ``local["cargo"]["--version"]``.
+    method : {"call", "run"}, optional
+        ``"call"`` (the default) returns stdout and raises
+        :class:`ProcessExecutionError` on a non-zero exit; ``"run"`` returns a
+        :class:`RunResult` regardless of the exit status.
+    env : Mapping[str, str] | None, optional
+        Environment overrides with the same semantics as :func:`run_cmd`.
+    timeout : float | None, optional
+        Seconds to wait before killing the process and raising
+        :class:`ProcessTimedOut`.
+
+    Returns
+    -------
+    str | RunResult
+        Decoded stdout for ``"call"``; a :class:`RunResult` for ``"run"``.
+
+    Raises
+    ------
+    TypeError
+        If ``cmd`` is not a plumbum command invocation.
+    ValueError
+        If ``method`` is not an asynchronous run method.
+    ProcessExecutionError
+        If ``method`` is ``"call"`` and the command exits non-zero.
+    ProcessTimedOut
+        If the command does not finish within ``timeout`` seconds.
+    """
+    if not isinstance(cmd, SupportsFormulate):
+        msg = "run_cmd_async requires a plumbum command invocation"
+        raise TypeError(msg)
+    if method not in typ.get_args(AsyncRunMethod):
+        msg = f"Unknown run method: {method}"
+        raise ValueError(msg)
+
+    typer.echo(f"$ {cmd}")
+
+    _invalidate_for_mutation(cmd)
+    span = _TraceSpan.begin(cmd, method)
+    try:
+        result = await _communicate_async(cmd, env, timeout)
+    except BaseException as exc:
+        if span is not None:
+            span.finish_with_error(exc)
+        raise
+    if span is not None:
+        span.finish(*result)
+    if method == "run":
+        return result
+    if result.returncode != 0:
+        argv = [str(part) for part in cmd.formulate()]
+        raise ProcessExecutionError(
+            argv, result.returncode, result.stdout, result.stderr
+        )
+    return result.stdout
+
+
+async def _communicate_async(
+    cmd: SupportsFormulate,
+    env: cabc.Mapping[str, str] | None,
+    timeout: float | None,
+) -> RunResult:
+    """Spawn *cmd* and collect its buffered output as a :class:`RunResult`."""
+    argv = [str(part) for part in cmd.formulate()]
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_effective_env(cmd, env),
+        cwd=str(local.cwd),
+    )
+    try:
+        raw_stdout, raw_stderr = await asyncio.wait_for(
+            proc.communicate(), timeout=timeout
+        )
+    except TimeoutError as exc:
+        await _terminate_process(proc)
+        msg = f"Process did not terminate within {timeout} seconds"
+        raise ProcessTimedOut(msg, argv) from exc
+    except asyncio.CancelledError:
+        await _terminate_process(proc)
+        raise
+
+    return RunResult(
+        typ.cast("int", proc.returncode),
+        _ensure_text(raw_stdout),
+        _ensure_text(raw_stderr),
+    )
+
+
+async def run_many_async(
+    commands: cabc.Iterable[object],
+    *,
+    max_concurrency: int | None = None,
+    method: AsyncRunMethod = "call",
+    env: cabc.Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> list[str | RunResult]:
+    """Run ``commands`` concurrently with at most ``max_concurrency`` in flight.
+
+    Results are returned in the same order as ``commands``. When any command
+    raises (for example a non-zero exit under ``method="call"``), the
+    remaining commands are cancelled and their processes killed before the
+    first error propagates.
+
+    Parameters
+    ----------
+    commands : Iterable[object]
+        Plumbum command invocations to execute.
+    max_concurrency : int | None, optional
+        Upper bound on simultaneously running processes. Defaults to the
+        number of available CPUs.
+    method, env, timeout
+        Forwarded to :func:`run_cmd_async` for every command; ``timeout``
+        applies to each command individually.
+
+    Returns
+    -------
+    list[str | RunResult]
+        One result per command, in input order.
+    """
+    limit = _default_concurrency() if max_concurrency is None else max_concurrency
+    if limit < 1:
+        msg = "max_concurrency must be at least 1"
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(command: object) -> str | RunResult:
+        async with semaphore:
+            return await run_cmd_async(command, method=method, env=env, timeout=timeout)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_bounded(command)) for command in commands]
+    except BaseExceptionGroup as group_exc:
+        raise group_exc.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+def run_many(
+    commands: cabc.Iterable[object],
+    *,
+    max_concurrency: int | None = None,
+    method: AsyncRunMethod = "call",
+    env: cabc.Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> list[str | RunResult]:
+    """Run ``commands`` with bounded concurrency and block until they finish.
+
+    A blocking wrapper around :func:`run_many_async` for the synchronous
+    action scripts. It must not be called from inside a running event loop;
+    await :func:`run_many_async` there instead.
+    """
+    return asyncio.run(
+        run_many_async(
+            commands,
+            max_concurrency=max_concurrency,
+            method=method,
+            env=env,
+            timeout=timeout,
+        )
+    )
+
+
+CACHE_DIR_ENV_VAR: typ.Final[str] = "CMD_UTILS_CACHE_DIR"
+DEFAULT_CACHE_TTL: typ.Final[float] = 3600.0
+# Variables that change what a read-only probe reports; everything else in the
+# environment is ignored when computing cache keys.
+CACHE_ENV_KEYS: typ.Final[tuple[str, ...]] = (
+    "CARGO_HOME",
+    "CONTAINER_HOST",
+    "CROSS_CONTAINER_ENGINE",
+    "DOCKER_CONTEXT",
+    "DOCKER_HOST",
+    "HOME",
+    "PATH",
+    "RUSTUP_HOME",
+    "RUSTUP_TOOLCHAIN",
+)
+# Subcommand prefixes that mutate tool state, mapped per executable to the
+# cache tags they invalidate. An empty tag tuple clears the whole cache.
+_MUTATING_SUBCOMMANDS: typ.Final[
+    dict[str, tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]]
+] = {
+    "rustup": (
+        (("toolchain", "install"), ("rustup", "rustc", "cargo")),
+        (("toolchain", "uninstall"), ("rustup", "rustc", "cargo")),
+        (("toolchain", "link"), ("rustup", "rustc", "cargo")),
+        (("target", "add"), ("rustup",)),
+        (("target", "remove"), ("rustup",)),
+        (("component", "add"), ("rustup", "cargo")),
+        (("component", "remove"), ("rustup", "cargo")),
+        (("default",), ("rustup", "rustc", "cargo")),
+        (("override",), ("rustup", "rustc", "cargo")),
+        (("update",), ("rustup", "rustc", "cargo")),
+        (("install",), ("rustup", "rustc", "cargo")),
+    ),
+    "cargo": (
+        (("install",), ()),
+        (("uninstall",), ()),
+        (("binstall",), ()),
+    ),
 }
 
 
+def _cache_dir() -> Path | None:
+    """Return the job-scoped cache directory, or ``None`` when disabled."""
+    raw = os.environ.get(CACHE_DIR_ENV_VAR, "").strip()
+    return Path(raw).expanduser() if raw else None
+
+
+def _executable_tag(argv: cabc.Sequence[str]) -> str:
+    """Return the default cache tag for *argv* (its executable stem)."""
+    return Path(argv[0]).stem.lower() if argv else ""
+
+
+def _resolve_executable(executable: str) -> Path | None:
+    """Return the resolved path of *executable*, or ``None`` if not found."""
+    located = executable if Path(executable).is_absolute() else None
+    located = located or shutil.which(executable)
+    if located is None:
+        return None
+    try:
+        return Path(located).resolve(strict=True)
+    except OSError:
+        return None
+
+
+def _cache_key(
+    cmd: SupportsFormulate,
+    env: cabc.Mapping[str, str] | None,
+    cwd: object,
+) -> str | None:
+    """Return the content key for *cmd*, or ``None`` if it cannot be keyed.
+
+    The key covers the executable's resolved path, mtime and size, the full
+    argv, the working directory, and the :data:`CACHE_ENV_KEYS` subset of the
+    effective environment.
+    """
+    argv = [str(part) for part in cmd.formulate()]
+    executable = _resolve_executable(argv[0]) if argv else None
+    if executable is None:
+        return None
+    try:
+        stat = executable.stat()
+    except OSError:
+        return None
+    effective_env = _effective_env(cmd, env)
+    material = {
+        "executable": str(executable),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "args": argv[1:],
+        "cwd": str(cwd if cwd is not None else local.cwd),
+        "env": {key: effective_env.get(key) for key in CACHE_ENV_KEYS},
+    }
+    encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _read_cache_entry(path: Path, ttl: float) -> RunResult | None:
+    """Return the cached result at *path* if it exists and is fresh."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        created = float(entry["created"])
+        result = RunResult(
+            int(entry["returncode"]), str(entry["stdout"]), str(entry["stderr"])
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if time.time() - created > ttl:
+        return None
+    return result
+
+
+def _write_cache_entry(
+    path: Path, argv: list[str], tags: cabc.Iterable[str], result: RunResult
+) -> None:
+    """Atomically persist *result* at *path*, ignoring filesystem failures."""
+    entry = {
+        "created": time.time(),
+        "argv": argv,
+        "tags": sorted(set(tags)),
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+    }
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as exc:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        typer.echo(f"::warning::Could not write command cache {path}: {exc}", err=True)
+
+
+def run_cached(
+    cmd: object,
+    *,
+    env: cabc.Mapping[str, str] | None = None,
+    ttl: float = DEFAULT_CACHE_TTL,
+    tags: cabc.Iterable[str] = (),
+    **run_kwargs: object,
+) -> RunResult:
+    """Run a read-only *cmd* via ``method="run"``, reusing cached results.
+
+    Caching is active only when ``CMD_UTILS_CACHE_DIR`` names a directory,
+    typically under ``RUNNER_TEMP`` so entries live for one job. Only
+    successful results are stored. Otherwise this behaves exactly like
+    ``run_cmd(cmd, method="run", ...)``.
+
+    Parameters
+    ----------
+    cmd : object
+        A plumbum command invocation the caller knows to be side-effect free.
+    env : Mapping[str, str] | None, optional
+        Environment overrides with the same semantics as :func:`run_cmd`.
+    ttl : float, optional
+        Maximum age in seconds of a reusable entry.
+    tags : Iterable[str], optional
+        Extra invalidation tags; the executable's stem is always included.
+    **run_kwargs : object
+        Forwarded to :func:`run_cmd`. ``cwd`` also participates in the key.
+
+    Returns
+    -------
+    RunResult
+        The cached or freshly captured result.
+    """
+    if not isinstance(cmd, SupportsFormulate):
+        msg = "run_cached requires a plumbum command invocation"
+        raise TypeError(msg)
+    cache_dir = _cache_dir()
+    key = _cache_key(cmd, env, run_kwargs.get("cwd")) if cache_dir else None
+    if cache_dir is None or key is None:
+        return coerce_run_result(
+            typ.cast("RunResult", run_cmd(cmd, method="run", env=env, **run_kwargs))
+        )
+
+    entry_path = cache_dir / f"{key}.json"
+    cached = _read_cache_entry(entry_path, ttl)
+    if cached is not None:
+        typer.echo(f"$ {cmd} (cached)")
+        return cached
+
+    result = coerce_run_result(
+        typ.cast("RunResult", run_cmd(cmd, method="run", env=env, **run_kwargs))
+    )
+    if result.returncode == 0:
+        argv = [str(part) for part in cmd.formulate()]
+        _write_cache_entry(entry_path, argv, (_executable_tag(argv), *tags), result)
+    return result
+
+
+def invalidate_cache(*tags: str) -> int:
+    """Remove cached results carrying any of *tags*, or all results if none.
+
+    Returns
+    -------
+    int
+        The number of entries removed.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return 0
+    wanted = {tag.lower() for tag in tags}
+    removed = 0
+    for entry_path in cache_dir.glob("*.json"):
+        if wanted:
+            try:
+                entry = json.loads(entry_path.read_text(encoding="utf-8"))
+                entry_tags = {str(tag) for tag in entry.get("tags", ())}
+            except (OSError, ValueError, AttributeError):
+                entry_tags = set()
+            if entry_tags and not entry_tags & wanted:
+                continue
+        with contextlib.suppress(FileNotFoundError):
+            entry_path.unlink()
+            removed += 1
+    return removed
+
+
+def _invalidate_for_mutation(cmd: SupportsFormulate) -> None:
+    """Drop cache entries made stale by a known state-mutating *cmd*."""
+    if _cache_dir() is None:
+        return
+    argv = [str(part) for part in cmd.formulate()]
+    args = tuple(argv[1:])
+    for prefix, tags in _MUTATING_SUBCOMMANDS.get(_executable_tag(argv), ()):
+        if args[: len(prefix)] == prefix:
+            invalidate_cache(*tags)
+            return
+
+
 __all__ = [
+    "CACHE_DIR_ENV_VAR",
+    "CACHE_ENV_KEYS",
+    "DEFAULT_CACHE_TTL",
+    "TRACE_ENV_VAR",
+    "AsyncRunMethod",
     "RunMethod",
     "RunResult",
+    "StreamResult",
     "coerce_run_result",
+    "invalidate_cache",
+    "load_trace",
     "process_error_to_run_result",
     "process_error_to_subprocess",
+    "render_trace_summary",
+    "run_cached",
     "run_cmd",
+    "run_cmd_async",
+    "run_many",
+    "run_many_async",
+    "write_trace_summary",
 ]
@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import typing as typ
-from subprocess import CalledProcessError, TimeoutExpired
+from pathlib import Path
+from subprocess import CalledProcessError, Popen, TimeoutExpired
 
 from plumbum.commands.processes import ProcessExecutionError, ProcessTimedOut
 
-RunMethod = typ.Literal["call", "run", "run_fg"]
+RunMethod = typ.Literal["call", "run", "run_fg", "stream"]
+AsyncRunMethod = typ.Literal["call", "run"]
+TRACE_ENV_VAR: typ.Final[str]
+CACHE_DIR_ENV_VAR: typ.Final[str]
+DEFAULT_CACHE_TTL: typ.Final[float]
+CACHE_ENV_KEYS: typ.Final[tuple[str, ...]]
 
 class RunResult(typ.NamedTuple):
     returncode: int
     stdout: str
     stderr: str
 
+class StreamResult(typ.NamedTuple):
+    returncode: int
+    stdout_tail: tuple[str, ...]
+    stderr_tail: tuple[str, ...]
+    matches: tuple[str, ...]
+
 @typ.runtime_checkable
 class SupportsFormulate(typ.Protocol):
     def formulate(self) -> cabc.Sequence[str]: ...
@@ -29,6 +41,10 @@ class SupportsRun(SupportsFormulate, typ.Protocol):
 class SupportsRunFg(SupportsFormulate, typ.Protocol):
     def run_fg(self, **kwargs: object) -> object: ...
 
+@typ.runtime_checkable
+class SupportsPopen(SupportsFormulate, typ.Protocol):
+    def popen(self, *args: object, **kwargs: object) -> Popen[bytes]: ...
+
 @typ.runtime_checkable
 class SupportsAnd(SupportsFormulate, typ.Protocol):
     def __and__(self, other: object) -> object: ...
@@ -45,6 +61,27 @@ def process_error_to_subprocess(
     *,
     timeout: float | None = ...,
 ) -> CalledProcessError | TimeoutExpired: ...
+def run_cached(
+    cmd: object,
+    *,
+    env: cabc.Mapping[str, str] | None = ...,
+    ttl: float = ...,
+    tags: cabc.Iterable[str] = ...,
+    **run_kwargs: object,
+) -> RunResult: ...
+def invalidate_cache(*tags: str) -> int: ...
+def load_trace(trace_path: Path) -> list[dict[str, typ.Any]]: ...
+def render_trace_summary(
+    records: cabc.Sequence[cabc.Mapping[str, typ.Any]],
+    *,
+    limit: int = ...,
+) -> str: ...
+def write_trace_summary(
+    trace_path: Path | None = ...,
+    summary_path: Path | None = ...,
+    *,
+    limit: int = ...,
+) -> bool: ...
 def run_cmd(
     cmd: object,
     *,
@@ -52,12 +89,49 @@ def run_cmd(
     env: cabc.Mapping[str, str] | None = ...,
     **run_kwargs: object,
 ) -> object: ...
+async def run_cmd_async(
+    cmd: object,
+    *,
+    method: AsyncRunMethod = ...,
+    env: cabc.Mapping[str, str] | None = ...,
+    timeout: float | None = ...,
+) -> str | RunResult: ...
+async def run_many_async(
+    commands: cabc.Iterable[object],
+    *,
+    max_concurrency: int | None = ...,
+    method: AsyncRunMethod = ...,
+    env: cabc.Mapping[str, str] | None = ...,
+    timeout: float | None = ...,
+) -> list[str | RunResult]: ...
+def run_many(
+    commands: cabc.Iterable[object],
+    *,
+    max_concurrency: int | None = ...,
+    method: AsyncRunMethod = ...,
+    env: cabc.Mapping[str, str] | None = ...,
+    timeout: float | None = ...,
+) -> list[str | RunResult]: ...
 
 __all__ = [
+    "CACHE_DIR_ENV_VAR",
+    "CACHE_ENV_KEYS",
+    "DEFAULT_CACHE_TTL",
+    "TRACE_ENV_VAR",
+    "AsyncRunMethod",
     "RunMethod",
     "RunResult",
+    "StreamResult",
     "coerce_run_result",
+    "invalidate_cache",
+    "load_trace",
     "process_error_to_run_result",
     "process_error_to_subprocess",
+    "render_trace_summary",
+    "run_cached",
     "run_cmd",
+    "run_cmd_async",
+    "run_many",
+    "run_many_async",
+    "write_trace_summary",
 ]
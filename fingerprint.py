@@ -0,0 +1,330 @@
+r"""Cheap, stable cache keys for lockfiles and source trees.
+
+A fingerprint combines two digests:
+
+* a lockfile digest over ``Cargo.lock`` / ``uv.lock``, parsed and re-encoded
+  canonically so comment and formatting churn does not change the key, and
+* a source-tree digest built from the blob ids that ``git ls-files -s``
+  already knows, so tracked file contents are never read. Only files with
+  unstaged edits are hashed (through ``git hash-object``), which keeps local
+  runs honest without slowing down clean CI checkouts.
+
+Both are folded into one hex ``key`` suitable for ``actions/cache`` keys or
+``GITHUB_OUTPUT``.
+
+Examples
+--------
+Compute a key for Rust sources and write it as a step output::
+
+    >>> fp = compute_fingerprint(Path("."), include=["src", "Cargo.toml"])
+    >>> len(fp.key)
+    64
+
+From a workflow step::
+
+    python fingerprint.py --include src --include crates --exclude '*.md' \
+        --output-name key
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tomllib
+import typing as typ
+from pathlib import Path
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+DEFAULT_LOCKFILES: tuple[str, ...] = ("Cargo.lock", "uv.lock")
+"""Lockfiles included when none are requested explicitly."""
+
+_FORMAT_VERSION = "1"
+_GIT_TIMEOUT = 120
+
+
+class FingerprintError(RuntimeError):
+    """Raised when the source tree cannot be fingerprinted."""
+
+
+class Fingerprint(typ.NamedTuple):
+    """Digests describing a set of build inputs.
+
+    Attributes
+    ----------
+    lockfiles : str
+        SHA-256 over the normalized lockfiles.
+    sources : str
+        SHA-256 over the ``(mode, blob id, path)`` entries of tracked files.
+    file_count : int
+        Number of tracked files that contributed to ``sources``.
+    key : str
+        SHA-256 combining both digests and the optional salt.
+    """
+
+    lockfiles: str
+    sources: str
+    file_count: int
+    key: str
+
+
+def _normalized_lockfile(path: Path) -> bytes:
+    """Return a canonical encoding of *path* for hashing.
+
+    TOML lockfiles are parsed and dumped as sorted JSON so comments, spacing
+    and key order do not matter. Files that are not valid TOML are hashed
+    with normalized line endings instead.
+    """
+    raw = path.read_bytes()
+    try:
+        document = tomllib.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return raw.replace(b"\r\n", b"\n")
+    return json.dumps(
+        document, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+def lockfile_digest(paths: cabc.Iterable[Path]) -> str:
+    """Return a digest over the normalized contents of *paths*.
+
+    Parameters
+    ----------
+    paths : Iterable[Path]
+        Lockfiles to include. Missing files contribute an explicit
+        "absent" marker, so adding or removing a lockfile changes the digest.
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(f"\0{path.name}\0".encode())
+        if path.is_file():
+            digest.update(_normalized_lockfile(path))
+        else:
+            digest.update(b"<absent>")
+    return digest.hexdigest()
+
+
+def _git(root: Path, *args: str, stdin: bytes | None = None) -> bytes:
+    """Run ``git`` in *root* and return its stdout."""
+    git = shutil.which("git")
+    if git is None:
+        msg = "git is required to fingerprint the source tree"
+        raise FingerprintError(msg)
+    proc = subprocess.Popen(  # noqa: S603 - git resolved from PATH, fixed args
+        [git, "-C", str(root), *args],
+        stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = proc.communicate(stdin, timeout=_GIT_TIMEOUT)
+    except subprocess.TimeoutExpired as exc:
+        proc.kill()
+        proc.communicate()
+        msg = f"git {args[0]} timed out after {_GIT_TIMEOUT}s"
+        raise FingerprintError(msg) from exc
+    if proc.returncode != 0:
+        detail = stderr.decode(errors="replace").strip()
+        msg = f"git {args[0]} failed ({proc.returncode}): {detail}"
+        raise FingerprintError(msg)
+    return stdout
+
+
+def _pathspecs(include: cabc.Sequence[str], exclude: cabc.Sequence[str]) -> list[str]:
+    """Translate include/exclude patterns into git pathspecs.
+
+    Includes use glob magic, so ``*`` stops at ``/`` and ``**`` crosses
+    directories. Excludes do not: their ``*`` also matches ``/``, so ``*.md``
+    drops Markdown files at any depth, as ``.gitignore`` patterns would.
+    """
+    specs = [f":(glob){pattern}" for pattern in include] or ["."]
+    specs.extend(f":(exclude){pattern}" for pattern in exclude)
+    return specs
+
+
+def _split_z(output: bytes) -> list[bytes]:
+    return [item for item in output.split(b"\0") if item]
+
+
+def source_tree_digest(
+    root: Path,
+    *,
+    include: cabc.Sequence[str] = (),
+    exclude: cabc.Sequence[str] = (),
+) -> tuple[str, int]:
+    """Return a digest of the tracked files under *root* and their count.
+
+    Parameters
+    ----------
+    root : Path
+        Directory inside a git work tree.
+    include : Sequence[str], optional
+        Glob pathspecs selecting files (``src``, ``crates/**/*.rs``). All
+        tracked files are included when empty.
+    exclude : Sequence[str], optional
+        Pathspecs removed from the selection. ``*`` also matches ``/``, so
+        ``*.md`` excludes Markdown files in every directory.
+
+    Returns
+    -------
+    tuple[str, int]
+        Hex-encoded SHA-256 digest and the number of files hashed.
+
+    Raises
+    ------
+    FingerprintError
+        If git is unavailable or *root* is not inside a work tree.
+
+    Notes
+    -----
+    Staged content is described by the index blob ids. Files with unstaged
+    edits are re-hashed with ``git hash-object`` so the key follows the work
+    tree. Untracked files are ignored.
+    """
+    specs = _pathspecs(include, exclude)
+    entries: dict[bytes, tuple[bytes, bytes]] = {}
+    for record in _split_z(_git(root, "ls-files", "-s", "-z", "--", *specs)):
+        meta, _, path = record.partition(b"\t")
+        mode, blob, _stage = meta.split(b" ", 2)
+        entries[path] = (mode, blob)
+
+    modified = [
+        path
+        for path in _split_z(_git(root, "ls-files", "-m", "-z", "--", *specs))
+        if path in entries
+    ]
+    if modified:
+        present = [path for path in modified if (root / os.fsdecode(path)).exists()]
+        for path in set(modified) - set(present):
+            del entries[path]  # deleted in the work tree
+        if present:
+            blobs = _git(
+                root,
+                "hash-object",
+                "--stdin-paths",
+                stdin=b"\n".join(present) + b"\n",
+            ).split()
+            for path, blob in zip(present, blobs, strict=True):
+                entries[path] = (entries[path][0], blob)
+
+    digest = hashlib.sha256()
+    for path in sorted(entries):
+        mode, blob = entries[path]
+        digest.update(mode + b" " + blob + b"\t" + path + b"\0")
+    return digest.hexdigest(), len(entries)
+
+
+def compute_fingerprint(
+    root: Path,
+    *,
+    lockfiles: cabc.Sequence[Path] | None = None,
+    include: cabc.Sequence[str] = (),
+    exclude: cabc.Sequence[str] = (),
+    salt: str = "",
+) -> Fingerprint:
+    """Return the combined fingerprint of lockfiles and sources under *root*.
+
+    Parameters
+    ----------
+    root : Path
+        Repository (or sub-directory) to fingerprint.
+    lockfiles : Sequence[Path], optional
+        Lockfiles to hash, relative to *root* unless absolute. Defaults to
+        :data:`DEFAULT_LOCKFILES` that exist under *root*.
+    include, exclude : Sequence[str], optional
+        Git pathspecs passed to :func:`source_tree_digest`.
+    salt : str, optional
+        Extra text mixed into the key, such as a toolchain or runner OS, so
+        unrelated caches sharing inputs do not collide.
+
+    Returns
+    -------
+    Fingerprint
+        The individual digests and the combined key.
+    """
+    if lockfiles is None:
+        candidates = [root / name for name in DEFAULT_LOCKFILES]
+        lock_paths = [path for path in candidates if path.is_file()]
+    else:
+        lock_paths = [path if path.is_absolute() else root / path for path in lockfiles]
+    locks = lockfile_digest(lock_paths)
+    sources, count = source_tree_digest(root, include=include, exclude=exclude)
+    combined = hashlib.sha256(
+        "\0".join((_FORMAT_VERSION, salt, locks, sources)).encode()
+    ).hexdigest()
+    return Fingerprint(lockfiles=locks, sources=sources, file_count=count, key=combined)
+
+
+def write_github_output(name: str, value: str) -> bool:
+    """Append ``name=value`` to ``GITHUB_OUTPUT`` when it is set."""
+    output = os.environ.get("GITHUB_OUTPUT")
+    if not output:
+        return False
+    with Path(output).open("a", encoding="utf-8") as handle:
+        handle.write(f"{name}={value}\n")
+    return True
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+    """Print a fingerprint key and optionally export it as a step output."""
+    parser = argparse.ArgumentParser(description="Fingerprint build inputs.")
+    parser.add_argument("--root", type=Path, default=Path())
+    parser.add_argument(
+        "--lockfile",
+        action="append",
+        type=Path,
+        dest="lockfiles",
+        help="lockfile to include (repeatable; default: Cargo.lock and uv.lock)",
+    )
+    parser.add_argument("--include", action="append", default=[])
+    parser.add_argument("--exclude", action="append", default=[])
+    parser.add_argument("--salt", default="")
+    parser.add_argument(
+        "--output-name",
+        default="",
+        help="also write the key to GITHUB_OUTPUT under this name",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        fingerprint = compute_fingerprint(
+            args.root,
+            lockfiles=args.lockfiles,
+            include=args.include,
+            exclude=args.exclude,
+            salt=args.salt,
+        )
+    except FingerprintError as exc:
+        print(f"::error::{exc}", file=sys.stderr)
+        return 1
+
+    print(fingerprint.key)
+    if args.output_name:
+        write_github_output(args.output_name, fingerprint.key)
+    return 0
+
+
+__all__ = [
+    "DEFAULT_LOCKFILES",
+    "Fingerprint",
+    "FingerprintError",
+    "compute_fingerprint",
+    "lockfile_digest",
+    "source_tree_digest",
+    "write_github_output",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,570 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "cyclopts==3.24.0",
+#     "httpx==0.28.1",
+#     "jinja2==3.1.6",
+#     "lxml==6.1.3",
+#     "packaging==26.3",
+#     "plumbum==2.0.2",
+#     "pyyaml==6.0.3",
+#     "syspath-hack==0.4.0",
+#     "typer==0.27.3",
+# ]
+# ///
+r"""Job-scoped worker that runs action scripts in a pre-warmed interpreter.
+
+Every action step normally starts a fresh interpreter through
+``uv run --script``, which resolves the script's PEP 723 dependencies and
+re-imports typer, plumbum, cyclopts, lxml and friends. This module lets the
+first step of a job start one long-lived worker that imports those modules
+once; later steps hand their script path, argv, environment, cwd and standard
+streams to it over a Unix socket. The worker forks a child per request, so
+each script still runs in an isolated process, but the fork inherits the warm
+imports and starts in milliseconds.
+
+The worker's own dependencies are pinned, so every script it runs sees the
+same versions. Before running a script, the worker parses each entry of the
+script's PEP 723 ``dependencies`` with :class:`packaging.requirements.Requirement`
+and checks it, along with ``requires-python``, against what it has installed.
+The client side uses only the standard library so it can run under any
+``python3`` on the runner. The client falls back to ``uv run --script``,
+exactly as the action would have done without the worker, when any of these
+hold:
+
+- no worker is listening;
+- the platform lacks Unix sockets;
+- any requirement is absent or its installed version falls outside the
+  specifier.
+
+Once a request has been sent the worker may already have started the script,
+so a dropped connection or malformed reply is reported as a failure with exit
+status 1 rather than running the script a second time.
+
+Examples
+--------
+Start the worker once per job, then run scripts through it::
+
+    $ python3 script_daemon.py start
+    $ python3 script_daemon.py run .github/actions/generate-coverage/scripts/detect.py
+
+Run a script from Python, receiving ``None`` when the worker is unavailable::
+
+    >>> run_script(Path("scripts/detect.py"), ["--help"])
+    0
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import importlib.metadata
+import json
+import os
+import platform
+import re
+import runpy
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import typing as typ
+from pathlib import Path
+
+SOCKET_ENV_VAR: typ.Final[str] = "SHARED_ACTIONS_DAEMON_SOCKET"
+SOCKET_FILENAME: typ.Final[str] = "shared-actions-daemon.sock"
+DEFAULT_IDLE_TIMEOUT: typ.Final[float] = 1800.0
+DEFAULT_START_TIMEOUT: typ.Final[float] = 120.0
+PRELOAD_MODULES: typ.Final[tuple[str, ...]] = (
+    "cyclopts",
+    "httpx",
+    "jinja2",
+    "lxml.etree",
+    "packaging.requirements",
+    "plumbum",
+    "syspath_hack",
+    "tomllib",
+    "typer",
+    "yaml",
+)
+
+_LENGTH = struct.Struct("!I")
+_MAX_MESSAGE_BYTES: typ.Final[int] = 16 * 1024 * 1024
+_STREAM_FDS: typ.Final[tuple[int, int, int]] = (0, 1, 2)
+_PEP723_BLOCK = re.compile(
+    r"^# /// script\s*$(?P<body>.*?)^# ///\s*$", re.MULTILINE | re.DOTALL
+)
+
+
+class DaemonProtocolError(RuntimeError):
+    """Raised when the worker and client exchange a malformed message."""
+
+
+def default_socket_path() -> Path | None:
+    """Return the worker socket path for this job, or ``None`` if unknown.
+
+    ``SHARED_ACTIONS_DAEMON_SOCKET`` takes precedence; otherwise the socket
+    lives in ``RUNNER_TEMP`` so it is scoped to a single job.
+    """
+    explicit = os.environ.get(SOCKET_ENV_VAR, "").strip()
+    if explicit:
+        return Path(explicit).expanduser()
+    runner_temp = os.environ.get("RUNNER_TEMP", "").strip()
+    if runner_temp:
+        return Path(runner_temp) / SOCKET_FILENAME
+    return None
+
+
+def _supports_daemon() -> bool:
+    """Return ``True`` when the platform offers fork and fd passing."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork")
+
+
+def _send_message(
+    conn: socket.socket, payload: dict[str, object], fds: list[int] | None = None
+) -> None:
+    """Send a length-prefixed JSON *payload*, attaching *fds* when given."""
+    data = json.dumps(payload).encode("utf-8")
+    frame = _LENGTH.pack(len(data)) + data
+    if fds:
+        socket.send_fds(conn, [frame], fds)
+    else:
+        conn.sendall(frame)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    """Read exactly *size* bytes from *conn*."""
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining:
+        chunk = conn.recv(remaining)
+        if not chunk:
+            msg = "connection closed mid-message"
+            raise DaemonProtocolError(msg)
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _decode(data: bytes) -> dict[str, typ.Any]:
+    """Decode a JSON object payload."""
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError as exc:
+        msg = f"invalid message: {exc}"
+        raise DaemonProtocolError(msg) from exc
+    if not isinstance(payload, dict):
+        msg = "message must be a JSON object"
+        raise DaemonProtocolError(msg)
+    return payload
+
+
+def _recv_message(conn: socket.socket) -> dict[str, typ.Any]:
+    """Receive one length-prefixed JSON message without descriptors."""
+    (length,) = _LENGTH.unpack(_recv_exact(conn, _LENGTH.size))
+    if length > _MAX_MESSAGE_BYTES:
+        msg = f"message of {length} bytes exceeds limit"
+        raise DaemonProtocolError(msg)
+    return _decode(_recv_exact(conn, length))
+
+
+def _recv_request(conn: socket.socket) -> tuple[dict[str, typ.Any], list[int]]:
+    """Receive a request message together with its passed descriptors."""
+    head, fds, _flags, _addr = socket.recv_fds(conn, _LENGTH.size, 8)
+    if len(head) < _LENGTH.size:
+        head += _recv_exact(conn, _LENGTH.size - len(head))
+    (length,) = _LENGTH.unpack(head)
+    if length > _MAX_MESSAGE_BYTES:
+        msg = f"message of {length} bytes exceeds limit"
+        raise DaemonProtocolError(msg)
+    return _decode(_recv_exact(conn, length)), list(fds)
+
+
+def _script_metadata(script: Path) -> dict[str, typ.Any]:
+    """Return *script*'s parsed PEP 723 metadata, or ``{}`` when it has none.
+
+    ``tomllib`` is imported here rather than at module level so the client and
+    ``start`` still run under a runner ``python3`` older than 3.11.
+    """
+    import tomllib
+
+    try:
+        text = script.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    block = _PEP723_BLOCK.search(text)
+    if block is None:
+        return {}
+    body = "\n".join(
+        line.removeprefix("#").removeprefix(" ") for line in block["body"].splitlines()
+    )
+    try:
+        return tomllib.loads(body)
+    except ValueError:
+        return {}
+
+
+def script_requirements(script: Path) -> list[str]:
+    """Return the requirement strings declared in *script*'s PEP 723 block."""
+    return [str(entry) for entry in _script_metadata(script).get("dependencies", ())]
+
+
+def missing_requirements(script: Path) -> list[str]:
+    """Return the PEP 723 requirements of *script* this interpreter does not meet.
+
+    Each dependency is parsed with :class:`packaging.requirements.Requirement`.
+    It is unmet when it cannot be parsed, its distribution is absent, or the
+    installed version is outside its specifier. Extras are expanded into the
+    requirements they add. Entries whose environment marker excludes this
+    interpreter are skipped, and an unmet ``requires-python`` is reported as
+    ``python<specifier>``. Only the worker calls this, so ``packaging`` is
+    imported lazily to keep the client on the standard library.
+    """
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+    metadata = _script_metadata(script)
+    missing: list[str] = []
+    requires_python = str(metadata.get("requires-python", ""))
+    try:
+        if not SpecifierSet(requires_python).contains(platform.python_version()):
+            missing.append(f"python{requires_python}")
+    except InvalidSpecifier:
+        missing.append(f"python{requires_python}")
+
+    pending = [(entry, "") for entry in script_requirements(script)]
+    seen: set[tuple[str, str]] = set()
+    while pending:
+        entry, extra = pending.pop()
+        if (entry, extra) in seen:
+            continue
+        seen.add((entry, extra))
+        try:
+            requirement = Requirement(entry)
+        except InvalidRequirement:
+            missing.append(entry)
+            continue
+        marker = requirement.marker
+        if marker is not None and not marker.evaluate({"extra": extra}):
+            continue
+        try:
+            installed = importlib.metadata.version(requirement.name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(entry)
+            continue
+        if not requirement.specifier.contains(installed, prereleases=True):
+            missing.append(entry)
+            continue
+        for name in requirement.extras:
+            requires = importlib.metadata.requires(requirement.name) or []
+            pending.extend((dependency, name) for dependency in requires)
+    return missing
+
+
+def _preload_modules() -> None:
+    """Import the heavy shared dependencies so forked children inherit them."""
+    for name in PRELOAD_MODULES:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+
+
+def _exit_code(code: object) -> int:
+    """Translate a :class:`SystemExit` payload into a process exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+def _refresh_preloaded_state() -> None:
+    """Re-sync preloaded modules that snapshot the environment at import.
+
+    ``plumbum.local.env`` copies ``os.environ`` when plumbum is imported, so
+    without this the commands a script spawns would inherit the worker's
+    environment instead of the requesting step's.
+    """
+    plumbum = sys.modules.get("plumbum")
+    if plumbum is not None:
+        plumbum.local.env.clear()
+        plumbum.local.env.update(os.environ)
+
+
+def _execute_script(request: dict[str, typ.Any], fds: list[int]) -> int:
+    """Run the requested script in the current (forked) process."""
+    for target, source in zip(_STREAM_FDS, fds, strict=False):
+        os.dup2(source, target)
+    for source in fds:
+        if source not in _STREAM_FDS:
+            os.close(source)
+    script = Path(str(request["script"]))
+    os.environ.clear()
+    os.environ.update({str(k): str(v) for k, v in dict(request["env"]).items()})
+    os.chdir(str(request["cwd"]))
+    _refresh_preloaded_state()
+    sys.argv = [str(script), *(str(arg) for arg in request.get("argv", ()))]
+    python_path = os.environ.get("PYTHONPATH", "")
+    extra_paths = [entry for entry in python_path.split(os.pathsep) if entry]
+    sys.path[0:1] = [str(script.parent), *extra_paths]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except BaseException:  # noqa: BLE001 - report like the interpreter would
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _serve_request(conn: socket.socket) -> None:
+    """Handle one client connection inside a forked child and exit."""
+    status = 1
+    try:
+        request, fds = _recv_request(conn)
+        script = Path(str(request.get("script", "")))
+        missing = missing_requirements(script)
+        if missing:
+            _send_message(conn, {"status": "unsupported", "missing": missing})
+            status = 0
+        else:
+            status = _execute_script(request, fds)
+            with contextlib.suppress(Exception):
+                sys.stdout.flush()
+                sys.stderr.flush()
+            _send_message(conn, {"status": "exited", "code": status})
+    except Exception:  # noqa: BLE001 - the child must never return to serve()
+        traceback.print_exc()
+    finally:
+        os._exit(status if 0 <= status < 256 else 1)
+
+
+def _reap_children() -> None:
+    """Collect exited request children without blocking."""
+    with contextlib.suppress(ChildProcessError):
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+
+
+def serve(socket_path: Path, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Listen on *socket_path* and fork a child per script request.
+
+    The worker exits after *idle_timeout* seconds without requests. The socket
+    is created with owner-only permissions and removed on shutdown.
+    """
+    _preload_modules()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    server.settimeout(min(idle_timeout, 5.0))
+    last_request = time.monotonic()
+    try:
+        while time.monotonic() - last_request < idle_timeout:
+            _reap_children()
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            last_request = time.monotonic()
+            if os.fork() == 0:
+                server.close()
+                _serve_request(conn)
+            conn.close()
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Return a connection to the worker, or ``None`` if none is listening."""
+    if not _supports_daemon() or not socket_path.exists():
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(socket_path))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def run_script(
+    script: Path,
+    argv: typ.Sequence[str] = (),
+    *,
+    socket_path: Path | None = None,
+) -> int | None:
+    """Run *script* through the worker and return its exit status.
+
+    The worker receives this process's environment, working directory and
+    standard stream descriptors, so output appears exactly as if the script
+    ran locally.
+
+    Returns
+    -------
+    int | None
+        The script's exit status, or ``None`` when no worker is listening or
+        it replies that it cannot satisfy the script's dependencies. Callers
+        should then run the script themselves. Any other failure after the
+        connection is made returns ``1`` with an ``::error::`` annotation,
+        because the worker may already have run the script.
+    """
+    socket_path = socket_path or default_socket_path()
+    if socket_path is None:
+        return None
+    conn = _connect(socket_path)
+    if conn is None:
+        return None
+    with conn:
+        request: dict[str, object] = {
+            "script": str(script.resolve()),
+            "argv": list(argv),
+            "env": dict(os.environ),
+            "cwd": str(Path.cwd()),
+        }
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(Exception):
+                stream.flush()
+        try:
+            _send_message(conn, request, list(_STREAM_FDS))
+            reply = _recv_message(conn)
+        except (OSError, DaemonProtocolError) as exc:
+            sys.stderr.write(f"::error::script worker failed running {script}: {exc}\n")
+            return 1
+    status = reply.get("status")
+    if status == "unsupported":
+        return None
+    if status != "exited":
+        sys.stderr.write(
+            f"::error::script worker sent an unexpected reply for {script}: {reply}\n"
+        )
+        return 1
+    return int(reply.get("code", 1))
+
+
+def start_daemon(
+    socket_path: Path | None = None,
+    *,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    timeout: float = DEFAULT_START_TIMEOUT,
+) -> bool:
+    """Start a detached worker for this job unless one is already listening.
+
+    The worker is launched with ``uv run --script`` so its environment holds
+    the union of dependencies declared in this module's PEP 723 block.
+
+    Returns
+    -------
+    bool
+        ``True`` once a worker accepts connections; ``False`` when the
+        platform is unsupported, no socket path is known, ``uv`` is missing,
+        or the worker did not come up within *timeout* seconds.
+    """
+    socket_path = socket_path or default_socket_path()
+    if socket_path is None or not _supports_daemon():
+        return False
+    existing = _connect(socket_path)
+    if existing is not None:
+        existing.close()
+        return True
+    uv = shutil.which("uv")
+    if uv is None:
+        return False
+    log_path = Path(tempfile.gettempdir()) / f"{socket_path.name}.log"
+    with log_path.open("ab") as log:
+        subprocess.Popen(  # noqa: S603 - fixed argv, no shell
+            [
+                uv,
+                "run",
+                "--script",
+                str(Path(__file__).resolve()),
+                "serve",
+                "--socket",
+                str(socket_path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        conn = _connect(socket_path)
+        if conn is not None:
+            conn.close()
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def _fallback(script: Path, argv: typ.Sequence[str]) -> typ.NoReturn:
+    """Replace this process with ``uv run --script`` for *script*."""
+    uv = shutil.which("uv") or "uv"
+    os.execvp(uv, [uv, "run", "--script", str(script), *argv])  # noqa: S606
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the worker in the foreground")
+    serve_parser.add_argument("--socket", type=Path, default=None)
+    serve_parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT
+    )
+
+    start_parser = commands.add_parser("start", help="start a detached worker")
+    start_parser.add_argument("--socket", type=Path, default=None)
+    start_parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT
+    )
+
+    run_parser = commands.add_parser(
+        "run", help="run a script via the worker, falling back to uv run --script"
+    )
+    run_parser.add_argument("script", type=Path)
+    run_parser.add_argument("args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv: typ.Sequence[str] | None = None) -> int:
+    """Entry point for the ``serve``, ``start`` and ``run`` subcommands."""
+    args = _build_parser().parse_args(argv)
+    if args.command == "run":
+        status = run_script(args.script, args.args)
+        if status is None:
+            _fallback(args.script, args.args)
+        return status
+    socket_path = args.socket or default_socket_path()
+    if socket_path is None:
+        sys.stderr.write(
+            f"::warning::set {SOCKET_ENV_VAR} or RUNNER_TEMP to locate the worker\n"
+        )
+        return 1
+    if args.command == "serve":
+        serve(socket_path, idle_timeout=args.idle_timeout)
+        return 0
+    if start_daemon(socket_path, idle_timeout=args.idle_timeout):
+        return 0
+    sys.stderr.write("::warning::script worker unavailable; steps will use uv\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["plumbum", "typer"]
+# ///
+"""Benchmark the generate-coverage cargo output pump in lines per second.
+
+A child interpreter writes ``--lines`` nextest-style lines (one million by
+default, one in ten on stderr) as fast as it can, and each pump copies them to
+the console (``/dev/null`` here, so only the pump is timed) while capturing
+stdout, in a fresh interpreter. ``chunked`` is the shipped
+``_cargo_runner._pump_cargo_output``, which reads 64 KiB chunks from the raw
+descriptors and splits lines only for the captured stream; ``readline-echo``
+is the previous pump (a text-mode pipe read line by line and echoed with
+``typer.echo``), kept here as the baseline. The command exits non-zero when a
+pump captures the wrong number of lines.
+
+``_cargo_runner`` imports ``cargo`` through plumbum, so a Rust toolchain must
+be on ``PATH``. Run it from the repository root::
+
+    python scripts/cargo_pump_benchmark.py
+    python scripts/cargo_pump_benchmark.py --lines 200000 --only chunked
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import selectors
+import subprocess
+import sys
+import time
+import typing as typ
+from pathlib import Path
+from types import MappingProxyType
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / ".github" / "actions" / "generate-coverage" / "scripts"
+# Every STDERR_EVERY-th line goes to stderr, like cargo's progress output.
+STDERR_EVERY = 10
+_EMITTER = """
+import sys
+lines, every = int(sys.argv[1]), int(sys.argv[2])
+out, err = [], []
+for n in range(lines):
+    line = f"        PASS [   0.{n % 1000:03d}s] bench::suite tests::case_{n:07d}\\n"
+    (err if n % every == every - 1 else out).append(line)
+sys.stdout.write("".join(out))
+sys.stderr.write("".join(err))
+"""
+
+
+class Measurement(typ.NamedTuple):
+    """The outcome of pumping the emitter's output once."""
+
+    name: str
+    seconds: float
+    captured: int
+
+    def lines_per_second(self, lines: int) -> float:
+        """Return the console throughput for ``lines`` emitted lines."""
+        return lines / self.seconds if self.seconds > 0 else float("inf")
+
+
+def expected_stdout_lines(lines: int) -> int:
+    """Return how many of ``lines`` emitted lines the emitter puts on stdout."""
+    return lines - lines // STDERR_EVERY
+
+
+def _spawn_emitter(lines: int, *, text: bool) -> subprocess.Popen[typ.Any]:
+    stream_kwargs: dict[str, typ.Any] = (
+        {"text": True, "encoding": "utf-8", "errors": "replace"}
+        if text
+        else {"bufsize": 0}
+    )
+    return subprocess.Popen(  # noqa: S603 - argv built from trusted values
+        [sys.executable, "-c", _EMITTER, str(lines), str(STDERR_EVERY)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **stream_kwargs,
+    )
+
+
+def _readline_echo(lines: int) -> list[str]:
+    """Pump with the previous selector loop: one ``readline`` per event."""
+    import typer
+
+    proc = _spawn_emitter(lines, text=True)
+    captured: list[str] = []
+    sel = selectors.DefaultSelector()
+    sel.register(typ.cast("typ.IO[str]", proc.stdout), selectors.EVENT_READ, "stdout")
+    sel.register(typ.cast("typ.IO[str]", proc.stderr), selectors.EVENT_READ, "stderr")
+    while sel.get_map():
+        for key, _ in sel.select():
+            stream = typ.cast("typ.TextIO", key.fileobj)
+            line = stream.readline()
+            if not line:
+                sel.unregister(stream)
+            elif key.data == "stdout":
+                typer.echo(line, nl=False)
+                captured.append(line.rstrip("\r\n"))
+            else:
+                typer.echo(line, err=True, nl=False)
+    sel.close()
+    proc.wait()
+    return captured
+
+
+def _chunked(lines: int) -> list[str]:
+    """Pump with the shipped ``_cargo_runner._pump_cargo_output``."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import _cargo_runner
+
+    proc = _spawn_emitter(lines, text=False)
+    captured = _cargo_runner._pump_cargo_output(
+        proc, deadline=time.monotonic() + 600, wait_timeout=600
+    )
+    proc.wait()
+    return captured
+
+
+_PUMPS: cabc.Mapping[str, cabc.Callable[[int], list[str]]] = MappingProxyType(
+    {
+        "readline-echo": _readline_echo,
+        "chunked": _chunked,
+    }
+)
+
+
+@contextlib.contextmanager
+def _console_to_devnull() -> cabc.Iterator[None]:
+    """Point ``sys.stdout`` and ``sys.stderr`` at ``os.devnull``."""
+    saved = sys.stdout, sys.stderr
+    with (
+        Path(os.devnull).open("wb") as out_raw,
+        Path(os.devnull).open("wb") as err_raw,
+    ):
+        sys.stdout = io.TextIOWrapper(out_raw, encoding="utf-8")
+        sys.stderr = io.TextIOWrapper(err_raw, encoding="utf-8")
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout, sys.stderr = saved
+
+
+def _measure_here(name: str, lines: int) -> dict[str, typ.Any]:
+    """Run pump *name* in this process and return its measurement."""
+    with _console_to_devnull():
+        started = time.perf_counter()
+        captured = _PUMPS[name](lines)
+        seconds = time.perf_counter() - started
+    return {"seconds": seconds, "captured": len(captured)}
+
+
+def measure(name: str, lines: int, *, python: str = sys.executable) -> Measurement:
+    """Run pump *name* over ``lines`` emitted lines in a fresh interpreter."""
+    proc = subprocess.Popen(  # noqa: S603 - argv built from trusted values
+        [python, __file__, "--measure", name, "--lines", str(lines)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        msg = f"{name} failed with exit {proc.returncode}: {stderr.strip()}"
+        raise RuntimeError(msg)
+    data = json.loads(stdout)
+    return Measurement(name, data["seconds"], data["captured"])
+
+
+def measure_best(name: str, lines: int, *, repeat: int) -> Measurement:
+    """Return the fastest of *repeat* runs of pump *name*."""
+    runs = [measure(name, lines) for _ in range(max(repeat, 1))]
+    return min(runs, key=lambda result: result.seconds)
+
+
+def render_table(results: cabc.Sequence[Measurement], lines: int) -> str:
+    """Return a Markdown table of *results*."""
+    rows = [
+        f"{lines:,} emitted lines, {lines // STDERR_EVERY:,} of them on stderr.",
+        "",
+        "| Pump | Time (s) | Lines/s | Captured stdout lines |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    rows.extend(
+        f"| `{result.name}` | {result.seconds:.2f} | "
+        f"{result.lines_per_second(lines):,.0f} | {result.captured:,} |"
+        for result in results
+    )
+    return "\n".join(rows) + "\n"
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+    """Benchmark the cargo output pumps and check what they capture."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--only", choices=list(_PUMPS), action="append", default=[])
+    parser.add_argument("--measure", choices=list(_PUMPS), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure is not None:
+        print(json.dumps(_measure_here(args.measure, args.lines)))
+        return 0
+
+    names = args.only or list(_PUMPS)
+    results = [measure_best(name, args.lines, repeat=args.repeat) for name in names]
+
+    table = render_table(results, args.lines)
+    print(table, end="")
+    if summary := os.environ.get("GITHUB_STEP_SUMMARY"):
+        with Path(summary).open("a", encoding="utf-8") as handle:
+            handle.write("### Cargo output pump benchmark\n\n" + table + "\n")
+
+    expected = expected_stdout_lines(args.lines)
+    wrong = [result.name for result in results if result.captured != expected]
+    for name in wrong:
+        print(
+            f"::error::{name} did not capture {expected} stdout lines", file=sys.stderr
+        )
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
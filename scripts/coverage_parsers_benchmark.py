@@ -0,0 +1,273 @@
+#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["lxml", "typer"]
+# ///
+"""Benchmark the generate-coverage report parsers on synthetic fixtures.
+
+A Cobertura report and an LCOV tracefile with ``--lines`` line entries each
+(one million by default) are written to a temporary directory, then each
+parser runs in a fresh interpreter so its wall time and peak resident set
+size are measured in isolation. ``cobertura-stream`` and ``lcov-mmap`` are the
+shipped ``coverage_parsers.read_cobertura_totals`` and ``read_lcov_totals``;
+``cobertura-dom`` (a whole-tree parse counted with XPath) and ``lcov-text``
+(decode the file, then one ``re.findall`` per tag) are the previous approaches,
+kept here as baselines. The command exits non-zero when parsers of the same
+format disagree on the totals.
+
+Run it from the repository root with the development environment active::
+
+    python scripts/coverage_parsers_benchmark.py
+    python scripts/coverage_parsers_benchmark.py --lines 200000 --only lcov-mmap
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import typing as typ
+from pathlib import Path
+from types import MappingProxyType
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    import types
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PARSERS_DIR = REPO_ROOT / ".github" / "actions" / "generate-coverage" / "scripts"
+
+
+class Measurement(typ.NamedTuple):
+    """The outcome of running one parser over the fixture."""
+
+    name: str
+    seconds: float
+    peak_rss_mib: float | None
+    totals: tuple[int, int]
+
+
+def write_cobertura_fixture(
+    path: Path,
+    *,
+    lines: int,
+    lines_per_class: int = 1000,
+    branch_every: int = 10,
+) -> None:
+    """Stream a synthetic Cobertura report with ``lines`` line entries to *path*.
+
+    Every third line is uncovered and every ``branch_every``-th line is a
+    half-covered two-way branch, so both line and branch totals are non-trivial.
+    """
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write('<?xml version="1.0" ?>\n<coverage version="bench">')
+        fh.write("<sources><source>.</source></sources><packages>")
+        fh.write('<package name="bench"><classes>')
+        number = 0
+        for index in range(0, lines, lines_per_class):
+            fh.write(
+                f'<class name="c{index}" filename="src/c{index}.rs"><methods/><lines>'
+            )
+            for _ in range(min(lines_per_class, lines - index)):
+                number += 1
+                hits = 0 if number % 3 == 0 else number % 7 + 1
+                if number % branch_every == 0:
+                    fh.write(
+                        f'<line number="{number}" hits="{hits}" branch="true" '
+                        'condition-coverage="50% (1/2)"/>'
+                    )
+                else:
+                    fh.write(f'<line number="{number}" hits="{hits}"/>')
+            fh.write("</lines></class>")
+        fh.write("</classes></package></packages></coverage>\n")
+
+
+def write_lcov_fixture(path: Path, *, lines: int, lines_per_file: int = 1000) -> None:
+    """Stream a synthetic LCOV tracefile with ``lines`` ``DA`` entries to *path*.
+
+    Hit counts follow the Cobertura fixture, so both report the same totals.
+    """
+    with path.open("w", encoding="utf-8") as fh:
+        number = 0
+        for index in range(0, lines, lines_per_file):
+            fh.write(f"SF:src/c{index}.rs\nFN:1,f{index}\nFNDA:1,f{index}\n")
+            fh.write("FNF:1\nFNH:1\n")
+            found = hit = 0
+            for _ in range(min(lines_per_file, lines - index)):
+                number += 1
+                hits = 0 if number % 3 == 0 else number % 7 + 1
+                fh.write(f"DA:{number},{hits}\n")
+                found += 1
+                hit += hits > 0
+            fh.write(f"LF:{found}\nLH:{hit}\nend_of_record\n")
+
+
+def _coverage_parsers() -> types.ModuleType:
+    sys.path.insert(0, str(PARSERS_DIR))
+    import coverage_parsers
+
+    return coverage_parsers
+
+
+def _cobertura_stream_totals(path: Path) -> tuple[int, int]:
+    totals = _coverage_parsers().read_cobertura_totals(path)
+    return totals.lines_covered, totals.lines_valid
+
+
+def _cobertura_dom_totals(path: Path) -> tuple[int, int]:
+    from lxml import etree
+
+    root = etree.parse(str(path)).getroot()
+    valid = int(root.xpath("count(//class/lines/line)"))
+    covered = int(root.xpath("count(//class/lines/line[number(@hits) > 0])"))
+    return covered, valid
+
+
+def _lcov_mmap_totals(path: Path) -> tuple[int, int]:
+    totals = _coverage_parsers().read_lcov_totals(path).totals
+    return totals.lines_hit, totals.lines_found
+
+
+def _lcov_text_totals(path: Path) -> tuple[int, int]:
+    text = path.read_text(encoding="utf-8")
+
+    def total(tag: str) -> int:
+        values = re.findall(rf"^{tag}:(\d+)$", text, flags=re.MULTILINE)
+        return sum(int(v) for v in values)
+
+    return total("LH"), total("LF")
+
+
+# Parser names are prefixed with the report format they read.
+_PARSERS: cabc.Mapping[str, cabc.Callable[[Path], tuple[int, int]]] = MappingProxyType(
+    {
+        "cobertura-stream": _cobertura_stream_totals,
+        "cobertura-dom": _cobertura_dom_totals,
+        "lcov-mmap": _lcov_mmap_totals,
+        "lcov-text": _lcov_text_totals,
+    }
+)
+
+
+def _report_format(name: str) -> str:
+    return name.partition("-")[0]
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure_here(name: str, path: Path) -> dict[str, typ.Any]:
+    """Run parser *name* in this process and return its measurement."""
+    started = time.perf_counter()
+    totals = _PARSERS[name](path)
+    return {
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mib": _peak_rss_mib(),
+        "totals": list(totals),
+    }
+
+
+def measure(name: str, path: Path, *, python: str = sys.executable) -> Measurement:
+    """Run parser *name* over *path* in a fresh interpreter."""
+    proc = subprocess.Popen(  # noqa: S603 - argv built from trusted values
+        [python, __file__, "--measure", name, str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+    )
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        msg = f"{name} failed with exit {proc.returncode}: {stderr.strip()}"
+        raise RuntimeError(msg)
+    data = json.loads(stdout)
+    return Measurement(
+        name, data["seconds"], data["peak_rss_mib"], tuple(data["totals"])
+    )
+
+
+def measure_best(name: str, path: Path, *, repeat: int) -> Measurement:
+    """Return the fastest of *repeat* runs of parser *name*."""
+    runs = [measure(name, path) for _ in range(max(repeat, 1))]
+    return min(runs, key=lambda result: result.seconds)
+
+
+def render_table(results: cabc.Sequence[Measurement], lines: int) -> str:
+    """Return a Markdown table of *results*."""
+    rows = [
+        f"Synthetic reports with {lines:,} lines each.",
+        "",
+        "| Parser | Time (s) | Peak RSS (MiB) | Lines covered/valid |",
+        "| --- | ---: | ---: | --- |",
+    ]
+    for result in results:
+        rss = "n/a" if result.peak_rss_mib is None else f"{result.peak_rss_mib:.1f}"
+        covered, valid = result.totals
+        rows.append(
+            f"| `{result.name}` | {result.seconds:.2f} | {rss} | {covered}/{valid} |"
+        )
+    return "\n".join(rows) + "\n"
+
+
+def _disagreements(results: cabc.Sequence[Measurement]) -> list[str]:
+    """Return the formats whose parsers reported different totals."""
+    seen: dict[str, set[tuple[int, int]]] = {}
+    for result in results:
+        seen.setdefault(_report_format(result.name), set()).add(result.totals)
+    return [fmt for fmt, totals in seen.items() if len(totals) > 1]
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+    """Benchmark the coverage parsers and check that they agree."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--only", choices=list(_PARSERS), action="append", default=[])
+    parser.add_argument("--measure", choices=list(_PARSERS), help=argparse.SUPPRESS)
+    parser.add_argument("fixture", nargs="?", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure is not None:
+        print(json.dumps(_measure_here(args.measure, args.fixture)))
+        return 0
+
+    names = args.only or list(_PARSERS)
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures = {
+            "cobertura": Path(tmp) / "coverage.xml",
+            "lcov": Path(tmp) / "lcov.info",
+        }
+        write_cobertura_fixture(fixtures["cobertura"], lines=args.lines)
+        write_lcov_fixture(fixtures["lcov"], lines=args.lines)
+        results = [
+            measure_best(name, fixtures[_report_format(name)], repeat=args.repeat)
+            for name in names
+        ]
+
+    table = render_table(results, args.lines)
+    print(table, end="")
+    if summary := os.environ.get("GITHUB_STEP_SUMMARY"):
+        with Path(summary).open("a", encoding="utf-8") as handle:
+            handle.write("### Coverage parser benchmark\n\n" + table + "\n")
+
+    mismatched = _disagreements(results)
+    for fmt in mismatched:
+        print(f"::error::{fmt} parsers disagree on the totals", file=sys.stderr)
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
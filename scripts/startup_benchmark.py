@@ -0,0 +1,318 @@
+#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.12"
+# dependencies = []
+# ///
+"""Measure cold-start import cost of the action entry points.
+
+Each entry point listed in ``startup_budgets.toml`` is launched in a fresh
+interpreter under ``-X importtime``. Scripts are invoked with ``--help`` so
+they import everything a real step would and then exit before doing any
+work; library modules are imported with ``-c "import <name>"``. The
+top-level cumulative import times are summed and compared with the entry's
+budget. Entries may also list ``forbidden`` packages that must stay deferred
+until first use. The command exits non-zero when any entry regresses past its
+budget, eagerly imports a forbidden package, or fails to start.
+
+Run it from the repository root with the development environment active::
+
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --json startup.json --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tomllib
+import typing as typ
+from pathlib import Path
+from types import MappingProxyType
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CONFIG = Path(__file__).resolve().with_name("startup_budgets.toml")
+IMPORTTIME_PREFIX = "import time:"
+
+
+class Entry(typ.NamedTuple):
+    """One entry point to benchmark."""
+
+    path: Path
+    budget_ms: float
+    module: str | None = None
+    args: tuple[str, ...] = ("--help",)
+    env: cabc.Mapping[str, str] = MappingProxyType({})
+    forbidden: tuple[str, ...] = ()
+
+
+class Measurement(typ.NamedTuple):
+    """The outcome of benchmarking one entry point."""
+
+    entry: Entry
+    import_ms: float
+    wall_ms: float
+    module_count: int
+    error: str | None = None
+    forbidden_loaded: tuple[str, ...] = ()
+
+    @property
+    def over_budget(self) -> bool:
+        """Return ``True`` when the entry failed or exceeded its budget."""
+        return (
+            self.error is not None
+            or bool(self.forbidden_loaded)
+            or self.import_ms > self.entry.budget_ms
+        )
+
+
+def load_entries(config: Path, *, root: Path = REPO_ROOT) -> list[Entry]:
+    """Return the entry points declared in *config*.
+
+    Parameters
+    ----------
+    config : Path
+        TOML file holding ``[[entry]]`` tables with ``path`` and ``budget_ms``
+        keys, plus optional ``module``, ``args``, ``env`` and ``forbidden``.
+    root : Path, optional
+        Directory that relative entry paths are resolved against.
+
+    Returns
+    -------
+    list[Entry]
+        The configured entries in file order.
+    """
+    with config.open("rb") as handle:
+        data = tomllib.load(handle)
+    entries: list[Entry] = []
+    for raw in data.get("entry", []):
+        args = raw.get("args", ["--help"])
+        entries.append(
+            Entry(
+                path=root / raw["path"],
+                budget_ms=float(raw["budget_ms"]),
+                module=raw.get("module"),
+                args=tuple(str(arg) for arg in args),
+                env={key: str(value) for key, value in raw.get("env", {}).items()},
+                forbidden=tuple(raw.get("forbidden", ())),
+            )
+        )
+    return entries
+
+
+def parse_importtime(stderr: str) -> tuple[float, list[str]]:
+    """Return total top-level import time in milliseconds and module names.
+
+    ``-X importtime`` writes one line per module in the form
+    ``import time: <self us> | <cumulative us> | <indent><name>``. Nested
+    imports are indented by two extra spaces per level, so only unindented
+    names contribute their cumulative time to the total.
+    """
+    total_us = 0
+    modules: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(IMPORTTIME_PREFIX) :].split("|", 2)
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        name = fields[2]
+        modules.append(name.strip())
+        if name.startswith(" ") and not name.startswith("  "):
+            total_us += int(fields[1])
+    return total_us / 1000, modules
+
+
+def _forbidden_loaded(entry: Entry, modules: cabc.Iterable[str]) -> tuple[str, ...]:
+    """Return the forbidden packages (or their submodules) that were imported."""
+    loaded = set(modules)
+    return tuple(
+        name
+        for name in entry.forbidden
+        if name in loaded or any(mod.startswith(f"{name}.") for mod in loaded)
+    )
+
+
+def _entry_env(entry: Entry, root: Path) -> dict[str, str]:
+    """Return the environment a step would give *entry*."""
+    env = dict(os.environ)
+    pythonpath = [str(root), str(entry.path.parent)]
+    if existing := env.get("PYTHONPATH"):
+        pythonpath.append(existing)
+    env["PYTHONPATH"] = os.pathsep.join(pythonpath)
+    # Actions import cmd_utils relative to their own directory.
+    action_dir = entry.path.parent
+    if action_dir.name in {"scripts", "src"}:
+        action_dir = action_dir.parent
+    env["GITHUB_ACTION_PATH"] = str(action_dir)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    env.update(entry.env)
+    return env
+
+
+def _entry_argv(entry: Entry, python: str) -> list[str]:
+    if entry.module is not None:
+        return [python, "-X", "importtime", "-c", f"import {entry.module}"]
+    return [python, "-X", "importtime", str(entry.path), *entry.args]
+
+
+def measure(
+    entry: Entry,
+    *,
+    python: str = sys.executable,
+    root: Path = REPO_ROOT,
+    timeout: float = 60,
+) -> Measurement:
+    """Cold-start *entry* once and return its import and wall-clock times."""
+    started = time.perf_counter()
+    proc = subprocess.Popen(  # noqa: S603 - argv built from trusted config
+        _entry_argv(entry, python),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=root,
+        env=_entry_env(entry, root),
+    )
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return Measurement(entry, 0.0, timeout * 1000, 0, "timed out")
+    wall_ms = (time.perf_counter() - started) * 1000
+    import_ms, modules = parse_importtime(stderr)
+    error = None
+    if proc.returncode != 0:
+        tail = [
+            line for line in stderr.splitlines() if not line.startswith("import time")
+        ]
+        detail = tail[-1] if tail else ""
+        error = f"exit {proc.returncode}: {detail}".rstrip(": ")
+    return Measurement(
+        entry,
+        import_ms,
+        wall_ms,
+        len(modules),
+        error,
+        _forbidden_loaded(entry, modules),
+    )
+
+
+def measure_best(
+    entry: Entry,
+    *,
+    repeat: int,
+    python: str = sys.executable,
+    root: Path = REPO_ROOT,
+) -> Measurement:
+    """Return the fastest of *repeat* cold starts to damp scheduler noise."""
+    best: Measurement | None = None
+    for _ in range(max(repeat, 1)):
+        result = measure(entry, python=python, root=root)
+        if result.error is not None or result.forbidden_loaded:
+            return result
+        if best is None or result.import_ms < best.import_ms:
+            best = result
+    assert best is not None  # noqa: S101 - repeat is at least one
+    return best
+
+
+def render_table(results: cabc.Sequence[Measurement], root: Path = REPO_ROOT) -> str:
+    """Return a Markdown table of *results*."""
+    lines = [
+        "| Entry point | Import (ms) | Budget (ms) | Wall (ms) | Modules | Status |",
+        "| --- | ---: | ---: | ---: | ---: | --- |",
+    ]
+    for result in results:
+        try:
+            label = result.entry.path.relative_to(root).as_posix()
+        except ValueError:
+            label = result.entry.path.as_posix()
+        if result.error is not None:
+            status = f"error ({result.error})"
+        elif result.forbidden_loaded:
+            status = "eager import of " + ", ".join(result.forbidden_loaded)
+        elif result.over_budget:
+            status = "over budget"
+        else:
+            status = "ok"
+        lines.append(
+            f"| `{label}` | {result.import_ms:.1f} | {result.entry.budget_ms:.0f} "
+            f"| {result.wall_ms:.1f} | {result.module_count} | {status} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _write_json(path: Path, results: cabc.Sequence[Measurement]) -> None:
+    records = [
+        {
+            "path": str(result.entry.path),
+            "import_ms": round(result.import_ms, 3),
+            "wall_ms": round(result.wall_ms, 3),
+            "modules": result.module_count,
+            "budget_ms": result.entry.budget_ms,
+            "error": result.error,
+            "forbidden_loaded": list(result.forbidden_loaded),
+        }
+        for result in results
+    ]
+    path.write_text(json.dumps(records, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+    """Benchmark every configured entry point and enforce the budgets."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, dest="json_path")
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="benchmark only entries whose path contains this substring",
+    )
+    args = parser.parse_args(argv)
+
+    entries = load_entries(args.config)
+    if args.only:
+        entries = [
+            entry
+            for entry in entries
+            if any(token in entry.path.as_posix() for token in args.only)
+        ]
+    results = [
+        measure_best(entry, repeat=args.repeat, python=args.python) for entry in entries
+    ]
+
+    table = render_table(results)
+    print(table, end="")
+    if summary := os.environ.get("GITHUB_STEP_SUMMARY"):
+        with Path(summary).open("a", encoding="utf-8") as handle:
+            handle.write("### Entry point start-up\n\n" + table + "\n")
+    if args.json_path is not None:
+        _write_json(args.json_path, results)
+
+    failures = [result for result in results if result.over_budget]
+    for result in failures:
+        if result.error is not None:
+            reason = result.error
+        elif result.forbidden_loaded:
+            reason = "eagerly imports " + ", ".join(result.forbidden_loaded)
+        else:
+            reason = (
+                f"{result.import_ms:.1f} ms exceeds budget of "
+                f"{result.entry.budget_ms:.0f} ms"
+            )
+        print(f"::error::{result.entry.path.name} start-up: {reason}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
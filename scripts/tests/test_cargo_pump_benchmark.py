@@ -0,0 +1,43 @@
+"""Tests for the cargo output pump benchmark."""
+
+from __future__ import annotations
+
+import importlib
+import shutil
+import typing as typ
+from pathlib import Path
+
+import pytest
+
+if typ.TYPE_CHECKING:
+    import types
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def bench(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Import the benchmark harness from the scripts directory."""
+    monkeypatch.syspath_prepend(str(SCRIPTS))
+    importlib.invalidate_caches()
+    return importlib.import_module("cargo_pump_benchmark")
+
+
+@pytest.mark.skipif(shutil.which("cargo") is None, reason="cargo not installed")
+def test_pumps_capture_every_stdout_line(
+    bench: types.ModuleType,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Both pumps capture all stdout lines and the table is written."""
+    summary = tmp_path / "summary.md"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+
+    assert bench.main(["--lines", "5000"]) == 0
+
+    out = capsys.readouterr().out
+    for name in ("readline-echo", "chunked"):
+        assert f"| `{name}` |" in out
+    assert out.count("| 4,500 |") == 2
+    assert "Cargo output pump benchmark" in summary.read_text(encoding="utf-8")
@@ -0,0 +1,56 @@
+"""Tests for the coverage parser benchmark."""
+
+from __future__ import annotations
+
+import importlib
+import typing as typ
+from pathlib import Path
+
+import pytest
+
+if typ.TYPE_CHECKING:
+    import types
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def bench(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Import the benchmark harness from the scripts directory."""
+    monkeypatch.syspath_prepend(str(SCRIPTS))
+    importlib.invalidate_caches()
+    return importlib.import_module("coverage_parsers_benchmark")
+
+
+def test_fixtures_have_requested_lines(bench: types.ModuleType, tmp_path: Path) -> None:
+    """The synthetic reports hold exactly the requested number of lines."""
+    cobertura = tmp_path / "coverage.xml"
+    lcov = tmp_path / "lcov.info"
+    bench.write_cobertura_fixture(cobertura, lines=2500, lines_per_class=1000)
+    bench.write_lcov_fixture(lcov, lines=2500, lines_per_file=1000)
+
+    text = cobertura.read_text(encoding="utf-8")
+    assert text.count("<line ") == 2500
+    assert text.count("<class ") == 3
+    records = lcov.read_text(encoding="utf-8")
+    assert records.count("\nDA:") == 2500
+    assert records.count("end_of_record") == 3
+
+
+def test_parsers_agree_on_small_fixture(
+    bench: types.ModuleType,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Parsers of each format report identical totals and the table is written."""
+    summary = tmp_path / "summary.md"
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+
+    assert bench.main(["--lines", "3000"]) == 0
+
+    out = capsys.readouterr().out
+    for name in ("cobertura-stream", "cobertura-dom", "lcov-mmap", "lcov-text"):
+        assert f"| `{name}` |" in out
+    assert out.count("2000/3000") == 4
+    assert "Coverage parser benchmark" in summary.read_text(encoding="utf-8")
@@ -0,0 +1,102 @@
+"""Tests for the entry point start-up benchmark."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import typing as typ
+from pathlib import Path
+
+import pytest
+
+if typ.TYPE_CHECKING:
+    import types
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | encodings
+import time:        50 |         50 |     encodings.aliases
+import time:      1000 |       1580 | json
+"""
+
+
+@pytest.fixture
+def bench(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Import the benchmark harness from the scripts directory."""
+    monkeypatch.syspath_prepend(str(SCRIPTS))
+    importlib.invalidate_caches()
+    return importlib.import_module("startup_benchmark")
+
+
+def _write_config(tmp_path: Path, body: str) -> Path:
+    script = tmp_path / "entry.py"
+    script.write_text("import json\nimport sys\nsys.exit(0)\n", encoding="utf-8")
+    config = tmp_path / "budgets.toml"
+    config.write_text(
+        f'[[entry]]\npath = "{script.as_posix()}"\n{body}', encoding="utf-8"
+    )
+    return config
+
+
+def test_parse_importtime_sums_top_level_cumulative(bench: types.ModuleType) -> None:
+    """Only unindented modules should contribute to the total."""
+    total_ms, modules = bench.parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert total_ms == pytest.approx(2.0)
+    assert modules == ["_io", "encodings", "encodings.aliases", "json"]
+
+
+def test_default_config_entries_exist(bench: types.ModuleType) -> None:
+    """Every configured entry point should exist in the tree."""
+    entries = bench.load_entries(bench.DEFAULT_CONFIG)
+
+    assert entries
+    missing = [entry.path for entry in entries if not entry.path.is_file()]
+    assert missing == []
+
+
+def test_main_passes_within_budget(
+    bench: types.ModuleType, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Entries under budget should pass and be recorded in the JSON report."""
+    config = _write_config(tmp_path, "budget_ms = 100000\n")
+    report = tmp_path / "report.json"
+
+    status = bench.main(
+        ["--config", str(config), "--repeat", "1", "--json", str(report)]
+    )
+
+    assert status == 0
+    assert "| ok |" in capsys.readouterr().out
+    (record,) = json.loads(report.read_text(encoding="utf-8"))
+    assert record["modules"] > 0
+    assert record["error"] is None
+
+
+def test_main_fails_on_forbidden_import(
+    bench: types.ModuleType, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Eagerly importing a forbidden package should fail the run."""
+    config = _write_config(tmp_path, 'budget_ms = 100000\nforbidden = ["json"]\n')
+
+    status = bench.main(["--config", str(config), "--repeat", "1"])
+
+    assert status == 1
+    captured = capsys.readouterr()
+    assert "eager import of json" in captured.out
+    assert "eagerly imports json" in captured.err
+
+
+def test_main_fails_over_budget(
+    bench: types.ModuleType, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A zero budget cannot be met and should fail the run."""
+    config = _write_config(tmp_path, "budget_ms = 0\n")
+
+    status = bench.main(["--config", str(config), "--repeat", "1"])
+
+    assert status == 1
+    assert "exceeds budget" in capsys.readouterr().err
@@ -6,12 +6,15 @@ from pathlib import Path
 
 import pytest
 
+import cargo_utils
 from cargo_utils import (
     ManifestError,
+    ManifestIndex,
     find_workspace_root,
     get_bin_name,
     get_package_field,
     get_workspace_version,
+    iter_member_versions,
     read_manifest,
     resolve_version,
 )
@@ -348,3 +351,288 @@ members = ["member"]
 
         with pytest.raises(ManifestError, match=r"package\.version is missing"):
             resolve_version(manifest, manifest_path)
+
+
+def _write_workspace(root: Path) -> tuple[Path, Path, Path]:
+    """Create a two-member workspace with inherited package metadata."""
+    root_manifest = root / "Cargo.toml"
+    root_manifest.write_text(
+        """\
+[workspace]
+members = ["crates/*"]
+exclude = ["crates/scratch"]
+
+[workspace.package]
+version = "4.5.6"
+license = "ISC"
+rust-version = "1.80"
+""",
+        encoding="utf-8",
+    )
+    manifests = []
+    for name, body in (
+        ("core", "version.workspace = true\nlicense.workspace = true\n"),
+        ("cli", 'version = "0.1.0"\nrust-version.workspace = true\n'),
+        ("scratch", 'version = "9.9.9"\n'),
+    ):
+        crate = root / "crates" / name
+        crate.mkdir(parents=True)
+        manifest = crate / "Cargo.toml"
+        manifest.write_text(f'[package]\nname = "{name}"\n{body}', encoding="utf-8")
+        manifests.append(manifest)
+    return root_manifest, manifests[0], manifests[1]
+
+
+class TestManifestIndex:
+    """Tests for :class:`ManifestIndex`."""
+
+    def test_parses_each_manifest_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated queries should reuse the parsed manifests."""
+        _, core, cli = _write_workspace(tmp_path)
+        index = ManifestIndex()
+        parsed: list[Path] = []
+        original = cargo_utils.read_manifest
+
+        def counting(path: Path) -> dict[str, object]:
+            parsed.append(path)
+            return original(path)
+
+        monkeypatch.setattr(cargo_utils, "read_manifest", counting)
+
+        for _ in range(3):
+            assert index.resolve_version(core) == "4.5.6"
+            assert index.resolve_version(cli) == "0.1.0"
+
+        assert sorted(p.name for p in parsed) == ["Cargo.toml"] * 3
+
+    def test_reparses_modified_manifest(self, tmp_path: Path) -> None:
+        """A manifest whose size or mtime changes should be read again."""
+        root_manifest, core, _ = _write_workspace(tmp_path)
+        index = ManifestIndex()
+        assert index.resolve_version(core) == "4.5.6"
+
+        root_manifest.write_text(
+            '[workspace]\nmembers = ["crates/*"]\n\n'
+            '[workspace.package]\nversion = "10.0.0"\n',
+            encoding="utf-8",
+        )
+
+        assert index.resolve_version(core) == "10.0.0"
+
+    def test_members_expand_globs_and_honour_exclude(self, tmp_path: Path) -> None:
+        """Members should come from globs with excluded crates dropped."""
+        root_manifest, core, cli = _write_workspace(tmp_path)
+
+        members = ManifestIndex().members(root_manifest)
+
+        assert sorted(members) == sorted([core, cli])
+
+    def test_resolves_any_inherited_field(self, tmp_path: Path) -> None:
+        """Non-version fields should honour ``workspace = true`` too."""
+        _, core, cli = _write_workspace(tmp_path)
+        index = ManifestIndex()
+
+        assert index.resolve_field(core, "license") == "ISC"
+        assert index.resolve_field(cli, "rust-version") == "1.80"
+        assert index.resolve_field(cli, "license") is None
+
+    def test_missing_inherited_field_raises(self, tmp_path: Path) -> None:
+        """Inheriting a field the workspace lacks should raise ManifestError."""
+        _, core, _ = _write_workspace(tmp_path)
+        core.write_text(
+            '[package]\nname = "core"\nedition.workspace = true\n',
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ManifestError, match=r"\[workspace.package\]\.edition"):
+            ManifestIndex().resolve_field(core, "edition")
+
+    def test_snapshot_round_trip_skips_parsing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A saved snapshot should let a new index start warm."""
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        root_manifest, core, _ = _write_workspace(workspace)
+        snapshot = tmp_path / "snapshot.json"
+        first = ManifestIndex(snapshot=snapshot)
+        first.members(root_manifest)
+        first.resolve_version(core)
+        assert first.save() == snapshot
+
+        def fail(path: Path) -> dict[str, object]:
+            pytest.fail(f"unexpected parse of {path}")
+
+        monkeypatch.setattr(cargo_utils, "read_manifest", fail)
+
+        assert ManifestIndex(snapshot=snapshot).resolve_version(core) == "4.5.6"
+
+    def test_iter_member_versions(self, tmp_path: Path) -> None:
+        """Every member should be reported with its resolved version."""
+        root_manifest, core, cli = _write_workspace(tmp_path)
+
+        versions = dict(iter_member_versions(root_manifest, ManifestIndex()))
+
+        assert versions == {core: "4.5.6", cli: "0.1.0"}
+
+
+def _cargo_payload(root: Path, *members: tuple[str, str, list[str]]) -> dict:
+    """Return a minimal ``cargo metadata`` document for *members*."""
+    packages = []
+    for name, version, bins in members:
+        crate = root / "crates" / name
+        packages.append(
+            {
+                "id": f"{name} {version}",
+                "name": name,
+                "version": version,
+                "description": f"  {name} crate  ",
+                "manifest_path": str(crate / "Cargo.toml"),
+                "targets": [
+                    {"name": bin_name, "kind": ["bin"], "src_path": "src/main.rs"}
+                    for bin_name in bins
+                ]
+                + [{"name": "cucumber", "kind": ["test"], "src_path": "t.rs"}],
+            }
+        )
+    return {
+        "packages": packages,
+        "workspace_members": [package["id"] for package in packages],
+        "workspace_root": str(root),
+    }
+
+
+class TestWorkspaceMetadata:
+    """Tests for the ``cargo metadata`` resolver."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cargo_utils, "_METADATA_MEMO", {})
+        monkeypatch.delenv(cargo_utils.METADATA_CACHE_ENV_VAR, raising=False)
+
+    def _fake_cargo(
+        self, monkeypatch: pytest.MonkeyPatch, payload: dict | None
+    ) -> list[Path]:
+        calls: list[Path] = []
+
+        def fake(root_manifest: Path) -> dict | None:
+            calls.append(root_manifest)
+            return payload
+
+        monkeypatch.setattr(cargo_utils, "_run_cargo_metadata", fake)
+        return calls
+
+    def test_builds_model_from_cargo_output(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Members should expose names, versions, bins and targets."""
+        root_manifest, core, cli = _write_workspace(tmp_path)
+        payload = _cargo_payload(
+            tmp_path, ("core", "4.5.6", []), ("cli", "0.1.0", ["x"])
+        )
+        calls = self._fake_cargo(monkeypatch, payload)
+
+        model = cargo_utils.load_workspace_metadata(cli, index=ManifestIndex())
+
+        assert model is not None
+        assert calls == [root_manifest]
+        package = model.package(cli)
+        assert package is not None
+        assert (package.name, package.version, package.bin_names) == (
+            "cli",
+            "0.1.0",
+            ("x",),
+        )
+        assert package.description == "cli crate"
+        assert package.has_target("cucumber", "test")
+        assert model.by_name("core") == model.package(core)
+
+    def test_memoizes_until_lockfile_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cargo should only run again when the cache key changes."""
+        _, core, cli = _write_workspace(tmp_path)
+        calls = self._fake_cargo(
+            monkeypatch, _cargo_payload(tmp_path, ("core", "4.5.6", []))
+        )
+        index = ManifestIndex()
+
+        cargo_utils.load_workspace_metadata(core, index=index)
+        cargo_utils.load_workspace_metadata(cli, index=index)
+        assert len(calls) == 1
+
+        (tmp_path / "Cargo.lock").write_text("version = 4\n", encoding="utf-8")
+        cargo_utils.load_workspace_metadata(core, index=index)
+        assert len(calls) == 2
+
+    def test_disk_cache_is_shared_between_processes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fresh process should reuse the cached cargo output."""
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        _, core, _ = _write_workspace(workspace)
+        cache_dir = tmp_path / "cache"
+        calls = self._fake_cargo(
+            monkeypatch, _cargo_payload(workspace, ("core", "4.5.6", []))
+        )
+
+        cargo_utils.load_workspace_metadata(core, cache_dir=cache_dir)
+        monkeypatch.setattr(cargo_utils, "_METADATA_MEMO", {})
+        model = cargo_utils.load_workspace_metadata(core, cache_dir=cache_dir)
+
+        assert len(calls) == 1
+        assert model is not None
+        assert model.package(core) is not None
+
+    def test_returns_none_without_cargo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing cargo should leave callers on the TOML path."""
+        _, core, _ = _write_workspace(tmp_path)
+        monkeypatch.setattr(cargo_utils.shutil, "which", lambda _name: None)
+        monkeypatch.setenv(cargo_utils.RESOLVER_ENV_VAR, "metadata")
+
+        assert cargo_utils.load_workspace_metadata(core) is None
+        assert cargo_utils.metadata_package(core) is None
+
+    def test_metadata_package_requires_metadata_mode(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The TOML resolver stays the default."""
+        _, core, _ = _write_workspace(tmp_path)
+        calls = self._fake_cargo(
+            monkeypatch, _cargo_payload(tmp_path, ("core", "4.5.6", []))
+        )
+        monkeypatch.delenv(cargo_utils.RESOLVER_ENV_VAR, raising=False)
+
+        assert cargo_utils.metadata_package(core) is None
+        assert calls == []
+
+        monkeypatch.setenv(cargo_utils.RESOLVER_ENV_VAR, "metadata")
+        resolved = cargo_utils.metadata_package(core)
+        assert resolved is not None
+        assert resolved.version == "4.5.6"
+
+    @pytest.mark.skipif(
+        cargo_utils.shutil.which("cargo") is None, reason="cargo not installed"
+    )
+    def test_real_cargo_metadata(self, tmp_path: Path) -> None:
+        """The real cargo view should agree with the TOML resolver."""
+        _, core, cli = _write_workspace(tmp_path)
+        for manifest in (core, cli, tmp_path / "crates" / "scratch" / "Cargo.toml"):
+            (manifest.parent / "src").mkdir()
+            (manifest.parent / "src" / "main.rs").write_text(
+                "fn main() {}\n", encoding="utf-8"
+            )
+
+        model = cargo_utils.load_workspace_metadata(core, index=ManifestIndex())
+
+        assert model is not None
+        assert sorted(p.name for p in model.packages.values()) == ["cli", "core"]
+        resolved = model.package(core)
+        assert resolved is not None
+        assert resolved.version == "4.5.6"
+        assert resolved.bin_names == ("core",)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import sys
+import time
 import typing as typ
 
 import pytest
@@ -13,21 +16,44 @@ from plumbum.commands.processes import ProcessExecutionError, ProcessTimedOut
 from cmd_utils_importer import import_cmd_utils
 
 if typ.TYPE_CHECKING:
+    from pathlib import Path
+
     from cmd_utils import (
         RunMethod as _RunMethod,
     )
     from cmd_utils import (
         RunResult as _RunResult,
     )
+    from cmd_utils import (
+        StreamResult as _StreamResult,
+    )
     from cmd_utils import (
         coerce_run_result as _coerce_run_result,
     )
+    from cmd_utils import (
+        invalidate_cache as _invalidate_cache,
+    )
+    from cmd_utils import (
+        load_trace as _load_trace,
+    )
     from cmd_utils import (
         process_error_to_run_result as _process_error_to_run_result,
     )
+    from cmd_utils import (
+        run_cached as _run_cached,
+    )
     from cmd_utils import (
         run_cmd as _run_cmd,
     )
+    from cmd_utils import (
+        run_cmd_async as _run_cmd_async,
+    )
+    from cmd_utils import (
+        run_many as _run_many,
+    )
+    from cmd_utils import (
+        write_trace_summary as _write_trace_summary,
+    )
 
 _cmd_utils = import_cmd_utils()
 run_cmd = typ.cast("_run_cmd", _cmd_utils.run_cmd)
@@ -35,7 +61,14 @@ coerce_run_result = typ.cast("_coerce_run_result", _cmd_utils.coerce_run_result)
 process_error_to_run_result = typ.cast(
     "_process_error_to_run_result", _cmd_utils.process_error_to_run_result
 )
+run_cmd_async = typ.cast("_run_cmd_async", _cmd_utils.run_cmd_async)
+run_many = typ.cast("_run_many", _cmd_utils.run_many)
+load_trace = typ.cast("_load_trace", _cmd_utils.load_trace)
+run_cached = typ.cast("_run_cached", _cmd_utils.run_cached)
+invalidate_cache = typ.cast("_invalidate_cache", _cmd_utils.invalidate_cache)
+write_trace_summary = typ.cast("_write_trace_summary", _cmd_utils.write_trace_summary)
 RunResult = typ.cast("type[_RunResult]", _cmd_utils.RunResult)
+StreamResult = typ.cast("type[_StreamResult]", _cmd_utils.StreamResult)
 RunMethod = typ.cast("_RunMethod", _cmd_utils.RunMethod)
 _ensure_text = typ.cast(
     "typ.Callable[[str | bytes | None], str]", _cmd_utils._ensure_text
@@ -72,7 +105,9 @@ def test_run_cmd_returns_stdout_by_default(capsys: pytest.CaptureFixture[str]) -
     assert "$ " in echoed.out
 
 
-@pytest.mark.parametrize("method", ["call", "run", "run_fg"], ids=lambda value: value)
+@pytest.mark.parametrize(
+    "method", ["call", "run", "run_fg", "stream"], ids=lambda value: value
+)
 def test_run_cmd_rejects_non_plumbum_inputs(method: RunMethod) -> None:
     """Passing non-plumbum objects should raise :class:`TypeError`."""
     with pytest.raises(TypeError, match="plumbum command"):
@@ -218,3 +253,380 @@ def test_run_cmd_rejects_unknown_method() -> None:
 
     with pytest.raises(ValueError, match="Unknown run method"):
         run_cmd(command, method=typ.cast("RunMethod", "unknown"))
+
+
+def test_run_cmd_async_returns_stdout_by_default(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """run_cmd_async should mirror run_cmd's echo and call semantics."""
+    script = "import sys; sys.stdout.write('async')"
+
+    result = asyncio.run(run_cmd_async(_python_command("-c", script)))
+
+    assert result == "async"
+    assert "$ " in capsys.readouterr().out
+
+
+def test_run_cmd_async_run_method_returns_run_result() -> None:
+    """The run method should report failures without raising."""
+    script = "import sys; sys.stderr.write('oops'); sys.exit(4)"
+
+    result = asyncio.run(run_cmd_async(_python_command("-c", script), method="run"))
+
+    assert result == RunResult(4, "", "oops")
+
+
+def test_run_cmd_async_call_raises_process_execution_error() -> None:
+    """Non-zero exits should raise under the call method."""
+    script = "import sys; sys.stderr.write('diagnostic'); sys.exit(6)"
+
+    with pytest.raises(ProcessExecutionError) as excinfo:
+        asyncio.run(run_cmd_async(_python_command("-c", script)))
+
+    assert excinfo.value.retcode == 6
+    assert "diagnostic" in (excinfo.value.stderr or "")
+
+
+def test_run_cmd_async_honours_timeout() -> None:
+    """Commands exceeding the timeout should be killed and reported."""
+    command = _python_command("-c", "import time; time.sleep(10)")
+
+    with pytest.raises(ProcessTimedOut):
+        asyncio.run(run_cmd_async(command, method="run", timeout=0.2))
+
+
+def test_run_cmd_async_applies_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Runtime and explicit environment overlays should match run_cmd."""
+    monkeypatch.setenv("CMD_UTILS_TOKEN", "runtime")
+    script = "import os; import sys; sys.stdout.write(os.environ['CMD_UTILS_TOKEN'])"
+    command = _python_command("-c", script)
+
+    assert asyncio.run(run_cmd_async(command)) == "runtime"
+    overridden = asyncio.run(
+        run_cmd_async(command, env={"CMD_UTILS_TOKEN": "override"})
+    )
+    assert overridden == "override"
+
+
+def test_run_cmd_async_rejects_foreground_method() -> None:
+    """Foreground execution cannot be buffered and should be rejected."""
+    command = _python_command("-c", "print('noop')")
+
+    with pytest.raises(ValueError, match="Unknown run method"):
+        asyncio.run(run_cmd_async(command, method=typ.cast("typ.Any", "run_fg")))
+
+
+def test_run_many_preserves_input_order() -> None:
+    """Results should be returned in the order the commands were given."""
+    commands = [
+        _python_command(
+            "-c", f"import sys, time; time.sleep({delay}); sys.stdout.write('{tag}')"
+        )
+        for tag, delay in (("slow", 0.3), ("fast", 0.0))
+    ]
+
+    assert run_many(commands) == ["slow", "fast"]
+
+
+def test_run_many_runs_commands_concurrently() -> None:
+    """Independent commands should overlap rather than run back to back."""
+    commands = [_python_command("-c", "import time; time.sleep(0.5)")] * 4
+
+    started = time.monotonic()
+    results = run_many(commands, method="run", max_concurrency=4)
+    elapsed = time.monotonic() - started
+
+    assert [typ.cast("_RunResult", r).returncode for r in results] == [0] * 4
+    assert elapsed < 1.9
+
+
+def test_run_many_propagates_first_failure() -> None:
+    """A failing command under the call method should raise its error."""
+    commands = [
+        _python_command("-c", "import sys; sys.exit(2)"),
+        _python_command("-c", "import time; time.sleep(10)"),
+    ]
+
+    started = time.monotonic()
+    with pytest.raises(ProcessExecutionError) as excinfo:
+        run_many(commands, max_concurrency=2)
+
+    assert excinfo.value.retcode == 2
+    assert time.monotonic() - started < 5
+
+
+def test_run_many_rejects_non_positive_concurrency() -> None:
+    """A concurrency limit below one is a configuration error."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        run_many([_python_command("-c", "pass")], max_concurrency=0)
+
+
+def test_run_cmd_is_untraced_without_env(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """No trace file should be written unless tracing is enabled."""
+    monkeypatch.delenv("CMD_UTILS_TRACE", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    run_cmd(_python_command("-c", "pass"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_cmd_records_trace(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Each invocation should append a JSONL record when tracing is enabled."""
+    trace = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("CMD_UTILS_TRACE", str(trace))
+    script = "import sys; sys.stdout.write('abc'); sys.stderr.write('de')"
+
+    run_cmd(_python_command("-c", script), method="run")
+    with pytest.raises(ProcessExecutionError):
+        run_cmd(_python_command("-c", "import sys; sys.exit(3)"))
+
+    first, second = (json.loads(line) for line in trace.read_text().splitlines())
+    assert first["argv"] == [sys.executable, "-c", script]
+    assert first["method"] == "run"
+    assert first["returncode"] == 0
+    assert (first["stdout_bytes"], first["stderr_bytes"]) == (3, 2)
+    assert first["end"] >= first["start"]
+    assert first["duration"] >= 0
+    assert second["method"] == "call"
+    assert second["returncode"] == 3
+    if sys.platform != "win32":
+        assert first["peak_child_rss_bytes"] > 0
+
+
+def test_trace_span_records_error_without_retcode(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A failure whose exit code plumbum could not read records ``None``."""
+    trace = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("CMD_UTILS_TRACE", str(trace))
+    span = _cmd_utils._TraceSpan.begin(_python_command("-c", "pass"), "call")
+    assert span is not None
+
+    span.finish_with_error(ProcessExecutionError(["python"], None, "", "boom"))
+
+    (record,) = load_trace(trace)
+    assert record["returncode"] is None
+    assert record["stderr_bytes"] == 4
+
+
+def test_run_cmd_async_records_trace(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Concurrent invocations should each contribute one trace record."""
+    trace = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("CMD_UTILS_TRACE", str(trace))
+
+    run_many([_python_command("-c", "print('x')")] * 3, max_concurrency=3)
+
+    records = load_trace(trace)
+    assert len(records) == 3
+    assert {record["stdout_bytes"] for record in records} == {len("x" + os.linesep)}
+
+
+def test_write_trace_summary_orders_slowest_first(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The rendered table should list the slowest commands first."""
+    trace = tmp_path / "trace.jsonl"
+    summary = tmp_path / "summary.md"
+    records = [
+        {"argv": ["fast"], "method": "call", "duration": 0.1, "returncode": 0},
+        {"argv": ["slow", "a|b"], "method": "run", "duration": 2.5, "returncode": 1},
+    ]
+    trace.write_text("".join(json.dumps(r) + "\n" for r in records) + "garbage\n")
+    monkeypatch.setenv("CMD_UTILS_TRACE", str(trace))
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+
+    assert write_trace_summary(limit=5) is True
+
+    content = summary.read_text()
+    assert "2 commands traced, 2.60s in total." in content
+    assert content.index("`slow") < content.index("`fast`")
+    assert "'a\\|b'" in content
+
+
+def test_write_trace_summary_skips_without_trace(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Rendering should be a no-op when tracing is disabled."""
+    monkeypatch.delenv("CMD_UTILS_TRACE", raising=False)
+    summary = tmp_path / "summary.md"
+
+    assert write_trace_summary(summary_path=summary) is False
+    assert not summary.exists()
+
+
+def test_run_cmd_stream_tees_output_and_keeps_bounded_tail(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Streaming should echo every line but retain only the configured tail."""
+    script = (
+        "import sys\n"
+        "for i in range(1000): print(f'line {i}')\n"
+        "print('TOTAL 87.50%')\n"
+        "sys.stderr.write('warn\\n')\n"
+        "sys.exit(2)"
+    )
+
+    result = run_cmd(
+        _python_command("-c", script),
+        method="stream",
+        tail_lines=3,
+        patterns=[r"^TOTAL", r"^line 50$"],
+    )
+
+    assert isinstance(result, StreamResult)
+    assert result.returncode == 2
+    assert result.stdout_tail == ("line 998", "line 999", "TOTAL 87.50%")
+    assert result.stderr_tail == ("warn",)
+    assert result.matches == ("line 50", "TOTAL 87.50%")
+    captured = capsys.readouterr()
+    assert "line 0\n" in captured.out
+    assert "TOTAL 87.50%" in captured.out
+    assert "warn" in captured.err
+
+
+def test_run_cmd_stream_honours_timeout() -> None:
+    """Streaming commands exceeding the timeout should be killed."""
+    command = _python_command("-c", "import time; time.sleep(10)")
+
+    with pytest.raises(ProcessTimedOut):
+        run_cmd(command, method="stream", timeout=0.2)
+
+
+def test_run_cmd_stream_rejects_unknown_options() -> None:
+    """Unsupported keyword arguments should be reported, not ignored."""
+    command = _python_command("-c", "pass")
+
+    with pytest.raises(TypeError, match="retcode"):
+        run_cmd(command, method="stream", retcode=None)
+
+
+_COUNTING_SCRIPT = (
+    "import os, pathlib, sys\n"
+    "counter = pathlib.Path(sys.argv[1])\n"
+    "count = int(counter.read_text()) + 1 if counter.exists() else 1\n"
+    "counter.write_text(str(count))\n"
+    "sys.stdout.write(os.environ.get('RUSTUP_TOOLCHAIN', 'none'))\n"
+    "sys.exit(int(sys.argv[2]))"
+)
+
+
+def _counting_command(counter: Path, exit_code: int = 0) -> object:
+    return _python_command("-c", _COUNTING_SCRIPT, str(counter), str(exit_code))
+
+
+def _invocations(counter: Path) -> int:
+    return int(counter.read_text()) if counter.exists() else 0
+
+
+@pytest.fixture
+def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Enable the command cache in a temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("CMD_UTILS_CACHE_DIR", str(directory))
+    monkeypatch.delenv("RUSTUP_TOOLCHAIN", raising=False)
+    return directory
+
+
+def test_run_cached_without_cache_dir_always_runs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Caching is opt-in; without a cache directory every call executes."""
+    monkeypatch.delenv("CMD_UTILS_CACHE_DIR", raising=False)
+    counter = tmp_path / "count"
+
+    run_cached(_counting_command(counter))
+    run_cached(_counting_command(counter))
+
+    assert _invocations(counter) == 2
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_run_cached_reuses_successful_results(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A repeated pure command should be served from the cache."""
+    counter = tmp_path / "count"
+
+    first = run_cached(_counting_command(counter))
+    second = run_cached(_counting_command(counter))
+
+    assert first == second == RunResult(0, "none", "")
+    assert _invocations(counter) == 1
+    assert "(cached)" in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_run_cached_keys_on_whitelisted_environment(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Whitelisted variables form part of the key; others do not."""
+    counter = tmp_path / "count"
+
+    run_cached(_counting_command(counter))
+    monkeypatch.setenv("UNRELATED_VARIABLE", "changed")
+    run_cached(_counting_command(counter))
+    assert _invocations(counter) == 1
+
+    result = run_cached(_counting_command(counter), env={"RUSTUP_TOOLCHAIN": "beta"})
+    assert result.stdout == "beta"
+    assert _invocations(counter) == 2
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_run_cached_skips_failures(tmp_path: Path) -> None:
+    """Failed probes should be retried rather than cached."""
+    counter = tmp_path / "count"
+
+    run_cached(_counting_command(counter, exit_code=1))
+    result = run_cached(_counting_command(counter, exit_code=1))
+
+    assert result.returncode == 1
+    assert _invocations(counter) == 2
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_run_cached_honours_ttl(tmp_path: Path) -> None:
+    """Entries older than the TTL should be refreshed."""
+    counter = tmp_path / "count"
+
+    run_cached(_counting_command(counter))
+    run_cached(_counting_command(counter), ttl=0)
+
+    assert _invocations(counter) == 2
+
+
+def test_invalidate_cache_filters_by_tag(cache_dir: Path, tmp_path: Path) -> None:
+    """Explicit invalidation should remove only the tagged entries."""
+    counter = tmp_path / "count"
+    run_cached(_counting_command(counter), tags=("probe",))
+
+    assert invalidate_cache("unrelated") == 0
+    assert invalidate_cache("probe") == 1
+    assert list(cache_dir.glob("*.json")) == []
+
+
+def test_mutating_command_invalidates_related_entries(
+    cache_dir: Path, tmp_path: Path
+) -> None:
+    """Known state-mutating subcommands should drop the executable's entries."""
+    if sys.platform == "win32":  # pragma: no cover - POSIX shell shim
+        pytest.skip("requires a POSIX shell")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    rustup = bin_dir / "rustup"
+    rustup.write_text('#!/bin/sh\necho "$@"\n', encoding="utf-8")
+    rustup.chmod(0o755)
+
+    run_cached(local[str(rustup)]["toolchain", "list"])
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    run_cmd(local[str(rustup)]["target", "list"])
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    run_cmd(local[str(rustup)]["target", "add", "wasm32-unknown-unknown"])
+    assert list(cache_dir.glob("*.json")) == []
@@ -0,0 +1,147 @@
+"""Tests for :mod:`fingerprint`."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import typing as typ
+
+import pytest
+
+import fingerprint
+
+if typ.TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is required for source digests"
+)
+
+_LOCK = """\
+# This file is automatically @generated by Cargo.
+version = 4
+
+[[package]]
+name = "demo"
+version = "0.1.0"
+"""
+
+
+def _git(repo: Path, *args: str) -> None:
+    git = shutil.which("git")
+    assert git is not None
+    proc = subprocess.Popen(  # noqa: S603 - test helper with fixed argv
+        [git, "-C", str(repo), *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.wait() == 0
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Return a committed git repository with sources, docs and a lockfile."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "lib.rs").write_text("pub fn a() {}\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# demo\n", encoding="utf-8")
+    (tmp_path / "Cargo.lock").write_text(_LOCK, encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(
+        tmp_path,
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t@example.com",
+        "commit",
+        "-q",
+        "-m",
+        "init",
+    )
+    return tmp_path
+
+
+def test_lockfile_digest_ignores_comments_and_layout(tmp_path: Path) -> None:
+    """Reformatting a lockfile should not change its digest."""
+    first = tmp_path / "a" / "Cargo.lock"
+    second = tmp_path / "b" / "Cargo.lock"
+    first.parent.mkdir()
+    second.parent.mkdir()
+    first.write_text(_LOCK, encoding="utf-8")
+    second.write_text(
+        'version   = 4\r\n[[package]]\r\nversion = "0.1.0"\r\nname = "demo"\r\n',
+        encoding="utf-8",
+    )
+
+    assert fingerprint.lockfile_digest([first]) == fingerprint.lockfile_digest([second])
+    second.write_text(_LOCK.replace("0.1.0", "0.2.0"), encoding="utf-8")
+    assert fingerprint.lockfile_digest([first]) != fingerprint.lockfile_digest([second])
+
+
+def test_lockfile_digest_marks_missing_files(tmp_path: Path) -> None:
+    """Adding a lockfile should change the digest."""
+    lock = tmp_path / "uv.lock"
+    before = fingerprint.lockfile_digest([lock])
+    lock.write_text("version = 1\n", encoding="utf-8")
+
+    assert fingerprint.lockfile_digest([lock]) != before
+
+
+def test_source_digest_honours_pathspecs(repo: Path) -> None:
+    """Excluded files should not affect the key."""
+    digest, count = fingerprint.source_tree_digest(repo, exclude=["*.md"])
+    assert count == 2
+
+    (repo / "README.md").write_text("# changed\n", encoding="utf-8")
+    assert fingerprint.source_tree_digest(repo, exclude=["*.md"]) == (digest, count)
+    (repo / "docs").mkdir()
+    (repo / "docs" / "guide.md").write_text("# guide\n", encoding="utf-8")
+    _git(repo, "add", "docs")
+    assert fingerprint.source_tree_digest(repo, exclude=["*.md"]) == (digest, count)
+    only_src, src_count = fingerprint.source_tree_digest(repo, include=["src/**"])
+    assert src_count == 1
+    assert only_src != digest
+
+
+def test_source_digest_tracks_unstaged_edits(repo: Path) -> None:
+    """Work tree edits and deletions should change the digest."""
+    clean, _ = fingerprint.source_tree_digest(repo)
+
+    (repo / "src" / "lib.rs").write_text("pub fn b() {}\n", encoding="utf-8")
+    edited, _ = fingerprint.source_tree_digest(repo)
+    assert edited != clean
+
+    (repo / "src" / "lib.rs").write_text("pub fn a() {}\n", encoding="utf-8")
+    assert fingerprint.source_tree_digest(repo)[0] == clean
+
+    (repo / "README.md").unlink()
+    removed, count = fingerprint.source_tree_digest(repo)
+    assert removed != clean
+    assert count == 2
+
+
+def test_source_digest_requires_work_tree(tmp_path: Path) -> None:
+    """Fingerprinting outside a repository should raise a clear error."""
+    with pytest.raises(fingerprint.FingerprintError, match="ls-files"):
+        fingerprint.source_tree_digest(tmp_path)
+
+
+def test_main_writes_github_output(
+    repo: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The CLI should print the key and export it as a step output."""
+    output = tmp_path / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+
+    status = fingerprint.main(
+        ["--root", str(repo), "--salt", "linux", "--output-name", "key"]
+    )
+
+    assert status == 0
+    key = capsys.readouterr().out.strip()
+    assert output.read_text(encoding="utf-8") == f"key={key}\n"
+    assert key == fingerprint.compute_fingerprint(repo, salt="linux").key
+    assert key != fingerprint.compute_fingerprint(repo, salt="macos").key
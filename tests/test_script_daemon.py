@@ -0,0 +1,275 @@
+"""Tests for :mod:`script_daemon`."""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as typ
+from pathlib import Path
+
+import pytest
+
+import script_daemon
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+pytestmark = pytest.mark.skipif(
+    not script_daemon._supports_daemon(),
+    reason="the script worker requires Unix sockets and fork",
+)
+
+_SCRIPT = """\
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [{deps}]
+# ///
+import os
+import pathlib
+import sys
+
+print("argv", sys.argv[1:])
+print("cwd", pathlib.Path.cwd().name)
+print("token", os.environ.get("DAEMON_TOKEN"))
+sys.stderr.write("to-stderr\\n")
+sys.exit(int(sys.argv[1]))
+"""
+
+
+def _write_script(directory: Path, deps: str = '"pytest"') -> Path:
+    script = directory / "probe.py"
+    script.write_text(_SCRIPT.format(deps=deps), encoding="utf-8")
+    return script
+
+
+@pytest.fixture
+def socket_path() -> cabc.Iterator[Path]:
+    """Return a short socket path (AF_UNIX paths are length-limited)."""
+    with tempfile.TemporaryDirectory(prefix="sad") as directory:
+        yield Path(directory) / "worker.sock"
+
+
+@pytest.fixture
+def worker(socket_path: Path) -> cabc.Iterator[Path]:
+    """Run a worker in the foreground of a child interpreter."""
+    proc = subprocess.Popen(  # noqa: S603 - test harness
+        [
+            sys.executable,
+            script_daemon.__file__,
+            "serve",
+            "--socket",
+            str(socket_path),
+            "--idle-timeout",
+            "60",
+        ],
+    )
+    deadline = time.monotonic() + 30
+    while not socket_path.exists():
+        if time.monotonic() > deadline or proc.poll() is not None:
+            proc.kill()
+            pytest.fail("script worker did not start")
+        time.sleep(0.05)
+    try:
+        yield socket_path
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_script_requirements_reads_pep723_block(tmp_path: Path) -> None:
+    """Requirement strings should be returned with their specifiers intact."""
+    script = _write_script(tmp_path, '"plumbum>=1.8", "typer[all]", "lxml"')
+
+    assert script_daemon.script_requirements(script) == [
+        "plumbum>=1.8",
+        "typer[all]",
+        "lxml",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("deps", "expected"),
+    [
+        ('"pytest"', []),
+        ('"pytest>=1"', []),
+        ('"pytest<1"', ["pytest<1"]),
+        ('"definitely-not-installed-dist"', ["definitely-not-installed-dist"]),
+        ('"not a requirement!"', ["not a requirement!"]),
+        ("\"pytest<1; python_version < '3'\"", []),
+    ],
+    ids=["bare", "satisfied", "version-mismatch", "absent", "invalid", "marker"],
+)
+def test_missing_requirements_checks_specifiers(
+    tmp_path: Path, deps: str, expected: list[str]
+) -> None:
+    """Installed versions outside a requirement's specifier count as missing."""
+    script = _write_script(tmp_path, deps)
+
+    assert script_daemon.missing_requirements(script) == expected
+
+
+def test_missing_requirements_checks_requires_python(tmp_path: Path) -> None:
+    """A ``requires-python`` the worker's interpreter does not meet is reported."""
+    script = _write_script(tmp_path)
+    script.write_text(script.read_text().replace(">=3.12", ">=99"), encoding="utf-8")
+
+    assert script_daemon.missing_requirements(script) == ["python>=99"]
+
+
+def test_run_script_returns_none_without_worker(
+    tmp_path: Path, socket_path: Path
+) -> None:
+    """Clients should fall back when nothing is listening."""
+    script = _write_script(tmp_path)
+
+    assert script_daemon.run_script(script, ["0"], socket_path=socket_path) is None
+
+
+def test_main_run_falls_back_to_uv_without_worker(
+    tmp_path: Path, socket_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``run`` should exec ``uv run --script`` when no worker is listening."""
+    script = _write_script(tmp_path)
+    monkeypatch.setenv(script_daemon.SOCKET_ENV_VAR, str(socket_path))
+    monkeypatch.setattr(script_daemon.shutil, "which", lambda _name: "/bin/uv")
+    calls: list[tuple[str, list[str]]] = []
+
+    def fake_execvp(file: str, args: list[str]) -> typ.NoReturn:
+        calls.append((file, args))
+        raise SystemExit(0)
+
+    monkeypatch.setattr(script_daemon.os, "execvp", fake_execvp)
+
+    with pytest.raises(SystemExit):
+        script_daemon.main(["run", str(script), "0", "--flag"])
+
+    assert calls == [
+        ("/bin/uv", ["/bin/uv", "run", "--script", str(script), "0", "--flag"])
+    ]
+
+
+def test_default_socket_path_prefers_explicit_env(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The explicit socket variable should win over RUNNER_TEMP."""
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+    monkeypatch.delenv(script_daemon.SOCKET_ENV_VAR, raising=False)
+    assert (
+        script_daemon.default_socket_path() == tmp_path / "shared-actions-daemon.sock"
+    )
+
+    monkeypatch.setenv(script_daemon.SOCKET_ENV_VAR, str(tmp_path / "x.sock"))
+    assert script_daemon.default_socket_path() == tmp_path / "x.sock"
+
+
+def test_run_script_forwards_argv_env_cwd_and_streams(
+    worker: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    """The worker should run the script with the client's context."""
+    script = _write_script(tmp_path)
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    monkeypatch.setenv("DAEMON_TOKEN", f"pid-{os.getpid()}")
+
+    status = script_daemon.run_script(script, ["3", "extra"], socket_path=worker)
+
+    assert status == 3
+    captured = capfd.readouterr()
+    assert "argv ['3', 'extra']" in captured.out
+    assert "cwd workdir" in captured.out
+    assert f"token pid-{os.getpid()}" in captured.out
+    assert "to-stderr" in captured.err
+
+
+def test_run_script_declines_unsatisfied_dependencies(
+    worker: Path, tmp_path: Path
+) -> None:
+    """Scripts needing packages the worker lacks should fall back."""
+    script = _write_script(tmp_path, '"definitely-not-installed-dist"')
+
+    assert script_daemon.run_script(script, ["0"], socket_path=worker) is None
+
+
+def test_run_script_declines_version_mismatch(worker: Path, tmp_path: Path) -> None:
+    """An installed version outside the script's specifier should fall back."""
+    script = _write_script(tmp_path, '"pytest<1"')
+
+    assert script_daemon.run_script(script, ["0"], socket_path=worker) is None
+
+
+def test_worker_refreshes_plumbum_environment(
+    worker: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    """Commands spawned through plumbum should see the client's environment."""
+    pytest.importorskip("plumbum")
+    script = tmp_path / "plumbum_probe.py"
+    script.write_text(
+        "# /// script\n"
+        "# dependencies = []\n"
+        "# ///\n"
+        "from plumbum import local\n"
+        "print('token', local.env.get('DAEMON_TOKEN'))\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("DAEMON_TOKEN", f"plumbum-{os.getpid()}")
+
+    assert script_daemon.run_script(script, socket_path=worker) == 0
+    assert f"token plumbum-{os.getpid()}" in capfd.readouterr().out
+
+
+def test_main_run_reports_dropped_connection_without_fallback(
+    tmp_path: Path,
+    socket_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A worker that drops the request must not make ``run`` start the script."""
+    script = _write_script(tmp_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+
+    def accept_and_close() -> None:
+        conn, _ = server.accept()
+        conn.close()
+
+    thread = threading.Thread(target=accept_and_close)
+    thread.start()
+    monkeypatch.setenv(script_daemon.SOCKET_ENV_VAR, str(socket_path))
+
+    def fake_execvp(file: str, args: list[str]) -> typ.NoReturn:
+        pytest.fail(f"fell back to {file} {args}")
+
+    monkeypatch.setattr(script_daemon.os, "execvp", fake_execvp)
+    try:
+        assert script_daemon.main(["run", str(script), "0"]) == 1
+    finally:
+        thread.join(timeout=10)
+        server.close()
+
+    assert "::error::script worker failed" in capsys.readouterr().err
+
+
+def test_client_imports_without_tomllib() -> None:
+    """The client must import on interpreters that predate ``tomllib``."""
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.modules['tomllib'] = None; import script_daemon",
+        ],
+        cwd=Path(script_daemon.__file__).parent,
+    )
+    assert proc.wait(timeout=30) == 0
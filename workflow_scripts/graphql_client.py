@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import json
 import time
+import typing as typ
 
-import httpx
+if typ.TYPE_CHECKING:
+    import httpx
 
 if __package__:
     from .output import fail
@@ -67,6 +69,8 @@ def _execute_graphql_attempt(
     token: str, query: str, variables: dict[str, JsonValue]
 ) -> httpx.Response | None:
     """Execute a single GraphQL request attempt, returning None on connection error."""
+    import httpx  # deferred: only needed once a request is actually sent
+
     headers = {
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github+json",